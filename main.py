@@ -1,14 +1,42 @@
 #!/usr/bin/env python3
 """
 Point d'entrée principal pour le jeu d'échecs.
-Lance une partie d'échecs dans le terminal pour deux joueurs locaux.
+Lance une partie d'échecs dans le terminal pour deux joueurs locaux,
+ou contre le moteur avec l'option --moteur.
 """
 
+import argparse
+
 from src.jeu import Jeu
+from src.ponderation import MoteurAsynchrone
+from src.stockage import Stockage
+from src.profilage import ajouter_option_profil, profil_optionnel
 
 
 def main():
     """Fonction principale qui lance le jeu."""
+    analyseur = argparse.ArgumentParser(description="Jeu d'échecs dans le terminal")
+    analyseur.add_argument('--moteur', choices=('blanc', 'noir'), default=None,
+                           help="Couleur jouée par le moteur (partie à deux joueurs sinon)")
+    analyseur.add_argument('--temps', type=float, default=3.0,
+                           help="Temps de réflexion du moteur par coup, en secondes")
+    analyseur.add_argument('--sans-ponderation', action='store_true',
+                           help="Le moteur ne réfléchit pas pendant la saisie du joueur")
+    analyseur.add_argument('--cadence', default=None, metavar='MIN+INC',
+                           help="Partie à la pendule, ex. 5+3 (5 minutes, 3 secondes par coup) ; "
+                                "le moteur gère alors son temps lui-même")
+    analyseur.add_argument('--base', default=None, metavar='FICHIER',
+                           help="Enregistre la partie, coup après coup, dans cette base SQLite")
+    ajouter_option_profil(analyseur)
+    arguments = analyseur.parse_args()
+    cadence = None
+    if arguments.cadence is not None:
+        try:
+            minutes, _, increment = arguments.cadence.partition('+')
+            cadence = (float(minutes) * 60, float(increment or 0))
+        except ValueError:
+            analyseur.error(f"Cadence invalide: {arguments.cadence}")
+    
     print("\n")
     print("╔══════════════════════════════════════════════════╗")
     print("║        JEU D'ÉCHECS - VERSION TERMINALE          ║")
@@ -16,17 +44,41 @@ def main():
     print("\n")
     
     # Demander les noms des joueurs
-    nom_joueur1 = input("Nom du joueur 1 (blancs) [Joueur 1]: ").strip()
-    if not nom_joueur1:
-        nom_joueur1 = "Joueur 1"
+    if arguments.moteur == 'blanc':
+        nom_joueur1 = "Moteur"
+    else:
+        nom_joueur1 = input("Nom du joueur 1 (blancs) [Joueur 1]: ").strip()
+        if not nom_joueur1:
+            nom_joueur1 = "Joueur 1"
     
-    nom_joueur2 = input("Nom du joueur 2 (noirs) [Joueur 2]: ").strip()
-    if not nom_joueur2:
-        nom_joueur2 = "Joueur 2"
+    if arguments.moteur == 'noir':
+        nom_joueur2 = "Moteur"
+    else:
+        nom_joueur2 = input("Nom du joueur 2 (noirs) [Joueur 2]: ").strip()
+        if not nom_joueur2:
+            nom_joueur2 = "Joueur 2"
     
     # Créer et démarrer le jeu
     jeu = Jeu(nom_joueur1, nom_joueur2)
-    jeu.demarrer()
+    if cadence is not None:
+        jeu.fixer_cadence(*cadence)
+    if arguments.base is not None:
+        jeu.stockage = Stockage(arguments.base)
+    try:
+        if arguments.moteur is None:
+            with profil_optionnel(arguments.profile):
+                jeu.demarrer()
+            return
+        
+        with MoteurAsynchrone() as moteur:
+            jeu.affronter_moteur(moteur, arguments.moteur,
+                                 None if cadence is not None else arguments.temps,
+                                 ponderation=not arguments.sans_ponderation)
+            with profil_optionnel(arguments.profile):
+                jeu.demarrer()
+    finally:
+        if jeu.stockage is not None:
+            jeu.stockage.fermer()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,11 @@
+#!/usr/bin/env python3
+"""
+Point d'entrée de l'analyse MultiPV d'une position.
+Exemple : python3 main_analyse.py "r1bqkbnr/pppp1ppp/2n5/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R w KQkq - 2 3" --lignes 3 --temps 5
+"""
+
+from src.analyse import main
+
+
+if __name__ == "__main__":
+    main()
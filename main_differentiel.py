@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+"""
+Point d'entrée du test différentiel de la génération des coups.
+Joue des parties aléatoires en parallèle et compare, position par
+position, les générateurs optimisés à l'implémentation de référence.
+"""
+
+from src.differentiel import main
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+"""
+Point d'entrée de l'explorateur d'ouvertures.
+Exemples :
+    python3 main_explorateur.py parties.pgn --sortie ouvertures.exp
+    python3 main_explorateur.py --sortie ouvertures.exp --position depart
+"""
+
+from src.explorateur import main
+
+
+if __name__ == "__main__":
+    main()
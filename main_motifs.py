@@ -0,0 +1,11 @@
+#!/usr/bin/env python3
+"""
+Point d'entrée de la recherche de motifs dans une base de parties.
+Exemple : python3 main_motifs.py 'R7 kg8' --base parties.db --index motifs
+"""
+
+from src.motifs import main
+
+
+if __name__ == "__main__":
+    main()
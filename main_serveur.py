@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Point d'entrée du serveur de parties.
+Héberge de nombreuses parties simultanées dans un seul processus ;
+les joueurs se connectent en TCP et échangent des messages JSON.
+"""
+
+import argparse
+import asyncio
+
+from src.serveur import ServeurParties
+
+
+def main():
+    """Fonction principale qui lance le serveur."""
+    analyseur = argparse.ArgumentParser(description="Serveur de parties d'échecs")
+    analyseur.add_argument('--hote', default='127.0.0.1', help="Adresse d'écoute")
+    analyseur.add_argument('--port', type=int, default=8765, help="Port d'écoute")
+    analyseur.add_argument('--max-sessions', type=int, default=10000,
+                           help="Nombre maximal de parties simultanées")
+    arguments = analyseur.parse_args()
+    
+    serveur = ServeurParties(arguments.hote, arguments.port,
+                             max_sessions=arguments.max_sessions)
+    print(f"Serveur de parties à l'écoute sur {arguments.hote}:{arguments.port}")
+    try:
+        asyncio.run(serveur.servir())
+    except KeyboardInterrupt:
+        print("\nArrêt du serveur.")
+
+
+if __name__ == "__main__":
+    main()
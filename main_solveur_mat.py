@@ -0,0 +1,11 @@
+#!/usr/bin/env python3
+"""
+Point d'entrée du solveur de mats forcés.
+Exemple : python3 main_solveur_mat.py "3r3k/6pp/8/6N1/2Q5/8/8/6K1 w - - 0 1" 4
+"""
+
+from src.solveur_mat import main
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,11 @@
+#!/usr/bin/env python3
+"""
+Point d'entrée de la génération des tables de finales.
+Exemple : python3 main_tables_finales.py KQK KRK KPK --dossier tables
+"""
+
+from src.tables_finales import main
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+"""
+Point d'entrée des matchs entre moteurs.
+Joue des parties en parallèle, les écrit dans un fichier PGN et arrête le
+match dès que l'écart d'Elo est établi (option --sprt).
+"""
+
+from src.tournoi import main
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+"""
+Point d'entrée UCI du moteur d'échecs.
+Permet d'utiliser le moteur depuis une interface graphique ou un
+gestionnaire de tournois compatible UCI (Arena, Cute Chess, ...).
+"""
+
+from src.uci import main
+
+
+if __name__ == "__main__":
+    main()
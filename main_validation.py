@@ -0,0 +1,11 @@
+#!/usr/bin/env python3
+"""
+Point d'entrée du banc d'essai de la validation de coups par micro-lots.
+Exemple : python3 main_validation.py --requetes 50000 --processus 4
+"""
+
+from src.validation import main
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Module contenant l'analyse d'une position en ligne de commande.
+Le moteur cherche les meilleurs coups en mode MultiPV et chaque ligne est
+affichée avec son évaluation et sa variante en notation algébrique.
+"""
+
+import argparse
+from typing import List
+from src.jeu import Jeu
+from src.moteur import Moteur, Coup
+from src.fen import FEN_INITIALE
+from src.pgn import coup_vers_san
+
+
+def formater_score(score: int) -> str:
+    """
+    Formate un score en pions (ou en coups avant le mat).
+    
+    Args:
+        score: Score en centipions du point de vue du joueur au trait
+        
+    Returns:
+        Le score, ex. '+0.35', '-1.20', '#3', '#-2'
+    """
+    if abs(score) >= Moteur.SEUIL_MAT:
+        coups = (Moteur.SCORE_MAT - abs(score) + 1) // 2
+        return f"#{coups if score > 0 else -coups}"
+    return f"{score / 100:+.2f}"
+
+
+def variante_vers_san(jeu: Jeu, variante: List[Coup]) -> str:
+    """
+    Écrit une variante en notation algébrique, numéros de coups compris.
+    
+    Args:
+        jeu: La partie à la position de départ de la variante (restaurée à la fin)
+        variante: Les coups de la variante
+        
+    Returns:
+        La variante, ex. '12. Nf3 Nc6 13. Bb5' ou '12... Nc6 13. Bb5'
+    """
+    champs = jeu.fen_depart.split()
+    premier_numero = int(champs[5]) if len(champs) > 5 else 1
+    noir = jeu.joueur_actuel.couleur == 'noir'
+    numero = premier_numero + (len(jeu.historique) + (champs[1] == 'b')) // 2
+    jetons = []
+    coups_joues = []
+    for indice, coup in enumerate(variante):
+        if not noir:
+            jetons.append(f"{numero}.")
+        elif indice == 0:
+            jetons.append(f"{numero}...")
+        jetons.append(coup_vers_san(jeu, *coup))
+        coups_joues.append(jeu.plateau.jouer_coup(*coup))
+        if noir:
+            numero += 1
+        noir = not noir
+    for coup_joue in reversed(coups_joues):
+        jeu.plateau.annuler_coup(coup_joue)
+    return ' '.join(jetons)
+
+
+def main():
+    """Analyse une position FEN donnée sur la ligne de commande."""
+    analyseur = argparse.ArgumentParser(description="Analyse MultiPV d'une position")
+    analyseur.add_argument('fen', nargs='?', default=FEN_INITIALE,
+                           help="Position en notation FEN (position initiale par défaut)")
+    analyseur.add_argument('--lignes', type=int, default=3, help="Nombre de lignes")
+    analyseur.add_argument('--profondeur', type=int, default=None, help="Profondeur maximale")
+    analyseur.add_argument('--temps', type=float, default=None, help="Temps maximal en secondes")
+    analyseur.add_argument('--noeuds', type=int, default=None, help="Nombre maximal de nœuds")
+    arguments = analyseur.parse_args()
+    
+    try:
+        jeu = Jeu.depuis_fen(arguments.fen)
+    except ValueError as e:
+        analyseur.error(str(e))
+    
+    def rapport(profondeur, lignes, noeuds, secondes):
+        print(f"profondeur {profondeur} ({noeuds} nœuds, {secondes:.2f} s)")
+        for numero, (_, score, variante) in enumerate(lignes, 1):
+            print(f"  {numero}. {formater_score(score):>7}  {variante_vers_san(jeu, variante)}")
+    
+    lignes = Moteur(profondeur=4).analyser(jeu, arguments.lignes, arguments.profondeur,
+                                           arguments.temps, arguments.noeuds, rapport)
+    if not lignes:
+        print("Aucun coup légal")
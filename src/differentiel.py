@@ -0,0 +1,550 @@
+"""
+Module contenant le test différentiel de la génération des coups.
+Des parties aléatoires sont jouées en grand nombre et, à chaque position,
+les générateurs optimisés (Jeu, Moteur, validation d'un coup, détection des
+attaques, cartes d'attaques, cache des mouvements, hachage, notation) sont comparés à
+une implémentation de référence volontairement naïve : chaque coup
+pseudo-légal est joué sur une copie du plateau (Plateau.copier) et l'échec
+est détecté en énumérant les coups de toutes les pièces adverses.
+
+Une divergence est réduite en retirant une à une les pièces dont elle ne
+dépend pas, puis rapportée avec la FEN de la position réduite. Les parties
+sont réparties entre plusieurs processus ; chacune est tirée d'une graine
+dérivée de la graine générale et de son numéro, ce qui la rend rejouable
+seule.
+"""
+
+import argparse
+import random
+import sys
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from src.jeu import Jeu
+from src.plateau import Plateau
+from src.piece import Pion, Tour, Cavalier, Fou, Reine, Roi
+from src.moteur import Moteur, couleur_adverse
+from src.fen import FEN_INITIALE, plateau_depuis_fen, fen_depuis_plateau
+from src.zobrist import hacher
+from src.encodage import encoder_position, decoder_position
+from src.notation import coup_vers_san, san_vers_coup, coup_vers_uci, uci_vers_coup
+
+Coup = Tuple[Tuple[int, int], Tuple[int, int]]
+
+PROMOTIONS = (Reine, Tour, Fou, Cavalier)
+# Parties confiées à un processus en une fois
+PARTIES_PAR_LOT = 8
+
+
+def cases_attaquees_reference(plateau: Plateau, couleur: str) -> Set[Tuple[int, int]]:
+    """
+    Énumère les cases vides ou adverses attaquées, à partir des coups des pièces.
+    
+    Args:
+        plateau: Le plateau
+        couleur: Couleur des attaquants
+        
+    Returns:
+        L'ensemble des cases attaquées (hors cases occupées par cette couleur)
+    """
+    attaquees = set()
+    for piece in plateau.obtenir_toutes_pieces(couleur):
+        ligne, colonne = piece.position
+        if isinstance(piece, Pion):
+            # Les coups d'un pion n'incluent ses prises que si la case est occupée
+            direction = -1 if couleur == 'blanc' else 1
+            cases = [(ligne + direction, colonne - 1), (ligne + direction, colonne + 1)]
+        elif isinstance(piece, Roi):
+            # Le roque ne compte pas comme une attaque
+            cases = [(ligne + dl, colonne + dc) for dl in (-1, 0, 1) for dc in (-1, 0, 1)
+                     if dl or dc]
+        else:
+            cases = piece.mouvements_possibles(plateau)
+        for case in cases:
+            if plateau.est_position_valide(case):
+                occupant = plateau.grille[case[0]][case[1]]
+                if occupant is None or occupant.couleur != couleur:
+                    attaquees.add(case)
+    return attaquees
+
+
+def echec_reference(plateau: Plateau, couleur: str) -> bool:
+    """Indique si le roi d'une couleur est attaqué, selon la référence."""
+    roi = plateau.trouver_roi(couleur)
+    return roi is not None and roi in cases_attaquees_reference(plateau, couleur_adverse(couleur))
+
+
+def coups_reference(plateau: Plateau, couleur: str) -> Set[Coup]:
+    """
+    Génère les coups légaux en jouant chaque coup pseudo-légal sur une copie du plateau.
+    
+    Args:
+        plateau: Le plateau (inchangé)
+        couleur: Couleur du camp au trait
+        
+    Returns:
+        L'ensemble des coups légaux (départ, arrivée)
+    """
+    legaux = set()
+    for piece in plateau.obtenir_toutes_pieces(couleur):
+        depart = piece.position
+        for arrivee in piece.mouvements_possibles(plateau):
+            if isinstance(piece, Roi) and abs(arrivee[1] - depart[1]) == 2:
+                passage = (depart[0], (depart[1] + arrivee[1]) // 2)
+                attaquees = cases_attaquees_reference(plateau, couleur_adverse(couleur))
+                if depart in attaquees or passage in attaquees:
+                    continue
+            copie = plateau.copier()
+            copie.jouer_coup(depart, arrivee)
+            if not echec_reference(copie, couleur):
+                legaux.add((depart, arrivee))
+    return legaux
+
+
+def _comparer_coups(nom: str, obtenus: List[Coup], reference: Set[Coup]) -> Optional[str]:
+    """Décrit l'écart entre des coups générés et les coups de référence (None s'il n'y en a pas)."""
+    if len(obtenus) != len(set(obtenus)):
+        return f"{nom} : coups en double"
+    manquants, en_trop = reference - set(obtenus), set(obtenus) - reference
+    if not manquants and not en_trop:
+        return None
+    return f"{nom} : manquants {sorted(manquants)}, en trop {sorted(en_trop)}"
+
+
+def verifier_jeu(plateau: Plateau, couleur: str, reference: Set[Coup]) -> Optional[str]:
+    """Compare Jeu.obtenir_tous_mouvements_legaux à la référence."""
+    jeu = Jeu()
+    jeu.plateau = plateau
+    cle = hacher(plateau, couleur)
+    obtenus = jeu.obtenir_tous_mouvements_legaux(couleur)
+    if hacher(plateau, couleur) != cle:
+        return "Jeu.obtenir_tous_mouvements_legaux modifie le plateau"
+    return _comparer_coups("Jeu.obtenir_tous_mouvements_legaux", obtenus, reference)
+
+
+def verifier_moteur(plateau: Plateau, couleur: str, reference: Set[Coup]) -> Optional[str]:
+    """Compare Moteur.coups_legaux à la référence."""
+    cle = hacher(plateau, couleur)
+    obtenus = Moteur(taille_table_mo=0).coups_legaux(plateau, couleur)
+    if hacher(plateau, couleur) != cle:
+        return "Moteur.coups_legaux modifie le plateau"
+    return _comparer_coups("Moteur.coups_legaux", obtenus, reference)
+
+
+def verifier_attaques(plateau: Plateau, couleur: str, reference: Set[Coup]) -> Optional[str]:
+    """Compare la détection des échecs et des cases attaquées à la référence."""
+    jeu = Jeu()
+    jeu.plateau = plateau
+    moteur = Moteur(taille_table_mo=0)
+    for camp in ('blanc', 'noir'):
+        attaquees = cases_attaquees_reference(plateau, camp)
+        roi = plateau.trouver_roi(couleur_adverse(camp))
+        attendu = roi is not None and roi in attaquees
+        if jeu.est_echec(couleur_adverse(camp)) != attendu:
+            return f"Jeu.est_echec({couleur_adverse(camp)}) : {not attendu} au lieu de {attendu}"
+        if moteur.est_en_echec(plateau, couleur_adverse(camp)) != attendu:
+            return f"Moteur.est_en_echec({couleur_adverse(camp)}) : {not attendu} au lieu de {attendu}"
+        for ligne in range(8):
+            for colonne in range(8):
+                piece = plateau.grille[ligne][colonne]
+                if piece is not None and piece.couleur == camp:
+                    continue
+                attendu = (ligne, colonne) in attaquees
+                if plateau.est_case_attaquee((ligne, colonne), camp) != attendu:
+                    return (f"Plateau.est_case_attaquee({(ligne, colonne)}, {camp}) : "
+                            f"{not attendu} au lieu de {attendu}")
+    return None
+
+
+def verifier_validation(plateau: Plateau, couleur: str, reference: Set[Coup]) -> Optional[str]:
+    """
+    Compare, pour chaque couple de cases, Plateau.est_coup_pseudo_legal aux
+    mouvements de la pièce et Jeu.verifier_coup aux coups de référence.
+    """
+    jeu = Jeu()
+    jeu.plateau = plateau
+    jeu.joueur_actuel = jeu.joueur_blanc if couleur == 'blanc' else jeu.joueur_noir
+    cle = hacher(plateau, couleur)
+    cases = [(ligne, colonne) for ligne in range(8) for colonne in range(8)]
+    for depart in cases:
+        piece = plateau.grille[depart[0]][depart[1]]
+        mouvements = set(piece.mouvements_possibles(plateau)) if piece is not None else set()
+        for arrivee in cases:
+            if plateau.est_coup_pseudo_legal(depart, arrivee) != (arrivee in mouvements):
+                return f"Plateau.est_coup_pseudo_legal{(depart, arrivee)} : {arrivee not in mouvements}"
+            legal = (depart, arrivee) in reference
+            if (jeu.verifier_coup(depart, arrivee) is None) != legal:
+                return f"Jeu.verifier_coup{(depart, arrivee)} : {'refusé' if legal else 'accepté'}"
+    if hacher(plateau, couleur) != cle:
+        return "Jeu.verifier_coup modifie le plateau"
+    return None
+
+
+def verifier_cartes_attaques(plateau: Plateau, couleur: str, reference: Set[Coup]) -> Optional[str]:
+    """
+    Compare les cartes d'attaques tenues à jour incrémentalement aux cases
+    attaquées de référence, puis, coup par coup, à des cartes recalculées
+    entièrement après jouer_coup() et après annuler_coup().
+    """
+    copie = plateau.copier()
+    copie.activer_attaques()
+    for camp in ('blanc', 'noir'):
+        attaquees = cases_attaquees_reference(plateau, camp)
+        for ligne in range(8):
+            for colonne in range(8):
+                piece = plateau.grille[ligne][colonne]
+                if piece is not None and piece.couleur == camp:
+                    continue
+                attendu = (ligne, colonne) in attaquees
+                if (copie.attaques[camp][ligne][colonne] > 0) != attendu:
+                    return f"carte d'attaques ({camp}) fausse en {(ligne, colonne)}"
+    
+    initiales = plateau.copier()
+    initiales.activer_attaques()
+    for depart, arrivee in sorted(reference):
+        coup_joue = copie.jouer_coup(depart, arrivee)
+        recalcul = copie.copier()
+        recalcul.activer_attaques()
+        if copie.attaques != recalcul.attaques:
+            return f"cartes d'attaques différentes d'un recalcul après jouer_coup{(depart, arrivee)}"
+        copie.annuler_coup(coup_joue)
+        if copie.attaques != initiales.attaques:
+            return f"cartes d'attaques différentes d'un recalcul après annuler_coup{(depart, arrivee)}"
+    return None
+
+
+def verifier_cache_mouvements(plateau: Plateau, couleur: str, reference: Set[Coup]) -> Optional[str]:
+    """
+    Remplit le cache des mouvements, puis, coup par coup, compare les
+    mouvements en cache de chaque case à mouvements_possibles() après
+    jouer_coup() et après annuler_coup().
+    """
+    cases = [(ligne, colonne) for ligne in range(8) for colonne in range(8)]
+    
+    def ecart(etape: str) -> Optional[str]:
+        for case in cases:
+            piece = plateau.grille[case[0]][case[1]]
+            attendus = piece.mouvements_possibles(plateau) if piece is not None else []
+            if sorted(plateau.mouvements(case)) != sorted(attendus):
+                return f"Plateau.mouvements({case}) périmé {etape}"
+        return None
+    
+    message = ecart("au départ")
+    for depart, arrivee in sorted(reference):
+        if message is not None:
+            break
+        coup_joue = plateau.jouer_coup(depart, arrivee)
+        message = ecart(f"après jouer_coup{(depart, arrivee)}")
+        plateau.annuler_coup(coup_joue)
+        message = message or ecart(f"après annuler_coup{(depart, arrivee)}")
+    return message
+
+
+def verifier_hachage(plateau: Plateau, couleur: str, reference: Set[Coup]) -> Optional[str]:
+    """
+    Vérifie, coup par coup, que jouer_coup() produit la même clé de Zobrist
+    que le même coup joué sur une copie, et que annuler_coup() restaure la
+    clé ; vérifie aussi l'aller-retour par la FEN et par l'encodage compact.
+    """
+    cle = hacher(plateau, couleur)
+    if hacher(*plateau_depuis_fen(fen_depuis_plateau(plateau, couleur))) != cle:
+        return "clé différente après un aller-retour par la FEN"
+    if hacher(*decoder_position(encoder_position(plateau, couleur))) != cle:
+        return "clé différente après un aller-retour par l'encodage compact"
+    
+    for depart, arrivee in sorted(reference):
+        copie = plateau.copier()
+        copie.jouer_coup(depart, arrivee)
+        coup_joue = plateau.jouer_coup(depart, arrivee)
+        apres = hacher(plateau, couleur_adverse(couleur))
+        plateau.annuler_coup(coup_joue)
+        if apres != hacher(copie, couleur_adverse(couleur)):
+            return f"clé différente après jouer_coup{(depart, arrivee)} et sur une copie"
+        if hacher(plateau, couleur) != cle:
+            return f"clé différente après annuler_coup{(depart, arrivee)}"
+    return None
+
+
+def verifier_notation(plateau: Plateau, couleur: str, reference: Set[Coup]) -> Optional[str]:
+    """
+    Vérifie, coup par coup (et pour chaque promotion), que le SAN est unique,
+    se relit en ce même coup et porte '+' ou '#' selon l'échec et le mat de
+    référence, puis l'aller-retour par la notation UCI.
+    """
+    vus: Dict[str, Coup] = {}
+    for depart, arrivee in sorted(reference):
+        promotions = (None,)
+        if isinstance(plateau.grille[depart[0]][depart[1]], Pion) and arrivee[0] in (0, 7):
+            promotions = PROMOTIONS
+        for promotion in promotions:
+            coup = (depart, arrivee, promotion)
+            san = coup_vers_san(plateau, depart, arrivee, promotion)
+            if san in vus:
+                return f"SAN {san} pour {vus[san]} et {coup}"
+            vus[san] = coup
+            if san_vers_coup(plateau, couleur, san) != coup:
+                return f"SAN {san} relu {san_vers_coup(plateau, couleur, san)} au lieu de {coup}"
+            
+            copie = plateau.copier()
+            copie.jouer_coup(depart, arrivee, promotion)
+            suffixe = ''
+            if echec_reference(copie, couleur_adverse(couleur)):
+                suffixe = '+' if coups_reference(copie, couleur_adverse(couleur)) else '#'
+            if (san[-1] if san[-1] in '+#' else '') != suffixe:
+                return f"SAN {san} pour {coup} : suffixe attendu '{suffixe}'"
+            
+            if uci_vers_coup(coup_vers_uci(plateau, (depart, arrivee), promotion)) != coup:
+                return f"aller-retour UCI incorrect pour {coup}"
+    return None
+
+
+# Vérifications disponibles, par nom ; chacune reçoit le plateau, le camp
+# au trait et les coups de référence, et décrit la divergence (None sinon)
+VERIFICATIONS: Dict[str, Callable[[Plateau, str, Set[Coup]], Optional[str]]] = {
+    'jeu': verifier_jeu,
+    'moteur': verifier_moteur,
+    'attaques': verifier_attaques,
+    'validation': verifier_validation,
+    'cartes_attaques': verifier_cartes_attaques,
+    'cache_mouvements': verifier_cache_mouvements,
+    'hachage': verifier_hachage,
+    'notation': verifier_notation,
+}
+
+
+def diverger(plateau: Plateau, couleur: str, nom: str) -> Optional[str]:
+    """
+    Applique une vérification à une position.
+    
+    Une exception levée par le code vérifié compte comme une divergence.
+    
+    Args:
+        plateau: Le plateau
+        couleur: Couleur du camp au trait
+        nom: Nom de la vérification (clé de VERIFICATIONS)
+        
+    Returns:
+        La description de la divergence, ou None
+    """
+    reference = coups_reference(plateau, couleur)
+    try:
+        return VERIFICATIONS[nom](plateau.copier(), couleur, reference)
+    except Exception as e:
+        return f"exception {type(e).__name__}: {e}"
+
+
+def minimiser(fen: str, nom: str) -> str:
+    """
+    Réduit une position divergente en retirant les pièces dont la divergence ne dépend pas.
+    
+    Une pièce (autre qu'un roi) est retirée si la position reste légale (le
+    camp qui n'a pas le trait n'est pas en échec) et diverge toujours ; on
+    recommence jusqu'à ce qu'aucune pièce ne puisse plus être retirée.
+    
+    Args:
+        fen: La position divergente
+        nom: Nom de la vérification en défaut
+        
+    Returns:
+        La FEN de la position réduite
+    """
+    plateau, couleur = plateau_depuis_fen(fen)
+    reduit = True
+    while reduit:
+        reduit = False
+        cases = [(ligne, colonne) for ligne in range(8) for colonne in range(8)
+                 if plateau.grille[ligne][colonne] is not None
+                 and not isinstance(plateau.grille[ligne][colonne], Roi)]
+        for case in cases:
+            candidat = plateau.copier()
+            candidat.retirer_piece(case)
+            if candidat.position_en_passant is not None:
+                ligne, colonne = candidat.position_en_passant
+                pion = (ligne + (1 if ligne == 2 else -1), colonne)
+                if not isinstance(candidat.obtenir_piece(pion), Pion):
+                    candidat.position_en_passant = None
+            if echec_reference(candidat, couleur_adverse(couleur)):
+                continue
+            if diverger(candidat, couleur, nom) is not None:
+                plateau, reduit = candidat, True
+                break
+    return fen_depuis_plateau(plateau, couleur)
+
+
+class Divergence:
+    """
+    Divergence constatée entre une vérification et la référence.
+    
+    Attributs:
+        verification (str): Nom de la vérification en défaut
+        message (str): Description de la divergence
+        fen (str): Position où elle a été constatée
+        fen_minimale (str): Position réduite qui diverge encore
+        graine (str): Graine de la partie aléatoire
+        demi_coup (int): Demi-coup de la partie où elle a été constatée
+    """
+    
+    def __init__(self, verification: str, message: str, fen: str, fen_minimale: str,
+                 graine: str, demi_coup: int):
+        """Initialise la divergence."""
+        self.verification = verification
+        self.message = message
+        self.fen = fen
+        self.fen_minimale = fen_minimale
+        self.graine = graine
+        self.demi_coup = demi_coup
+    
+    def __str__(self) -> str:
+        """Rapport de la divergence."""
+        return (f"[{self.verification}] {self.message}\n"
+                f"    partie {self.graine}, demi-coup {self.demi_coup}\n"
+                f"    position : {self.fen}\n"
+                f"    réduite  : {self.fen_minimale}")
+
+
+def jouer_partie_aleatoire(graine: str, demi_coups_max: int, verifications: List[str],
+                           fen: str = FEN_INITIALE) -> Tuple[int, List[Divergence]]:
+    """
+    Joue une partie de coups tirés au hasard en vérifiant chaque position.
+    
+    Les promotions sont tirées au hasard parmi les quatre pièces. Une
+    vérification en défaut n'est plus appliquée au reste de la partie.
+    
+    Args:
+        graine: Graine du tirage des coups
+        demi_coups_max: Longueur maximale de la partie
+        verifications: Noms des vérifications à appliquer
+        fen: Position de départ
+        
+    Returns:
+        Tuple (nombre de positions vérifiées, divergences)
+    """
+    hasard = random.Random(graine)
+    plateau, couleur = plateau_depuis_fen(fen)
+    actives = list(verifications)
+    divergences = []
+    positions = 0
+    for demi_coup in range(demi_coups_max + 1):
+        reference = coups_reference(plateau, couleur)
+        positions += 1
+        for nom in list(actives):
+            try:
+                message = VERIFICATIONS[nom](plateau.copier(), couleur, reference)
+            except Exception as e:
+                message = f"exception {type(e).__name__}: {e}"
+            if message is not None:
+                fen_position = fen_depuis_plateau(plateau, couleur)
+                divergences.append(Divergence(nom, message, fen_position,
+                                              minimiser(fen_position, nom), graine, demi_coup))
+                actives.remove(nom)
+        
+        # Fin de partie : mat, pat, ou rois seuls
+        if not reference or len(plateau.obtenir_toutes_pieces('blanc')) + \
+                len(plateau.obtenir_toutes_pieces('noir')) == 2:
+            break
+        depart, arrivee = hasard.choice(sorted(reference))
+        promotion = None
+        if isinstance(plateau.obtenir_piece(depart), Pion) and arrivee[0] in (0, 7):
+            promotion = hasard.choice(PROMOTIONS)
+        plateau.jouer_coup(depart, arrivee, promotion)
+        couleur = couleur_adverse(couleur)
+    return positions, divergences
+
+
+def verifier_lot(graine: int, premiere: int, nombre: int, demi_coups_max: int,
+                 verifications: List[str]) -> Tuple[int, List[Divergence]]:
+    """
+    Joue un lot de parties aléatoires (exécuté dans un processus séparé).
+    
+    Args:
+        graine: Graine générale
+        premiere: Numéro de la première partie du lot
+        nombre: Nombre de parties du lot
+        demi_coups_max: Longueur maximale de chaque partie
+        verifications: Noms des vérifications à appliquer
+        
+    Returns:
+        Tuple (nombre de positions vérifiées, divergences)
+    """
+    positions, divergences = 0, []
+    for numero in range(premiere, premiere + nombre):
+        nombre_positions, trouvees = jouer_partie_aleatoire(f"{graine}:{numero}", demi_coups_max,
+                                                            verifications)
+        positions += nombre_positions
+        divergences.extend(trouvees)
+    return positions, divergences
+
+
+def lancer(parties: int, graine: int = 0, demi_coups_max: int = 200,
+           verifications: Optional[List[str]] = None, concurrence: Optional[int] = None,
+           executeur: Optional[Executor] = None,
+           afficher: Optional[Callable[[str], None]] = None) -> Tuple[int, List[Divergence]]:
+    """
+    Joue des parties aléatoires en parallèle et rassemble les divergences.
+    
+    Args:
+        parties: Nombre de parties
+        graine: Graine générale (la partie n a pour graine 'graine:n')
+        demi_coups_max: Longueur maximale de chaque partie
+        verifications: Noms des vérifications (toutes si None)
+        concurrence: Nombre de processus (nombre de processeurs si None)
+        executeur: Exécuteur des lots (groupe de processus par défaut)
+        afficher: Fonction recevant une ligne de progression par lot (ou None)
+        
+    Returns:
+        Tuple (nombre de positions vérifiées, divergences triées par numéro de partie)
+        
+    Raises:
+        ValueError: Si une vérification est inconnue
+    """
+    verifications = list(verifications or VERIFICATIONS)
+    for nom in verifications:
+        if nom not in VERIFICATIONS:
+            raise ValueError(f"Vérification inconnue: {nom}")
+    
+    proprietaire = executeur is None
+    executeur = executeur or ProcessPoolExecutor(concurrence)
+    try:
+        futures = [executeur.submit(verifier_lot, graine, premiere,
+                                    min(PARTIES_PAR_LOT, parties - premiere),
+                                    demi_coups_max, verifications)
+                   for premiere in range(0, parties, PARTIES_PAR_LOT)]
+        positions, divergences = 0, []
+        for indice, future in enumerate(futures, 1):
+            nombre_positions, trouvees = future.result()
+            positions += nombre_positions
+            divergences.extend(trouvees)
+            if afficher is not None:
+                afficher(f"{min(indice * PARTIES_PAR_LOT, parties)}/{parties} parties, "
+                         f"{positions} positions, {len(divergences)} divergences")
+    finally:
+        if proprietaire:
+            executeur.shutdown(wait=True, cancel_futures=True)
+    divergences.sort(key=lambda divergence: int(divergence.graine.rpartition(':')[2]))
+    return positions, divergences
+
+
+def main():
+    """Lance le test différentiel depuis la ligne de commande."""
+    analyseur = argparse.ArgumentParser(
+        description="Test différentiel de la génération des coups sur des parties aléatoires")
+    analyseur.add_argument('--parties', type=int, default=200, help="Nombre de parties")
+    analyseur.add_argument('--graine', type=int, default=0, help="Graine générale")
+    analyseur.add_argument('--demi-coups', type=int, default=200,
+                           help="Longueur maximale de chaque partie")
+    analyseur.add_argument('--verification', action='append', choices=sorted(VERIFICATIONS),
+                           help="Vérification à appliquer (toutes par défaut ; répétable)")
+    analyseur.add_argument('--concurrence', type=int, default=None,
+                           help="Nombre de processus (nombre de processeurs par défaut)")
+    arguments = analyseur.parse_args()
+    
+    debut = time.perf_counter()
+    positions, divergences = lancer(arguments.parties, arguments.graine, arguments.demi_coups,
+                                    arguments.verification, arguments.concurrence,
+                                    afficher=print)
+    duree = time.perf_counter() - debut
+    print(f"\n{positions} positions vérifiées en {duree:.1f} s ({positions / duree:.0f} par seconde)")
+    for divergence in divergences:
+        print(divergence)
+    if divergences:
+        sys.exit(1)
@@ -0,0 +1,188 @@
+"""
+Module contenant l'encodage compact des positions et des coups.
+Une position tient sur 34 octets : les 64 cases sur 4 bits chacune, un
+octet d'indicateurs (trait et droits de roque) et un octet pour la case de
+prise en passant. Un coup tient sur un entier de 15 bits. Ces formats
+servent au stockage et à l'échange de grands volumes de positions.
+"""
+
+from typing import Optional, Tuple
+from src.plateau import Plateau
+from src.piece import Pion, Tour, Cavalier, Fou, Reine, Roi
+from src.zobrist import droits_roque
+from src.fen import LETTRES_PIECES, appliquer_droits_roque
+
+
+TAILLE_POSITION = 34
+
+# Code de chaque pièce sur 4 bits (0 : case vide) ; code - 1 = numéro de plan
+ORDRE_PIECES = (Pion, Cavalier, Fou, Tour, Reine, Roi)
+CODES_PIECES = {(classe, couleur): rang + 1 + (6 if couleur == 'noir' else 0)
+                for couleur in ('blanc', 'noir') for rang, classe in enumerate(ORDRE_PIECES)}
+PIECES_CODES = {code: cle for cle, code in CODES_PIECES.items()}
+
+# Bits de l'octet d'indicateurs
+TRAIT_NOIR = 1
+ROQUES = (2, 4, 8, 16)  # K, Q, k, q
+
+PROMOTIONS = (None, Reine, Tour, Fou, Cavalier)
+
+
+def encoder_position(plateau: Plateau, couleur: str) -> bytes:
+    """
+    Encode une position sur TAILLE_POSITION octets.
+    
+    Args:
+        plateau: Le plateau de jeu
+        couleur: Couleur du camp au trait
+        
+    Returns:
+        La position encodée
+    """
+    donnees = bytearray(TAILLE_POSITION)
+    for ligne in range(8):
+        for colonne in range(8):
+            piece = plateau.grille[ligne][colonne]
+            if piece is not None:
+                case = ligne * 8 + colonne
+                donnees[case >> 1] |= CODES_PIECES[(type(piece), piece.couleur)] << (4 * (case & 1))
+    
+    indicateurs = TRAIT_NOIR if couleur == 'noir' else 0
+    for bit, droit in zip(ROQUES, droits_roque(plateau)):
+        if droit:
+            indicateurs |= bit
+    donnees[32] = indicateurs
+    
+    if plateau.position_en_passant is not None:
+        ligne, colonne = plateau.position_en_passant
+        donnees[33] = ligne * 8 + colonne + 1
+    return bytes(donnees)
+
+
+def encoder_fen(fen: str) -> bytes:
+    """
+    Encode directement une chaîne FEN, sans construire de plateau.
+    
+    Args:
+        fen: La position en notation FEN
+        
+    Returns:
+        La position encodée
+        
+    Raises:
+        ValueError: Si la chaîne FEN est invalide
+    """
+    champs = fen.split()
+    if len(champs) < 2 or champs[1] not in ('w', 'b'):
+        raise ValueError(f"FEN invalide: {fen}")
+    
+    rangees = champs[0].split('/')
+    if len(rangees) != 8:
+        raise ValueError(f"FEN invalide (8 rangées attendues): {fen}")
+    
+    donnees = bytearray(TAILLE_POSITION)
+    for ligne, rangee in enumerate(rangees):
+        colonne = 0
+        for caractere in rangee:
+            if caractere.isdigit():
+                colonne += int(caractere)
+                continue
+            classe = LETTRES_PIECES.get(caractere.lower())
+            if classe is None or colonne > 7:
+                raise ValueError(f"FEN invalide: {fen}")
+            case = ligne * 8 + colonne
+            code = CODES_PIECES[(classe, 'blanc' if caractere.isupper() else 'noir')]
+            donnees[case >> 1] |= code << (4 * (case & 1))
+            colonne += 1
+        if colonne != 8:
+            raise ValueError(f"FEN invalide (rangée incomplète): {fen}")
+    
+    indicateurs = TRAIT_NOIR if champs[1] == 'b' else 0
+    roques = champs[2] if len(champs) > 2 else '-'
+    for bit, lettre in zip(ROQUES, 'KQkq'):
+        if lettre in roques:
+            indicateurs |= bit
+    donnees[32] = indicateurs
+    
+    en_passant = champs[3] if len(champs) > 3 else '-'
+    if en_passant != '-':
+        if len(en_passant) != 2 or en_passant[0] not in 'abcdefgh' or en_passant[1] not in '36':
+            raise ValueError(f"Case de prise en passant invalide: {en_passant}")
+        donnees[33] = (8 - int(en_passant[1])) * 8 + ord(en_passant[0]) - ord('a') + 1
+    return bytes(donnees)
+
+
+def decoder_position(donnees: bytes) -> Tuple[Plateau, str]:
+    """
+    Reconstruit un plateau à partir d'une position encodée.
+    
+    Comme pour la notation FEN, l'état a_bouge des pièces est déduit des
+    droits de roque et de la rangée des pions.
+    
+    Args:
+        donnees: La position encodée
+        
+    Returns:
+        Tuple (plateau, couleur au trait)
+        
+    Raises:
+        ValueError: Si les données sont invalides
+    """
+    if len(donnees) != TAILLE_POSITION:
+        raise ValueError(f"Position encodée invalide ({len(donnees)} octets)")
+    
+    plateau = Plateau()
+    for case in range(64):
+        code = (donnees[case >> 1] >> (4 * (case & 1))) & 0x0F
+        if code == 0:
+            continue
+        if code not in PIECES_CODES:
+            raise ValueError(f"Code de pièce invalide: {code}")
+        classe, couleur = PIECES_CODES[code]
+        ligne, colonne = divmod(case, 8)
+        piece = classe(couleur, (ligne, colonne))
+        piece.a_bouge = True
+        if classe is Pion:
+            piece.a_bouge = ligne != (6 if couleur == 'blanc' else 1)
+        plateau.grille[ligne][colonne] = piece
+    
+    indicateurs = donnees[32]
+    appliquer_droits_roque(plateau, tuple(bool(indicateurs & bit) for bit in ROQUES))
+    if donnees[33]:
+        # Case derrière un pion qui vient d'avancer de deux cases : 6e ou 3e rangée
+        en_passant = divmod(donnees[33] - 1, 8)
+        if donnees[33] > 64 or en_passant[0] not in (2, 5):
+            raise ValueError(f"Case de prise en passant invalide: {donnees[33]}")
+        plateau.position_en_passant = en_passant
+    
+    return plateau, 'noir' if indicateurs & TRAIT_NOIR else 'blanc'
+
+
+def encoder_coup(depart: Tuple[int, int], arrivee: Tuple[int, int],
+                 promotion: Optional[type] = None) -> int:
+    """
+    Encode un coup sur 15 bits (départ, arrivée, promotion).
+    
+    Args:
+        depart: Position de départ (ligne, colonne)
+        arrivee: Position d'arrivée (ligne, colonne)
+        promotion: Classe de la pièce de promotion (ou None)
+        
+    Returns:
+        Le coup encodé
+    """
+    return (depart[0] * 8 + depart[1]) | (arrivee[0] * 8 + arrivee[1]) << 6 | \
+        PROMOTIONS.index(promotion) << 12
+
+
+def decoder_coup(code: int) -> Tuple[Tuple[int, int], Tuple[int, int], Optional[type]]:
+    """
+    Décode un coup encodé par encoder_coup().
+    
+    Args:
+        code: Le coup encodé
+        
+    Returns:
+        Tuple (position de départ, position d'arrivée, classe de promotion ou None)
+    """
+    return divmod(code & 63, 8), divmod((code >> 6) & 63, 8), PROMOTIONS[code >> 12]
@@ -0,0 +1,246 @@
+"""
+Module contenant l'évaluation statique d'une position.
+L'évaluation combine le matériel et des tables de position par type de pièce,
+et peut y ajouter un terme de mobilité des pièces et un terme de structure
+des pions (mémorisé dans une table des pions).
+"""
+
+from typing import Dict, List, Optional, Tuple
+from src.plateau import Plateau
+from src.piece import Pion, Tour, Cavalier, Fou, Reine, Roi
+from src.table_pions import TablePions
+
+
+# Tables de position vues du côté des blancs : la ligne 0 correspond à la 8e rangée,
+# comme dans Plateau.grille. Pour les noirs, la table est lue en miroir vertical.
+TABLES_POSITION: Dict[type, List[List[int]]] = {
+    Pion: [
+        [0, 0, 0, 0, 0, 0, 0, 0],
+        [50, 50, 50, 50, 50, 50, 50, 50],
+        [10, 10, 20, 30, 30, 20, 10, 10],
+        [5, 5, 10, 25, 25, 10, 5, 5],
+        [0, 0, 0, 20, 20, 0, 0, 0],
+        [5, -5, -10, 0, 0, -10, -5, 5],
+        [5, 10, 10, -20, -20, 10, 10, 5],
+        [0, 0, 0, 0, 0, 0, 0, 0],
+    ],
+    Cavalier: [
+        [-50, -40, -30, -30, -30, -30, -40, -50],
+        [-40, -20, 0, 0, 0, 0, -20, -40],
+        [-30, 0, 10, 15, 15, 10, 0, -30],
+        [-30, 5, 15, 20, 20, 15, 5, -30],
+        [-30, 0, 15, 20, 20, 15, 0, -30],
+        [-30, 5, 10, 15, 15, 10, 5, -30],
+        [-40, -20, 0, 5, 5, 0, -20, -40],
+        [-50, -40, -30, -30, -30, -30, -40, -50],
+    ],
+    Fou: [
+        [-20, -10, -10, -10, -10, -10, -10, -20],
+        [-10, 0, 0, 0, 0, 0, 0, -10],
+        [-10, 0, 5, 10, 10, 5, 0, -10],
+        [-10, 5, 5, 10, 10, 5, 5, -10],
+        [-10, 0, 10, 10, 10, 10, 0, -10],
+        [-10, 10, 10, 10, 10, 10, 10, -10],
+        [-10, 5, 0, 0, 0, 0, 5, -10],
+        [-20, -10, -10, -10, -10, -10, -10, -20],
+    ],
+    Tour: [
+        [0, 0, 0, 0, 0, 0, 0, 0],
+        [5, 10, 10, 10, 10, 10, 10, 5],
+        [-5, 0, 0, 0, 0, 0, 0, -5],
+        [-5, 0, 0, 0, 0, 0, 0, -5],
+        [-5, 0, 0, 0, 0, 0, 0, -5],
+        [-5, 0, 0, 0, 0, 0, 0, -5],
+        [-5, 0, 0, 0, 0, 0, 0, -5],
+        [0, 0, 0, 5, 5, 0, 0, 0],
+    ],
+    Reine: [
+        [-20, -10, -10, -5, -5, -10, -10, -20],
+        [-10, 0, 0, 0, 0, 0, 0, -10],
+        [-10, 0, 5, 5, 5, 5, 0, -10],
+        [-5, 0, 5, 5, 5, 5, 0, -5],
+        [0, 0, 5, 5, 5, 5, 0, -5],
+        [-10, 5, 5, 5, 5, 5, 0, -10],
+        [-10, 0, 5, 0, 0, 0, 0, -10],
+        [-20, -10, -10, -5, -5, -10, -10, -20],
+    ],
+    Roi: [
+        [-30, -40, -40, -50, -50, -40, -40, -30],
+        [-30, -40, -40, -50, -50, -40, -40, -30],
+        [-30, -40, -40, -50, -50, -40, -40, -30],
+        [-30, -40, -40, -50, -50, -40, -40, -30],
+        [-20, -30, -30, -40, -40, -30, -30, -20],
+        [-10, -20, -20, -20, -20, -20, -20, -10],
+        [20, 20, 0, 0, 0, 0, 20, 20],
+        [20, 30, 10, 0, 0, 10, 30, 20],
+    ],
+}
+
+
+# Bonus par case accessible aux cavaliers, fous, tours et dames
+POIDS_MOBILITE = 4
+PIECES_MOBILES = (Cavalier, Fou, Tour, Reine)
+
+# Structure des pions, en centièmes de pion
+PENALITE_PION_DOUBLE = 15
+PENALITE_PION_ISOLE = 12
+PENALITE_PION_ARRIERE = 8
+# Bonus d'un pion passé selon le nombre de rangées parcourues depuis sa case de départ
+BONUS_PION_PASSE = [5, 10, 20, 35, 60, 100]
+# Pion passé dont la case d'avance est occupée par une pièce adverse
+PENALITE_PION_PASSE_BLOQUE = 10
+
+
+def valeur_position(piece) -> int:
+    """
+    Retourne la valeur d'une pièce sur sa case (matériel + bonus de position).
+    
+    Args:
+        piece: La pièce à évaluer
+        
+    Returns:
+        Valeur en centièmes de pion, toujours du point de vue de la pièce
+    """
+    ligne, colonne = piece.position
+    if piece.couleur == 'noir':
+        ligne = 7 - ligne
+    return piece.valeur + TABLES_POSITION[type(piece)][ligne][colonne]
+
+
+def mobilite(piece, plateau: Plateau) -> int:
+    """
+    Retourne le bonus de mobilité d'une pièce.
+    
+    Les cases comptées sont celles que la pièce peut atteindre (vides ou
+    occupées par l'adversaire), sans vérifier l'échec au roi.
+    
+    Args:
+        piece: La pièce à évaluer
+        plateau: Le plateau de jeu
+        
+    Returns:
+        Bonus en centièmes de pion (0 pour les pions et les rois)
+    """
+    if type(piece) not in PIECES_MOBILES:
+        return 0
+    return POIDS_MOBILITE * len(plateau.mouvements(piece.position))
+
+
+def structure_pions(plateau: Plateau) -> Tuple[int, int, int]:
+    """
+    Évalue la structure des pions : pions doublés, isolés, arriérés et passés.
+    
+    Un pion arriéré n'a plus de pion voisin à sa hauteur ou derrière lui
+    pour le soutenir, et sa case d'avance est attaquée par un pion adverse.
+    Le résultat ne dépend que des pions.
+    
+    Args:
+        plateau: Le plateau à évaluer
+        
+    Returns:
+        Tuple (score du point de vue des blancs, masque des pions passés
+        blancs, masque des pions passés noirs) ; bit ligne * 8 + colonne
+    """
+    # Lignes occupées par les pions de chaque couleur, par colonne
+    lignes = {'blanc': [[] for _ in range(8)], 'noir': [[] for _ in range(8)]}
+    for ligne in range(8):
+        for colonne, piece in enumerate(plateau.grille[ligne]):
+            if isinstance(piece, Pion):
+                lignes[piece.couleur][colonne].append(ligne)
+    
+    score = 0
+    passes = {'blanc': 0, 'noir': 0}
+    for couleur, signe, direction in (('blanc', 1, -1), ('noir', -1, 1)):
+        amis = lignes[couleur]
+        ennemis = lignes['noir' if couleur == 'blanc' else 'blanc']
+        for colonne in range(8):
+            if len(amis[colonne]) > 1:
+                score -= signe * PENALITE_PION_DOUBLE * (len(amis[colonne]) - 1)
+            voisines = [c for c in (colonne - 1, colonne + 1) if 0 <= c < 8]
+            for ligne in amis[colonne]:
+                # Passé : aucun pion adverse devant lui sur sa colonne ou les voisines,
+                # ni pion ami devant lui (seul le pion de tête d'un doublé est passé)
+                if not any((l - ligne) * direction > 0
+                           for c in voisines + [colonne] for l in ennemis[c]) and \
+                        not any((l - ligne) * direction > 0 for l in amis[colonne]):
+                    parcourues = 6 - ligne if couleur == 'blanc' else ligne - 1
+                    score += signe * BONUS_PION_PASSE[parcourues]
+                    passes[couleur] |= 1 << (ligne * 8 + colonne)
+                
+                if not any(amis[c] for c in voisines):
+                    score -= signe * PENALITE_PION_ISOLE
+                elif not any((l - ligne) * direction <= 0 for c in voisines for l in amis[c]) and \
+                        any(ligne + 2 * direction in ennemis[c] for c in voisines):
+                    score -= signe * PENALITE_PION_ARRIERE
+    
+    return score, passes['blanc'], passes['noir']
+
+
+def evaluer_structure_pions(plateau: Plateau, table_pions: Optional[TablePions] = None) -> int:
+    """
+    Retourne le terme de structure des pions, du point de vue des blancs.
+    
+    La structure est lue dans la table des pions si elle y figure, sinon
+    calculée puis enregistrée. Les pions passés bloqués par une pièce
+    adverse, qui dépendent aussi des autres pièces, sont comptés ensuite à
+    partir des masques de pions passés.
+    
+    Args:
+        plateau: Le plateau à évaluer
+        table_pions: Table des structures de pions (ou None pour tout calculer)
+        
+    Returns:
+        Score en centièmes de pion (positif si la structure favorise les blancs)
+    """
+    if table_pions is None:
+        score, passes_blancs, passes_noirs = structure_pions(plateau)
+    else:
+        cle = plateau.cle_pions()
+        entree = table_pions.sonder(cle)
+        if entree is None:
+            entree = structure_pions(plateau)
+            table_pions.stocker(cle, *entree)
+        score, passes_blancs, passes_noirs = entree
+    
+    for passes, couleur, signe, direction in ((passes_blancs, 'blanc', 1, -1),
+                                              (passes_noirs, 'noir', -1, 1)):
+        while passes:
+            case = (passes & -passes).bit_length() - 1
+            passes &= passes - 1
+            bloqueur = plateau.grille[case // 8 + direction][case % 8]
+            if bloqueur is not None and bloqueur.couleur != couleur:
+                score -= signe * PENALITE_PION_PASSE_BLOQUE
+    return score
+
+
+def evaluer(plateau: Plateau, couleur: str, avec_mobilite: bool = False,
+            avec_structure_pions: bool = False, table_pions: Optional[TablePions] = None) -> int:
+    """
+    Évalue statiquement une position.
+    
+    Args:
+        plateau: Le plateau à évaluer
+        couleur: Couleur du point de vue de laquelle on évalue
+        avec_mobilite: Ajoute le terme de mobilité (plus précis mais plus lent)
+        avec_structure_pions: Ajoute le terme de structure des pions
+        table_pions: Table des structures de pions consultée par ce terme (ou None)
+        
+    Returns:
+        Score en centièmes de pion (positif si la position favorise couleur)
+    """
+    score = 0
+    if avec_structure_pions:
+        structure = evaluer_structure_pions(plateau, table_pions)
+        score = structure if couleur == 'blanc' else -structure
+    for rangee in plateau.grille:
+        for piece in rangee:
+            if piece is None:
+                continue
+            valeur = valeur_position(piece)
+            if avec_mobilite:
+                valeur += mobilite(piece, plateau)
+            if piece.couleur == couleur:
+                score += valeur
+            else:
+                score -= valeur
+    return score
@@ -0,0 +1,137 @@
+"""
+Module contenant l'évaluation vectorisée d'un lot de positions.
+Les positions sont lues sous forme de plans NumPy (voir src/tenseurs.py) et
+le matériel, les tables de position et la mobilité sont calculés pour tout
+le lot par opérations sur des tableaux. Le résultat est identique, position
+par position, à celui de evaluation.evaluer().
+"""
+
+from typing import Optional
+from src.piece import Cavalier, Fou, Tour, Reine
+from src.evaluation import TABLES_POSITION, POIDS_MOBILITE
+from src.encodage import ORDRE_PIECES
+from src.tenseurs import np, _verifier_numpy, exporter_encodages
+
+DIRECTIONS_CAVALIER = ((-2, -1), (-2, 1), (-1, -2), (-1, 2), (1, -2), (1, 2), (2, -1), (2, 1))
+DIRECTIONS_FOU = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+DIRECTIONS_TOUR = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+
+def _poids_pieces() -> 'np.ndarray':
+    """
+    Construit le poids (matériel + table de position) de chaque plan et case.
+    
+    Returns:
+        Tableau (12, 8, 8) : positif pour les pièces blanches, négatif pour les noires
+    """
+    poids = np.empty((12, 8, 8), dtype=np.int64)
+    for rang, classe in enumerate(ORDRE_PIECES):
+        table = np.array(TABLES_POSITION[classe], dtype=np.int64) + classe.valeur
+        poids[rang] = table
+        # Les noirs lisent la table en miroir vertical
+        poids[rang + 6] = -table[::-1]
+    return poids
+
+
+def _decaler(plans: 'np.ndarray', d_ligne: int, d_colonne: int) -> 'np.ndarray':
+    """
+    Décale des plans (N, 8, 8) d'un vecteur, les cases sorties du plateau disparaissent.
+    
+    Returns:
+        Plans décalés : la case (l, c) reçoit la valeur de (l - d_ligne, c - d_colonne)
+    """
+    resultat = np.zeros_like(plans)
+    lignes_source = slice(max(0, -d_ligne), 8 - max(0, d_ligne))
+    lignes_cible = slice(max(0, d_ligne), 8 - max(0, -d_ligne))
+    colonnes_source = slice(max(0, -d_colonne), 8 - max(0, d_colonne))
+    colonnes_cible = slice(max(0, d_colonne), 8 - max(0, -d_colonne))
+    resultat[:, lignes_cible, colonnes_cible] = plans[:, lignes_source, colonnes_source]
+    return resultat
+
+
+def _mobilite_camp(pieces: 'np.ndarray', premier_plan: int, propres: 'np.ndarray',
+                   vides: 'np.ndarray') -> 'np.ndarray':
+    """
+    Compte les cases accessibles aux cavaliers, fous, tours et dames d'un camp.
+    
+    Les rayons des pièces glissantes s'arrêtent sur la première case occupée :
+    deux rayons de même direction ne peuvent donc jamais se superposer.
+    
+    Args:
+        pieces: Plans des pièces (N, 12, 8, 8)
+        premier_plan: 0 pour les blancs, 6 pour les noirs
+        propres: Cases occupées par le camp (N, 8, 8)
+        vides: Cases vides (N, 8, 8)
+        
+    Returns:
+        Nombre de cases accessibles par position (N,)
+    """
+    accessibles = ~propres
+    # Compteur par case (au plus 8 cavaliers et 8 rayons y arrivent), sommé une seule fois
+    compte = np.zeros(propres.shape, dtype=np.uint8)
+    
+    cavaliers = pieces[:, premier_plan + ORDRE_PIECES.index(Cavalier)]
+    for d_ligne, d_colonne in DIRECTIONS_CAVALIER:
+        compte += _decaler(cavaliers, d_ligne, d_colonne) & accessibles
+    
+    dames = pieces[:, premier_plan + ORDRE_PIECES.index(Reine)]
+    fous = pieces[:, premier_plan + ORDRE_PIECES.index(Fou)] | dames
+    tours = pieces[:, premier_plan + ORDRE_PIECES.index(Tour)] | dames
+    for glisseurs, directions in ((fous, DIRECTIONS_FOU), (tours, DIRECTIONS_TOUR)):
+        for d_ligne, d_colonne in directions:
+            front = glisseurs
+            for _ in range(7):
+                front = _decaler(front, d_ligne, d_colonne)
+                if not front.any():
+                    break
+                compte += front & accessibles
+                front = front & vides
+    return compte.sum(axis=(1, 2), dtype=np.int64)
+
+
+def evaluer_plans(pieces: 'np.ndarray', auxiliaires: Optional['np.ndarray'] = None,
+                  avec_mobilite: bool = False) -> 'np.ndarray':
+    """
+    Évalue un lot de positions données par leurs plans.
+    
+    Args:
+        pieces: Plans des pièces (N, 12, 8, 8)
+        auxiliaires: Plans auxiliaires (N, 6, 8, 8) ; s'ils sont fournis, le
+            score est donné du point de vue du camp au trait, sinon des blancs
+        avec_mobilite: Ajoute le terme de mobilité
+        
+    Returns:
+        Scores en centièmes de pion (N,), égaux à evaluation.evaluer()
+    """
+    _verifier_numpy()
+    pieces = np.asarray(pieces).astype(np.bool_, copy=False)
+    nombre = len(pieces)
+    
+    scores = pieces.reshape(nombre, 12 * 64).astype(np.int64) @ _poids_pieces().reshape(12 * 64)
+    
+    if avec_mobilite:
+        blancs = pieces[:, :6].any(axis=1)
+        noirs = pieces[:, 6:].any(axis=1)
+        vides = ~(blancs | noirs)
+        scores += POIDS_MOBILITE * (_mobilite_camp(pieces, 0, blancs, vides) -
+                                    _mobilite_camp(pieces, 6, noirs, vides))
+    
+    if auxiliaires is not None:
+        trait_blanc = np.asarray(auxiliaires)[:, 0, 0, 0].astype(np.bool_)
+        scores = np.where(trait_blanc, scores, -scores)
+    return scores
+
+
+def evaluer_encodages(encodages: 'np.ndarray', avec_mobilite: bool = False) -> 'np.ndarray':
+    """
+    Évalue un lot de positions encodées, du point de vue du camp au trait.
+    
+    Args:
+        encodages: Tableau (N, TAILLE_POSITION) d'octets
+        avec_mobilite: Ajoute le terme de mobilité
+        
+    Returns:
+        Scores en centièmes de pion (N,)
+    """
+    pieces, auxiliaires = exporter_encodages(encodages)
+    return evaluer_plans(pieces, auxiliaires, avec_mobilite)
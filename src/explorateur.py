@@ -0,0 +1,358 @@
+"""
+Module contenant l'explorateur d'ouvertures construit à partir de parties PGN.
+Les parties sont lues une à une et rejouées avec les règles du jeu ; chaque
+demi-coup ajoute la partie, et son résultat, aux compteurs du couple
+(clé de Zobrist de la position, coup joué). Les compteurs sont agrégés dans
+un dictionnaire de taille bornée : quand il est plein, il est trié et écrit
+sur disque (une série), puis toutes les séries sont fusionnées en un seul
+fichier trié. La mémoire utilisée ne dépend donc pas du nombre de parties.
+
+Format du fichier (petit-boutiste) :
+    en-tête  : FORMAT_ENTETE (signature, nombre n de couples)
+    clés     : n clés de 64 bits, triées (une par couple position-coup)
+    données  : n enregistrements FORMAT_DONNEES (coup encodé, parties,
+               gains des blancs, nulles, gains des noirs), dans le même ordre
+Le fichier est projeté en mémoire et la colonne des clés est vue comme un
+tableau d'entiers : la recherche d'une position est une dichotomie.
+"""
+
+import bisect
+import heapq
+import mmap
+import os
+import shutil
+import struct
+import sys
+import tempfile
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from src.plateau import Plateau
+from src.fen import FEN_INITIALE, plateau_depuis_fen
+from src.zobrist import hacher
+from src.encodage import encoder_coup, decoder_coup
+from src.notation import san_vers_coup
+from src.moteur import couleur_adverse
+from src.pgn import lire_parties
+
+Coup = Tuple[Tuple[int, int], Tuple[int, int], Optional[type]]
+# Coup, parties, gains des blancs, nulles, gains des noirs
+Suite = Tuple[Coup, int, int, int, int]
+
+ENTETE = b'SAEEX\x00\x01\x00'
+FORMAT_ENTETE = '<8sQ'
+TAILLE_ENTETE = struct.calcsize(FORMAT_ENTETE)
+TAILLE_CLE = 8
+FORMAT_DONNEES = struct.Struct('<H4I')
+# Enregistrement d'une série : clé, coup encodé et les quatre compteurs
+FORMAT_SERIE = struct.Struct('<QH4I')
+
+# Indice du compteur incrémenté pour chaque résultat (0 : nombre de parties)
+INDICES_RESULTATS = {'1-0': 1, '1/2-1/2': 2, '0-1': 3}
+
+DEMI_COUPS_MAX = 40
+ENTREES_MAX = 500000
+# Nombre d'enregistrements lus ou écrits à la fois pendant la fusion
+TAILLE_LOT = 4096
+
+
+class Explorateur:
+    """
+    Explorateur d'ouvertures projeté en mémoire.
+    
+    Attributs:
+        chemin (str): Chemin du fichier
+        entrees (int): Nombre de couples (position, coup) du fichier
+    """
+    
+    def __init__(self, chemin: str):
+        """
+        Ouvre un explorateur.
+        
+        Args:
+            chemin: Chemin du fichier produit par construire_explorateur()
+            
+        Raises:
+            ValueError: Si le fichier n'est pas un explorateur valide
+        """
+        self.chemin = chemin
+        with open(chemin, 'rb') as fichier:
+            entete = fichier.read(TAILLE_ENTETE)
+            if len(entete) != TAILLE_ENTETE:
+                raise ValueError(f"Explorateur invalide: {chemin}")
+            signature, self.entrees = struct.unpack(FORMAT_ENTETE, entete)
+            taille = TAILLE_ENTETE + self.entrees * (TAILLE_CLE + FORMAT_DONNEES.size)
+            if signature != ENTETE or os.fstat(fichier.fileno()).st_size != taille:
+                raise ValueError(f"Explorateur invalide: {chemin}")
+            self._donnees = mmap.mmap(fichier.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        self._debut_donnees = TAILLE_ENTETE + self.entrees * TAILLE_CLE
+        if sys.byteorder == 'little':
+            self._cles = memoryview(self._donnees)[TAILLE_ENTETE:self._debut_donnees].cast('Q')
+        else:
+            self._cles = array('Q', self._donnees[TAILLE_ENTETE:self._debut_donnees])
+            self._cles.byteswap()
+    
+    def __enter__(self) -> 'Explorateur':
+        """Retourne l'explorateur au début d'un bloc with."""
+        return self
+    
+    def __exit__(self, *exception):
+        """Ferme l'explorateur."""
+        self.fermer()
+    
+    def fermer(self):
+        """Libère la projection en mémoire."""
+        if isinstance(self._cles, memoryview):
+            self._cles.release()
+        self._donnees.close()
+    
+    def suites_cle(self, cle: int) -> List[Suite]:
+        """
+        Retourne les coups joués depuis une position, désignée par sa clé.
+        
+        Args:
+            cle: Clé de Zobrist de la position (voir zobrist.hacher)
+            
+        Returns:
+            Liste de tuples (coup, parties, gains des blancs, nulles, gains
+            des noirs), du coup le plus joué au moins joué
+        """
+        cles = self._cles
+        indice = bisect.bisect_left(cles, cle)
+        suites = []
+        while indice < self.entrees and cles[indice] == cle:
+            code, parties, blancs, nulles, noirs = FORMAT_DONNEES.unpack_from(
+                self._donnees, self._debut_donnees + indice * FORMAT_DONNEES.size)
+            suites.append((decoder_coup(code), parties, blancs, nulles, noirs))
+            indice += 1
+        suites.sort(key=lambda suite: -suite[1])
+        return suites
+    
+    def suites(self, plateau: Plateau, couleur: str) -> List[Suite]:
+        """
+        Retourne les coups joués depuis une position.
+        
+        Args:
+            plateau: La position
+            couleur: Couleur du camp au trait
+            
+        Returns:
+            Liste de tuples (coup, parties, gains des blancs, nulles, gains
+            des noirs), du coup le plus joué au moins joué
+        """
+        return self.suites_cle(hacher(plateau, couleur))
+    
+    def statistiques(self, plateau: Plateau, couleur: str) -> Tuple[int, int, int, int]:
+        """
+        Retourne le bilan des parties qui ont continué depuis une position.
+        
+        Args:
+            plateau: La position
+            couleur: Couleur du camp au trait
+            
+        Returns:
+            Tuple (parties, gains des blancs, nulles, gains des noirs)
+        """
+        bilan = [0, 0, 0, 0]
+        for suite in self.suites(plateau, couleur):
+            for indice in range(4):
+                bilan[indice] += suite[indice + 1]
+        return tuple(bilan)
+
+
+# --- Construction -----------------------------------------------------------
+
+def construire_explorateur(chemins: Iterable[str], sortie: str,
+                           demi_coups_max: Optional[int] = DEMI_COUPS_MAX,
+                           entrees_max: int = ENTREES_MAX,
+                           dossier_temporaire: Optional[str] = None) -> Tuple[int, int]:
+    """
+    Construit un explorateur à partir de fichiers PGN.
+    
+    Args:
+        chemins: Fichiers PGN à lire
+        sortie: Chemin du fichier à écrire (remplacé s'il existe)
+        demi_coups_max: Nombre de demi-coups retenus par partie (None : tous)
+        entrees_max: Nombre de couples (position, coup) gardés en mémoire
+            avant d'écrire une série sur disque
+        dossier_temporaire: Dossier des séries (celui du système si None)
+        
+    Returns:
+        Tuple (parties ajoutées, parties rejetées car d'une FEN invalide ou
+        contenant un coup illégal parmi les demi-coups retenus)
+        
+    Raises:
+        ValueError: Si entrees_max n'est pas strictement positif
+    """
+    if entrees_max < 1:
+        raise ValueError(f"Nombre d'entrées invalide: {entrees_max}")
+    
+    compteurs: Dict[int, List[int]] = {}
+    ajoutees = rejetees = 0
+    with tempfile.TemporaryDirectory(dir=dossier_temporaire) as dossier:
+        series = []
+        for chemin in chemins:
+            with open(chemin, encoding='utf-8', errors='replace') as fichier:
+                for entetes, coups, resultat in lire_parties(fichier):
+                    cles = _rejouer(entetes, coups, demi_coups_max)
+                    if cles is None:
+                        rejetees += 1
+                        continue
+                    ajoutees += 1
+                    indice = INDICES_RESULTATS.get(resultat)
+                    for cle in cles:
+                        compteur = compteurs.get(cle)
+                        if compteur is None:
+                            # Dictionnaire plein : il devient une série triée sur disque
+                            if len(compteurs) >= entrees_max:
+                                series.append(_ecrire_serie(compteurs, dossier, len(series)))
+                                compteurs = {}
+                            compteur = compteurs[cle] = [0, 0, 0, 0]
+                        compteur[0] += 1
+                        if indice:
+                            compteur[indice] += 1
+        
+        en_memoire = ((cle >> 16, cle & 0xFFFF, *compteurs[cle]) for cle in sorted(compteurs))
+        _fusionner([_lire_serie(chemin) for chemin in series] + [en_memoire], sortie)
+    return ajoutees, rejetees
+
+
+def _rejouer(entetes: Dict[str, str], coups: List[str],
+             demi_coups_max: Optional[int]) -> Optional[List[int]]:
+    """
+    Rejoue une partie et retourne les couples (position, coup) rencontrés.
+    
+    Args:
+        entetes: En-têtes de la partie (la position de départ est lue dans 'FEN')
+        coups: Coups en notation SAN
+        demi_coups_max: Nombre de demi-coups retenus (None : tous)
+        
+    Returns:
+        Liste des entiers clé << 16 | coup encodé, ou None si un coup est
+        illégal ou la FEN invalide
+    """
+    try:
+        plateau, couleur = plateau_depuis_fen(entetes.get('FEN', FEN_INITIALE))
+        cles = []
+        for san in coups[:demi_coups_max]:
+            depart, arrivee, promotion = san_vers_coup(plateau, couleur, san)
+            cles.append(hacher(plateau, couleur) << 16 | encoder_coup(depart, arrivee, promotion))
+            plateau.jouer_coup(depart, arrivee, promotion)
+            couleur = couleur_adverse(couleur)
+    except ValueError:
+        return None
+    return cles
+
+
+def _ecrire_serie(compteurs: Dict[int, List[int]], dossier: str, numero: int) -> str:
+    """
+    Écrit les compteurs, triés par clé puis par coup, dans un fichier de série.
+    
+    Returns:
+        Chemin du fichier écrit
+    """
+    chemin = os.path.join(dossier, f'serie{numero}.bin')
+    with open(chemin, 'wb') as fichier:
+        fichier.write(b''.join(FORMAT_SERIE.pack(cle >> 16, cle & 0xFFFF, *compteurs[cle])
+                               for cle in sorted(compteurs)))
+    return chemin
+
+
+def _lire_serie(chemin: str) -> Iterator[Tuple[int, int, int, int, int, int]]:
+    """Relit une série par lots de TAILLE_LOT enregistrements."""
+    with open(chemin, 'rb') as fichier:
+        while True:
+            bloc = fichier.read(FORMAT_SERIE.size * TAILLE_LOT)
+            if not bloc:
+                return
+            yield from FORMAT_SERIE.iter_unpack(bloc)
+
+
+def _fusionner(series: List[Iterable[Tuple[int, int, int, int, int, int]]], sortie: str) -> int:
+    """
+    Fusionne des séries triées en un fichier d'explorateur.
+    
+    Les enregistrements d'un même couple (position, coup) présents dans
+    plusieurs séries sont additionnés. Les clés sont écrites directement
+    dans le fichier, les données dans un fichier temporaire recopié à la fin.
+    
+    Args:
+        series: Séries triées de tuples (clé, coup, parties, blancs, nulles, noirs)
+        sortie: Chemin du fichier à écrire
+        
+    Returns:
+        Le nombre de couples écrits
+    """
+    chemin_temporaire = sortie + '.tmp'
+    entrees = 0
+    with open(chemin_temporaire, 'wb') as fichier, tempfile.TemporaryFile() as donnees:
+        fichier.write(struct.pack(FORMAT_ENTETE, ENTETE, 0))
+        cles = array('Q')
+        lot = []
+        
+        def vider():
+            if sys.byteorder != 'little':
+                cles.byteswap()
+            fichier.write(cles.tobytes())
+            donnees.write(b''.join(lot))
+            del cles[:], lot[:]
+        
+        courant = None
+        for enregistrement in heapq.merge(*series):
+            if courant is not None and courant[0] == enregistrement[0] and \
+                    courant[1] == enregistrement[1]:
+                for indice in range(2, 6):
+                    courant[indice] += enregistrement[indice]
+                continue
+            if courant is not None:
+                cles.append(courant[0])
+                lot.append(FORMAT_DONNEES.pack(*courant[1:]))
+                entrees += 1
+                if len(lot) >= TAILLE_LOT:
+                    vider()
+            courant = list(enregistrement)
+        if courant is not None:
+            cles.append(courant[0])
+            lot.append(FORMAT_DONNEES.pack(*courant[1:]))
+            entrees += 1
+        vider()
+        
+        donnees.seek(0)
+        shutil.copyfileobj(donnees, fichier)
+        fichier.seek(0)
+        fichier.write(struct.pack(FORMAT_ENTETE, ENTETE, entrees))
+    os.replace(chemin_temporaire, sortie)
+    return entrees
+
+
+def main():
+    """Construit ou consulte un explorateur depuis la ligne de commande."""
+    import argparse
+    from src.notation import coup_vers_san
+    analyseur = argparse.ArgumentParser(description="Explorateur d'ouvertures")
+    analyseur.add_argument('pgn', nargs='*', help="Fichiers PGN à importer")
+    analyseur.add_argument('--sortie', default='ouvertures.exp', help="Fichier de l'explorateur")
+    analyseur.add_argument('--demi-coups', type=int, default=DEMI_COUPS_MAX,
+                           help="Demi-coups retenus par partie (0 : tous)")
+    analyseur.add_argument('--entrees-max', type=int, default=ENTREES_MAX,
+                           help="Couples (position, coup) gardés en mémoire pendant la construction")
+    analyseur.add_argument('--temporaire', default=None, help="Dossier des fichiers temporaires")
+    analyseur.add_argument('--position', default=None,
+                           help="FEN d'une position à consulter ('depart' : position initiale)")
+    arguments = analyseur.parse_args()
+    
+    if arguments.pgn:
+        ajoutees, rejetees = construire_explorateur(
+            arguments.pgn, arguments.sortie, arguments.demi_coups or None,
+            arguments.entrees_max, arguments.temporaire)
+        print(f"{ajoutees} parties importées, {rejetees} rejetées -> {arguments.sortie}")
+    
+    if arguments.position:
+        fen = FEN_INITIALE if arguments.position == 'depart' else arguments.position
+        plateau, couleur = plateau_depuis_fen(fen)
+        with Explorateur(arguments.sortie) as explorateur:
+            for (depart, arrivee, promotion), parties, blancs, nulles, noirs in \
+                    explorateur.suites(plateau, couleur):
+                san = coup_vers_san(plateau, depart, arrivee, promotion)
+                print(f"{san:8} {parties:8}  {100 * blancs / parties:5.1f}% "
+                      f"{100 * nulles / parties:5.1f}% {100 * noirs / parties:5.1f}%")
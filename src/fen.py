@@ -0,0 +1,138 @@
+"""
+Module contenant la conversion entre plateaux et notation FEN.
+La notation FEN décrit une position complète sur une seule ligne :
+placement des pièces, trait, droits de roque et case de prise en passant.
+"""
+
+from typing import Tuple
+from src.plateau import Plateau
+from src.piece import Pion, Tour, Cavalier, Fou, Reine, Roi
+from src.zobrist import droits_roque
+
+
+FEN_INITIALE = 'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1'
+
+LETTRES_PIECES = {'p': Pion, 'r': Tour, 'n': Cavalier, 'b': Fou, 'q': Reine, 'k': Roi}
+PIECES_LETTRES = {classe: lettre for lettre, classe in LETTRES_PIECES.items()}
+
+
+def plateau_depuis_fen(fen: str) -> Tuple[Plateau, str]:
+    """
+    Construit un plateau à partir d'une chaîne FEN.
+    
+    L'état a_bouge des pièces est déduit de la position : un pion hors de
+    sa rangée de départ a bougé, un roi ou une tour n'a pas bougé tant
+    qu'un droit de roque correspondant est indiqué.
+    
+    Args:
+        fen: La position en notation FEN (les compteurs sont facultatifs)
+        
+    Returns:
+        Tuple (plateau, couleur au trait)
+        
+    Raises:
+        ValueError: Si la chaîne FEN est invalide
+    """
+    champs = fen.split()
+    if len(champs) < 2:
+        raise ValueError(f"FEN invalide: {fen}")
+    
+    rangees = champs[0].split('/')
+    if len(rangees) != 8:
+        raise ValueError(f"FEN invalide (8 rangées attendues): {fen}")
+    
+    plateau = Plateau()
+    for ligne, rangee in enumerate(rangees):
+        colonne = 0
+        for caractere in rangee:
+            if caractere.isdigit():
+                colonne += int(caractere)
+                continue
+            classe = LETTRES_PIECES.get(caractere.lower())
+            if classe is None or colonne > 7:
+                raise ValueError(f"FEN invalide: {fen}")
+            couleur = 'blanc' if caractere.isupper() else 'noir'
+            piece = classe(couleur, (ligne, colonne))
+            piece.a_bouge = True
+            if classe is Pion:
+                piece.a_bouge = ligne != (6 if couleur == 'blanc' else 1)
+            plateau.grille[ligne][colonne] = piece
+            colonne += 1
+        if colonne != 8:
+            raise ValueError(f"FEN invalide (rangée incomplète): {fen}")
+    
+    if champs[1] not in ('w', 'b'):
+        raise ValueError(f"Trait invalide: {champs[1]}")
+    couleur_trait = 'blanc' if champs[1] == 'w' else 'noir'
+    
+    roques = champs[2] if len(champs) > 2 else '-'
+    appliquer_droits_roque(plateau, tuple(lettre in roques for lettre in 'KQkq'))
+    
+    en_passant = champs[3] if len(champs) > 3 else '-'
+    if en_passant != '-':
+        if len(en_passant) != 2 or en_passant[0] not in 'abcdefgh' or en_passant[1] not in '36':
+            raise ValueError(f"Case de prise en passant invalide: {en_passant}")
+        plateau.position_en_passant = (8 - int(en_passant[1]), ord(en_passant[0]) - ord('a'))
+    
+    return plateau, couleur_trait
+
+
+def appliquer_droits_roque(plateau: Plateau, droits: Tuple[bool, bool, bool, bool]):
+    """
+    Marque comme n'ayant pas bougé le roi et la tour de chaque droit de roque.
+    
+    Args:
+        plateau: Le plateau (toutes ses pièces sont supposées avoir bougé)
+        droits: Droits de roque (K, Q, k, q), comme retournés par droits_roque()
+    """
+    for droit, (ligne, colonne_tour) in zip(droits, ((7, 7), (7, 0), (0, 7), (0, 0))):
+        if not droit:
+            continue
+        roi = plateau.grille[ligne][4]
+        tour = plateau.grille[ligne][colonne_tour]
+        if isinstance(roi, Roi) and isinstance(tour, Tour):
+            roi.a_bouge = False
+            tour.a_bouge = False
+
+
+def fen_depuis_plateau(plateau: Plateau, couleur: str,
+                       demi_coups: int = 0, numero_coup: int = 1) -> str:
+    """
+    Convertit un plateau en chaîne FEN.
+    
+    Args:
+        plateau: Le plateau de jeu
+        couleur: Couleur du camp au trait
+        demi_coups: Nombre de demi-coups depuis la dernière capture ou poussée de pion
+        numero_coup: Numéro du coup complet
+        
+    Returns:
+        La position en notation FEN
+    """
+    rangees = []
+    for ligne in range(8):
+        rangee = ''
+        vides = 0
+        for colonne in range(8):
+            piece = plateau.grille[ligne][colonne]
+            if piece is None:
+                vides += 1
+                continue
+            if vides:
+                rangee += str(vides)
+                vides = 0
+            lettre = PIECES_LETTRES[type(piece)]
+            rangee += lettre.upper() if piece.couleur == 'blanc' else lettre
+        if vides:
+            rangee += str(vides)
+        rangees.append(rangee)
+    
+    roques = ''.join(lettre for lettre, droit in zip('KQkq', droits_roque(plateau)) if droit)
+    
+    en_passant = '-'
+    if plateau.position_en_passant is not None:
+        ligne, colonne = plateau.position_en_passant
+        en_passant = chr(ord('a') + colonne) + str(8 - ligne)
+    
+    trait = 'w' if couleur == 'blanc' else 'b'
+    return f"{'/'.join(rangees)} {trait} {roques or '-'} {en_passant} {demi_coups} {numero_coup}"
@@ -0,0 +1,118 @@
+"""
+Module contenant la gestion du temps du moteur sous une cadence.
+Pour chaque coup, deux limites sont calculées à partir du temps restant,
+de l'incrément et du numéro du coup :
+- la limite souple : une nouvelle itération de l'approfondissement
+  itératif n'est pas commencée au-delà ;
+- la limite dure : la recherche en cours est interrompue et le résultat
+  de la dernière itération complète est joué.
+La limite souple est allongée quand le meilleur coup change d'une
+itération à l'autre ou que le score chute (recherche instable).
+"""
+
+import time
+from typing import Optional, Tuple
+
+# Coups à prévoir sans indication de la cadence : beaucoup au début, au moins ce minimum ensuite
+COUPS_PREVUS_DEBUT = 40
+COUPS_PREVUS_MIN = 20
+# Réserve gardée pour le temps de communication et d'affichage
+MARGE = 0.05
+# La limite dure ne dépasse jamais cette fraction du temps restant
+FRACTION_DURE = 0.4
+FACTEUR_DUR = 3.0
+# Allongement de la limite souple en cas d'instabilité
+FACTEUR_INSTABILITE_MAX = 2.5
+CHUTE_SCORE = 50
+# Une itération coûte plusieurs fois la précédente : ne pas commencer celle
+# qui n'aurait aucune chance de finir avant la limite souple (au-delà de cette part)
+PART_ITERATION = 0.5
+
+
+def allouer(temps_restant: float, increment: float = 0.0, numero_coup: int = 1,
+            coups_restants: Optional[int] = None) -> Tuple[float, float]:
+    """
+    Calcule les limites souple et dure d'un coup.
+    
+    Args:
+        temps_restant: Temps restant à la pendule en secondes
+        increment: Incrément par coup en secondes
+        numero_coup: Numéro du coup dans la partie (à partir de 1)
+        coups_restants: Coups à jouer avant le prochain contrôle (inconnu si None)
+        
+    Returns:
+        Tuple (limite souple, limite dure) en secondes
+    """
+    disponible = max(0.0, temps_restant - MARGE)
+    if coups_restants is None:
+        coups_restants = max(COUPS_PREVUS_MIN, COUPS_PREVUS_DEBUT - numero_coup // 2)
+    
+    souple = disponible / max(1, coups_restants) + 0.8 * increment
+    dure = min(souple * FACTEUR_DUR, disponible * FRACTION_DURE + increment, disponible)
+    return min(souple, dure), dure
+
+
+class GestionTemps:
+    """
+    Décide, itération après itération, si la recherche d'un coup doit continuer.
+    
+    Attributs:
+        limite_souple (float): Pas de nouvelle itération au-delà (en secondes, avant allongement)
+        limite_dure (float): Interruption de la recherche (en secondes)
+        facteur_instabilite (float): Allongement courant de la limite souple
+    """
+    
+    def __init__(self, temps_restant: float, increment: float = 0.0, numero_coup: int = 1,
+                 coups_restants: Optional[int] = None):
+        """
+        Initialise la gestion du temps d'un coup.
+        
+        Args:
+            temps_restant: Temps restant à la pendule en secondes
+            increment: Incrément par coup en secondes
+            numero_coup: Numéro du coup dans la partie (à partir de 1)
+            coups_restants: Coups à jouer avant le prochain contrôle (inconnu si None)
+        """
+        self.limite_souple, self.limite_dure = allouer(temps_restant, increment, numero_coup,
+                                                       coups_restants)
+        self.facteur_instabilite = 1.0
+        self.debut: Optional[float] = None
+        self._dernier_coup = None
+        self._dernier_score: Optional[int] = None
+    
+    def demarrer(self):
+        """Lance le décompte : les limites comptent à partir de cet instant."""
+        self.debut = time.perf_counter()
+    
+    def ecoule(self) -> float:
+        """Retourne le temps écoulé depuis demarrer()."""
+        if self.debut is None:
+            return 0.0
+        return time.perf_counter() - self.debut
+    
+    def temps_dur_restant(self) -> float:
+        """Retourne le temps restant avant la limite dure."""
+        return max(0.0, self.limite_dure - self.ecoule())
+    
+    def continuer(self, coup, score: int) -> bool:
+        """
+        Enregistre le résultat d'une itération et décide s'il faut en commencer une autre.
+        
+        Args:
+            coup: Meilleur coup de l'itération
+            score: Score de l'itération
+            
+        Returns:
+            True si une nouvelle itération peut être commencée
+        """
+        if self._dernier_coup is not None and coup != self._dernier_coup:
+            self.facteur_instabilite = min(FACTEUR_INSTABILITE_MAX, self.facteur_instabilite * 1.5)
+        elif self._dernier_score is not None and score < self._dernier_score - CHUTE_SCORE:
+            self.facteur_instabilite = min(FACTEUR_INSTABILITE_MAX, self.facteur_instabilite * 1.25)
+        else:
+            # Le coup se confirme : l'allongement se résorbe progressivement
+            self.facteur_instabilite = max(1.0, self.facteur_instabilite * 0.9)
+        self._dernier_coup, self._dernier_score = coup, score
+        
+        limite = min(self.limite_souple * self.facteur_instabilite, self.limite_dure)
+        return self.ecoule() < PART_ITERATION * limite
@@ -2,10 +2,14 @@
 Module contenant la classe Jeu qui gère la logique du jeu d'échecs.
 """
 
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from src.plateau import Plateau
 from src.joueur import Joueur
 from src.piece import Piece, Pion, Tour, Roi, Reine, Fou, Cavalier
+from src.fen import FEN_INITIALE, plateau_depuis_fen, fen_depuis_plateau
+from src.notation import coup_vers_san, notation_vers_case
+from src.pendule import Pendule
+from src.gestion_temps import GestionTemps
 
 
 class Jeu:
@@ -17,8 +21,13 @@ class Jeu:
         joueur_blanc (Joueur): Joueur avec les pièces blanches
         joueur_noir (Joueur): Joueur avec les pièces noires
         joueur_actuel (Joueur): Le joueur dont c'est le tour
-        historique (List[Tuple]): Historique des coups joués
+        historique (List[Tuple]): Historique des coups joués (départ, arrivée, type de la pièce)
+        promotions (Dict[int, type]): Pièce choisie à chaque promotion, par indice dans historique
+        fen_depart (str): Position de départ de la partie
         partie_terminee (bool): Indique si la partie est terminée
+        moteur (Optional[MoteurAsynchrone]): Moteur adverse (None entre deux joueurs humains)
+        pendule (Optional[Pendule]): Pendule de la partie (None sans cadence)
+        stockage (Optional[Stockage]): Base où la partie est enregistrée après chaque tour (ou None)
     """
     
     def __init__(self, nom_joueur1: str = "Joueur 1", nom_joueur2: str = "Joueur 2"):
@@ -37,7 +46,90 @@ class Jeu:
         self.joueur_actuel = self.joueur_blanc
         
         self.historique: List[Tuple] = []
+        self.promotions: Dict[int, type] = {}
+        self.fen_depart = FEN_INITIALE
         self.partie_terminee = False
+        
+        self.moteur = None
+        self.couleur_moteur: Optional[str] = None
+        self.temps_moteur: Optional[float] = None
+        self.ponderation = False
+        self._reponse_ponderee = None
+        self.pendule: Optional[Pendule] = None
+        self.stockage = None
+        self.identifiant_stockage: Optional[int] = None
+    
+    def fixer_cadence(self, base: float, increment: float = 0.0):
+        """
+        Joue la partie à la pendule ; le cadran du joueur au trait démarre aussitôt.
+        
+        Args:
+            base: Temps de chaque joueur en secondes
+            increment: Temps ajouté après chaque coup en secondes
+        """
+        self.pendule = Pendule(base, increment)
+        self.pendule.demarrer(self.joueur_actuel.couleur)
+    
+    def gestion_temps(self) -> Optional[GestionTemps]:
+        """
+        Prépare la gestion du temps du coup à jouer d'après la pendule.
+        
+        Returns:
+            La gestion du temps du joueur au trait, ou None sans cadence
+        """
+        if self.pendule is None:
+            return None
+        return GestionTemps(self.pendule.temps_restant(self.joueur_actuel.couleur),
+                            self.pendule.increment, len(self.historique) // 2 + 1)
+    
+    def affronter_moteur(self, moteur, couleur: str = 'noir', temps_par_coup: Optional[float] = 3.0,
+                         ponderation: bool = True):
+        """
+        Confie l'une des couleurs au moteur.
+        
+        Args:
+            moteur: Le moteur (MoteurAsynchrone, voir src/ponderation.py)
+            couleur: Couleur jouée par le moteur
+            temps_par_coup: Temps de réflexion du moteur en secondes
+            ponderation: Si True, le moteur réfléchit pendant la saisie du joueur
+        """
+        self.moteur = moteur
+        self.couleur_moteur = couleur
+        self.temps_moteur = temps_par_coup
+        self.ponderation = ponderation
+    
+    @classmethod
+    def depuis_fen(cls, fen: str, nom_joueur1: str = "Joueur 1",
+                   nom_joueur2: str = "Joueur 2") -> 'Jeu':
+        """
+        Crée une partie à partir d'une position en notation FEN.
+        
+        Args:
+            fen: La position de départ
+            nom_joueur1: Nom du premier joueur (blancs)
+            nom_joueur2: Nom du deuxième joueur (noirs)
+            
+        Returns:
+            Une nouvelle partie dont le trait correspond à la FEN
+            
+        Raises:
+            ValueError: Si la chaîne FEN est invalide
+        """
+        jeu = cls(nom_joueur1, nom_joueur2)
+        jeu.plateau, couleur = plateau_depuis_fen(fen)
+        jeu.joueur_actuel = jeu.joueur_blanc if couleur == 'blanc' else jeu.joueur_noir
+        jeu.fen_depart = fen
+        return jeu
+    
+    def vers_fen(self) -> str:
+        """
+        Retourne la position courante en notation FEN.
+        
+        Returns:
+            La position en notation FEN
+        """
+        return fen_depuis_plateau(self.plateau, self.joueur_actuel.couleur,
+                                  numero_coup=len(self.historique) // 2 + 1)
     
     def demarrer(self):
         """Lance la partie et gère la boucle de jeu principale."""
@@ -52,16 +144,36 @@ class Jeu:
         
         while not self.partie_terminee:
             self.jouer_tour()
+            self._enregistrer()
+        
+        if self.moteur is not None:
+            self.moteur.annuler_ponderation()
         
         print("\n" + "=" * 50)
         print("         FIN DE LA PARTIE")
         print("=" * 50)
     
+    def _enregistrer(self):
+        """Enregistre la partie dans la base associée (s'il y en a une)."""
+        if self.stockage is None:
+            return
+        self.identifiant_stockage = self.stockage.enregistrer(self, self.identifiant_stockage)
+        self.stockage.valider()
+    
     def jouer_tour(self):
         """Gère un tour de jeu complet."""
         # Afficher le plateau
         self.plateau.afficher()
         
+        if self.pendule is not None:
+            print(f"\n⏱  {self.pendule}")
+            tombe = self.pendule.couleur_tombee()
+            if tombe is not None:
+                gagnant = self.joueur_noir if tombe == 'blanc' else self.joueur_blanc
+                print(f"\n*** TEMPS ÉCOULÉ ! {gagnant.nom} gagne ! ***")
+                self.partie_terminee = True
+                return
+        
         # Vérifier les conditions de fin de partie
         if self.est_echec_et_mat(self.joueur_actuel.couleur):
             adversaire = self.joueur_noir if self.joueur_actuel == self.joueur_blanc else self.joueur_blanc
@@ -78,6 +190,10 @@ class Jeu:
         if self.est_echec(self.joueur_actuel.couleur):
             print(f"\n⚠️  ÉCHEC ! Le roi {self.joueur_actuel.couleur} est en danger !")
         
+        if self.moteur is not None and self.joueur_actuel.couleur == self.couleur_moteur:
+            self._jouer_tour_moteur()
+            return
+        
         # Demander au joueur de saisir son coup
         while True:
             try:
@@ -112,81 +228,99 @@ class Jeu:
         
         # Changer de joueur
         self.changer_joueur()
+        
+        # Le moteur réfléchissait peut-être déjà à la position obtenue
+        if self.moteur is not None:
+            self._reponse_ponderee = self.moteur.conclure_ponderation(
+                self.plateau, self.joueur_actuel.couleur, self.temps_moteur, self.gestion_temps())
     
-    def effectuer_coup(self, depart: Tuple[int, int], arrivee: Tuple[int, int]) -> bool:
+    def _jouer_tour_moteur(self):
+        """Fait jouer le moteur, puis le fait réfléchir à la réponse attendue du joueur."""
+        couleur = self.joueur_actuel.couleur
+        resultat = self._reponse_ponderee
+        self._reponse_ponderee = None
+        if resultat is None or resultat[0] is None:
+            resultat = self.moteur.chercher(self.plateau, couleur, self.temps_moteur,
+                                            self.gestion_temps())
+        coup, _, variante = resultat
+        
+        depart, arrivee = coup
+        print(f"\n{self.joueur_actuel.nom} ({couleur}) joue "
+              f"{Joueur.position_vers_notation(depart)} {Joueur.position_vers_notation(arrivee)}")
+        self.jouer_coup(depart, arrivee)
+        
+        # Analyser dès maintenant la position qui suivrait la réponse attendue
+        if self.ponderation and len(variante) > 1 and variante[0] == coup:
+            self.moteur.ponderer(self.plateau, self.joueur_actuel.couleur, variante[1])
+    
+    def verifier_coup(self, depart: Tuple[int, int], arrivee: Tuple[int, int]) -> Optional[str]:
         """
-        Effectue un coup si celui-ci est valide.
+        Vérifie qu'un coup du joueur actuel est légal, sans rien afficher.
         
         Args:
             depart: Position de départ (ligne, colonne)
             arrivee: Position d'arrivée (ligne, colonne)
             
         Returns:
-            True si le coup a été effectué, False sinon
+            None si le coup est légal, sinon le message d'erreur
         """
         # Vérifier que la position de départ contient une pièce du joueur actuel
         piece = self.plateau.obtenir_piece(depart)
         
         if piece is None:
-            print("❌ Il n'y a pas de pièce à cette position.")
-            return False
+            return "Il n'y a pas de pièce à cette position."
         
         if piece.couleur != self.joueur_actuel.couleur:
-            print("❌ Cette pièce n'est pas la vôtre.")
-            return False
+            return "Cette pièce n'est pas la vôtre."
         
-        # Vérifier que le mouvement est dans les mouvements possibles
-        if arrivee not in piece.mouvements_possibles(self.plateau):
-            print("❌ Ce mouvement n'est pas valide pour cette pièce.")
-            return False
+        # Vérifier le déplacement de cette seule pièce (sans générer tous ses mouvements)
+        if not self.plateau.est_coup_pseudo_legal(depart, arrivee):
+            return "Ce mouvement n'est pas valide pour cette pièce."
         
-        # Simuler le mouvement pour vérifier qu'il ne met pas le roi en échec
-        plateau_test = self.plateau.copier()
+        # Jouer le coup puis l'annuler pour vérifier qu'il ne met pas le roi en échec
+        coup_joue = self.plateau.jouer_coup(depart, arrivee)
+        en_echec = self._est_roi_en_echec(self.plateau, piece.couleur)
+        self.plateau.annuler_coup(coup_joue)
+        if en_echec:
+            return "Ce coup mettrait votre roi en échec."
         
-        # Gérer l'en passant dans la simulation
-        if isinstance(piece, Pion) and arrivee == self.plateau.position_en_passant:
-            self._effectuer_en_passant_sur_plateau(plateau_test, arrivee, piece.couleur)
+        # Vérifier que le roi ne roque ni en échec ni en traversant une case attaquée
+        if isinstance(piece, Roi) and abs(arrivee[1] - depart[1]) == 2:
+            couleur_adverse = 'noir' if piece.couleur == 'blanc' else 'blanc'
+            passage = (depart[0], (depart[1] + arrivee[1]) // 2)
+            if self.plateau.est_case_attaquee(depart, couleur_adverse) or \
+               self.plateau.est_case_attaquee(passage, couleur_adverse):
+                return "Le roi ne peut pas roquer en traversant une case en échec."
         
-        plateau_test.deplacer_piece(depart, arrivee)
+        return None
+    
+    def effectuer_coup(self, depart: Tuple[int, int], arrivee: Tuple[int, int]) -> bool:
+        """
+        Effectue un coup si celui-ci est valide.
         
-        if self._est_roi_en_echec(plateau_test, self.joueur_actuel.couleur):
-            print("❌ Ce coup mettrait votre roi en échec.")
+        Args:
+            depart: Position de départ (ligne, colonne)
+            arrivee: Position d'arrivée (ligne, colonne)
+            
+        Returns:
+            True si le coup a été effectué, False sinon
+        """
+        erreur = self.verifier_coup(depart, arrivee)
+        if erreur is not None:
+            print(f"❌ {erreur}")
             return False
         
+        piece = self.plateau.obtenir_piece(depart)
+        
         # Gérer le roque
         if isinstance(piece, Roi) and abs(arrivee[1] - depart[1]) == 2:
             # C'est un roque
             ligne = depart[0]
             
-            # Vérifier que le roi ne traverse pas une case en échec
             if arrivee[1] > depart[1]:  # Petit roque
-                # Vérifier les cases intermédiaires
-                for col in range(depart[1], depart[1] + 3):
-                    plateau_intermediaire = self.plateau.copier()
-                    roi_test = plateau_intermediaire.obtenir_piece(depart)
-                    plateau_intermediaire.retirer_piece(depart)
-                    plateau_intermediaire.placer_piece(roi_test, (ligne, col))
-                    
-                    if self._est_roi_en_echec(plateau_intermediaire, self.joueur_actuel.couleur):
-                        print("❌ Le roi ne peut pas roquer en traversant une case en échec.")
-                        return False
-                
-                # Déplacer la tour
                 tour_depart = (ligne, 7)
                 tour_arrivee = (ligne, 5)
             else:  # Grand roque
-                # Vérifier les cases intermédiaires
-                for col in range(depart[1] - 2, depart[1] + 1):
-                    plateau_intermediaire = self.plateau.copier()
-                    roi_test = plateau_intermediaire.obtenir_piece(depart)
-                    plateau_intermediaire.retirer_piece(depart)
-                    plateau_intermediaire.placer_piece(roi_test, (ligne, col))
-                    
-                    if self._est_roi_en_echec(plateau_intermediaire, self.joueur_actuel.couleur):
-                        print("❌ Le roi ne peut pas roquer en traversant une case en échec.")
-                        return False
-                
-                # Déplacer la tour
                 tour_depart = (ligne, 0)
                 tour_arrivee = (ligne, 3)
             
@@ -213,8 +347,8 @@ class Jeu:
         # Gérer la position en passant pour le prochain coup
         if isinstance(piece, Pion) and abs(arrivee[0] - depart[0]) == 2:
             # Le pion a avancé de deux cases, l'en passant est possible au prochain tour
-            direction = -1 if piece.couleur == 'blanc' else 1
-            self.plateau.position_en_passant = (arrivee[0] + direction, arrivee[1])
+            # sur la case qu'il a traversée
+            self.plateau.position_en_passant = ((depart[0] + arrivee[0]) // 2, arrivee[1])
         
         # Gérer la promotion du pion
         if isinstance(piece, Pion):
@@ -222,12 +356,82 @@ class Jeu:
             if (piece.couleur == 'blanc' and ligne_arrivee == 0) or \
                (piece.couleur == 'noir' and ligne_arrivee == 7):
                 self._promouvoir_pion(arrivee)
+                self.promotions[len(self.historique)] = type(self.plateau.obtenir_piece(arrivee))
         
         # Ajouter le coup à l'historique
-        self.historique.append((depart, arrivee, piece))
+        self.historique.append((depart, arrivee, type(piece)))
         
         return True
     
+    def jouer_coup(self, depart: Tuple[int, int], arrivee: Tuple[int, int],
+                   promotion: Optional[type] = None) -> Optional[str]:
+        """
+        Joue un coup sans affichage ni saisie, puis passe au joueur suivant.
+        
+        Utilisé lorsque la partie est pilotée par un programme (serveur,
+        moteur, tests) plutôt que par un joueur dans le terminal.
+        
+        Args:
+            depart: Position de départ (ligne, colonne)
+            arrivee: Position d'arrivée (ligne, colonne)
+            promotion: Classe de la pièce de promotion (Reine si None)
+            
+        Returns:
+            None si le coup a été joué, sinon le message d'erreur
+        """
+        erreur = self.verifier_coup(depart, arrivee)
+        if erreur is not None:
+            return erreur
+        
+        piece = self.plateau.obtenir_piece(depart)
+        self.plateau.jouer_coup(depart, arrivee, promotion)
+        if isinstance(piece, Pion) and arrivee[0] in (0, 7):
+            self.promotions[len(self.historique)] = promotion or Reine
+        self.historique.append((depart, arrivee, type(piece)))
+        self.changer_joueur()
+        return None
+    
+    def resultat_pgn(self) -> str:
+        """
+        Retourne le résultat de la partie au format PGN.
+        
+        Returns:
+            '1-0', '0-1', '1/2-1/2' ou '*' si la partie n'est pas terminée
+        """
+        if not self.partie_terminee:
+            return '*'
+        fin = self.resultat()
+        if fin == 'pat':
+            return '1/2-1/2'
+        # Échec et mat ou abandon : le joueur au trait a perdu
+        perdant = self.pendule.couleur_tombee() if fin == 'temps_depasse' else self.joueur_actuel.couleur
+        return '0-1' if perdant == 'blanc' else '1-0'
+    
+    def coups_joues(self) -> List[Tuple[Tuple[int, int], Tuple[int, int], Optional[type]]]:
+        """
+        Retourne les coups joués depuis la position de départ.
+        
+        Returns:
+            Liste de tuples (position de départ, position d'arrivée, classe de promotion ou None)
+        """
+        return [(depart, arrivee, self.promotions.get(indice))
+                for indice, (depart, arrivee, _) in enumerate(self.historique)]
+    
+    def resultat(self) -> Optional[str]:
+        """
+        Détermine si la partie est finie pour le joueur au trait.
+        
+        Returns:
+            'echec_et_mat', 'pat', 'temps_depasse' (le camp tombé est donné
+            par pendule.couleur_tombee()) ou None si la partie continue
+        """
+        if self.pendule is not None and self.pendule.couleur_tombee() is not None:
+            return 'temps_depasse'
+        couleur = self.joueur_actuel.couleur
+        if self.obtenir_tous_mouvements_legaux(couleur):
+            return None
+        return 'echec_et_mat' if self.est_echec(couleur) else 'pat'
+    
     def _promouvoir_pion(self, position: Tuple[int, int]):
         """
         Gère la promotion d'un pion.
@@ -308,15 +512,9 @@ class Jeu:
         if not position_roi:
             return False
         
-        # Vérifier si une pièce adverse peut attaquer le roi
+        # Chercher une pièce adverse attaquant la case du roi
         couleur_adverse = 'noir' if couleur == 'blanc' else 'blanc'
-        pieces_adverses = plateau.obtenir_toutes_pieces(couleur_adverse)
-        
-        for piece in pieces_adverses:
-            if position_roi in piece.mouvements_possibles(plateau):
-                return True
-        
-        return False
+        return plateau.est_case_attaquee(position_roi, couleur_adverse)
     
     def est_echec_et_mat(self, couleur: str) -> bool:
         """
@@ -364,24 +562,32 @@ class Jeu:
         """
         mouvements_legaux = []
         pieces = self.plateau.obtenir_toutes_pieces(couleur)
+        couleur_adverse = 'noir' if couleur == 'blanc' else 'blanc'
         
         for piece in pieces:
             depart = piece.position
-            mouvements_possibles = piece.mouvements_possibles(self.plateau)
+            mouvements_possibles = self.plateau.mouvements(depart)
             
             for arrivee in mouvements_possibles:
-                # Simuler le mouvement
-                plateau_test = self.plateau.copier()
-                plateau_test.deplacer_piece(depart, arrivee)
+                # Le roi ne roque ni en échec ni en traversant une case attaquée
+                if isinstance(piece, Roi) and abs(arrivee[1] - depart[1]) == 2:
+                    passage = (depart[0], (depart[1] + arrivee[1]) // 2)
+                    if self.plateau.est_case_attaquee(depart, couleur_adverse) or \
+                       self.plateau.est_case_attaquee(passage, couleur_adverse):
+                        continue
                 
-                # Vérifier si le roi serait en échec
-                if not self._est_roi_en_echec(plateau_test, couleur):
+                # Jouer le coup sur le plateau puis l'annuler (plus rapide qu'une copie)
+                coup_joue = self.plateau.jouer_coup(depart, arrivee)
+                if not self._est_roi_en_echec(self.plateau, couleur):
                     mouvements_legaux.append((depart, arrivee))
+                self.plateau.annuler_coup(coup_joue)
         
         return mouvements_legaux
     
     def changer_joueur(self):
-        """Passe au joueur suivant."""
+        """Passe au joueur suivant (et appuie sur la pendule s'il y en a une)."""
+        if self.pendule is not None:
+            self.pendule.appuyer()
         self.joueur_actuel = self.joueur_noir if self.joueur_actuel == self.joueur_blanc else self.joueur_blanc
     
     def afficher_historique(self):
@@ -391,12 +597,30 @@ class Jeu:
             return
         
         print("\n--- Historique des coups ---")
-        for i, (depart, arrivee, piece) in enumerate(self.historique, 1):
-            depart_notation = Joueur.position_vers_notation(depart)
-            arrivee_notation = Joueur.position_vers_notation(arrivee)
-            print(f"{i}. {piece.symbole()} {depart_notation} → {arrivee_notation}")
+        coups = self.coups_san()
+        _, couleur = plateau_depuis_fen(self.fen_depart)
+        if couleur == 'noir':
+            coups.insert(0, '...')
+        for i in range(0, len(coups), 2):
+            print(f"{i // 2 + 1}. {' '.join(coups[i:i + 2])}")
         print("---------------------------\n")
     
+    def coups_san(self) -> List[str]:
+        """
+        Retourne les coups joués en notation algébrique standard.
+        
+        Les coups sont rejoués sur une copie de la position de départ.
+        
+        Returns:
+            Liste des coups en notation SAN (ex: ['e4', 'e5', 'Nf3'])
+        """
+        plateau, _ = plateau_depuis_fen(self.fen_depart)
+        coups = []
+        for depart, arrivee, promotion in self.coups_joues():
+            coups.append(coup_vers_san(plateau, depart, arrivee, promotion))
+            plateau.jouer_coup(depart, arrivee, promotion)
+        return coups
+    
     def _notation_vers_position(self, notation: str) -> Tuple[int, int]:
         """
         Convertit une notation d'échecs en position.
@@ -406,20 +630,8 @@ class Jeu:
             
         Returns:
             Position (ligne, colonne)
+            
+        Raises:
+            ValueError: Si la notation est invalide
         """
-        if len(notation) != 2:
-            raise ValueError(f"Notation invalide: {notation}")
-        
-        colonne_char = notation[0]
-        ligne_char = notation[1]
-        
-        if colonne_char not in 'abcdefgh':
-            raise ValueError(f"Colonne invalide: {colonne_char}")
-        
-        if ligne_char not in '12345678':
-            raise ValueError(f"Ligne invalide: {ligne_char}")
-        
-        colonne = ord(colonne_char) - ord('a')
-        ligne = 8 - int(ligne_char)
-        
-        return (ligne, colonne)
+        return notation_vers_case(notation)
@@ -3,6 +3,7 @@ Module contenant la classe Joueur.
 """
 
 from typing import Tuple
+from src.notation import case_vers_notation, notation_vers_case
 
 
 class Joueur:
@@ -72,25 +73,7 @@ class Joueur:
         Raises:
             ValueError: Si la notation est invalide
         """
-        if len(notation) != 2:
-            raise ValueError(f"Notation invalide: {notation}")
-        
-        colonne_char = notation[0]
-        ligne_char = notation[1]
-        
-        if colonne_char not in 'abcdefgh':
-            raise ValueError(f"Colonne invalide: {colonne_char}")
-        
-        if ligne_char not in '12345678':
-            raise ValueError(f"Ligne invalide: {ligne_char}")
-        
-        # Convertir colonne (a=0, b=1, ..., h=7)
-        colonne = ord(colonne_char) - ord('a')
-        
-        # Convertir ligne (1=7, 2=6, ..., 8=0) - inversé car ligne 8 est en haut
-        ligne = 8 - int(ligne_char)
-        
-        return (ligne, colonne)
+        return notation_vers_case(notation)
     
     @staticmethod
     def position_vers_notation(position: Tuple[int, int]) -> str:
@@ -103,7 +86,4 @@ class Joueur:
         Returns:
             Notation d'échecs (ex: 'e2')
         """
-        ligne, colonne = position
-        colonne_char = chr(ord('a') + colonne)
-        ligne_char = str(8 - ligne)
-        return colonne_char + ligne_char
+        return case_vers_notation(position)
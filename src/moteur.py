@@ -0,0 +1,851 @@
+"""
+Module contenant le moteur de recherche du jeu d'échecs.
+Le moteur explore l'arbre des coups par alpha-bêta puis prolonge les feuilles
+par une recherche de quiescence limitée aux captures et aux promotions.
+L'approfondissement itératif, la table de transposition et les limites de
+temps ou de nœuds permettent de l'utiliser sous une interface de jeu.
+Les techniques de recherche sélective (coup nul, réductions des coups
+tardifs, PVS, extensions d'échec, fenêtres d'aspiration) s'activent une à une.
+"""
+
+import time
+from typing import Callable, List, Tuple, Optional
+from src.plateau import Plateau
+from src.piece import Pion, Roi
+from src.evaluation import evaluer
+from src.transposition import TableTransposition, EXACT, BORNE_INFERIEURE, BORNE_SUPERIEURE
+from src.table_pions import TablePions
+from src.zobrist import hacher, droits_roque
+from src.gestion_temps import GestionTemps
+
+
+Coup = Tuple[Tuple[int, int], Tuple[int, int]]
+
+
+def couleur_adverse(couleur: str) -> str:
+    """Retourne la couleur opposée."""
+    return 'noir' if couleur == 'blanc' else 'blanc'
+
+
+class RechercheInterrompue(Exception):
+    """Exception levée pour interrompre une recherche (arrêt ou limite atteinte)."""
+    pass
+
+
+class Moteur:
+    """
+    Moteur de recherche alpha-bêta (négamax) avec recherche de quiescence.
+    
+    Attributs:
+        profondeur (int): Profondeur de recherche par défaut (en demi-coups)
+        elaguer_captures_perdantes (bool): Ignore en quiescence les captures
+            dont l'échange statique (SEE) est négatif
+        noeuds (int): Nombre de positions visitées lors de la dernière recherche
+        table (TableTransposition): Table de transposition partagée entre les recherches
+        arret_demande (bool): Passe à True pour interrompre la recherche en cours
+        tables_finales (TablesFinales): Tables de finales sondées pendant la recherche (ou None)
+        structure_pions (bool): Ajoute la structure des pions à l'évaluation
+        table_pions (TablePions): Table des structures de pions, partagée entre les recherches
+        coup_nul (bool): Élagage par coup nul
+        reductions (bool): Réductions des coups tardifs (LMR)
+        pvs (bool): Recherche à fenêtre nulle des coups après le premier (PVS)
+        extensions_echec (bool): Prolonge d'un demi-coup les coups qui donnent échec
+        fenetres_aspiration (bool): Cherche chaque itération autour du score de la précédente
+        noeuds_iterations (List[int]): Nœuds de chaque itération complète de la dernière
+            recherche itérative
+    """
+    
+    SCORE_MAT = 100000
+    # Au-delà de ce score, la position est un mat forcé
+    SEUIL_MAT = SCORE_MAT - 1000
+    PROFONDEUR_MAXIMALE = 64
+    # Recherche sélective : réduction du coup nul, coups explorés sans
+    # réduction, profondeur minimale des réductions, demi-largeur de la
+    # fenêtre d'aspiration
+    REDUCTION_COUP_NUL = 2
+    COUPS_SANS_REDUCTION = 3
+    PROFONDEUR_REDUCTION = 3
+    FENETRE_ASPIRATION = 50
+    
+    def __init__(self, profondeur: int = 3, elaguer_captures_perdantes: bool = True,
+                 taille_table_mo: int = 16, tables_finales=None, structure_pions: bool = False,
+                 coup_nul: bool = False, reductions: bool = False, pvs: bool = False,
+                 extensions_echec: bool = False, fenetres_aspiration: bool = False):
+        """
+        Initialise le moteur.
+        
+        Args:
+            profondeur: Profondeur de recherche par défaut
+            elaguer_captures_perdantes: Active l'élagage des captures perdantes
+            taille_table_mo: Taille de la table de transposition en mégaoctets
+            tables_finales: Tables de finales à sonder (TablesFinales ou None)
+            structure_pions: Ajoute la structure des pions à l'évaluation
+            coup_nul: Active l'élagage par coup nul
+            reductions: Active les réductions des coups tardifs
+            pvs: Active la recherche à fenêtre nulle (PVS)
+            extensions_echec: Active les extensions d'échec
+            fenetres_aspiration: Active les fenêtres d'aspiration
+        """
+        self.profondeur = profondeur
+        self.elaguer_captures_perdantes = elaguer_captures_perdantes
+        self.noeuds = 0
+        self.table = TableTransposition(taille_table_mo)
+        self.arret_demande = False
+        self._limites_actives = False
+        self._echeance: Optional[float] = None
+        self._limite_noeuds: Optional[int] = None
+        self.tables_finales = tables_finales
+        self.structure_pions = structure_pions
+        self.table_pions = TablePions()
+        self.coup_nul = coup_nul
+        self.reductions = reductions
+        self.pvs = pvs
+        self.extensions_echec = extensions_echec
+        self.fenetres_aspiration = fenetres_aspiration
+        self.noeuds_iterations: List[int] = []
+        # Nombre de pièces à la racine et captures déjà jouées (sondage des finales)
+        self._pieces_racine = 0
+        self._captures_racine = 0
+    
+    def arreter(self):
+        """Demande l'arrêt de la recherche en cours (appelable depuis un autre fil)."""
+        self.arret_demande = True
+    
+    def fixer_echeance(self, temps_restant: Optional[float]):
+        """
+        Fixe la limite de temps de la recherche en cours (appelable depuis un autre fil).
+        
+        Args:
+            temps_restant: Secondes accordées à partir de maintenant (illimité si None)
+        """
+        self._echeance = time.perf_counter() + temps_restant if temps_restant is not None else None
+    
+    def facteur_branchement(self) -> Optional[float]:
+        """
+        Retourne le facteur de branchement effectif de la dernière recherche itérative.
+        
+        C'est la moyenne géométrique des rapports entre les nœuds de deux
+        itérations successives, soit (N_d / N_1) ** (1 / (d - 1)) pour d
+        itérations complètes : la recherche sélective doit le faire baisser.
+        
+        Returns:
+            Le facteur de branchement, ou None avant deux itérations complètes
+        """
+        iterations = self.noeuds_iterations
+        if len(iterations) < 2 or iterations[0] == 0:
+            return None
+        return (iterations[-1] / iterations[0]) ** (1 / (len(iterations) - 1))
+    
+    def est_en_echec(self, plateau: Plateau, couleur: str) -> bool:
+        """
+        Vérifie si le roi d'une couleur est attaqué.
+        
+        Args:
+            plateau: Le plateau à vérifier
+            couleur: Couleur du roi
+            
+        Returns:
+            True si le roi est en échec, False sinon
+        """
+        position_roi = plateau.trouver_roi(couleur)
+        if position_roi is None:
+            return False
+        return plateau.est_case_attaquee(position_roi, couleur_adverse(couleur))
+    
+    def generer_coups(self, plateau: Plateau, couleur: str,
+                      captures_seulement: bool = False) -> List[Coup]:
+        """
+        Génère les coups pseudo-légaux d'une couleur.
+        
+        Les roques traversant une case attaquée sont déjà écartés ; il reste
+        à vérifier que le coup ne laisse pas le roi en échec.
+        
+        Args:
+            plateau: Le plateau de jeu
+            couleur: Couleur du camp au trait
+            captures_seulement: Ne garder que les captures et les promotions
+            
+        Returns:
+            Liste de tuples (position_depart, position_arrivee)
+        """
+        coups = []
+        adverse = couleur_adverse(couleur)
+        
+        for piece in plateau.obtenir_toutes_pieces(couleur):
+            depart = piece.position
+            for arrivee in plateau.mouvements(depart):
+                if captures_seulement and not self._est_tactique(plateau, piece, arrivee):
+                    continue
+                
+                if isinstance(piece, Roi) and abs(arrivee[1] - depart[1]) == 2:
+                    case_traversee = (depart[0], (depart[1] + arrivee[1]) // 2)
+                    if plateau.est_case_attaquee(depart, adverse) or \
+                       plateau.est_case_attaquee(case_traversee, adverse):
+                        continue
+                
+                coups.append((depart, arrivee))
+        
+        return coups
+    
+    def coups_legaux(self, plateau: Plateau, couleur: str) -> List[Coup]:
+        """
+        Retourne les coups légaux d'une couleur.
+        
+        Args:
+            plateau: Le plateau de jeu
+            couleur: Couleur du camp au trait
+            
+        Returns:
+            Liste de tuples (position_depart, position_arrivee)
+        """
+        legaux = []
+        for depart, arrivee in self.generer_coups(plateau, couleur):
+            coup_joue = plateau.jouer_coup(depart, arrivee)
+            if not self.est_en_echec(plateau, couleur):
+                legaux.append((depart, arrivee))
+            plateau.annuler_coup(coup_joue)
+        return legaux
+    
+    def meilleur_coup(self, jeu) -> Optional[Coup]:
+        """
+        Cherche le meilleur coup pour le joueur au trait d'une partie.
+        
+        Args:
+            jeu: La partie en cours (non modifiée)
+            
+        Returns:
+            Le meilleur coup trouvé ou None s'il n'y a aucun coup légal
+        """
+        coup, _ = self.chercher(jeu.plateau.copier(), jeu.joueur_actuel.couleur)
+        return coup
+    
+    def chercher(self, plateau: Plateau, couleur: str,
+                 profondeur: Optional[int] = None) -> Tuple[Optional[Coup], int]:
+        """
+        Recherche le meilleur coup pour une couleur à profondeur fixe.
+        
+        Le plateau est modifié pendant la recherche puis restauré.
+        
+        Args:
+            plateau: Le plateau de jeu
+            couleur: Couleur du camp au trait
+            profondeur: Profondeur de recherche (profondeur par défaut si None)
+            
+        Returns:
+            Tuple (meilleur coup ou None, score du point de vue de couleur)
+        """
+        if profondeur is None:
+            profondeur = self.profondeur
+        self.noeuds = 0
+        self.noeuds_iterations = []
+        self._limites_actives = False
+        self.table.nouvelle_recherche()
+        return self._chercher_racine(plateau, couleur, profondeur)
+    
+    def chercher_iteratif(self, plateau: Plateau, couleur: str,
+                          profondeur_max: Optional[int] = None,
+                          temps_max: Optional[float] = None,
+                          noeuds_max: Optional[int] = None,
+                          rapport: Optional[Callable] = None,
+                          gestion_temps: Optional[GestionTemps] = None) -> Tuple[Optional[Coup], int]:
+        """
+        Recherche par approfondissement itératif jusqu'à une limite.
+        
+        Chaque itération profite de la table de transposition remplie par la
+        précédente. Si une limite est atteinte ou si arreter() est appelée,
+        le résultat de la dernière itération complète est retourné.
+        
+        Sous une cadence, gestion_temps fournit la limite dure et décide après
+        chaque itération s'il reste le temps d'en commencer une autre.
+        
+        Args:
+            plateau: Le plateau de jeu (non modifié : la recherche travaille sur une copie)
+            couleur: Couleur du camp au trait
+            profondeur_max: Profondeur maximale (illimitée si None)
+            temps_max: Temps maximal en secondes (illimité si None)
+            noeuds_max: Nombre maximal de nœuds (illimité si None)
+            rapport: Fonction appelée après chaque itération avec
+                (profondeur, score, noeuds, secondes écoulées, variante principale)
+            gestion_temps: Gestion du temps du coup (voir src/gestion_temps.py)
+            
+        Returns:
+            Tuple (meilleur coup ou None, score du point de vue de couleur)
+        """
+        # Une recherche interrompue laisse son plateau incohérent : travailler sur une copie
+        plateau_racine = plateau
+        plateau = plateau_racine.copier()
+        debut = self._activer_limites(temps_max, noeuds_max, gestion_temps)
+        
+        meilleur_coup, meilleur_score = None, 0
+        profondeur_max = profondeur_max or self.PROFONDEUR_MAXIMALE
+        
+        for profondeur in range(1, profondeur_max + 1):
+            noeuds_avant = self.noeuds
+            try:
+                coup, score = self._chercher_racine(plateau, couleur, profondeur,
+                                                    meilleur_score if profondeur > 1 else None)
+            except RechercheInterrompue:
+                break
+            
+            self.noeuds_iterations.append(self.noeuds - noeuds_avant)
+            meilleur_coup, meilleur_score = coup, score
+            if rapport is not None:
+                rapport(profondeur, score, self.noeuds, time.perf_counter() - debut,
+                        self.variante_principale(plateau, couleur, profondeur))
+            
+            if coup is None or abs(score) >= self.SEUIL_MAT:
+                break
+            if gestion_temps is not None and not gestion_temps.continuer(coup, score):
+                break
+        
+        self._limites_actives = False
+        
+        if meilleur_coup is None:
+            # Interrompu avant la fin de la première itération : jouer un coup légal
+            coups = self.coups_legaux(plateau_racine.copier(), couleur)
+            if coups:
+                meilleur_coup = coups[0]
+        
+        return meilleur_coup, meilleur_score
+    
+    def chercher_multipv(self, plateau: Plateau, couleur: str, nombre: int = 3,
+                         profondeur_max: Optional[int] = None,
+                         temps_max: Optional[float] = None,
+                         noeuds_max: Optional[int] = None,
+                         rapport: Optional[Callable] = None,
+                         gestion_temps: Optional[GestionTemps] = None) -> List[Tuple[Coup, int, List[Coup]]]:
+        """
+        Recherche les meilleurs coups de la racine et leurs variantes (mode MultiPV).
+        
+        Chaque itération de l'approfondissement classe les 'nombre' meilleurs
+        coups en un seul passage sur la racine (voir _classer_racine), en
+        explorant d'abord les coups classés par l'itération précédente ; la
+        table de transposition sert à toutes les lignes. Les limites se
+        comportent comme dans chercher_iteratif().
+        
+        Args:
+            plateau: Le plateau de jeu (non modifié : la recherche travaille sur une copie)
+            couleur: Couleur du camp au trait
+            nombre: Nombre de lignes
+            profondeur_max: Profondeur maximale (illimitée si None)
+            temps_max: Temps maximal en secondes (illimité si None)
+            noeuds_max: Nombre maximal de nœuds (illimité si None)
+            rapport: Fonction appelée après chaque itération avec
+                (profondeur, lignes, noeuds, secondes écoulées)
+            gestion_temps: Gestion du temps du coup (voir src/gestion_temps.py)
+            
+        Returns:
+            Liste de tuples (coup, score du point de vue de couleur, variante
+            principale commençant par ce coup), du meilleur au moins bon
+        """
+        plateau = plateau.copier()
+        debut = self._activer_limites(temps_max, noeuds_max, gestion_temps)
+        
+        lignes: List[Tuple[Coup, int, List[Coup]]] = []
+        profondeur_max = profondeur_max or self.PROFONDEUR_MAXIMALE
+        
+        for profondeur in range(1, profondeur_max + 1):
+            noeuds_avant = self.noeuds
+            try:
+                classement = self._classer_racine(plateau, couleur, profondeur, nombre,
+                                                  [coup for coup, _, _ in lignes])
+            except RechercheInterrompue:
+                break
+            if not classement:
+                break
+            self.noeuds_iterations.append(self.noeuds - noeuds_avant)
+            
+            lignes = []
+            for score, coup in classement:
+                coup_joue = plateau.jouer_coup(*coup)
+                suite = self.variante_principale(plateau, couleur_adverse(couleur), profondeur - 1)
+                plateau.annuler_coup(coup_joue)
+                lignes.append((coup, score, [coup] + suite))
+            if rapport is not None:
+                rapport(profondeur, lignes, self.noeuds, time.perf_counter() - debut)
+            
+            meilleur_score = classement[0][0]
+            if abs(meilleur_score) >= self.SEUIL_MAT:
+                break
+            if gestion_temps is not None and not gestion_temps.continuer(classement[0][1],
+                                                                         meilleur_score):
+                break
+        
+        self._limites_actives = False
+        
+        if not lignes:
+            # Interrompu avant la fin de la première itération : coups légaux sans score
+            lignes = [(coup, 0, [coup]) for coup in self.coups_legaux(plateau, couleur)[:nombre]]
+        
+        return lignes
+    
+    def analyser(self, jeu, lignes: int = 3, profondeur_max: Optional[int] = None,
+                 temps_max: Optional[float] = None, noeuds_max: Optional[int] = None,
+                 rapport: Optional[Callable] = None) -> List[Tuple[Coup, int, List[Coup]]]:
+        """
+        Analyse la position d'une partie en mode MultiPV.
+        
+        Sans limite, la recherche s'arrête à la profondeur par défaut du moteur.
+        
+        Args:
+            jeu: La partie en cours (non modifiée)
+            lignes: Nombre de lignes
+            profondeur_max: Profondeur maximale (profondeur par défaut si aucune limite)
+            temps_max: Temps maximal en secondes (ou None)
+            noeuds_max: Nombre maximal de nœuds (ou None)
+            rapport: Voir chercher_multipv()
+            
+        Returns:
+            Liste de tuples (coup, score du point de vue du joueur au trait, variante)
+        """
+        if profondeur_max is None and temps_max is None and noeuds_max is None:
+            profondeur_max = self.profondeur
+        return self.chercher_multipv(jeu.plateau, jeu.joueur_actuel.couleur, lignes,
+                                     profondeur_max, temps_max, noeuds_max, rapport)
+    
+    def _activer_limites(self, temps_max: Optional[float], noeuds_max: Optional[int],
+                         gestion_temps: Optional[GestionTemps]) -> float:
+        """
+        Prépare une recherche limitée en temps ou en nœuds.
+        
+        Args:
+            temps_max: Temps maximal en secondes (illimité si None)
+            noeuds_max: Nombre maximal de nœuds (illimité si None)
+            gestion_temps: Gestion du temps du coup (sa limite dure borne temps_max)
+            
+        Returns:
+            L'instant du début de la recherche
+        """
+        debut = time.perf_counter()
+        if gestion_temps is not None:
+            gestion_temps.demarrer()
+            if temps_max is None or gestion_temps.limite_dure < temps_max:
+                temps_max = gestion_temps.limite_dure
+        
+        self.noeuds = 0
+        self.noeuds_iterations = []
+        self.arret_demande = False
+        self._limites_actives = True
+        self._echeance = debut + temps_max if temps_max is not None else None
+        self._limite_noeuds = noeuds_max
+        self.table.nouvelle_recherche()
+        return debut
+    
+    def variante_principale(self, plateau: Plateau, couleur: str,
+                            longueur: int) -> List[Coup]:
+        """
+        Reconstitue la variante principale à partir de la table de transposition.
+        
+        Args:
+            plateau: Le plateau à la racine (restauré à la fin)
+            couleur: Couleur du camp au trait
+            longueur: Nombre maximal de demi-coups
+            
+        Returns:
+            Liste des coups de la variante principale
+        """
+        variante = []
+        coups_joues = []
+        
+        for _ in range(longueur):
+            entree = self.table.sonder(hacher(plateau, couleur))
+            if entree is None or entree[4] is None:
+                break
+            coup = entree[4]
+            if coup not in self.coups_legaux(plateau, couleur):
+                break
+            variante.append(coup)
+            coups_joues.append(plateau.jouer_coup(*coup))
+            couleur = couleur_adverse(couleur)
+        
+        for coup_joue in reversed(coups_joues):
+            plateau.annuler_coup(coup_joue)
+        
+        return variante
+    
+    def _chercher_racine(self, plateau: Plateau, couleur: str, profondeur: int,
+                         score_precedent: Optional[int] = None) -> Tuple[Optional[Coup], int]:
+        """
+        Explore tous les coups de la racine à une profondeur donnée.
+        
+        Avec les fenêtres d'aspiration, la racine est d'abord cherchée dans
+        une fenêtre étroite autour du score de l'itération précédente ; si le
+        score en sort, la fenêtre est élargie du côté de l'échec (de deux fois
+        plus à chaque nouvel échec) et la racine cherchée de nouveau.
+        
+        Args:
+            plateau: Le plateau de jeu
+            couleur: Couleur du camp au trait
+            profondeur: Profondeur de recherche
+            score_precedent: Score de l'itération précédente (ou None)
+            
+        Returns:
+            Tuple (meilleur coup ou None, score du point de vue de couleur)
+        """
+        alpha, beta = -self.SCORE_MAT - 1, self.SCORE_MAT + 1
+        ecart = self.FENETRE_ASPIRATION
+        if self.fenetres_aspiration and score_precedent is not None and \
+                abs(score_precedent) < self.SEUIL_MAT:
+            alpha, beta = score_precedent - ecart, score_precedent + ecart
+        
+        while True:
+            classement = self._classer_racine(plateau, couleur, profondeur, alpha=alpha, beta=beta)
+            if not classement:
+                break
+            score = classement[0][0]
+            if score <= alpha:
+                ecart *= 2
+                alpha = max(score - ecart, -self.SCORE_MAT - 1)
+            elif score >= beta:
+                ecart *= 2
+                beta = min(score + ecart, self.SCORE_MAT + 1)
+            else:
+                break
+        
+        if not classement:
+            return None, -self.SCORE_MAT if self.est_en_echec(plateau, couleur) else 0
+        score, coup = classement[0]
+        return coup, score
+    
+    def _classer_racine(self, plateau: Plateau, couleur: str, profondeur: int,
+                        nombre: int = 1, premiers: List[Coup] = (),
+                        alpha: int = -SCORE_MAT - 1, beta: int = SCORE_MAT + 1) -> List[Tuple[int, Coup]]:
+        """
+        Explore les coups de la racine et classe les meilleurs.
+        
+        Un coup n'est exploré en fenêtre ouverte que s'il peut entrer dans le
+        classement : la borne inférieure est le score du dernier classé, ce
+        qui donne les scores exacts des 'nombre' meilleurs coups en un seul
+        passage (nombre = 1 : recherche alpha-bêta ordinaire).
+        
+        Args:
+            plateau: Le plateau de jeu
+            couleur: Couleur du camp au trait
+            profondeur: Profondeur de recherche
+            nombre: Nombre de coups à classer
+            premiers: Coups à explorer en premier (classement de l'itération précédente)
+            alpha: Borne inférieure de la fenêtre (fenêtre d'aspiration)
+            beta: Borne supérieure de la fenêtre
+            
+        Returns:
+            Liste de tuples (score, coup) par score décroissant (vide s'il n'y a
+            aucun coup légal) ; un meilleur score hors de ]alpha, beta[ n'est qu'une borne
+        """
+        plancher = alpha
+        classement: List[Tuple[int, Coup]] = []
+        self._pieces_racine = sum(1 for rangee in plateau.grille for piece in rangee
+                                  if piece is not None)
+        self._captures_racine = len(plateau.pieces_capturees)
+        cle = hacher(plateau, couleur)
+        entree = self.table.sonder(cle)
+        coup_table = entree[4] if entree is not None else None
+        
+        coups = self._ordonner(plateau, self.generer_coups(plateau, couleur), coup_table)
+        if premiers:
+            coups = [coup for coup in premiers if coup in coups] + \
+                    [coup for coup in coups if coup not in premiers]
+        
+        for depart, arrivee in coups:
+            coup_joue = plateau.jouer_coup(depart, arrivee)
+            if self.est_en_echec(plateau, couleur):
+                plateau.annuler_coup(coup_joue)
+                continue
+            score = -self._negamax(plateau, couleur_adverse(couleur), profondeur - 1,
+                                   -beta, -plancher, 1)
+            plateau.annuler_coup(coup_joue)
+            
+            if len(classement) < nombre or score > plancher:
+                classement.append((score, (depart, arrivee)))
+                # Tri stable : à score égal, le coup exploré le premier reste devant
+                classement.sort(key=lambda ligne: -ligne[0])
+                del classement[nombre:]
+                if len(classement) == nombre:
+                    plancher = classement[-1][0]
+                    if plancher >= beta:
+                        break
+        
+        if classement:
+            score = classement[0][0]
+            if score <= alpha:
+                borne = BORNE_SUPERIEURE
+            elif score >= beta:
+                borne = BORNE_INFERIEURE
+            else:
+                borne = EXACT
+            self.table.stocker(cle, profondeur, score, borne, classement[0][1])
+        return classement
+    
+    def _negamax(self, plateau: Plateau, couleur: str, profondeur: int,
+                 alpha: int, beta: int, ply: int, coup_nul_permis: bool = True) -> int:
+        """
+        Recherche alpha-bêta en formulation négamax.
+        
+        Les techniques de recherche sélective activées dans le moteur
+        s'appliquent ici : coup nul (hors échec, avec au moins une pièce autre
+        que les pions et le roi, jamais deux fois de suite), extension des
+        coups qui donnent échec, réduction des coups calmes tardifs et
+        fenêtre nulle pour les coups après le premier, avec une nouvelle
+        recherche complète quand le score dépasse alpha.
+        
+        Args:
+            plateau: Le plateau de jeu
+            couleur: Couleur du camp au trait
+            profondeur: Profondeur restante
+            alpha: Borne inférieure de la fenêtre
+            beta: Borne supérieure de la fenêtre
+            ply: Distance à la racine (pour préférer les mats les plus courts)
+            coup_nul_permis: False juste après un coup nul
+            
+        Returns:
+            Score de la position du point de vue de couleur
+        """
+        if profondeur <= 0:
+            return self.quiescence(plateau, couleur, alpha, beta, ply)
+        
+        self._compter_noeud()
+        
+        if self.tables_finales is not None:
+            score_finale = self._sonder_finales(plateau, couleur, ply)
+            if score_finale is not None:
+                return score_finale
+        
+        cle = hacher(plateau, couleur)
+        entree = self.table.sonder(cle)
+        coup_table = None
+        if entree is not None:
+            _, profondeur_table, score_table, borne, coup_table = entree
+            if profondeur_table >= profondeur:
+                score_table = self._score_depuis_table(score_table, ply)
+                if borne == EXACT or \
+                   (borne == BORNE_INFERIEURE and score_table >= beta) or \
+                   (borne == BORNE_SUPERIEURE and score_table <= alpha):
+                    return score_table
+        
+        adverse = couleur_adverse(couleur)
+        selectif = self.coup_nul or self.reductions or self.extensions_echec
+        en_echec = selectif and self.est_en_echec(plateau, couleur)
+        
+        if self.coup_nul and coup_nul_permis and not en_echec and \
+                profondeur > self.REDUCTION_COUP_NUL and beta < self.SEUIL_MAT and \
+                self._a_des_pieces(plateau, couleur):
+            # Si passer son tour suffit à dépasser beta, un vrai coup le ferait aussi
+            ancien_en_passant = plateau.jouer_coup_nul()
+            score = -self._negamax(plateau, adverse, profondeur - 1 - self.REDUCTION_COUP_NUL,
+                                   -beta, -beta + 1, ply + 1, False)
+            plateau.annuler_coup_nul(ancien_en_passant)
+            if score >= beta:
+                return beta
+        
+        alpha_initial = alpha
+        meilleur_coup = None
+        coups_explores = 0
+        
+        for depart, arrivee in self._ordonner(plateau, self.generer_coups(plateau, couleur),
+                                              coup_table):
+            tactique = self.reductions and \
+                self._est_tactique(plateau, plateau.grille[depart[0]][depart[1]], arrivee)
+            coup_joue = plateau.jouer_coup(depart, arrivee)
+            if self.est_en_echec(plateau, couleur):
+                plateau.annuler_coup(coup_joue)
+                continue
+            coups_explores += 1
+            
+            nouvelle_profondeur = profondeur - 1
+            donne_echec = selectif and self.est_en_echec(plateau, adverse)
+            if donne_echec and self.extensions_echec:
+                nouvelle_profondeur += 1
+            
+            if coups_explores == 1 or not (self.pvs or self.reductions):
+                score = -self._negamax(plateau, adverse, nouvelle_profondeur,
+                                       -beta, -alpha, ply + 1)
+            else:
+                reduction = 0
+                if self.reductions and coups_explores > self.COUPS_SANS_REDUCTION and \
+                        profondeur >= self.PROFONDEUR_REDUCTION and \
+                        not (tactique or en_echec or donne_echec):
+                    reduction = 1 if coups_explores <= 2 * self.COUPS_SANS_REDUCTION else 2
+                    reduction = min(reduction, nouvelle_profondeur - 1)
+                borne = alpha + 1 if self.pvs else beta
+                score = -self._negamax(plateau, adverse, nouvelle_profondeur - reduction,
+                                       -borne, -alpha, ply + 1)
+                if reduction and score > alpha:
+                    score = -self._negamax(plateau, adverse, nouvelle_profondeur,
+                                           -borne, -alpha, ply + 1)
+                if borne < beta and alpha < score < beta:
+                    score = -self._negamax(plateau, adverse, nouvelle_profondeur,
+                                           -beta, -alpha, ply + 1)
+            plateau.annuler_coup(coup_joue)
+            
+            if score >= beta:
+                self.table.stocker(cle, profondeur, self._score_vers_table(beta, ply),
+                                   BORNE_INFERIEURE, (depart, arrivee))
+                return beta
+            if score > alpha:
+                alpha = score
+                meilleur_coup = (depart, arrivee)
+        
+        if not coups_explores:
+            # Échec et mat ou pat
+            return -self.SCORE_MAT + ply if self.est_en_echec(plateau, couleur) else 0
+        
+        borne = EXACT if alpha > alpha_initial else BORNE_SUPERIEURE
+        self.table.stocker(cle, profondeur, self._score_vers_table(alpha, ply), borne, meilleur_coup)
+        return alpha
+    
+    def quiescence(self, plateau: Plateau, couleur: str, alpha: int, beta: int,
+                   ply: int = 0) -> int:
+        """
+        Prolonge la recherche par les seules captures et promotions.
+        
+        L'évaluation statique sert de score plancher (« stand pat ») : le camp
+        au trait n'est jamais obligé de capturer. Les captures perdantes selon
+        l'échange statique sont ignorées si l'élagage est activé. Un camp en
+        échec ne peut pas se contenter de l'évaluation statique : toutes ses
+        parades sont examinées, et sans parade la position est mate.
+        
+        Args:
+            plateau: Le plateau de jeu
+            couleur: Couleur du camp au trait
+            alpha: Borne inférieure de la fenêtre
+            beta: Borne supérieure de la fenêtre
+            ply: Distance à la racine (pour préférer les mats les plus courts)
+            
+        Returns:
+            Score de la position du point de vue de couleur
+        """
+        self._compter_noeud()
+        
+        en_echec = self.est_en_echec(plateau, couleur)
+        if en_echec:
+            coups = self.generer_coups(plateau, couleur)
+        else:
+            score_statique = evaluer(plateau, couleur, avec_structure_pions=self.structure_pions,
+                                     table_pions=self.table_pions)
+            if score_statique >= beta:
+                return beta
+            if score_statique > alpha:
+                alpha = score_statique
+            coups = self.generer_coups(plateau, couleur, captures_seulement=True)
+        
+        coups_explores = 0
+        for depart, arrivee in self._ordonner(plateau, coups):
+            if not en_echec and self.elaguer_captures_perdantes and \
+               plateau.echange_statique(depart, arrivee) < 0:
+                continue
+            
+            coup_joue = plateau.jouer_coup(depart, arrivee)
+            if self.est_en_echec(plateau, couleur):
+                plateau.annuler_coup(coup_joue)
+                continue
+            coups_explores += 1
+            score = -self.quiescence(plateau, couleur_adverse(couleur), -beta, -alpha, ply + 1)
+            plateau.annuler_coup(coup_joue)
+            
+            if score >= beta:
+                return beta
+            if score > alpha:
+                alpha = score
+        
+        if en_echec and not coups_explores:
+            return -self.SCORE_MAT + ply
+        return alpha
+    
+    def _compter_noeud(self):
+        """
+        Compte un nœud et vérifie régulièrement les limites de la recherche.
+        
+        Raises:
+            RechercheInterrompue: Si l'arrêt est demandé ou si une limite est atteinte
+        """
+        self.noeuds += 1
+        if not self._limites_actives:
+            return
+        if self.arret_demande:
+            raise RechercheInterrompue()
+        if self.noeuds & 255 == 0:
+            if self._limite_noeuds is not None and self.noeuds >= self._limite_noeuds:
+                raise RechercheInterrompue()
+            if self._echeance is not None and time.perf_counter() >= self._echeance:
+                raise RechercheInterrompue()
+    
+    def _sonder_finales(self, plateau: Plateau, couleur: str, ply: int) -> Optional[int]:
+        """
+        Sonde les tables de finales si le matériel restant est couvert.
+        
+        Args:
+            plateau: Le plateau de jeu
+            couleur: Couleur du camp au trait
+            ply: Distance à la racine
+            
+        Returns:
+            Score exact de la position du point de vue de couleur, ou None
+        """
+        pieces = self._pieces_racine - (len(plateau.pieces_capturees) - self._captures_racine)
+        if pieces > self.tables_finales.pieces_max:
+            return None
+        # Les tables ne connaissent ni le roque ni la prise en passant
+        if plateau.position_en_passant is not None or any(droits_roque(plateau)):
+            return None
+        resultat = self.tables_finales.sonder(plateau, couleur)
+        if resultat is None:
+            return None
+        issue, demi_coups = resultat
+        if issue == 'gain':
+            return self.SCORE_MAT - ply - demi_coups
+        if issue == 'perte':
+            return -self.SCORE_MAT + ply + demi_coups
+        return 0
+    
+    def _score_vers_table(self, score: int, ply: int) -> int:
+        """Rend un score de mat relatif à la position (et non à la racine) avant stockage."""
+        if score >= self.SEUIL_MAT:
+            return score + ply
+        if score <= -self.SEUIL_MAT:
+            return score - ply
+        return score
+    
+    def _score_depuis_table(self, score: int, ply: int) -> int:
+        """Rend un score de mat stocké relatif à la racine de la recherche en cours."""
+        if score >= self.SEUIL_MAT:
+            return score - ply
+        if score <= -self.SEUIL_MAT:
+            return score + ply
+        return score
+    
+    def _a_des_pieces(self, plateau: Plateau, couleur: str) -> bool:
+        """Vérifie si une couleur a une pièce autre que ses pions et son roi (risque de zugzwang sinon)."""
+        for rangee in plateau.grille:
+            for piece in rangee:
+                if piece is not None and piece.couleur == couleur and \
+                        not isinstance(piece, (Pion, Roi)):
+                    return True
+        return False
+    
+    def _est_tactique(self, plateau: Plateau, piece, arrivee: Tuple[int, int]) -> bool:
+        """Vérifie si un coup est une capture ou une promotion."""
+        if plateau.grille[arrivee[0]][arrivee[1]] is not None:
+            return True
+        if isinstance(piece, Pion):
+            return arrivee[0] in (0, 7) or arrivee == plateau.position_en_passant
+        return False
+    
+    def _ordonner(self, plateau: Plateau, coups: List[Coup],
+                  coup_table: Optional[Coup] = None) -> List[Coup]:
+        """
+        Trie les coups pour améliorer les coupures alpha-bêta.
+        
+        Le coup de la table de transposition passe en premier, puis les
+        captures, de la victime la plus précieuse prise par l'attaquant le
+        moins précieux (MVV-LVA).
+        """
+        def cle(coup):
+            if coup == coup_table:
+                return 1000000
+            depart, arrivee = coup
+            victime = plateau.grille[arrivee[0]][arrivee[1]]
+            if victime is None:
+                return 0
+            attaquant = plateau.grille[depart[0]][depart[1]]
+            return 10 * victime.valeur - attaquant.valeur
+        
+        return sorted(coups, key=cle, reverse=True)
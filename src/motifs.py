@@ -0,0 +1,310 @@
+"""
+Module contenant l'index de recherche de motifs dans une base de parties.
+Chaque position de chaque partie de la base (voir src/stockage.py) est
+réduite à douze masques d'occupation de 64 bits, un par type de pièce et par
+couleur (bit ligne * 8 + colonne, plans dans l'ordre de encodage.CODES_PIECES).
+Les masques sont rangés par plan dans des fichiers NumPy projetés en mémoire :
+une recherche de motif, par exemple « tour blanche en 7e rangée et roi noir
+en g8 », devient une suite de ET bit à bit sur les seuls plans concernés,
+sans rejouer aucune partie.
+
+Syntaxe d'un motif : des termes séparés par des espaces, tous exigés.
+    terme : ['!'] pièce [cases]
+    pièce : PNBRQK pour les blancs, pnbrqk pour les noirs
+    cases : une case ('g8'), une colonne ('e'), une rangée ('7') ou plusieurs
+            de ces éléments séparés par des virgules ('g1,h1') ; partout si absent
+Un terme exige au moins une telle pièce sur ces cases ; précédé de '!', il
+exige qu'il n'y en ait aucune. Exemple : 'R7 kg8 !q' (tour blanche en 7e
+rangée, roi noir en g8, plus de dame noire).
+
+NumPy est une dépendance facultative : il n'est nécessaire que pour ce module.
+"""
+
+import os
+from typing import List, Optional, Tuple
+from src.fen import LETTRES_PIECES, plateau_depuis_fen
+from src.encodage import CODES_PIECES, TAILLE_POSITION, TRAIT_NOIR, encoder_position
+from src.notation import COLONNES, notation_vers_case
+from src.moteur import couleur_adverse
+from src.stockage import Stockage
+from src.tenseurs import cases_depuis_encodages
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est facultatif
+    np = None
+
+
+NOMBRE_PLANS = 12
+MASQUE_PLEIN = (1 << 64) - 1
+
+# Fichiers de l'index : nom, type des éléments
+COLONNES_INDEX = (('pieces', '<u8'), ('parties', '<u4'), ('demi_coups', '<u2'), ('indicateurs', 'u1'))
+
+# Positions encodées avant conversion en masques pendant la construction
+TAILLE_LOT = 65536
+# Positions filtrées à la fois pendant une recherche
+TAILLE_BLOC = 1 << 20
+
+# Plan, masque des cases, True si la pièce doit être présente
+Terme = Tuple[int, int, bool]
+
+
+def _verifier_numpy():
+    """Lève une erreur explicite si NumPy n'est pas installé."""
+    if np is None:
+        raise ImportError("NumPy est nécessaire pour l'index des motifs (pip install numpy)")
+
+
+def _masque_cases(texte: str) -> int:
+    """
+    Convertit une case, une colonne ou une rangée en masque de 64 bits.
+    
+    Raises:
+        ValueError: Si le texte n'est ni une case, ni une colonne, ni une rangée
+    """
+    if len(texte) == 1 and texte in COLONNES:
+        return sum(1 << (ligne * 8 + COLONNES.index(texte)) for ligne in range(8))
+    if len(texte) == 1 and texte in '12345678':
+        return 0xFF << ((8 - int(texte)) * 8)
+    ligne, colonne = notation_vers_case(texte)
+    return 1 << (ligne * 8 + colonne)
+
+
+def analyser_motif(texte: str) -> List[Terme]:
+    """
+    Analyse un motif (voir la syntaxe en tête du module).
+    
+    Args:
+        texte: Le motif (ex: 'R7 kg8 !q')
+        
+    Returns:
+        Liste de termes (plan, masque des cases, présence exigée)
+        
+    Raises:
+        ValueError: Si le motif est vide ou mal formé
+    """
+    termes = []
+    for mot in texte.split():
+        present = not mot.startswith('!')
+        if not present:
+            mot = mot[1:]
+        if not mot or mot[0].lower() not in LETTRES_PIECES:
+            raise ValueError(f"Terme de motif invalide: {mot!r}")
+        couleur = 'blanc' if mot[0].isupper() else 'noir'
+        plan = CODES_PIECES[(LETTRES_PIECES[mot[0].lower()], couleur)] - 1
+        masque = 0
+        for cases in mot[1:].split(',') if mot[1:] else ():
+            masque |= _masque_cases(cases)
+        termes.append((plan, masque or MASQUE_PLEIN, present))
+    if not termes:
+        raise ValueError("Motif vide")
+    return termes
+
+
+class IndexMotifs:
+    """
+    Index des motifs projeté en mémoire.
+    
+    Attributs:
+        dossier (str): Dossier des fichiers de l'index
+        positions (int): Nombre de positions indexées
+        pieces (np.ndarray): Masques d'occupation (NOMBRE_PLANS, positions)
+        parties (np.ndarray): Identifiant de la partie de chaque position
+        demi_coups (np.ndarray): Demi-coup de chaque position dans sa partie
+        indicateurs (np.ndarray): Trait et droits de roque (bits de encodage)
+    """
+    
+    def __init__(self, dossier: str):
+        """
+        Ouvre un index.
+        
+        Args:
+            dossier: Dossier produit par construire_index()
+            
+        Raises:
+            ValueError: Si les fichiers de l'index sont incohérents
+        """
+        _verifier_numpy()
+        self.dossier = dossier
+        for nom, _ in COLONNES_INDEX:
+            setattr(self, nom, np.load(os.path.join(dossier, nom + '.npy'), mmap_mode='r'))
+        self.positions = len(self.parties)
+        if self.pieces.shape != (NOMBRE_PLANS, self.positions) or \
+                len(self.demi_coups) != self.positions or len(self.indicateurs) != self.positions:
+            raise ValueError(f"Index de motifs invalide: {dossier}")
+    
+    def filtrer(self, motif: str, couleur: Optional[str] = None) -> 'np.ndarray':
+        """
+        Retourne les positions correspondant à un motif.
+        
+        Les positions sont filtrées par blocs de TAILLE_BLOC ; dans un bloc,
+        les termes suivants ne sont pas évalués dès qu'aucune position ne reste.
+        
+        Args:
+            motif: Le motif (voir la syntaxe en tête du module)
+            couleur: Couleur du camp au trait exigée (ou None)
+            
+        Returns:
+            Indices croissants des positions dans l'index
+            
+        Raises:
+            ValueError: Si le motif est mal formé
+        """
+        termes = analyser_motif(motif)
+        taille = min(TAILLE_BLOC, self.positions)
+        masques = np.empty(taille, dtype=np.uint64)
+        gardees = np.empty(taille, dtype=np.bool_)
+        essai = np.empty(taille, dtype=np.bool_)
+        resultats = [np.empty(0, dtype=np.intp)]
+        for debut in range(0, self.positions, TAILLE_BLOC):
+            fin = min(debut + TAILLE_BLOC, self.positions)
+            nombre = fin - debut
+            garde = gardees[:nombre]
+            garde[:] = True
+            if couleur is not None:
+                np.not_equal(self.indicateurs[debut:fin] & TRAIT_NOIR, 0, out=garde)
+                if couleur == 'blanc':
+                    np.logical_not(garde, out=garde)
+            for plan, masque, present in termes:
+                colonne = self.pieces[plan, debut:fin]
+                if masque != MASQUE_PLEIN:
+                    colonne = np.bitwise_and(colonne, np.uint64(masque), out=masques[:nombre])
+                comparaison = np.not_equal if present else np.equal
+                comparaison(colonne, 0, out=essai[:nombre])
+                np.logical_and(garde, essai[:nombre], out=garde)
+                if not garde.any():
+                    break
+            resultats.append(np.flatnonzero(garde) + debut)
+        return np.concatenate(resultats)
+    
+    def rechercher(self, motif: str, couleur: Optional[str] = None,
+                   limite: Optional[int] = None) -> List[Tuple[int, int]]:
+        """
+        Recherche les positions correspondant à un motif.
+        
+        Args:
+            motif: Le motif (voir la syntaxe en tête du module)
+            couleur: Couleur du camp au trait exigée (ou None)
+            limite: Nombre maximal de résultats (ou None)
+            
+        Returns:
+            Liste de tuples (identifiant de la partie, demi-coup), dans l'ordre de la base
+        """
+        indices = self.filtrer(motif, couleur)[:limite]
+        return list(zip(self.parties[indices].tolist(), self.demi_coups[indices].tolist()))
+    
+    def parties_atteignant(self, motif: str, couleur: Optional[str] = None) -> List[Tuple[int, int]]:
+        """
+        Recherche les parties passant par un motif.
+        
+        Args:
+            motif: Le motif (voir la syntaxe en tête du module)
+            couleur: Couleur du camp au trait exigée (ou None)
+            
+        Returns:
+            Liste de tuples (identifiant de la partie, premier demi-coup où le motif apparaît)
+        """
+        indices = self.filtrer(motif, couleur)
+        # Les positions sont rangées par partie puis par demi-coup
+        parties, premiers = np.unique(self.parties[indices], return_index=True)
+        return list(zip(parties.tolist(), self.demi_coups[indices[premiers]].tolist()))
+
+
+def construire_index(base: Stockage, dossier: str) -> int:
+    """
+    Construit l'index des motifs de toutes les parties d'une base.
+    
+    Chaque partie est rejouée une fois sur un plateau ; les positions sont
+    encodées (voir encodage.encoder_position) puis converties en masques par
+    lots de TAILLE_LOT. Les fichiers existants sont remplacés à la fin.
+    
+    Args:
+        base: La base des parties
+        dossier: Dossier où écrire les fichiers de l'index
+        
+    Returns:
+        Le nombre de positions indexées
+    """
+    _verifier_numpy()
+    os.makedirs(dossier, exist_ok=True)
+    nombre = sum(demi_coups + 1 for *_, demi_coups in base.lister())
+    formes = {'pieces': (NOMBRE_PLANS, nombre)}
+    colonnes = {nom: np.lib.format.open_memmap(os.path.join(dossier, nom + '.npy.tmp'), mode='w+',
+                                               dtype=type_elements, shape=formes.get(nom, (nombre,)))
+                for nom, type_elements in COLONNES_INDEX}
+    
+    debut = 0
+    encodages, parties, demi_coups = [], [], []
+    for identifiant, fen_depart, coups in base.parcourir():
+        plateau, couleur = plateau_depuis_fen(fen_depart)
+        encodages.append(encoder_position(plateau, couleur))
+        for coup in coups:
+            plateau.jouer_coup(*coup)
+            couleur = couleur_adverse(couleur)
+            encodages.append(encoder_position(plateau, couleur))
+        parties.extend([identifiant] * (len(coups) + 1))
+        demi_coups.extend(range(len(coups) + 1))
+        if len(encodages) >= TAILLE_LOT:
+            debut = _ecrire_lot(colonnes, debut, encodages, parties, demi_coups)
+            encodages, parties, demi_coups = [], [], []
+    if encodages:
+        debut = _ecrire_lot(colonnes, debut, encodages, parties, demi_coups)
+    
+    for colonne in colonnes.values():
+        colonne.flush()
+    colonnes.clear()
+    for nom, _ in COLONNES_INDEX:
+        chemin = os.path.join(dossier, nom + '.npy')
+        os.replace(chemin + '.tmp', chemin)
+    return debut
+
+
+def _ecrire_lot(colonnes: dict, debut: int, encodages: List[bytes], parties: List[int],
+                demi_coups: List[int]) -> int:
+    """
+    Convertit un lot de positions encodées en masques et l'écrit dans l'index.
+    
+    Returns:
+        L'indice de la position suivant le lot
+    """
+    lot = np.frombuffer(b''.join(encodages), dtype=np.uint8).reshape(-1, TAILLE_POSITION)
+    fin = debut + len(lot)
+    cases = cases_depuis_encodages(lot)
+    for plan in range(NOMBRE_PLANS):
+        # Huit octets par position, bit de poids faible en case 0 : un entier de 64 bits
+        octets = np.packbits(cases == plan + 1, axis=1, bitorder='little')
+        colonnes['pieces'][plan, debut:fin] = octets.view('<u8').ravel()
+    colonnes['parties'][debut:fin] = parties
+    colonnes['demi_coups'][debut:fin] = demi_coups
+    colonnes['indicateurs'][debut:fin] = lot[:, 32]
+    return fin
+
+
+def main():
+    """Recherche un motif depuis la ligne de commande, en construisant l'index au besoin."""
+    import argparse
+    import time
+    analyseur = argparse.ArgumentParser(description="Recherche de motifs dans une base de parties")
+    analyseur.add_argument('motif', help="Motif recherché (ex: 'R7 kg8 !q')")
+    analyseur.add_argument('--base', default='parties.db', help="Base SQLite des parties")
+    analyseur.add_argument('--index', default='motifs', help="Dossier de l'index")
+    analyseur.add_argument('--reconstruire', action='store_true',
+                           help="Reconstruit l'index (après l'ajout de parties)")
+    analyseur.add_argument('--trait', choices=('blanc', 'noir'), default=None,
+                           help="Camp au trait exigé")
+    analyseur.add_argument('--limite', type=int, default=20, help="Nombre de parties affichées")
+    arguments = analyseur.parse_args()
+    
+    if arguments.reconstruire or not os.path.exists(os.path.join(arguments.index, 'pieces.npy')):
+        with Stockage(arguments.base) as base:
+            print(f"{construire_index(base, arguments.index)} positions indexées")
+    
+    index = IndexMotifs(arguments.index)
+    debut = time.perf_counter()
+    indices = index.filtrer(arguments.motif, arguments.trait)
+    duree = time.perf_counter() - debut
+    parties = index.parties_atteignant(arguments.motif, arguments.trait)
+    print(f"{len(indices)} positions dans {len(parties)} parties ({1000 * duree:.1f} ms)")
+    for identifiant, demi_coup in parties[:arguments.limite]:
+        print(f"  partie {identifiant}, demi-coup {demi_coup}")
@@ -0,0 +1,389 @@
+"""
+Module contenant la conversion entre les coups et leurs notations.
+Les cases s'écrivent en notation algébrique ('e4'), les coups en notation
+UCI ('e2e4', 'e7e8n') ou en notation algébrique standard (SAN : 'Nbd7',
+'exd6', 'e8=Q+', 'O-O').
+
+La levée d'ambiguïté du SAN, à l'écriture comme à la lecture, part de la
+case d'arrivée : les pièces du même type qui l'atteignent sont trouvées sur
+les rayons précalculés (RAYONS) et les sauts de cavalier, sans générer les
+coups de la couleur. Seul un coup qui donne échec demande de chercher une
+parade pour distinguer '+' de '#'.
+"""
+
+from typing import Dict, List, Optional, Tuple
+from src.plateau import (Plateau, RAYONS, SAUTS_CAVALIER, DIRECTIONS_DROITES, DIRECTIONS_DIAGONALES,
+                         DIRECTIONS_ROI)
+from src.piece import Pion, Tour, Cavalier, Fou, Reine, Roi
+from src.moteur import couleur_adverse
+
+Coup = Tuple[Tuple[int, int], Tuple[int, int]]
+
+COLONNES = 'abcdefgh'
+# Nom de chaque case (NOMS_CASES[ligne][colonne]) et case de chaque nom
+NOMS_CASES = [[COLONNES[colonne] + str(8 - ligne) for colonne in range(8)] for ligne in range(8)]
+CASES: Dict[str, Tuple[int, int]] = {NOMS_CASES[ligne][colonne]: (ligne, colonne)
+                                     for ligne in range(8) for colonne in range(8)}
+
+LETTRES_SAN = {Roi: 'K', Reine: 'Q', Tour: 'R', Fou: 'B', Cavalier: 'N'}
+PIECES_SAN = {lettre: classe for classe, lettre in LETTRES_SAN.items()}
+PROMOTIONS_UCI = {'q': Reine, 'r': Tour, 'b': Fou, 'n': Cavalier}
+LETTRES_UCI = {classe: lettre for lettre, classe in PROMOTIONS_UCI.items()}
+
+# Directions des pièces à longue portée (le roi n'avance que d'une case)
+DIRECTIONS_PIECES = {Tour: DIRECTIONS_DROITES, Fou: DIRECTIONS_DIAGONALES,
+                     Reine: DIRECTIONS_ROI, Roi: DIRECTIONS_ROI}
+
+ROQUES_SAN = {'O-O': 6, '0-0': 6, 'O-O-O': 2, '0-0-0': 2}
+
+
+def case_vers_notation(position: Tuple[int, int]) -> str:
+    """
+    Convertit une position de tableau en notation d'échecs.
+    
+    Args:
+        position: Position (ligne, colonne)
+        
+    Returns:
+        Notation d'échecs (ex: 'e2')
+    """
+    return NOMS_CASES[position[0]][position[1]]
+
+
+def notation_vers_case(notation: str) -> Tuple[int, int]:
+    """
+    Convertit une notation d'échecs (ex: 'e2') en position de tableau.
+    
+    Args:
+        notation: Notation d'échecs (ex: 'e2')
+        
+    Returns:
+        Position (ligne, colonne) dans le tableau (la ligne 8 est la ligne 0)
+        
+    Raises:
+        ValueError: Si la notation est invalide
+    """
+    position = CASES.get(notation)
+    if position is not None:
+        return position
+    if len(notation) != 2:
+        raise ValueError(f"Notation invalide: {notation}")
+    if notation[0] not in COLONNES:
+        raise ValueError(f"Colonne invalide: {notation[0]}")
+    raise ValueError(f"Ligne invalide: {notation[1]}")
+
+
+def coup_vers_uci(plateau: Plateau, coup: Coup, promotion: Optional[type] = None) -> str:
+    """
+    Convertit un coup en notation UCI (ex: 'e2e4', 'e7e8q').
+    
+    Args:
+        plateau: Le plateau avant le coup
+        coup: Tuple (position_depart, position_arrivee)
+        promotion: Classe de la pièce de promotion (Reine si None)
+        
+    Returns:
+        Le coup en notation UCI
+    """
+    depart, arrivee = coup
+    texte = NOMS_CASES[depart[0]][depart[1]] + NOMS_CASES[arrivee[0]][arrivee[1]]
+    if arrivee[0] in (0, 7) and isinstance(plateau.grille[depart[0]][depart[1]], Pion):
+        texte += LETTRES_UCI[promotion or Reine]
+    return texte
+
+
+def uci_vers_coup(texte: str):
+    """
+    Convertit un coup en notation UCI.
+    
+    Args:
+        texte: Le coup en notation UCI (ex: 'e2e4', 'e7e8n')
+        
+    Returns:
+        Tuple (position_depart, position_arrivee, classe de promotion ou None)
+        
+    Raises:
+        ValueError: Si le coup est mal formé
+    """
+    depart = CASES.get(texte[:2])
+    arrivee = CASES.get(texte[2:4])
+    if len(texte) not in (4, 5) or depart is None or arrivee is None:
+        raise ValueError(f"Coup UCI invalide: {texte}")
+    promotion = None
+    if len(texte) == 5:
+        if texte[4] not in PROMOTIONS_UCI:
+            raise ValueError(f"Promotion invalide: {texte}")
+        promotion = PROMOTIONS_UCI[texte[4]]
+    return depart, arrivee, promotion
+
+
+def coup_vers_san(plateau: Plateau, depart: Tuple[int, int], arrivee: Tuple[int, int],
+                  promotion: Optional[type] = None) -> str:
+    """
+    Convertit un coup légal en notation algébrique standard.
+    
+    Le coup est joué pour détecter l'échec et le mat, puis annulé.
+    
+    Args:
+        plateau: Le plateau avant le coup
+        depart: Position de départ (ligne, colonne)
+        arrivee: Position d'arrivée (ligne, colonne)
+        promotion: Classe de la pièce de promotion (Reine si None)
+        
+    Returns:
+        Le coup en notation SAN (ex: 'Nbd7', 'exd6', 'e8=Q+', 'O-O')
+    """
+    piece = plateau.grille[depart[0]][depart[1]]
+    couleur = piece.couleur
+    classe = type(piece)
+    case = NOMS_CASES[arrivee[0]][arrivee[1]]
+    
+    if classe is Roi and abs(arrivee[1] - depart[1]) == 2:
+        texte = 'O-O' if arrivee[1] > depart[1] else 'O-O-O'
+    elif classe is Pion:
+        # Une prise de pion change toujours de colonne (y compris en passant)
+        texte = case
+        if depart[1] != arrivee[1]:
+            texte = COLONNES[depart[1]] + 'x' + case
+        if arrivee[0] in (0, 7):
+            texte += '=' + LETTRES_SAN[promotion or Reine]
+    else:
+        precision = ''
+        rivaux = [autre for autre in _origines(plateau, classe, couleur, arrivee) if autre != depart]
+        if rivaux:
+            roi = plateau.trouver_roi(couleur)
+            en_echec = roi is not None and plateau.est_case_attaquee(roi, couleur_adverse(couleur))
+            rivaux = [autre for autre in rivaux
+                      if _est_legal(plateau, autre, arrivee, couleur, roi, en_echec)]
+        if rivaux:
+            if all(autre[1] != depart[1] for autre in rivaux):
+                precision = COLONNES[depart[1]]
+            elif all(autre[0] != depart[0] for autre in rivaux):
+                precision = str(8 - depart[0])
+            else:
+                precision = NOMS_CASES[depart[0]][depart[1]]
+        prise = 'x' if plateau.grille[arrivee[0]][arrivee[1]] is not None else ''
+        texte = LETTRES_SAN[classe] + precision + prise + case
+    
+    defenseur = couleur_adverse(couleur)
+    roi = plateau.trouver_roi(defenseur)
+    coup_joue = plateau.jouer_coup(depart, arrivee, promotion)
+    try:
+        if roi is not None and plateau.est_case_attaquee(roi, couleur):
+            texte += '+' if _a_une_parade(plateau, defenseur, roi) else '#'
+    finally:
+        plateau.annuler_coup(coup_joue)
+    return texte
+
+
+def san_vers_coup(plateau: Plateau, couleur: str, texte: str):
+    """
+    Convertit un coup en notation algébrique standard.
+    
+    Les suffixes ('+', '#', '!', '?'), le roque écrit avec des zéros et la
+    promotion sans '=' ('e8Q') sont acceptés ; le coup doit être légal.
+    
+    Args:
+        plateau: Le plateau avant le coup
+        couleur: Couleur du camp au trait
+        texte: Le coup en notation SAN (ex: 'Nbd7', 'exd6', 'e8=Q+', 'O-O')
+        
+    Returns:
+        Tuple (position_depart, position_arrivee, classe de promotion ou None)
+        
+    Raises:
+        ValueError: Si le coup est mal formé, illégal ou ambigu
+    """
+    san = texte.rstrip('+#!?')
+    attaquant = couleur_adverse(couleur)
+    
+    if san in ROQUES_SAN:
+        ligne = 7 if couleur == 'blanc' else 0
+        depart, arrivee = (ligne, 4), (ligne, ROQUES_SAN[san])
+        roi = plateau.grille[ligne][4]
+        passage = (ligne, (4 + arrivee[1]) // 2)
+        if type(roi) is not Roi or roi.couleur != couleur or \
+                arrivee not in plateau.mouvements(depart) or \
+                plateau.est_case_attaquee(depart, attaquant) or \
+                plateau.est_case_attaquee(passage, attaquant) or \
+                not _est_legal(plateau, depart, arrivee, couleur, depart, False):
+            raise ValueError(f"Roque illégal: {texte}")
+        return depart, arrivee, None
+    
+    promotion = None
+    if '=' in san:
+        san, _, lettre = san.partition('=')
+        promotion = PIECES_SAN.get(lettre)
+        if promotion is None or promotion is Roi:
+            raise ValueError(f"Promotion invalide: {texte}")
+    elif len(san) > 2 and san[-1] in 'QRBN' and san[0] in COLONNES:
+        san, promotion = san[:-1], PIECES_SAN[san[-1]]
+    
+    classe = PIECES_SAN.get(san[:1], Pion)
+    if classe is not Pion:
+        san = san[1:]
+    arrivee = CASES.get(san[-2:])
+    precision = san[:-2]
+    if precision.endswith('x'):
+        precision = precision[:-1]
+    if arrivee is None or len(precision) > 2:
+        raise ValueError(f"Coup SAN invalide: {texte}")
+    cible = plateau.grille[arrivee[0]][arrivee[1]]
+    if cible is not None and cible.couleur == couleur:
+        raise ValueError(f"Coup SAN illégal: {texte}")
+    
+    if classe is Pion:
+        origines = _origines_pion(plateau, couleur, arrivee, precision)
+        if promotion is not None and arrivee[0] not in (0, 7):
+            raise ValueError(f"Promotion invalide: {texte}")
+    else:
+        if promotion is not None:
+            raise ValueError(f"Promotion invalide: {texte}")
+        origines = [origine for origine in _origines(plateau, classe, couleur, arrivee)
+                    if precision in ('', COLONNES[origine[1]], str(8 - origine[0]),
+                                     NOMS_CASES[origine[0]][origine[1]])]
+    
+    if origines:
+        roi = plateau.trouver_roi(couleur)
+        en_echec = roi is not None and plateau.est_case_attaquee(roi, attaquant)
+        origines = [origine for origine in origines
+                    if _est_legal(plateau, origine, arrivee, couleur, roi, en_echec)]
+    if not origines:
+        raise ValueError(f"Coup SAN illégal: {texte}")
+    if len(origines) > 1:
+        raise ValueError(f"Coup SAN ambigu: {texte}")
+    return origines[0], arrivee, promotion
+
+
+def _origines(plateau: Plateau, classe: type, couleur: str,
+              arrivee: Tuple[int, int]) -> List[Tuple[int, int]]:
+    """
+    Retourne les cases des pièces d'un type (hors pion) qui atteignent une case.
+    
+    Les coups trouvés sont pseudo-légaux : le roque n'en fait pas partie.
+    
+    Args:
+        plateau: Le plateau
+        classe: Type des pièces (Cavalier, Fou, Tour, Reine ou Roi)
+        couleur: Couleur des pièces
+        arrivee: Case visée (ligne, colonne)
+        
+    Returns:
+        Liste des positions de départ
+    """
+    ligne, colonne = arrivee
+    grille = plateau.grille
+    origines = []
+    if classe is Cavalier:
+        for l, c in SAUTS_CAVALIER[ligne][colonne]:
+            piece = grille[l][c]
+            if type(piece) is Cavalier and piece.couleur == couleur:
+                origines.append((l, c))
+        return origines
+    
+    for direction in DIRECTIONS_PIECES[classe]:
+        for l, c in RAYONS[direction][ligne][colonne]:
+            piece = grille[l][c]
+            if piece is not None:
+                if type(piece) is classe and piece.couleur == couleur:
+                    origines.append((l, c))
+                break
+            if classe is Roi:
+                break
+    return origines
+
+
+def _origines_pion(plateau: Plateau, couleur: str, arrivee: Tuple[int, int],
+                   precision: str) -> List[Tuple[int, int]]:
+    """
+    Retourne les cases des pions qui peuvent jouer vers une case.
+    
+    Args:
+        plateau: Le plateau
+        couleur: Couleur des pions
+        arrivee: Case d'arrivée (ligne, colonne), vide ou adverse
+        precision: Colonne de départ d'une prise ('' pour une poussée)
+        
+    Returns:
+        Liste des positions de départ (au plus une)
+    """
+    grille = plateau.grille
+    recul = 1 if couleur == 'blanc' else -1
+    ligne = arrivee[0] + recul
+    if not 0 <= ligne < 8:
+        return []
+    cible = grille[arrivee[0]][arrivee[1]]
+    if precision:
+        if len(precision) != 1 or precision not in COLONNES:
+            return []
+        depart = (ligne, COLONNES.index(precision))
+        if abs(depart[1] - arrivee[1]) != 1 or \
+                (cible is None and arrivee != plateau.position_en_passant):
+            return []
+    else:
+        if cible is not None:
+            return []
+        depart = (ligne, arrivee[1])
+        # Poussée de deux cases depuis la rangée de départ
+        if grille[ligne][arrivee[1]] is None and ligne + recul == (6 if couleur == 'blanc' else 1):
+            depart = (ligne + recul, arrivee[1])
+    
+    pion = grille[depart[0]][depart[1]]
+    if type(pion) is not Pion or pion.couleur != couleur:
+        return []
+    return [depart]
+
+
+def _est_legal(plateau: Plateau, depart: Tuple[int, int], arrivee: Tuple[int, int],
+               couleur: str, roi: Optional[Tuple[int, int]], en_echec: bool) -> bool:
+    """
+    Vérifie qu'un coup pseudo-légal ne laisse pas le roi de sa couleur en échec.
+    
+    Hors échec, une pièce qui n'est alignée ni en colonne, ni en rangée, ni
+    en diagonale avec son roi ne peut pas être clouée : le coup n'est joué
+    que dans les autres cas (roi, prise en passant, pièce alignée).
+    
+    Args:
+        plateau: Le plateau
+        depart: Position de départ
+        arrivee: Position d'arrivée
+        couleur: Couleur du camp au trait
+        roi: Case du roi de cette couleur avant le coup (ou None)
+        en_echec: Le roi est-il en échec avant le coup
+    """
+    if roi is None:
+        return True
+    d_ligne, d_colonne = depart[0] - roi[0], depart[1] - roi[1]
+    if not en_echec and depart != roi and d_ligne and d_colonne and abs(d_ligne) != abs(d_colonne):
+        piece = plateau.grille[depart[0]][depart[1]]
+        if type(piece) is not Pion or depart[1] == arrivee[1] or \
+                plateau.grille[arrivee[0]][arrivee[1]] is not None:
+            return True
+    coup_joue = plateau.jouer_coup(depart, arrivee)
+    legal = not plateau.est_case_attaquee(arrivee if depart == roi else roi, couleur_adverse(couleur))
+    plateau.annuler_coup(coup_joue)
+    return legal
+
+
+def _a_une_parade(plateau: Plateau, couleur: str, roi: Tuple[int, int]) -> bool:
+    """
+    Vérifie si une couleur en échec a au moins un coup légal.
+    
+    Les coups du roi sont essayés d'abord ; le roque, interdit en échec, est ignoré.
+    """
+    grille = plateau.grille
+    for direction in DIRECTIONS_ROI:
+        for arrivee in RAYONS[direction][roi[0]][roi[1]][:1]:
+            cible = grille[arrivee[0]][arrivee[1]]
+            if (cible is None or cible.couleur != couleur) and \
+                    _est_legal(plateau, roi, arrivee, couleur, roi, True):
+                return True
+    for ligne, rangee in enumerate(plateau.grille):
+        for colonne, piece in enumerate(rangee):
+            if piece is None or piece.couleur != couleur or type(piece) is Roi:
+                continue
+            depart = (ligne, colonne)
+            for arrivee in plateau.mouvements(depart):
+                if _est_legal(plateau, depart, arrivee, couleur, roi, True):
+                    return True
+    return False
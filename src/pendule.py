@@ -0,0 +1,118 @@
+"""
+Module contenant la pendule d'une partie à cadence : un temps de base par
+camp et un incrément ajouté après chaque coup joué.
+"""
+
+import time
+from typing import Callable, Dict, Optional
+
+
+class Pendule:
+    """
+    Pendule d'échecs à deux cadrans avec incrément (cadence Fischer).
+    
+    Attributs:
+        base (float): Temps initial de chaque camp en secondes
+        increment (float): Temps ajouté après chaque coup en secondes
+        en_marche (Optional[str]): Couleur dont le cadran tourne (None si arrêtée)
+    """
+    
+    def __init__(self, base: float, increment: float = 0.0,
+                 horloge: Callable[[], float] = time.monotonic):
+        """
+        Initialise une pendule arrêtée.
+        
+        Args:
+            base: Temps initial de chaque camp en secondes
+            increment: Temps ajouté après chaque coup en secondes
+            horloge: Source du temps (remplaçable pour les tests)
+        """
+        self.base = base
+        self.increment = increment
+        self.horloge = horloge
+        self._restants: Dict[str, float] = {'blanc': base, 'noir': base}
+        self.en_marche: Optional[str] = None
+        self._depuis = 0.0
+    
+    def demarrer(self, couleur: str):
+        """
+        Lance le cadran d'un camp.
+        
+        Args:
+            couleur: Couleur du camp au trait
+        """
+        self.arreter()
+        self.en_marche = couleur
+        self._depuis = self.horloge()
+    
+    def arreter(self) -> float:
+        """
+        Arrête le cadran en marche et décompte le temps écoulé.
+        
+        Returns:
+            Temps écoulé depuis le lancement du cadran (0 si la pendule était arrêtée)
+        """
+        if self.en_marche is None:
+            return 0.0
+        ecoule = self.horloge() - self._depuis
+        self._restants[self.en_marche] -= ecoule
+        self.en_marche = None
+        return ecoule
+    
+    def appuyer(self) -> float:
+        """
+        Termine le coup du camp en marche : décompte son temps, ajoute
+        l'incrément s'il n'est pas tombé et lance le cadran adverse.
+        
+        Returns:
+            Temps pris pour le coup
+        """
+        couleur = self.en_marche
+        if couleur is None:
+            return 0.0
+        ecoule = self.arreter()
+        if self._restants[couleur] > 0:
+            self._restants[couleur] += self.increment
+        self.demarrer('noir' if couleur == 'blanc' else 'blanc')
+        return ecoule
+    
+    def temps_restant(self, couleur: str) -> float:
+        """
+        Retourne le temps restant d'un camp, cadran en marche compris.
+        
+        Args:
+            couleur: Couleur du camp
+            
+        Returns:
+            Temps restant en secondes (négatif si le drapeau est tombé)
+        """
+        restant = self._restants[couleur]
+        if couleur == self.en_marche:
+            restant -= self.horloge() - self._depuis
+        return restant
+    
+    def couleur_tombee(self) -> Optional[str]:
+        """
+        Indique si un camp a dépassé son temps.
+        
+        Returns:
+            La couleur du camp tombé, ou None
+        """
+        for couleur in ('blanc', 'noir'):
+            if self.temps_restant(couleur) <= 0:
+                return couleur
+        return None
+    
+    @staticmethod
+    def formater_duree(secondes: float) -> str:
+        """Formate une durée en minutes:secondes (dixièmes sous les 20 secondes)."""
+        secondes = max(0.0, secondes)
+        minutes, reste = divmod(secondes, 60)
+        if secondes < 20:
+            return f"{int(minutes)}:{reste:04.1f}"
+        return f"{int(minutes)}:{int(reste):02d}"
+    
+    def __str__(self) -> str:
+        """Représentation des deux cadrans."""
+        return (f"Blancs {self.formater_duree(self.temps_restant('blanc'))} | "
+                f"Noirs {self.formater_duree(self.temps_restant('noir'))}")
@@ -0,0 +1,171 @@
+"""
+Module contenant l'écriture et la lecture des parties au format PGN.
+Les coups sont convertis en notation algébrique standard (SAN) : lettres
+anglaises des pièces, levée d'ambiguïté par colonne puis par rangée,
+'x' pour les prises, '=' pour les promotions, '+' et '#' pour l'échec et
+le mat, 'O-O' et 'O-O-O' pour les roques (voir src/notation.py).
+La lecture parcourt un fichier partie par partie, sans le charger en entier.
+"""
+
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from src.jeu import Jeu
+from src.notation import LETTRES_SAN, coup_vers_san as san_plateau
+
+# Les sept en-têtes obligatoires, dans l'ordre imposé par le format
+ENTETES_OBLIGATOIRES = ('Event', 'Site', 'Date', 'Round', 'White', 'Black', 'Result')
+
+LONGUEUR_LIGNE = 79
+
+RESULTATS = ('1-0', '0-1', '1/2-1/2', '*')
+
+_ENTETE = re.compile(r'\[\s*(\w+)\s+"((?:[^"\\]|\\.)*)"\s*\]')
+# Commentaires, variantes, annotations numériques et mots du texte des coups
+_JETONS = re.compile(r'\{[^}]*\}?|;[^\n]*|[()]|\$\d+|[^\s(){};$]+')
+_NUMERO = re.compile(r'\d+\.+')
+
+
+def coup_vers_san(jeu: Jeu, depart: Tuple[int, int], arrivee: Tuple[int, int],
+                  promotion: Optional[type] = None) -> str:
+    """
+    Convertit un coup légal d'une partie en notation algébrique standard.
+    
+    Le coup n'est pas joué : le plateau est restauré avant de retourner
+    (voir notation.coup_vers_san).
+    
+    Args:
+        jeu: La partie, avant le coup
+        depart: Position de départ (ligne, colonne)
+        arrivee: Position d'arrivée (ligne, colonne)
+        promotion: Classe de la pièce de promotion (Reine si None)
+        
+    Returns:
+        Le coup en notation SAN (ex: 'Nbd7', 'exd6', 'e8=Q+', 'O-O')
+    """
+    return san_plateau(jeu.plateau, depart, arrivee, promotion)
+
+
+def ecrire_partie(entetes: Dict[str, str], coups: List[str], resultat: str,
+                  noirs_commencent: bool = False, premier_numero: int = 1,
+                  commentaire: Optional[str] = None) -> str:
+    """
+    Met en forme une partie au format PGN.
+    
+    Args:
+        entetes: En-têtes de la partie ('Result' est fixé par resultat)
+        coups: Coups en notation SAN, dans l'ordre
+        resultat: '1-0', '0-1', '1/2-1/2' ou '*'
+        noirs_commencent: True si le premier coup est joué par les noirs
+        premier_numero: Numéro du premier coup
+        commentaire: Commentaire placé avant le résultat (ou None)
+        
+    Returns:
+        Le texte PGN de la partie, terminé par une ligne vide
+    """
+    entetes = dict(entetes)
+    entetes['Result'] = resultat
+    lignes = [f'[{nom} "{_echapper(entetes.get(nom, "?"))}"]' for nom in ENTETES_OBLIGATOIRES]
+    lignes += [f'[{nom} "{_echapper(valeur)}"]' for nom, valeur in entetes.items()
+               if nom not in ENTETES_OBLIGATOIRES]
+    lignes.append('')
+    
+    jetons = []
+    numero, trait_noir = premier_numero, noirs_commencent
+    for indice, san in enumerate(coups):
+        if not trait_noir:
+            jetons.append(f"{numero}.")
+        elif indice == 0:
+            jetons.append(f"{numero}...")
+        jetons.append(san)
+        if trait_noir:
+            numero += 1
+        trait_noir = not trait_noir
+    if commentaire:
+        jetons.append('{' + commentaire.replace('}', ')') + '}')
+    jetons.append(resultat)
+    
+    # Le texte des coups est coupé en lignes de moins de 80 caractères
+    ligne = ''
+    for jeton in jetons:
+        if ligne and len(ligne) + 1 + len(jeton) > LONGUEUR_LIGNE:
+            lignes.append(ligne)
+            ligne = jeton
+        else:
+            ligne = f"{ligne} {jeton}" if ligne else jeton
+    lignes.append(ligne)
+    return '\n'.join(lignes) + '\n\n'
+
+
+def _echapper(valeur: str) -> str:
+    """Protège les guillemets et les barres obliques inverses d'une valeur d'en-tête."""
+    return valeur.replace('\\', '\\\\').replace('"', '\\"')
+
+
+def lire_parties(lignes: Iterable[str]) -> Iterator[Tuple[Dict[str, str], List[str], str]]:
+    """
+    Lit les parties d'un texte PGN, une à une.
+    
+    Une partie se termine à son résultat ou, à défaut, à la première
+    en-tête qui suit ses coups. Les commentaires, les variantes, les
+    annotations numériques ($n) et les numéros de coups sont ignorés ;
+    les coups ne sont pas vérifiés.
+    
+    Args:
+        lignes: Lignes du texte (par exemple un fichier ouvert)
+        
+    Returns:
+        Itérateur de tuples (en-têtes, coups en notation SAN, résultat) ; le
+        résultat est celui du texte des coups, à défaut celui de l'en-tête
+        'Result', à défaut '*'
+    """
+    entetes: Dict[str, str] = {}
+    coups: List[str] = []
+    profondeur = 0
+    commentaire = False
+    for ligne in lignes:
+        if commentaire:
+            # Un commentaire entre accolades peut s'étendre sur plusieurs lignes
+            fin = ligne.find('}')
+            if fin < 0:
+                continue
+            ligne = ligne[fin + 1:]
+            commentaire = False
+        elif ligne.startswith('%'):
+            continue
+        else:
+            correspondance = _ENTETE.match(ligne.lstrip())
+            if correspondance:
+                if coups:
+                    yield entetes, coups, _resultat_entete(entetes)
+                    entetes, coups, profondeur = {}, [], 0
+                nom, valeur = correspondance.groups()
+                entetes[nom] = re.sub(r'\\(.)', r'\1', valeur)
+                continue
+        
+        for jeton in _JETONS.findall(ligne):
+            premier = jeton[0]
+            if premier == '{':
+                commentaire = not jeton.endswith('}')
+            elif premier in ';$':
+                continue
+            elif jeton == '(':
+                profondeur += 1
+            elif jeton == ')':
+                profondeur = max(profondeur - 1, 0)
+            elif profondeur == 0:
+                if jeton in RESULTATS:
+                    yield entetes, coups, jeton
+                    entetes, coups = {}, []
+                    continue
+                if premier.isdigit() and '.' in jeton:
+                    jeton = _NUMERO.sub('', jeton, count=1)
+                if jeton:
+                    coups.append(jeton)
+    if coups or entetes:
+        yield entetes, coups, _resultat_entete(entetes)
+
+
+def _resultat_entete(entetes: Dict[str, str]) -> str:
+    """Retourne le résultat de l'en-tête 'Result', ou '*' s'il est absent ou invalide."""
+    resultat = entetes.get('Result', '*')
+    return resultat if resultat in RESULTATS else '*'
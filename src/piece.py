@@ -15,8 +15,15 @@ class Piece(ABC):
         couleur (str): La couleur de la pièce ('blanc' ou 'noir')
         position (Tuple[int, int]): Position actuelle (ligne, colonne)
         a_bouge (bool): Indique si la pièce a déjà bougé (pour roque et en passant)
+        valeur (int): Valeur matérielle de la pièce en centièmes de pion
+    
+    Une pièce n'est à jour que tant qu'elle est dans la grille de son plateau :
+    un plateau copié (Plateau.copier) remplace ses pièces par des clones au
+    moment de les modifier.
     """
     
+    valeur = 0
+    
     def __init__(self, couleur: str, position: Tuple[int, int]):
         """
         Initialise une pièce.
@@ -106,6 +113,8 @@ class Piece(ABC):
 class Pion(Piece):
     """Classe représentant un pion."""
     
+    valeur = 100
+    
     def symbole(self) -> str:
         """Retourne le symbole du pion."""
         return '♙' if self.couleur == 'blanc' else '♟'
@@ -153,6 +162,8 @@ class Pion(Piece):
 class Tour(Piece):
     """Classe représentant une tour."""
     
+    valeur = 500
+    
     def symbole(self) -> str:
         """Retourne le symbole de la tour."""
         return '♖' if self.couleur == 'blanc' else '♜'
@@ -169,6 +180,8 @@ class Tour(Piece):
 class Cavalier(Piece):
     """Classe représentant un cavalier."""
     
+    valeur = 320
+    
     def symbole(self) -> str:
         """Retourne le symbole du cavalier."""
         return '♘' if self.couleur == 'blanc' else '♞'
@@ -204,6 +217,8 @@ class Cavalier(Piece):
 class Fou(Piece):
     """Classe représentant un fou."""
     
+    valeur = 330
+    
     def symbole(self) -> str:
         """Retourne le symbole du fou."""
         return '♗' if self.couleur == 'blanc' else '♝'
@@ -220,6 +235,8 @@ class Fou(Piece):
 class Reine(Piece):
     """Classe représentant une reine."""
     
+    valeur = 900
+    
     def symbole(self) -> str:
         """Retourne le symbole de la reine."""
         return '♕' if self.couleur == 'blanc' else '♛'
@@ -240,6 +257,8 @@ class Reine(Piece):
 class Roi(Piece):
     """Classe représentant un roi."""
     
+    valeur = 20000
+    
     def symbole(self) -> str:
         """Retourne le symbole du roi."""
         return '♔' if self.couleur == 'blanc' else '♚'
@@ -2,10 +2,46 @@
 Module contenant la classe Plateau pour gérer l'échiquier.
 """
 
-from typing import List, Tuple, Optional
+import random
+from typing import Dict, List, Tuple, Optional, Collection
 from src.piece import Piece, Pion, Tour, Cavalier, Fou, Reine, Roi
 
 
+# Directions de déplacement utilisées pour la détection des attaques
+DIRECTIONS_DROITES = [(0, 1), (0, -1), (1, 0), (-1, 0)]
+DIRECTIONS_DIAGONALES = [(1, 1), (1, -1), (-1, 1), (-1, -1)]
+DEPLACEMENTS_CAVALIER = [
+    (-2, -1), (-2, 1), (-1, -2), (-1, 2),
+    (1, -2), (1, 2), (2, -1), (2, 1)
+]
+DIRECTIONS_ROI = DIRECTIONS_DROITES + DIRECTIONS_DIAGONALES
+
+# Les quatre axes de rayons, chacun avec les pièces à longue portée qui s'y déplacent
+AXES = [((0, 1), (Tour, Reine)), ((1, 0), (Tour, Reine)),
+        ((1, 1), (Fou, Reine)), ((1, -1), (Fou, Reine))]
+# Les huit directions, chacune avec les pièces à longue portée qui s'y déplacent
+DIRECTIONS_GLISSANTES = [(direction, types_glissants) for (d_ligne, d_colonne), types_glissants in AXES
+                         for direction in ((d_ligne, d_colonne), (-d_ligne, -d_colonne))]
+
+# Clés de Zobrist des pions seuls (voir Plateau.cle_pions), à graine fixe
+_generateur_pions = random.Random(20240917)
+CLES_PIONS: Dict[str, List[int]] = {
+    couleur: [_generateur_pions.getrandbits(64) for _ in range(64)] for couleur in ('blanc', 'noir')
+}
+
+# Cases de chaque rayon, de la plus proche à la plus éloignée : RAYONS[direction][ligne][colonne]
+RAYONS = {
+    (d_ligne, d_colonne): [[[(ligne + d_ligne * k, colonne + d_colonne * k) for k in range(1, 8)
+                             if 0 <= ligne + d_ligne * k < 8 and 0 <= colonne + d_colonne * k < 8]
+                            for colonne in range(8)] for ligne in range(8)]
+    for d_ligne, d_colonne in DIRECTIONS_ROI
+}
+# Cases atteintes par un saut de cavalier depuis chaque case : SAUTS_CAVALIER[ligne][colonne]
+SAUTS_CAVALIER = [[[(ligne + d_ligne, colonne + d_colonne) for d_ligne, d_colonne in DEPLACEMENTS_CAVALIER
+                    if 0 <= ligne + d_ligne < 8 and 0 <= colonne + d_colonne < 8]
+                   for colonne in range(8)] for ligne in range(8)]
+
+
 class Plateau:
     """
     Classe représentant le plateau d'échecs.
@@ -14,6 +50,21 @@ class Plateau:
         grille (List[List[Optional[Piece]]]): Grille 8x8 contenant les pièces
         pieces_capturees (List[Piece]): Liste des pièces capturées
         position_en_passant (Optional[Tuple[int, int]]): Position pour la prise en passant
+        attaques (Optional[Dict[str, List[List[int]]]]): Nombre d'attaquants de chaque
+            couleur sur chaque case, ou None si les cartes d'attaques sont désactivées
+    
+    Les mouvements pseudo-légaux de chaque pièce sont mis en cache par
+    mouvements() ; placer_piece() et retirer_piece() notent les cases
+    modifiées, et seules les pièces dont les mouvements dépendent de ces cases
+    sont recalculées à la requête suivante.
+    
+    Les copies (copier()) partagent les rangées de la grille et leurs pièces :
+    une rangée partagée n'est jamais modifiée sur place, elle est d'abord
+    recopiée avec ses pièces par le plateau qui la modifie. Cela vaut aussi
+    pour le plateau copié : après copier(), une pièce obtenue auparavant peut
+    être remplacée par un clone à la modification suivante de sa rangée, et
+    ne plus suivre le jeu. Il faut donc relire les pièces dans la grille
+    plutôt que les conserver d'un coup à l'autre.
     """
     
     def __init__(self):
@@ -21,9 +72,22 @@ class Plateau:
         self.grille: List[List[Optional[Piece]]] = [[None for _ in range(8)] for _ in range(8)]
         self.pieces_capturees: List[Piece] = []
         self.position_en_passant: Optional[Tuple[int, int]] = None
+        self.attaques: Optional[Dict[str, List[List[int]]]] = None
+        # Cache des mouvements par case, cases modifiées depuis la dernière
+        # synchronisation (avec leur contenu d'alors) et case d'en passant connue du cache
+        self._mouvements: Dict[Tuple[int, int], List[Tuple[int, int]]] = {}
+        self._modifiees: Dict[Tuple[int, int], Tuple[Optional[Piece], bool]] = {}
+        self._en_passant_mouvements: Optional[Tuple[int, int]] = None
+        # Rangées partagées avec d'autres plateaux (bit 'ligne'), à recopier avant modification
+        self._lignes_partagees = 0
+        # Clé des pions, tenue à jour par placer_piece() et retirer_piece() une fois calculée
+        self._cle_pions: Optional[int] = None
     
     def initialiser(self):
         """Place toutes les pièces dans leur position initiale."""
+        for ligne in range(8):
+            self._posseder_ligne(ligne)
+        
         # Pions
         for col in range(8):
             self.grille[1][col] = Pion('noir', (1, col))
@@ -54,6 +118,12 @@ class Plateau:
         # Rois
         self.grille[0][4] = Roi('noir', (0, 4))
         self.grille[7][4] = Roi('blanc', (7, 4))
+        
+        self._mouvements.clear()
+        self._modifiees.clear()
+        self._cle_pions = None
+        if self.attaques is not None:
+            self.activer_attaques()
     
     def obtenir_piece(self, position: Tuple[int, int]) -> Optional[Piece]:
         """
@@ -79,7 +149,20 @@ class Plateau:
             position: Position de destination (ligne, colonne)
         """
         ligne, colonne = position
-        self.grille[ligne][colonne] = piece
+        if self._lignes_partagees >> ligne & 1:
+            self._posseder_ligne(ligne)
+        if position not in self._modifiees:
+            self._noter_modification(position)
+        if self._cle_pions is not None:
+            ancienne = self.grille[ligne][colonne]
+            if isinstance(ancienne, Pion):
+                self._cle_pions ^= CLES_PIONS[ancienne.couleur][ligne * 8 + colonne]
+            if isinstance(piece, Pion):
+                self._cle_pions ^= CLES_PIONS[piece.couleur][ligne * 8 + colonne]
+        if self.attaques is None:
+            self.grille[ligne][colonne] = piece
+        else:
+            self._modifier_case(ligne, colonne, piece)
         piece.position = position
     
     def retirer_piece(self, position: Tuple[int, int]) -> Optional[Piece]:
@@ -94,7 +177,17 @@ class Plateau:
         """
         ligne, colonne = position
         piece = self.grille[ligne][colonne]
-        self.grille[ligne][colonne] = None
+        if piece is not None and self._lignes_partagees >> ligne & 1:
+            self._posseder_ligne(ligne)
+            piece = self.grille[ligne][colonne]
+        if piece is not None and position not in self._modifiees:
+            self._noter_modification(position)
+        if self._cle_pions is not None and isinstance(piece, Pion):
+            self._cle_pions ^= CLES_PIONS[piece.couleur][ligne * 8 + colonne]
+        if self.attaques is None:
+            self.grille[ligne][colonne] = None
+        elif piece is not None:
+            self._modifier_case(ligne, colonne, None)
         return piece
     
     def deplacer_piece(self, depart: Tuple[int, int], arrivee: Tuple[int, int]) -> Optional[Piece]:
@@ -123,6 +216,123 @@ class Plateau:
         
         return piece_capturee
     
+    def cle_pions(self) -> int:
+        """
+        Retourne la clé de Zobrist des seuls pions de la position.
+        
+        Calculée entièrement au premier appel, la clé est ensuite tenue à
+        jour à chaque pion posé ou retiré. Elle indexe la table des
+        structures de pions (voir table_pions.TablePions).
+        
+        Returns:
+            Clé de 64 bits
+        """
+        if self._cle_pions is None:
+            cle = 0
+            for ligne in range(8):
+                for colonne in range(8):
+                    piece = self.grille[ligne][colonne]
+                    if isinstance(piece, Pion):
+                        cle ^= CLES_PIONS[piece.couleur][ligne * 8 + colonne]
+            self._cle_pions = cle
+        return self._cle_pions
+    
+    def _posseder_ligne(self, ligne: int):
+        """Recopie une rangée partagée, avec ses pièces, pour pouvoir la modifier."""
+        if not self._lignes_partagees >> ligne & 1:
+            return
+        nouvelle_rangee = []
+        for piece in self.grille[ligne]:
+            if piece is not None:
+                copie = type(piece)(piece.couleur, piece.position)
+                copie.a_bouge = piece.a_bouge
+                piece = copie
+            nouvelle_rangee.append(piece)
+        self.grille[ligne] = nouvelle_rangee
+        self._lignes_partagees &= ~(1 << ligne)
+    
+    def _noter_modification(self, position: Tuple[int, int]):
+        """Retient le contenu d'une case avant sa première modification depuis la synchronisation."""
+        piece = self.grille[position[0]][position[1]]
+        self._modifiees[position] = (piece, piece is not None and piece.a_bouge)
+    
+    def mouvements(self, position: Tuple[int, int]) -> List[Tuple[int, int]]:
+        """
+        Retourne les mouvements pseudo-légaux de la pièce d'une position, via le cache.
+        
+        Le résultat est celui de piece.mouvements_possibles(plateau), calculé
+        seulement si la pièce est nouvelle ou si une case dont ses mouvements
+        dépendent a changé. La liste retournée est partagée et ne doit pas
+        être modifiée. Les écritures directes dans la grille ne sont pas suivies.
+        
+        Args:
+            position: Position de la pièce (ligne, colonne)
+            
+        Returns:
+            Liste des positions possibles (vide si la case est vide)
+        """
+        if self._modifiees or self.position_en_passant != self._en_passant_mouvements:
+            self._synchroniser_mouvements()
+        mouvements = self._mouvements.get(position)
+        if mouvements is None:
+            piece = self.grille[position[0]][position[1]]
+            mouvements = piece.mouvements_possibles(self) if piece is not None else []
+            self._mouvements[position] = mouvements
+        return mouvements
+    
+    def _synchroniser_mouvements(self):
+        """Invalide les mouvements en cache qui dépendent des cases modifiées."""
+        if self.position_en_passant != self._en_passant_mouvements:
+            for case in (self._en_passant_mouvements, self.position_en_passant):
+                if case is not None:
+                    self._invalider_pions(case)
+            self._en_passant_mouvements = self.position_en_passant
+        
+        for case, (piece, a_bouge) in self._modifiees.items():
+            actuelle = self.grille[case[0]][case[1]]
+            # Case revenue à son état (coup joué puis annulé) : rien ne change
+            if actuelle is piece and (piece is None or piece.a_bouge == a_bouge):
+                continue
+            self._invalider_autour(case)
+        self._modifiees.clear()
+    
+    def _invalider_pions(self, case: Tuple[int, int]):
+        """Invalide les pions dont la poussée ou la prise dépend d'une case."""
+        ligne, colonne = case
+        for couleur, recul in (('blanc', 1), ('noir', -1)):
+            for d_ligne, d_colonne in ((recul, 0), (2 * recul, 0), (recul, -1), (recul, 1)):
+                position = (ligne + d_ligne, colonne + d_colonne)
+                if 0 <= position[0] < 8 and 0 <= position[1] < 8:
+                    piece = self.grille[position[0]][position[1]]
+                    if isinstance(piece, Pion) and piece.couleur == couleur:
+                        self._mouvements.pop(position, None)
+    
+    def _invalider_autour(self, case: Tuple[int, int]):
+        """
+        Invalide les mouvements de la pièce d'une case modifiée et de celles
+        qui en dépendent : cavaliers et rois voisins, pions, roi de la même
+        rangée (roque) et pièces à longue portée dont un rayon atteint la case.
+        """
+        ligne, colonne = case
+        grille = self.grille
+        cache = self._mouvements
+        cache.pop(case, None)
+        for sauts, classe in ((DEPLACEMENTS_CAVALIER, Cavalier), (DIRECTIONS_ROI, Roi)):
+            for d_ligne, d_colonne in sauts:
+                l, c = ligne + d_ligne, colonne + d_colonne
+                if 0 <= l < 8 and 0 <= c < 8 and isinstance(grille[l][c], classe):
+                    cache.pop((l, c), None)
+        if isinstance(grille[ligne][4], Roi):
+            cache.pop((ligne, 4), None)
+        self._invalider_pions(case)
+        for direction, types_glissants in DIRECTIONS_GLISSANTES:
+            for l, c in RAYONS[direction][ligne][colonne]:
+                bout = grille[l][c]
+                if bout is not None:
+                    if isinstance(bout, types_glissants):
+                        cache.pop((l, c), None)
+                    break
+    
     def est_case_vide(self, position: Tuple[int, int]) -> bool:
         """
         Vérifie si une case est vide.
@@ -183,6 +393,461 @@ class Plateau:
                     pieces.append(piece)
         return pieces
     
+    def attaquants(self, case: Tuple[int, int], couleur: str,
+                   cases_ignorees: Collection[Tuple[int, int]] = ()) -> List[Piece]:
+        """
+        Retourne les pièces d'une couleur qui attaquent une case.
+        
+        Le calcul part de la case visée (rayons, sauts de cavalier, cases
+        voisines) au lieu de générer les mouvements de chaque pièce adverse.
+        Les cases ignorées sont considérées comme vides, ce qui permet de
+        découvrir les attaques en rayons X lors d'un échange.
+        
+        Args:
+            case: Case attaquée (ligne, colonne)
+            couleur: Couleur des pièces attaquantes
+            cases_ignorees: Cases à traiter comme vides
+            
+        Returns:
+            Liste des pièces attaquantes
+        """
+        ligne, colonne = case
+        resultat = []
+        
+        # Pions : un pion blanc attaque vers le haut, donc se trouve une ligne plus bas
+        ligne_pion = ligne + 1 if couleur == 'blanc' else ligne - 1
+        for d_colonne in (-1, 1):
+            position = (ligne_pion, colonne + d_colonne)
+            if position in cases_ignorees:
+                continue
+            piece = self.obtenir_piece(position)
+            if isinstance(piece, Pion) and piece.couleur == couleur:
+                resultat.append(piece)
+        
+        # Cavaliers
+        for d_ligne, d_colonne in DEPLACEMENTS_CAVALIER:
+            position = (ligne + d_ligne, colonne + d_colonne)
+            if position in cases_ignorees:
+                continue
+            piece = self.obtenir_piece(position)
+            if isinstance(piece, Cavalier) and piece.couleur == couleur:
+                resultat.append(piece)
+        
+        # Pièces à longue portée (et roi sur la première case du rayon)
+        for directions, types_glissants in ((DIRECTIONS_DROITES, (Tour, Reine)),
+                                            (DIRECTIONS_DIAGONALES, (Fou, Reine))):
+            for d_ligne, d_colonne in directions:
+                nouvelle_ligne, nouvelle_colonne = ligne + d_ligne, colonne + d_colonne
+                distance = 1
+                while 0 <= nouvelle_ligne < 8 and 0 <= nouvelle_colonne < 8:
+                    if (nouvelle_ligne, nouvelle_colonne) not in cases_ignorees:
+                        piece = self.grille[nouvelle_ligne][nouvelle_colonne]
+                        if piece is not None:
+                            if piece.couleur == couleur and (
+                                    isinstance(piece, types_glissants) or
+                                    (distance == 1 and isinstance(piece, Roi))):
+                                resultat.append(piece)
+                            break
+                    nouvelle_ligne += d_ligne
+                    nouvelle_colonne += d_colonne
+                    distance += 1
+        
+        return resultat
+    
+    def est_case_attaquee(self, case: Tuple[int, int], couleur: str) -> bool:
+        """
+        Vérifie si une case est attaquée par au moins une pièce d'une couleur.
+        
+        Avec les cartes d'attaques activées, c'est une simple lecture de table.
+        Sinon, la recherche part de la case comme attaquants(), mais s'arrête
+        au premier attaquant trouvé.
+        
+        Args:
+            case: Case à vérifier (ligne, colonne)
+            couleur: Couleur des pièces attaquantes
+            
+        Returns:
+            True si la case est attaquée, False sinon
+        """
+        if self.attaques is not None:
+            return self.attaques[couleur][case[0]][case[1]] > 0
+        
+        grille = self.grille
+        ligne, colonne = case
+        ligne_pion = ligne + 1 if couleur == 'blanc' else ligne - 1
+        if 0 <= ligne_pion < 8:
+            for colonne_pion in (colonne - 1, colonne + 1):
+                if 0 <= colonne_pion < 8:
+                    piece = grille[ligne_pion][colonne_pion]
+                    if isinstance(piece, Pion) and piece.couleur == couleur:
+                        return True
+        for l, c in SAUTS_CAVALIER[ligne][colonne]:
+            piece = grille[l][c]
+            if isinstance(piece, Cavalier) and piece.couleur == couleur:
+                return True
+        for direction, types_glissants in DIRECTIONS_GLISSANTES:
+            premiere = True
+            for l, c in RAYONS[direction][ligne][colonne]:
+                piece = grille[l][c]
+                if piece is not None:
+                    if piece.couleur == couleur and (isinstance(piece, types_glissants) or
+                                                     (premiere and isinstance(piece, Roi))):
+                        return True
+                    break
+                premiere = False
+        return False
+    
+    def activer_attaques(self):
+        """
+        Active (ou recalcule) les cartes d'attaques de chaque couleur.
+        
+        Les cartes comptent, pour chaque case, les pièces de chaque couleur
+        qui l'attaquent (une case occupée par une pièce de la même couleur est
+        comptée comme défendue). Elles sont ensuite tenues à jour par
+        placer_piece() et retirer_piece() : seule la pièce de la case modifiée
+        et les rayons des pièces à longue portée qui traversent cette case sont
+        recalculés. Les écritures directes dans la grille ne sont pas suivies.
+        """
+        self.attaques = {'blanc': [[0] * 8 for _ in range(8)],
+                         'noir': [[0] * 8 for _ in range(8)]}
+        for ligne in range(8):
+            for colonne in range(8):
+                piece = self.grille[ligne][colonne]
+                if piece is not None:
+                    self._compter_controle(ligne, colonne, piece, 1)
+    
+    def desactiver_attaques(self):
+        """Désactive les cartes d'attaques : les requêtes repartent de la case visée."""
+        self.attaques = None
+    
+    def cases_controlees(self, position: Tuple[int, int]) -> List[Tuple[int, int]]:
+        """
+        Retourne les cases attaquées par la pièce d'une position.
+        
+        Contrairement à mouvements_possibles(), les cases occupées par des
+        pièces de la même couleur sont incluses, les poussées de pion et le
+        roque exclus.
+        
+        Args:
+            position: Position de la pièce (ligne, colonne)
+            
+        Returns:
+            Liste des cases attaquées (vide si la case est vide)
+        """
+        ligne, colonne = position
+        piece = self.grille[ligne][colonne]
+        if piece is None:
+            return []
+        
+        if isinstance(piece, Pion):
+            ligne_prise = ligne - 1 if piece.couleur == 'blanc' else ligne + 1
+            if not 0 <= ligne_prise < 8:
+                return []
+            return [(ligne_prise, c) for c in (colonne - 1, colonne + 1) if 0 <= c < 8]
+        
+        if isinstance(piece, (Cavalier, Roi)):
+            sauts = DEPLACEMENTS_CAVALIER if isinstance(piece, Cavalier) else DIRECTIONS_ROI
+            return [(ligne + d_ligne, colonne + d_colonne) for d_ligne, d_colonne in sauts
+                    if 0 <= ligne + d_ligne < 8 and 0 <= colonne + d_colonne < 8]
+        
+        directions = []
+        if isinstance(piece, (Tour, Reine)):
+            directions += DIRECTIONS_DROITES
+        if isinstance(piece, (Fou, Reine)):
+            directions += DIRECTIONS_DIAGONALES
+        cases = []
+        for direction in directions:
+            for case in RAYONS[direction][ligne][colonne]:
+                cases.append(case)
+                if self.grille[case[0]][case[1]] is not None:
+                    break
+        return cases
+    
+    def _compter_controle(self, ligne: int, colonne: int, piece: Piece, signe: int):
+        """Ajoute (signe 1) ou retire (signe -1) les attaques d'une pièce aux cartes."""
+        carte = self.attaques[piece.couleur]
+        for ligne_cible, colonne_cible in self.cases_controlees((ligne, colonne)):
+            carte[ligne_cible][colonne_cible] += signe
+    
+    def _modifier_case(self, ligne: int, colonne: int, piece: Optional[Piece]):
+        """
+        Change le contenu d'une case en tenant les cartes d'attaques à jour.
+        
+        Seule cette case change : la première pièce rencontrée dans chaque
+        direction est donc la même avant et après. Si la case passe de vide à
+        occupée (ou l'inverse), le rayon d'une pièce à longue portée qui y
+        arrive s'arrête désormais sur elle (ou la traverse) : on retire (ou
+        ajoute) ses attaques sur le segment au-delà, jusqu'à la pièce suivante.
+        """
+        ancienne = self.grille[ligne][colonne]
+        if ancienne is not None:
+            self._compter_controle(ligne, colonne, ancienne, -1)
+        
+        if (ancienne is None) != (piece is None):
+            signe = 1 if piece is None else -1
+            grille = self.grille
+            for (d_ligne, d_colonne), types_glissants in AXES:
+                # Parcourir l'axe des deux côtés de la case
+                segments = []
+                for direction in ((d_ligne, d_colonne), (-d_ligne, -d_colonne)):
+                    rayon = RAYONS[direction][ligne][colonne]
+                    bout = None
+                    longueur = 0
+                    for ligne_rayon, colonne_rayon in rayon:
+                        longueur += 1
+                        bout = grille[ligne_rayon][colonne_rayon]
+                        if bout is not None:
+                            break
+                    segments.append((rayon[:longueur], bout))
+                (segment_avant, bout_avant), (segment_arriere, bout_arriere) = segments
+                if isinstance(bout_avant, types_glissants):
+                    carte = self.attaques[bout_avant.couleur]
+                    for ligne_cible, colonne_cible in segment_arriere:
+                        carte[ligne_cible][colonne_cible] += signe
+                if isinstance(bout_arriere, types_glissants):
+                    carte = self.attaques[bout_arriere.couleur]
+                    for ligne_cible, colonne_cible in segment_avant:
+                        carte[ligne_cible][colonne_cible] += signe
+        
+        self.grille[ligne][colonne] = piece
+        if piece is not None:
+            self._compter_controle(ligne, colonne, piece, 1)
+    
+    def echange_statique(self, depart: Tuple[int, int], arrivee: Tuple[int, int]) -> int:
+        """
+        Évalue statiquement la suite de captures sur une case (SEE).
+        
+        Chaque camp reprend à tour de rôle avec sa pièce la moins précieuse,
+        et peut s'arrêter dès que continuer lui ferait perdre du matériel.
+        Aucun coup n'est joué : les pièces déjà engagées sont simplement
+        ignorées pour faire apparaître les attaquants cachés derrière elles.
+        
+        Args:
+            depart: Position de la pièce qui capture en premier
+            arrivee: Case sur laquelle a lieu l'échange
+            
+        Returns:
+            Gain matériel attendu pour le camp qui capture (en centièmes de pion)
+        """
+        piece = self.obtenir_piece(depart)
+        if piece is None:
+            return 0
+        
+        cible = self.obtenir_piece(arrivee)
+        if cible is not None:
+            gains = [cible.valeur]
+        elif isinstance(piece, Pion) and arrivee == self.position_en_passant:
+            gains = [Pion.valeur]
+        else:
+            gains = [0]
+        
+        cases_ignorees = {depart}
+        valeur_en_prise = piece.valeur
+        couleur = 'noir' if piece.couleur == 'blanc' else 'blanc'
+        
+        while True:
+            attaquants = self.attaquants(arrivee, couleur, cases_ignorees)
+            if not attaquants:
+                break
+            attaquant = min(attaquants, key=lambda p: p.valeur)
+            gains.append(valeur_en_prise - gains[-1])
+            valeur_en_prise = attaquant.valeur
+            cases_ignorees.add(attaquant.position)
+            couleur = 'noir' if couleur == 'blanc' else 'blanc'
+        
+        # Remonter la séquence : chaque camp choisit entre reprendre ou s'arrêter
+        while len(gains) > 1:
+            gain = gains.pop()
+            gains[-1] = -max(-gains[-1], gain)
+        
+        return gains[0]
+    
+    def est_coup_pseudo_legal(self, depart: Tuple[int, int], arrivee: Tuple[int, int]) -> bool:
+        """
+        Vérifie un seul coup sans générer tous les mouvements de la pièce.
+        
+        Le résultat est celui de 'arrivee in piece.mouvements_possibles(plateau)' :
+        géométrie du déplacement, cases traversées libres (parcours du rayon
+        entre les deux cases), règles du pion (poussée, prise, en passant) et
+        conditions du roque hors cases attaquées. Le coup peut encore laisser
+        le roi en échec.
+        
+        Args:
+            depart: Position de départ (ligne, colonne)
+            arrivee: Position d'arrivée (ligne, colonne)
+            
+        Returns:
+            True si la pièce de la case de départ peut aller sur la case d'arrivée
+        """
+        if not self.est_position_valide(depart) or not self.est_position_valide(arrivee):
+            return False
+        piece = self.grille[depart[0]][depart[1]]
+        if piece is None or depart == arrivee:
+            return False
+        cible = self.grille[arrivee[0]][arrivee[1]]
+        if cible is not None and cible.couleur == piece.couleur:
+            return False
+        d_ligne, d_colonne = arrivee[0] - depart[0], arrivee[1] - depart[1]
+        
+        if isinstance(piece, Cavalier):
+            return (abs(d_ligne), abs(d_colonne)) in ((1, 2), (2, 1))
+        
+        if isinstance(piece, Roi):
+            if abs(d_ligne) <= 1 and abs(d_colonne) <= 1:
+                return True
+            if d_ligne != 0 or piece.a_bouge:
+                return False
+            if d_colonne == 2:
+                return piece._peut_roquer_petit(self)
+            return d_colonne == -2 and piece._peut_roquer_grand(self)
+        
+        if isinstance(piece, Pion):
+            direction = -1 if piece.couleur == 'blanc' else 1
+            if d_colonne == 0:
+                if cible is not None:
+                    return False
+                if d_ligne == direction:
+                    return True
+                return d_ligne == 2 * direction and not piece.a_bouge and \
+                    self.grille[depart[0] + direction][depart[1]] is None
+            return d_ligne == direction and abs(d_colonne) == 1 and \
+                (cible is not None or arrivee == self.position_en_passant)
+        
+        # Pièces à longue portée : direction autorisée puis cases intermédiaires vides
+        en_ligne = d_ligne == 0 or d_colonne == 0
+        en_diagonale = abs(d_ligne) == abs(d_colonne)
+        if (isinstance(piece, Tour) and not en_ligne) or \
+                (isinstance(piece, Fou) and not en_diagonale) or \
+                not (en_ligne or en_diagonale):
+            return False
+        pas_ligne = (d_ligne > 0) - (d_ligne < 0)
+        pas_colonne = (d_colonne > 0) - (d_colonne < 0)
+        ligne, colonne = depart[0] + pas_ligne, depart[1] + pas_colonne
+        while (ligne, colonne) != arrivee:
+            if self.grille[ligne][colonne] is not None:
+                return False
+            ligne += pas_ligne
+            colonne += pas_colonne
+        return True
+    
+    def jouer_coup(self, depart: Tuple[int, int], arrivee: Tuple[int, int],
+                   promotion: Optional[type] = None) -> Tuple:
+        """
+        Joue un coup complet sur le plateau, sans affichage ni saisie.
+        
+        Gère la prise en passant, le déplacement de la tour lors du roque,
+        la promotion (en reine par défaut) et la mise à jour de la case
+        de prise en passant. Le coup n'est pas validé.
+        
+        Args:
+            depart: Position de départ (ligne, colonne)
+            arrivee: Position d'arrivée (ligne, colonne)
+            promotion: Classe de la pièce de promotion (Reine si None)
+            
+        Returns:
+            Les informations nécessaires à annuler_coup()
+        """
+        self._posseder_ligne(depart[0])
+        piece = self.grille[depart[0]][depart[1]]
+        ancien_en_passant = self.position_en_passant
+        ancien_a_bouge = piece.a_bouge
+        
+        # Déterminer la case de la pièce capturée (différente en cas d'en passant)
+        case_capture = arrivee
+        if isinstance(piece, Pion) and arrivee == ancien_en_passant and \
+                self.grille[arrivee[0]][arrivee[1]] is None:
+            case_capture = (depart[0], arrivee[1])
+        
+        piece_capturee = self.retirer_piece(case_capture)
+        if piece_capturee:
+            self.pieces_capturees.append(piece_capturee)
+        
+        self.retirer_piece(depart)
+        self.placer_piece(piece, arrivee)
+        piece.a_bouge = True
+        
+        # Roque : déplacer aussi la tour
+        roque = None
+        if isinstance(piece, Roi) and abs(arrivee[1] - depart[1]) == 2:
+            ligne = depart[0]
+            if arrivee[1] > depart[1]:
+                tour_depart, tour_arrivee = (ligne, 7), (ligne, 5)
+            else:
+                tour_depart, tour_arrivee = (ligne, 0), (ligne, 3)
+            tour = self.retirer_piece(tour_depart)
+            roque = (tour, tour_depart, tour_arrivee, tour.a_bouge)
+            self.placer_piece(tour, tour_arrivee)
+            tour.a_bouge = True
+        
+        # Promotion
+        piece_promue = None
+        if isinstance(piece, Pion) and arrivee[0] in (0, 7):
+            classe = promotion if promotion is not None else Reine
+            piece_promue = classe(piece.couleur, arrivee)
+            piece_promue.a_bouge = True
+            self.placer_piece(piece_promue, arrivee)
+        
+        # Case de prise en passant pour le coup suivant
+        self.position_en_passant = None
+        if isinstance(piece, Pion) and abs(arrivee[0] - depart[0]) == 2:
+            self.position_en_passant = ((depart[0] + arrivee[0]) // 2, depart[1])
+        
+        return (depart, arrivee, piece, ancien_a_bouge, piece_capturee,
+                case_capture, ancien_en_passant, roque, piece_promue)
+    
+    def annuler_coup(self, coup_joue: Tuple):
+        """
+        Annule un coup joué avec jouer_coup().
+        
+        Args:
+            coup_joue: Les informations retournées par jouer_coup()
+        """
+        (depart, arrivee, piece, ancien_a_bouge, piece_capturee,
+         case_capture, ancien_en_passant, roque, piece_promue) = coup_joue
+        
+        # Les pièces sont relues sur la grille : depuis une copie du plateau,
+        # celles du coup joué peuvent être partagées et ne pas être modifiées
+        if roque is not None:
+            _, tour_depart, tour_arrivee, tour_a_bouge = roque
+            tour = self.retirer_piece(tour_arrivee)
+            self.placer_piece(tour, tour_depart)
+            tour.a_bouge = tour_a_bouge
+        
+        piece_arrivee = self.retirer_piece(arrivee)
+        if piece_promue is None:
+            piece = piece_arrivee
+        self.placer_piece(piece, depart)
+        piece.a_bouge = ancien_a_bouge
+        
+        if piece_capturee is not None:
+            self.pieces_capturees.pop()
+            self.placer_piece(piece_capturee, case_capture)
+        
+        self.position_en_passant = ancien_en_passant
+    
+    def jouer_coup_nul(self) -> Optional[Tuple[int, int]]:
+        """
+        Joue un coup nul : le trait passe sans qu'aucune pièce ne bouge.
+        
+        Seule la case de prise en passant est effacée ; le camp au trait est
+        porté par l'appelant. Réservé à la recherche (élagage par coup nul).
+        
+        Returns:
+            L'ancienne case de prise en passant, à passer à annuler_coup_nul()
+        """
+        ancien_en_passant = self.position_en_passant
+        self.position_en_passant = None
+        return ancien_en_passant
+    
+    def annuler_coup_nul(self, ancien_en_passant: Optional[Tuple[int, int]]):
+        """
+        Annule un coup nul joué avec jouer_coup_nul().
+        
+        Args:
+            ancien_en_passant: La valeur retournée par jouer_coup_nul()
+        """
+        self.position_en_passant = ancien_en_passant
+    
     def afficher(self):
         """Affiche le plateau dans le terminal."""
         print("\n   a b c d e f g h")
@@ -207,23 +872,31 @@ class Plateau:
     
     def copier(self) -> 'Plateau':
         """
-        Crée une copie du plateau.
+        Crée une copie du plateau, par copie sur écriture.
+        
+        Les rangées de la grille et leurs pièces sont partagées entre les
+        deux plateaux ; chacun recopie une rangée seulement au moment de la
+        modifier. Une copie coûte donc huit références, et un arbre de
+        positions dérivées occupe une mémoire proportionnelle à leurs
+        différences. Les mouvements en cache sont repris.
         
         Returns:
             Une nouvelle instance de Plateau avec le même état
         """
         nouveau_plateau = Plateau()
         
-        # Copier la grille
-        for ligne in range(8):
-            for colonne in range(8):
-                piece = self.grille[ligne][colonne]
-                if piece:
-                    # Créer une nouvelle instance de la même classe
-                    nouvelle_piece = type(piece)(piece.couleur, (ligne, colonne))
-                    nouvelle_piece.a_bouge = piece.a_bouge
-                    nouveau_plateau.grille[ligne][colonne] = nouvelle_piece
+        # Partager les rangées : plus aucun des deux plateaux ne peut les modifier sur place
+        nouveau_plateau.grille = list(self.grille)
+        nouveau_plateau._lignes_partagees = self._lignes_partagees = 0xFF
         
         nouveau_plateau.position_en_passant = self.position_en_passant
+        nouveau_plateau._cle_pions = self._cle_pions
+        if self._modifiees or self.position_en_passant != self._en_passant_mouvements:
+            self._synchroniser_mouvements()
+        nouveau_plateau._mouvements = dict(self._mouvements)
+        nouveau_plateau._en_passant_mouvements = self.position_en_passant
+        if self.attaques is not None:
+            nouveau_plateau.attaques = {couleur: [rangee[:] for rangee in carte]
+                                        for couleur, carte in self.attaques.items()}
         
         return nouveau_plateau
@@ -0,0 +1,293 @@
+"""
+Module contenant la réflexion sur le temps de l'adversaire (ponder).
+Le moteur tourne dans un processus séparé qui conserve sa table de
+transposition d'un coup à l'autre. Pendant que le joueur humain saisit son
+coup, le moteur analyse déjà la position qui suivrait la réponse attendue :
+si le joueur joue ce coup, la recherche continue simplement et son résultat
+est disponible presque immédiatement ; sinon elle est abandonnée.
+"""
+
+import multiprocessing
+import queue
+import threading
+import time
+from typing import List, Optional, Tuple
+from src.plateau import Plateau
+from src.moteur import Moteur, Coup
+from src.gestion_temps import GestionTemps
+from src.encodage import encoder_position, decoder_position
+
+# (meilleur coup ou None, score du point de vue du camp au trait, variante principale)
+Resultat = Tuple[Optional[Coup], int, List[Coup]]
+
+
+class _Travail:
+    """
+    Recherche demandée au processus du moteur.
+    
+    Attributs:
+        echeance (Optional[float]): Instant limite (illimité si None)
+        annule (bool): True si la recherche doit s'arrêter au plus tôt
+        gestion_temps (Optional[GestionTemps]): Gestion du temps reçue au cours de la recherche
+    """
+    
+    def __init__(self, encodage: bytes, echeance: Optional[float], profondeur_max: Optional[int],
+                 gestion_temps: Optional[GestionTemps]):
+        """Initialise une recherche à effectuer."""
+        self.encodage = encodage
+        self.echeance = echeance
+        self.profondeur_max = profondeur_max
+        self.gestion_initiale = gestion_temps
+        self.gestion_temps: Optional[GestionTemps] = None
+        self.annule = False
+
+
+class _ServiceMoteur:
+    """
+    Côté processus du moteur : un fil lit les commandes, un autre cherche.
+    
+    Commandes reçues :
+        ('chercher', encodage, temps_max, profondeur_max, gestion_temps) : une réponse
+            'resultat' suit toujours
+        ('ponderhit', temps_restant, gestion_temps) : fixe une limite à la recherche en cours
+        ('stop',) : interrompt la recherche en cours
+        ('quitter',) : termine le processus
+    """
+    
+    def __init__(self, connexion, taille_table_mo: int):
+        """Initialise le service avec un moteur persistant."""
+        self.connexion = connexion
+        self.moteur = Moteur(taille_table_mo=taille_table_mo)
+        self.travaux: 'queue.Queue[Optional[_Travail]]' = queue.Queue()
+        self.travail: Optional[_Travail] = None
+    
+    def boucle(self):
+        """Traite les commandes jusqu'à 'quitter' ou la fermeture de la connexion."""
+        fil = threading.Thread(target=self._rechercher, daemon=True)
+        fil.start()
+        while True:
+            try:
+                message = self.connexion.recv()
+            except (EOFError, OSError):
+                break
+            commande = message[0]
+            
+            if commande == 'chercher':
+                _, encodage, temps_max, profondeur_max, gestion_temps = message
+                echeance = time.perf_counter() + temps_max if temps_max is not None else None
+                self.travail = _Travail(encodage, echeance, profondeur_max, gestion_temps)
+                self.travaux.put(self.travail)
+            elif commande == 'ponderhit' and self.travail is not None:
+                _, temps_restant, gestion_temps = message
+                if gestion_temps is not None:
+                    # La pendule du moteur ne tourne qu'à partir de maintenant
+                    gestion_temps.demarrer()
+                    temps_restant = gestion_temps.limite_dure
+                    self.travail.gestion_temps = gestion_temps
+                self.travail.echeance = time.perf_counter() + temps_restant
+                self.moteur.fixer_echeance(temps_restant)
+            elif commande == 'stop' and self.travail is not None:
+                self.travail.annule = True
+                self.moteur.arreter()
+            elif commande == 'quitter':
+                break
+        
+        if self.travail is not None:
+            self.travail.annule = True
+        self.moteur.arreter()
+        self.travaux.put(None)
+        fil.join()
+    
+    def _rechercher(self):
+        """Corps du fil de recherche : traite les travaux un par un."""
+        while True:
+            travail = self.travaux.get()
+            if travail is None:
+                return
+            plateau, couleur = decoder_position(travail.encodage)
+            variante: List[Coup] = []
+            
+            def rapport(profondeur, score, noeuds, secondes, variante_iteration):
+                variante[:] = variante_iteration
+                # Une commande arrivée avant le début de la recherche a pu être
+                # effacée par chercher_iteratif() : la réappliquer à chaque itération
+                if travail.annule:
+                    self.moteur.arreter()
+                    return
+                if travail.echeance is not None:
+                    self.moteur.fixer_echeance(travail.echeance - time.perf_counter())
+                gestion = travail.gestion_temps
+                if gestion is not None and not gestion.continuer(variante_iteration[0], score):
+                    self.moteur.arreter()
+            
+            if travail.annule:
+                coup, score = None, 0
+            else:
+                restant = None
+                if travail.echeance is not None:
+                    restant = max(0.0, travail.echeance - time.perf_counter())
+                coup, score = self.moteur.chercher_iteratif(plateau, couleur, travail.profondeur_max,
+                                                            restant, rapport=rapport,
+                                                            gestion_temps=travail.gestion_initiale)
+            if coup is not None and (not variante or variante[0] != coup):
+                variante[:] = [coup]
+            try:
+                self.connexion.send(('resultat', coup, score, list(variante)))
+            except (BrokenPipeError, OSError):
+                return
+
+
+def _processus_moteur(connexion, taille_table_mo: int):
+    """Point d'entrée du processus du moteur."""
+    _ServiceMoteur(connexion, taille_table_mo).boucle()
+
+
+class MoteurAsynchrone:
+    """
+    Moteur exécuté dans un processus séparé, capable de réfléchir sur le temps adverse.
+    
+    S'utilise comme gestionnaire de contexte :
+        with MoteurAsynchrone() as moteur:
+            coup, score, variante = moteur.chercher(plateau, 'noir', temps_max=2.0)
+    
+    Attributs:
+        profondeur_max (Optional[int]): Profondeur maximale des recherches (illimitée si None)
+        ponderations (int): Nombre de réflexions lancées sur le temps adverse
+        ponderations_reussies (int): Nombre de réflexions dont le coup attendu a été joué
+    """
+    
+    def __init__(self, profondeur_max: Optional[int] = None, taille_table_mo: int = 16):
+        """
+        Démarre le processus du moteur.
+        
+        Args:
+            profondeur_max: Profondeur maximale des recherches (illimitée si None)
+            taille_table_mo: Taille de la table de transposition en mégaoctets
+        """
+        self.profondeur_max = profondeur_max
+        self.ponderations = 0
+        self.ponderations_reussies = 0
+        self._connexion, connexion_processus = multiprocessing.Pipe()
+        self._processus = multiprocessing.Process(target=_processus_moteur,
+                                                  args=(connexion_processus, taille_table_mo),
+                                                  daemon=True)
+        self._processus.start()
+        connexion_processus.close()
+        self._position_ponderee: Optional[bytes] = None
+        self._debut_ponderation = 0.0
+    
+    def __enter__(self) -> 'MoteurAsynchrone':
+        """Retourne le moteur au début d'un bloc with."""
+        return self
+    
+    def __exit__(self, *exception):
+        """Arrête le processus à la fin du bloc with."""
+        self.fermer()
+    
+    @property
+    def en_ponderation(self) -> bool:
+        """True si une réflexion sur le temps adverse est en cours."""
+        return self._position_ponderee is not None
+    
+    def _recevoir(self) -> Resultat:
+        """Attend la réponse à la dernière commande 'chercher'."""
+        _, coup, score, variante = self._connexion.recv()
+        return coup, score, variante
+    
+    def chercher(self, plateau: Plateau, couleur: str, temps_max: Optional[float] = None,
+                 gestion_temps: Optional[GestionTemps] = None) -> Resultat:
+        """
+        Cherche le meilleur coup et attend le résultat.
+        
+        Une réflexion en cours sur le temps adverse est d'abord abandonnée.
+        
+        Args:
+            plateau: Le plateau de jeu (non modifié)
+            couleur: Couleur du camp au trait
+            temps_max: Temps maximal en secondes (illimité si None)
+            gestion_temps: Gestion du temps sous une cadence (ou None)
+            
+        Returns:
+            Tuple (meilleur coup ou None, score, variante principale)
+        """
+        self.annuler_ponderation()
+        self._connexion.send(('chercher', encoder_position(plateau, couleur), temps_max,
+                              self.profondeur_max, gestion_temps))
+        return self._recevoir()
+    
+    def ponderer(self, plateau: Plateau, couleur: str, coup_attendu: Coup):
+        """
+        Lance, sans attendre, l'analyse de la position qui suivrait le coup attendu.
+        
+        Args:
+            plateau: Le plateau de jeu, adversaire au trait (non modifié)
+            couleur: Couleur de l'adversaire
+            coup_attendu: Réponse attendue de l'adversaire
+        """
+        self.annuler_ponderation()
+        copie = plateau.copier()
+        copie.jouer_coup(*coup_attendu)
+        couleur_moteur = 'noir' if couleur == 'blanc' else 'blanc'
+        self._position_ponderee = encoder_position(copie, couleur_moteur)
+        self._debut_ponderation = time.perf_counter()
+        self.ponderations += 1
+        self._connexion.send(('chercher', self._position_ponderee, None, self.profondeur_max, None))
+    
+    def conclure_ponderation(self, plateau: Plateau, couleur: str, temps_max: Optional[float] = None,
+                             gestion_temps: Optional[GestionTemps] = None) -> Optional[Resultat]:
+        """
+        Termine la réflexion en cours une fois le coup adverse joué.
+        
+        Si la position obtenue est celle qui était analysée, la recherche
+        continue jusqu'à temps_max (compté depuis son lancement) ou, sous une
+        cadence, selon gestion_temps (compté à partir de maintenant), et son
+        résultat est retourné. Sinon elle est abandonnée.
+        
+        Args:
+            plateau: Le plateau après le coup adverse
+            couleur: Couleur du moteur, désormais au trait
+            temps_max: Temps de réflexion accordé au coup (illimité si None)
+            gestion_temps: Gestion du temps sous une cadence (prioritaire sur temps_max)
+            
+        Returns:
+            Le résultat de la recherche si le coup attendu a été joué, None sinon
+        """
+        if not self.en_ponderation:
+            return None
+        if encoder_position(plateau, couleur) != self._position_ponderee:
+            self.annuler_ponderation()
+            return None
+        
+        self._position_ponderee = None
+        self.ponderations_reussies += 1
+        if gestion_temps is not None:
+            self._connexion.send(('ponderhit', None, gestion_temps))
+        elif temps_max is not None:
+            restant = max(0.0, self._debut_ponderation + temps_max - time.perf_counter())
+            self._connexion.send(('ponderhit', restant, None))
+        else:
+            self._connexion.send(('stop',))
+        return self._recevoir()
+    
+    def annuler_ponderation(self):
+        """Abandonne la réflexion en cours sur le temps adverse (s'il y en a une)."""
+        if not self.en_ponderation:
+            return
+        self._position_ponderee = None
+        self._connexion.send(('stop',))
+        self._recevoir()
+    
+    def fermer(self):
+        """Arrête le processus du moteur."""
+        if not self._processus.is_alive():
+            return
+        try:
+            self.annuler_ponderation()
+            self._connexion.send(('quitter',))
+        except (BrokenPipeError, OSError):
+            pass
+        self._processus.join(5)
+        if self._processus.is_alive():
+            self._processus.terminate()
+            self._processus.join()
+        self._connexion.close()
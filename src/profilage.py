@@ -0,0 +1,250 @@
+"""
+Module contenant l'instrumentation facultative des règles et de la recherche.
+Une fois activé, le profileur remplace les méthodes surveillées par des
+enveloppes qui comptent et chronomètrent leurs appels ; désactivé, il
+restaure les méthodes d'origine : le coût est alors strictement nul.
+Le rapport s'exporte en JSON ou au format des statistiques de cProfile
+(lisible avec pstats ou snakeviz).
+"""
+
+import argparse
+import functools
+import inspect
+import json
+import marshal
+import sys
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import src.moteur
+from src.plateau import Plateau
+from src.piece import Pion, Tour, Cavalier, Fou, Reine, Roi
+from src.jeu import Jeu
+from src.moteur import Moteur
+
+
+# (propriétaire, nom de l'attribut, chronométrer) : les appels très fréquents
+# et très courts ne sont que comptés pour ne pas fausser les mesures
+CIBLES: List[Tuple[object, str, bool]] = \
+    [(classe, 'mouvements_possibles', True) for classe in (Pion, Tour, Cavalier, Fou, Reine, Roi)] + [
+        (Plateau, 'copier', True),
+        (Jeu, '_est_roi_en_echec', True),
+        (Jeu, 'obtenir_tous_mouvements_legaux', True),
+        (Moteur, '_compter_noeud', False),
+        (Moteur, 'quiescence', True),
+        (Moteur, 'chercher', True),
+        (Moteur, 'chercher_iteratif', True),
+        (src.moteur, 'evaluer', True),
+    ]
+
+
+class Statistique:
+    """
+    Compteurs d'une fonction surveillée.
+    
+    Attributs:
+        appels (int): Nombre d'appels
+        temps (float): Temps cumulé en secondes (appels récursifs comptés une fois)
+    """
+    
+    __slots__ = ('appels', 'temps', 'profondeur', 'fonction')
+    
+    def __init__(self, fonction):
+        """Initialise des compteurs à zéro pour une fonction."""
+        self.appels = 0
+        self.temps = 0.0
+        self.profondeur = 0
+        self.fonction = fonction
+
+
+class Profileur:
+    """
+    Compte et chronomètre les appels des fonctions de CIBLES.
+    
+    S'utilise comme gestionnaire de contexte :
+        with Profileur() as profileur:
+            jeu.demarrer()
+        print(profileur.resume())
+    
+    Attributs:
+        statistiques (Dict[str, Statistique]): Compteurs par nom de fonction
+        actif (bool): True tant que les fonctions sont enveloppées
+    """
+    
+    def __init__(self, cibles: Optional[List[Tuple[object, str, bool]]] = None):
+        """
+        Initialise le profileur.
+        
+        Args:
+            cibles: Fonctions à surveiller (CIBLES par défaut)
+        """
+        self.cibles = cibles if cibles is not None else CIBLES
+        self.statistiques: Dict[str, Statistique] = {}
+        self.actif = False
+        self._originaux: List[Tuple[object, str, object]] = []
+        self._debut = 0.0
+        self.duree = 0.0
+    
+    def __enter__(self) -> 'Profileur':
+        """Active le profileur au début d'un bloc with."""
+        self.activer()
+        return self
+    
+    def __exit__(self, *exception):
+        """Désactive le profileur à la fin du bloc with."""
+        self.desactiver()
+    
+    def activer(self):
+        """Enveloppe les fonctions surveillées."""
+        if self.actif:
+            return
+        for proprietaire, attribut, chronometrer in self.cibles:
+            fonction = getattr(proprietaire, attribut)
+            nom = getattr(fonction, '__qualname__', attribut)
+            statistique = self.statistiques.setdefault(nom, Statistique(fonction))
+            self._originaux.append((proprietaire, attribut, proprietaire.__dict__[attribut]))
+            setattr(proprietaire, attribut, self._envelopper(fonction, statistique, chronometrer))
+        self.actif = True
+        self._debut = time.perf_counter()
+    
+    def desactiver(self):
+        """Restaure les fonctions d'origine."""
+        if not self.actif:
+            return
+        for proprietaire, attribut, original in reversed(self._originaux):
+            setattr(proprietaire, attribut, original)
+        self._originaux.clear()
+        self.actif = False
+        self.duree += time.perf_counter() - self._debut
+    
+    @staticmethod
+    def _envelopper(fonction, statistique: Statistique, chronometrer: bool):
+        """Crée l'enveloppe qui met à jour les compteurs d'une fonction."""
+        if not chronometrer:
+            @functools.wraps(fonction)
+            def enveloppe(*args, **kwargs):
+                statistique.appels += 1
+                return fonction(*args, **kwargs)
+            return enveloppe
+        
+        horloge = time.perf_counter
+        
+        @functools.wraps(fonction)
+        def enveloppe(*args, **kwargs):
+            statistique.appels += 1
+            if statistique.profondeur:
+                # Appel récursif : le temps est déjà compté par l'appel englobant
+                return fonction(*args, **kwargs)
+            statistique.profondeur += 1
+            debut = horloge()
+            try:
+                return fonction(*args, **kwargs)
+            finally:
+                statistique.temps += horloge() - debut
+                statistique.profondeur -= 1
+        return enveloppe
+    
+    def rapport(self) -> dict:
+        """
+        Retourne le rapport sous forme de dictionnaire sérialisable.
+        
+        Returns:
+            Dictionnaire {'duree': secondes, 'fonctions': {nom: {appels, temps, temps_par_appel}}}
+        """
+        fonctions = {}
+        for nom, statistique in sorted(self.statistiques.items(), key=lambda item: -item[1].temps):
+            fonctions[nom] = {
+                'appels': statistique.appels,
+                'temps': round(statistique.temps, 6),
+                'temps_par_appel': round(statistique.temps / statistique.appels, 9)
+                if statistique.appels else 0.0,
+            }
+        return {'duree': round(self.duree, 6), 'fonctions': fonctions}
+    
+    def resume(self) -> str:
+        """
+        Retourne le rapport sous forme de tableau lisible.
+        
+        Returns:
+            Une ligne par fonction : appels, temps cumulé et temps moyen
+        """
+        lignes = [f"{'Fonction':<45} {'Appels':>10} {'Temps (s)':>10} {'µs/appel':>10}"]
+        for nom, valeurs in self.rapport()['fonctions'].items():
+            lignes.append(f"{nom:<45} {valeurs['appels']:>10} {valeurs['temps']:>10.3f} "
+                          f"{valeurs['temps_par_appel'] * 1e6:>10.1f}")
+        return '\n'.join(lignes)
+    
+    def exporter_json(self, chemin: str):
+        """
+        Écrit le rapport dans un fichier JSON.
+        
+        Args:
+            chemin: Chemin du fichier
+        """
+        with open(chemin, 'w', encoding='utf-8') as fichier:
+            json.dump(self.rapport(), fichier, ensure_ascii=False, indent=2)
+    
+    def exporter_pstats(self, chemin: str):
+        """
+        Écrit les compteurs au format des statistiques de cProfile.
+        
+        Le fichier se lit avec pstats.Stats(chemin). Les temps enregistrés
+        sont cumulés (appels imbriqués inclus) et aucun appelant n'est connu.
+        
+        Args:
+            chemin: Chemin du fichier
+        """
+        statistiques = {}
+        for nom, statistique in self.statistiques.items():
+            fonction = inspect.unwrap(statistique.fonction)
+            code = getattr(fonction, '__code__', None)
+            cle = (code.co_filename, code.co_firstlineno, nom) if code else ('~', 0, nom)
+            statistiques[cle] = (statistique.appels, statistique.appels,
+                                 statistique.temps, statistique.temps, {})
+        with open(chemin, 'wb') as fichier:
+            marshal.dump(statistiques, fichier)
+    
+    def exporter(self, chemin: str):
+        """
+        Écrit le rapport, au format pstats si le chemin finit par .prof ou .pstats, en JSON sinon.
+        
+        Args:
+            chemin: Chemin du fichier
+        """
+        if chemin.endswith(('.prof', '.pstats')):
+            self.exporter_pstats(chemin)
+        else:
+            self.exporter_json(chemin)
+
+
+def ajouter_option_profil(analyseur: argparse.ArgumentParser):
+    """Ajoute l'option --profile [FICHIER] à un analyseur de ligne de commande."""
+    analyseur.add_argument('--profile', nargs='?', const='profil.json', default=None,
+                           metavar='FICHIER',
+                           help="Instrumente les règles et la recherche et écrit le rapport "
+                                "(JSON, ou pstats si FICHIER finit par .prof)")
+
+
+@contextmanager
+def profil_optionnel(chemin: Optional[str], afficher: bool = True) -> Iterator[Optional[Profileur]]:
+    """
+    Profile le bloc si un chemin de rapport est donné, sans rien faire sinon.
+    
+    Args:
+        chemin: Fichier du rapport (None pour ne pas profiler)
+        afficher: Affiche aussi le résumé sur la sortie d'erreur
+    """
+    if chemin is None:
+        yield None
+        return
+    profileur = Profileur()
+    profileur.activer()
+    try:
+        yield profileur
+    finally:
+        profileur.desactiver()
+        profileur.exporter(chemin)
+        if afficher:
+            print(profileur.resume(), file=sys.stderr)
+            print(f"Rapport de profilage écrit dans {chemin}", file=sys.stderr)
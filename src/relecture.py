@@ -0,0 +1,167 @@
+"""
+Module contenant la relecture d'une partie avec accès direct à n'importe
+quel demi-coup.
+Au chargement, la partie est jouée une fois et la position est
+photographiée tous les 'intervalle' demi-coups sous forme compacte
+(34 octets, voir encodage.encoder_position). Pour atteindre un demi-coup,
+on restaure la photographie la plus proche en amont puis on joue les
+quelques coups restants ; les déplacements d'un demi-coup en avant ou en
+arrière se font par jouer_coup() et annuler_coup(), sans restauration.
+"""
+
+from typing import List, Optional, Tuple
+from src.jeu import Jeu
+from src.plateau import Plateau
+from src.fen import FEN_INITIALE, plateau_depuis_fen, fen_depuis_plateau
+from src.encodage import encoder_position, decoder_position
+
+Coup = Tuple[Tuple[int, int], Tuple[int, int], Optional[type]]
+
+
+class Relecture:
+    """
+    Partie rejouable à n'importe quel demi-coup.
+    
+    Attributs:
+        coups (List[Coup]): Coups de la partie (départ, arrivée, promotion)
+        intervalle (int): Nombre de demi-coups entre deux photographies
+        demi_coup (int): Demi-coup courant (0 : position de départ)
+        plateau (Plateau): Position au demi-coup courant
+        couleur (str): Couleur du camp au trait au demi-coup courant
+        applications (int): Nombre de coups joués ou annulés depuis la création
+    """
+    
+    def __init__(self, coups: List[Coup], fen_depart: str = FEN_INITIALE, intervalle: int = 16):
+        """
+        Joue la partie une fois pour en prendre les photographies.
+        
+        Args:
+            coups: Coups de la partie (départ, arrivée, promotion)
+            fen_depart: Position de départ en notation FEN
+            intervalle: Nombre de demi-coups entre deux photographies
+            
+        Raises:
+            ValueError: Si l'intervalle n'est pas strictement positif
+        """
+        if intervalle < 1:
+            raise ValueError(f"Intervalle invalide: {intervalle}")
+        self.coups = list(coups)
+        self.intervalle = intervalle
+        self.fen_depart = fen_depart
+        
+        plateau, couleur = plateau_depuis_fen(fen_depart)
+        self._couleur_depart = couleur
+        self._photos: List[bytes] = [encoder_position(plateau, couleur)]
+        for indice, coup in enumerate(self.coups, 1):
+            plateau.jouer_coup(*coup)
+            if indice % intervalle == 0:
+                self._photos.append(encoder_position(plateau, self._couleur_au(indice)))
+        
+        self.applications = 0
+        self._restaurer(0)
+    
+    @classmethod
+    def depuis_jeu(cls, jeu: Jeu, intervalle: int = 16) -> 'Relecture':
+        """
+        Crée la relecture d'une partie à partir de son historique.
+        
+        Args:
+            jeu: La partie
+            intervalle: Nombre de demi-coups entre deux photographies
+            
+        Returns:
+            La relecture, positionnée au début de la partie
+        """
+        return cls(jeu.coups_joues(), jeu.fen_depart, intervalle)
+    
+    def __len__(self) -> int:
+        """Retourne le nombre de demi-coups de la partie."""
+        return len(self.coups)
+    
+    def _couleur_au(self, demi_coup: int) -> str:
+        """Retourne la couleur au trait après un nombre de demi-coups."""
+        if demi_coup % 2 == 0:
+            return self._couleur_depart
+        return 'noir' if self._couleur_depart == 'blanc' else 'blanc'
+    
+    def _restaurer(self, demi_coup: int):
+        """Restaure la photographie la plus proche en amont et joue les coups restants."""
+        base = demi_coup // self.intervalle
+        self.plateau, self.couleur = decoder_position(self._photos[base])
+        self.demi_coup = base * self.intervalle
+        # Les coups joués depuis la photographie, annulables par annuler_coup()
+        self._annulations: List[Tuple] = []
+        while self.demi_coup < demi_coup:
+            self.avancer()
+    
+    def avancer(self) -> bool:
+        """
+        Joue le coup suivant.
+        
+        Returns:
+            False si la partie est déjà à son dernier demi-coup
+        """
+        if self.demi_coup >= len(self.coups):
+            return False
+        self._annulations.append(self.plateau.jouer_coup(*self.coups[self.demi_coup]))
+        self.applications += 1
+        self.demi_coup += 1
+        self.couleur = self._couleur_au(self.demi_coup)
+        return True
+    
+    def reculer(self) -> bool:
+        """
+        Annule le dernier coup joué.
+        
+        Returns:
+            False si la partie est déjà à sa position de départ
+        """
+        if self.demi_coup == 0:
+            return False
+        if not self._annulations:
+            self._restaurer(self.demi_coup - 1)
+            return True
+        self.plateau.annuler_coup(self._annulations.pop())
+        self.applications += 1
+        self.demi_coup -= 1
+        self.couleur = self._couleur_au(self.demi_coup)
+        return True
+    
+    def aller(self, demi_coup: int) -> Plateau:
+        """
+        Se place à un demi-coup donné, par le chemin le plus court.
+        
+        Args:
+            demi_coup: Demi-coup à atteindre (0 : position de départ)
+            
+        Returns:
+            Le plateau à ce demi-coup
+            
+        Raises:
+            ValueError: Si le demi-coup est hors de la partie
+        """
+        if not 0 <= demi_coup <= len(self.coups):
+            raise ValueError(f"La partie compte {len(self.coups)} demi-coups")
+        
+        # Pas à pas depuis la position courante, tant que les annulations le permettent
+        premier_annulable = self.demi_coup - len(self._annulations)
+        pas = abs(demi_coup - self.demi_coup) if demi_coup >= premier_annulable else None
+        # Restaurer coûte le décodage (compté comme un coup) et les coups après la photographie
+        restauration = 1 + demi_coup % self.intervalle
+        if pas is None or restauration < pas:
+            self._restaurer(demi_coup)
+        while self.demi_coup < demi_coup:
+            self.avancer()
+        while self.demi_coup > demi_coup:
+            self.reculer()
+        return self.plateau
+    
+    def vers_fen(self) -> str:
+        """
+        Retourne la position courante en notation FEN.
+        
+        Returns:
+            La position en notation FEN
+        """
+        return fen_depuis_plateau(self.plateau, self.couleur,
+                                  numero_coup=self.demi_coup // 2 + 1)
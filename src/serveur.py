@@ -0,0 +1,428 @@
+"""
+Module contenant le serveur de parties multiples.
+Un seul processus héberge de nombreuses parties simultanées : les joueurs se
+connectent en TCP et échangent des messages JSON (un objet par ligne). Les
+coups sont validés par les règles de Jeu, et les calculs coûteux (réponse du
+moteur, détection du mat ou du pat) sont confiés à un groupe de processus
+pour que la boucle d'événements reste réactive.
+"""
+
+import asyncio
+import json
+import time
+import uuid
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Dict, Optional
+from src.jeu import Jeu
+from src.fen import FEN_INITIALE, plateau_depuis_fen
+from src.moteur import Moteur
+from src.notation import coup_vers_uci, uci_vers_coup
+
+
+# Taille maximale d'un message reçu (en octets) : borne la mémoire par connexion
+TAILLE_MAX_MESSAGE = 4096
+
+# Champs texte (chaîne ou absents) lus pour chaque type de message
+CHAMPS_TEXTE = {'creer': ('fen',), 'rejoindre': ('partie',), 'coup': ('coup',)}
+
+
+def analyser_position(fen: str) -> Optional[str]:
+    """
+    Détermine si la partie est terminée (exécuté dans un processus séparé).
+    
+    Args:
+        fen: La position à analyser
+        
+    Returns:
+        'echec_et_mat', 'pat' ou None si la partie continue
+    """
+    return Jeu.depuis_fen(fen).resultat()
+
+
+def calculer_coup_moteur(fen: str, profondeur: int) -> Optional[str]:
+    """
+    Calcule la réponse du moteur (exécuté dans un processus séparé).
+    
+    Args:
+        fen: La position à analyser
+        profondeur: Profondeur de recherche
+        
+    Returns:
+        Le coup en notation UCI ou None s'il n'y a aucun coup légal
+    """
+    plateau, couleur = plateau_depuis_fen(fen)
+    coup, _ = Moteur(profondeur=profondeur, taille_table_mo=1).chercher(plateau, couleur)
+    return coup_vers_uci(plateau, coup) if coup is not None else None
+
+
+class SessionPartie:
+    """
+    Une partie hébergée par le serveur.
+    
+    Les attributs sont déclarés dans __slots__ pour limiter la mémoire
+    occupée par les milliers de sessions inactives.
+    
+    Attributs:
+        identifiant (str): Identifiant unique de la partie
+        jeu (Jeu): L'état de la partie
+        joueurs (Dict[str, Connexion]): Connexion de chaque couleur
+        couleur_moteur (Optional[str]): Couleur jouée par le moteur, le cas échéant
+        coups (List[str]): Coups joués en notation UCI
+        resultat (Optional[str]): Résultat si la partie est terminée
+        dernier_acces (float): Date de la dernière activité
+    """
+    
+    __slots__ = ('identifiant', 'jeu', 'joueurs', 'couleur_moteur', 'coups',
+                 'resultat', 'dernier_acces', 'verrou')
+    
+    def __init__(self, identifiant: str, jeu: Jeu, couleur_moteur: Optional[str] = None):
+        """
+        Initialise une session.
+        
+        Args:
+            identifiant: Identifiant unique de la partie
+            jeu: La partie à héberger
+            couleur_moteur: Couleur jouée par le moteur (None pour deux humains)
+        """
+        self.identifiant = identifiant
+        self.jeu = jeu
+        self.joueurs: Dict[str, 'Connexion'] = {}
+        self.couleur_moteur = couleur_moteur
+        self.coups = []
+        self.resultat: Optional[str] = None
+        self.dernier_acces = time.monotonic()
+        self.verrou = asyncio.Lock()
+    
+    def etat(self) -> dict:
+        """
+        Retourne l'état de la partie à envoyer aux joueurs.
+        
+        Returns:
+            Dictionnaire sérialisable en JSON
+        """
+        return {
+            'type': 'etat',
+            'partie': self.identifiant,
+            'fen': self.jeu.vers_fen(),
+            'trait': self.jeu.joueur_actuel.couleur,
+            'coups': self.coups,
+            'echec': self.jeu.est_echec(self.jeu.joueur_actuel.couleur),
+            'resultat': self.resultat,
+        }
+
+
+class Connexion:
+    """
+    Une connexion de joueur au serveur.
+    
+    Attributs:
+        ecrivain (asyncio.StreamWriter): Flux d'écriture vers le client
+        session (Optional[SessionPartie]): Partie rejointe
+        couleur (Optional[str]): Couleur jouée dans cette partie
+    """
+    
+    __slots__ = ('ecrivain', 'session', 'couleur')
+    
+    def __init__(self, ecrivain: asyncio.StreamWriter):
+        """
+        Initialise une connexion.
+        
+        Args:
+            ecrivain: Flux d'écriture vers le client
+        """
+        self.ecrivain = ecrivain
+        self.session: Optional[SessionPartie] = None
+        self.couleur: Optional[str] = None
+    
+    async def envoyer(self, message: dict):
+        """
+        Envoie un message JSON au client.
+        
+        Args:
+            message: Le message à envoyer
+        """
+        if self.ecrivain.is_closing():
+            return
+        self.ecrivain.write(json.dumps(message, ensure_ascii=False).encode('utf-8') + b"\n")
+        await self.ecrivain.drain()
+
+
+class ServeurParties:
+    """
+    Serveur asyncio hébergeant de nombreuses parties simultanées.
+    
+    Messages acceptés (un objet JSON par ligne) :
+        {"type": "creer", "moteur": false, "fen": "..."}
+        {"type": "rejoindre", "partie": "<id>"}
+        {"type": "coup", "coup": "e2e4"}
+        {"type": "etat"}
+        {"type": "quitter"}
+    
+    Attributs:
+        sessions (Dict[str, SessionPartie]): Parties en cours, par identifiant
+        max_sessions (int): Nombre maximal de parties simultanées
+        inactivite_max (float): Durée (s) après laquelle une partie sans joueur est supprimée
+        profondeur_moteur (int): Profondeur de recherche du moteur adverse
+    """
+    
+    def __init__(self, hote: str = '127.0.0.1', port: int = 8765,
+                 executeur: Optional[Executor] = None, max_sessions: int = 10000,
+                 inactivite_max: float = 3600.0, profondeur_moteur: int = 2):
+        """
+        Initialise le serveur.
+        
+        Args:
+            hote: Adresse d'écoute
+            port: Port d'écoute (0 pour un port libre choisi par le système)
+            executeur: Exécuteur des calculs coûteux (groupe de processus par défaut)
+            max_sessions: Nombre maximal de parties simultanées
+            inactivite_max: Durée d'inactivité avant suppression d'une partie sans joueur
+            profondeur_moteur: Profondeur de recherche du moteur adverse
+        """
+        self.hote = hote
+        self.port = port
+        self.executeur = executeur
+        self.max_sessions = max_sessions
+        self.inactivite_max = inactivite_max
+        self.profondeur_moteur = profondeur_moteur
+        self.sessions: Dict[str, SessionPartie] = {}
+        self._serveur: Optional[asyncio.AbstractServer] = None
+        self._tache_nettoyage: Optional[asyncio.Task] = None
+    
+    async def demarrer(self):
+        """Démarre l'écoute des connexions et le nettoyage des parties inactives."""
+        if self.executeur is None:
+            self.executeur = ProcessPoolExecutor()
+        self._serveur = await asyncio.start_server(self._gerer_client, self.hote, self.port,
+                                                   limit=TAILLE_MAX_MESSAGE)
+        self.port = self._serveur.sockets[0].getsockname()[1]
+        self._tache_nettoyage = asyncio.ensure_future(self._nettoyer_periodiquement())
+    
+    async def arreter(self):
+        """Arrête le serveur et libère le groupe de processus."""
+        if self._tache_nettoyage is not None:
+            self._tache_nettoyage.cancel()
+        if self._serveur is not None:
+            self._serveur.close()
+            await self._serveur.wait_closed()
+        if self.executeur is not None:
+            self.executeur.shutdown(wait=False)
+    
+    async def servir(self):
+        """Démarre le serveur et le laisse tourner indéfiniment."""
+        await self.demarrer()
+        async with self._serveur:
+            await self._serveur.serve_forever()
+    
+    def nettoyer_sessions(self) -> int:
+        """
+        Supprime les parties sans joueur connecté et inactives depuis trop longtemps.
+        
+        Returns:
+            Nombre de parties supprimées
+        """
+        limite = time.monotonic() - self.inactivite_max
+        a_supprimer = [identifiant for identifiant, session in self.sessions.items()
+                       if not session.joueurs and session.dernier_acces < limite]
+        for identifiant in a_supprimer:
+            del self.sessions[identifiant]
+        return len(a_supprimer)
+    
+    async def _nettoyer_periodiquement(self):
+        """Tâche de fond qui nettoie les parties inactives."""
+        while True:
+            await asyncio.sleep(min(60.0, self.inactivite_max))
+            self.nettoyer_sessions()
+    
+    async def _executer(self, fonction, *arguments):
+        """Exécute un calcul coûteux hors de la boucle d'événements."""
+        boucle = asyncio.get_running_loop()
+        return await boucle.run_in_executor(self.executeur, fonction, *arguments)
+    
+    async def _gerer_client(self, lecteur: asyncio.StreamReader,
+                            ecrivain: asyncio.StreamWriter):
+        """
+        Lit et traite les messages d'un client jusqu'à sa déconnexion.
+        
+        Args:
+            lecteur: Flux de lecture du client
+            ecrivain: Flux d'écriture vers le client
+        """
+        connexion = Connexion(ecrivain)
+        try:
+            while True:
+                try:
+                    ligne = await lecteur.readline()
+                except ValueError:
+                    # Message plus long que TAILLE_MAX_MESSAGE
+                    await connexion.envoyer({'type': 'erreur', 'message': 'Message trop long.'})
+                    break
+                if not ligne:
+                    break
+                try:
+                    message = json.loads(ligne)
+                    if not isinstance(message, dict):
+                        raise ValueError("objet JSON attendu")
+                except ValueError:
+                    await connexion.envoyer({'type': 'erreur', 'message': 'Message JSON invalide.'})
+                    continue
+                if not await self._traiter_message(connexion, message):
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            self._quitter_session(connexion)
+            ecrivain.close()
+            try:
+                await ecrivain.wait_closed()
+            except ConnectionError:
+                pass
+    
+    async def _traiter_message(self, connexion: Connexion, message: dict) -> bool:
+        """
+        Traite un message d'un client.
+        
+        Args:
+            connexion: La connexion émettrice
+            message: Le message reçu
+            
+        Returns:
+            False si le client demande à quitter, True sinon
+        """
+        type_message = message.get('type')
+        for champ in CHAMPS_TEXTE.get(type_message, ()) if isinstance(type_message, str) else ():
+            if not isinstance(message.get(champ), (str, type(None))):
+                await connexion.envoyer({'type': 'erreur',
+                                         'message': f"Champ '{champ}' invalide: texte attendu."})
+                return True
+        
+        if type_message == 'creer':
+            await self._creer_partie(connexion, message)
+        elif type_message == 'rejoindre':
+            await self._rejoindre_partie(connexion, message.get('partie'))
+        elif type_message == 'coup':
+            await self._jouer_coup(connexion, message.get('coup'))
+        elif type_message == 'etat':
+            if connexion.session is None:
+                await connexion.envoyer({'type': 'erreur', 'message': 'Aucune partie rejointe.'})
+            else:
+                await connexion.envoyer(connexion.session.etat())
+        elif type_message == 'quitter':
+            return False
+        else:
+            await connexion.envoyer({'type': 'erreur',
+                                     'message': f"Type de message inconnu: {type_message}"})
+        return True
+    
+    async def _creer_partie(self, connexion: Connexion, message: dict):
+        """Crée une partie dont le créateur joue les blancs."""
+        if len(self.sessions) >= self.max_sessions:
+            self.nettoyer_sessions()
+        if len(self.sessions) >= self.max_sessions:
+            await connexion.envoyer({'type': 'erreur', 'message': 'Serveur complet.'})
+            return
+        
+        try:
+            jeu = Jeu.depuis_fen(message.get('fen') or FEN_INITIALE)
+        except ValueError as e:
+            await connexion.envoyer({'type': 'erreur', 'message': str(e)})
+            return
+        
+        self._quitter_session(connexion)
+        identifiant = uuid.uuid4().hex[:12]
+        session = SessionPartie(identifiant, jeu, 'noir' if message.get('moteur') else None)
+        self.sessions[identifiant] = session
+        session.joueurs['blanc'] = connexion
+        connexion.session, connexion.couleur = session, 'blanc'
+        
+        await connexion.envoyer({'type': 'cree', 'partie': identifiant, 'couleur': 'blanc'})
+        async with session.verrou:
+            await self._faire_jouer_moteur(session)
+        await connexion.envoyer(session.etat())
+    
+    async def _rejoindre_partie(self, connexion: Connexion, identifiant: Optional[str]):
+        """Fait rejoindre une partie existante avec la couleur libre."""
+        session = self.sessions.get(identifiant)
+        if session is None:
+            await connexion.envoyer({'type': 'erreur', 'message': 'Partie introuvable.'})
+            return
+        
+        libres = [couleur for couleur in ('blanc', 'noir')
+                  if couleur not in session.joueurs and couleur != session.couleur_moteur]
+        if not libres:
+            await connexion.envoyer({'type': 'erreur', 'message': 'Partie complète.'})
+            return
+        
+        self._quitter_session(connexion)
+        session.joueurs[libres[0]] = connexion
+        session.dernier_acces = time.monotonic()
+        connexion.session, connexion.couleur = session, libres[0]
+        
+        await connexion.envoyer({'type': 'rejoint', 'partie': identifiant, 'couleur': libres[0]})
+        await self._diffuser(session)
+    
+    async def _jouer_coup(self, connexion: Connexion, texte: Optional[str]):
+        """Valide et joue le coup d'un joueur, puis la réponse éventuelle du moteur."""
+        session = connexion.session
+        if session is None:
+            await connexion.envoyer({'type': 'erreur', 'message': 'Aucune partie rejointe.'})
+            return
+        
+        async with session.verrou:
+            session.dernier_acces = time.monotonic()
+            if session.resultat is not None:
+                await connexion.envoyer({'type': 'erreur', 'message': 'La partie est terminée.'})
+                return
+            if session.jeu.joueur_actuel.couleur != connexion.couleur:
+                await connexion.envoyer({'type': 'erreur', 'message': "Ce n'est pas votre tour."})
+                return
+            
+            try:
+                depart, arrivee, promotion = uci_vers_coup(texte or '')
+            except ValueError as e:
+                await connexion.envoyer({'type': 'erreur', 'message': str(e)})
+                return
+            
+            erreur = session.jeu.jouer_coup(depart, arrivee, promotion)
+            if erreur is not None:
+                await connexion.envoyer({'type': 'erreur', 'message': erreur})
+                return
+            
+            session.coups.append(texte)
+            session.resultat = await self._executer(analyser_position, session.jeu.vers_fen())
+            await self._faire_jouer_moteur(session)
+        
+        await self._diffuser(session)
+    
+    async def _faire_jouer_moteur(self, session: SessionPartie):
+        """Joue le coup du moteur si c'est à lui de jouer (verrou de session tenu)."""
+        if session.couleur_moteur is None or session.resultat is not None or \
+           session.jeu.joueur_actuel.couleur != session.couleur_moteur:
+            return
+        
+        texte = await self._executer(calculer_coup_moteur, session.jeu.vers_fen(),
+                                     self.profondeur_moteur)
+        if texte is None:
+            return
+        depart, arrivee, promotion = uci_vers_coup(texte)
+        session.jeu.jouer_coup(depart, arrivee, promotion)
+        session.coups.append(texte)
+        session.resultat = await self._executer(analyser_position, session.jeu.vers_fen())
+    
+    async def _diffuser(self, session: SessionPartie):
+        """Envoie l'état de la partie à tous ses joueurs connectés."""
+        etat = session.etat()
+        for connexion in list(session.joueurs.values()):
+            try:
+                await connexion.envoyer(etat)
+            except ConnectionError:
+                pass
+    
+    def _quitter_session(self, connexion: Connexion):
+        """Détache une connexion de sa partie (la partie reste disponible)."""
+        session = connexion.session
+        if session is not None and session.joueurs.get(connexion.couleur) is connexion:
+            del session.joueurs[connexion.couleur]
+            session.dernier_acces = time.monotonic()
+        connexion.session = None
+        connexion.couleur = None
@@ -0,0 +1,378 @@
+"""
+Module contenant le solveur de mats forcés (« mat en N coups »).
+Le solveur utilise la recherche par nombres de preuve en profondeur
+(df-pn) : l'attaquant ne joue que des coups d'échec, le défenseur essaie
+toutes ses réponses légales, et une table de transposition mémorise les
+nombres de preuve et de réfutation de chaque position déjà visitée. Une
+promotion est essayée pour chacune des quatre pièces, des deux côtés : les
+coups portent donc la pièce de promotion, (départ, arrivée, classe ou None).
+"""
+
+import time
+from typing import Dict, List, Optional, Tuple
+from src.jeu import Jeu
+from src.moteur import RechercheInterrompue, couleur_adverse
+from src.piece import Pion, Reine, Tour, Fou, Cavalier
+from src.zobrist import hacher
+
+Coup = Tuple[Tuple[int, int], Tuple[int, int], Optional[type]]
+
+
+# Nombre de preuve (ou de réfutation) d'une position réfutée (ou prouvée)
+INFINI = 10 ** 9
+PROMOTIONS = (Reine, Tour, Fou, Cavalier)
+
+
+class ResultatMat:
+    """
+    Résultat d'une recherche de mat forcé.
+    
+    Attributs:
+        prouve (Optional[bool]): True si le mat est prouvé, False s'il est
+            réfuté, None si la limite de nœuds a été atteinte
+        coups (int): Nombre de coups du mat le plus court trouvé (ou N demandé)
+        variante (List[Coup]): Suite de coups menant au mat (si prouvé)
+        refutations (Dict[Coup, Optional[Coup]]): Pour chaque échec de
+            l'attaquant, une réponse qui échappe au mat (None si le coup
+            mène directement au pat ou à une position sans suite)
+        noeuds (int): Nombre de positions visitées
+        secondes (float): Durée de la recherche
+    """
+    
+    def __init__(self, prouve: Optional[bool], coups: int, variante: List[Coup],
+                 refutations: Dict[Coup, Optional[Coup]], noeuds: int, secondes: float):
+        """Initialise le résultat."""
+        self.prouve = prouve
+        self.coups = coups
+        self.variante = variante
+        self.refutations = refutations
+        self.noeuds = noeuds
+        self.secondes = secondes
+    
+    @property
+    def noeuds_par_seconde(self) -> int:
+        """Vitesse de la recherche en nœuds par seconde."""
+        return int(self.noeuds / self.secondes) if self.secondes > 0 else 0
+
+
+class SolveurMat:
+    """
+    Solveur de mats forcés par recherche df-pn.
+    
+    Chaque position de la recherche est un nœud OU (l'attaquant cherche un
+    coup qui mate) ou un nœud ET (tous les coups du défenseur doivent être
+    matés). Le nombre de preuve d'un nœud est le nombre minimal de feuilles
+    à prouver pour établir le mat, son nombre de réfutation le nombre
+    minimal de feuilles à réfuter pour l'écarter : le solveur développe
+    toujours le nœud le plus facile à trancher.
+    
+    Attributs:
+        noeuds_max (Optional[int]): Limite de nœuds par recherche (illimitée si None)
+        taille_table_max (int): Nombre maximal d'entrées de la table de transposition
+        noeuds (int): Nombre de positions visitées lors de la dernière recherche
+    """
+    
+    def __init__(self, noeuds_max: Optional[int] = None, taille_table_max: int = 1000000):
+        """
+        Initialise le solveur.
+        
+        Args:
+            noeuds_max: Limite de nœuds par recherche (illimitée si None)
+            taille_table_max: Nombre maximal d'entrées de la table de transposition
+        """
+        self.noeuds_max = noeuds_max
+        self.taille_table_max = taille_table_max
+        self.noeuds = 0
+        # (clé de Zobrist, coups restants à l'attaquant) -> (preuve, réfutation)
+        self._table: Dict[Tuple[int, int], Tuple[int, int]] = {}
+        # (clé de Zobrist, attaquant au trait) -> [(coup, clé de la position suivante)]
+        self._coups: Dict[Tuple[int, bool], List[Tuple[Coup, int]]] = {}
+        self._jeu: Optional[Jeu] = None
+        # Coups joués sur le plateau depuis la racine (pour le restaurer)
+        self._coups_joues: List[Tuple] = []
+    
+    def resoudre(self, jeu: Jeu, coups: int) -> ResultatMat:
+        """
+        Cherche un mat en au plus N coups pour le joueur au trait.
+        
+        Les profondeurs 1 à N sont essayées dans l'ordre : le résultat
+        indique donc le mat le plus court. Le plateau du jeu est modifié
+        pendant la recherche puis restauré.
+        
+        Args:
+            jeu: La partie (le joueur actuel est l'attaquant)
+            coups: Nombre maximal de coups de l'attaquant
+            
+        Returns:
+            Le résultat de la recherche
+        """
+        self._jeu = jeu
+        self._coups_joues = []
+        self.noeuds = 0
+        self._table.clear()
+        self._coups.clear()
+        attaquant = jeu.joueur_actuel.couleur
+        debut = time.perf_counter()
+        
+        prouve: Optional[bool] = False
+        coups_essayes = coups
+        try:
+            for profondeur in range(1, coups + 1):
+                preuve, _ = self._mid(attaquant, True, profondeur, INFINI, INFINI)
+                if preuve == 0:
+                    prouve, coups_essayes = True, profondeur
+                    break
+        except RechercheInterrompue:
+            prouve = None
+            # Le plateau peut être resté au milieu d'une variante : le restaurer
+            while self._coups_joues:
+                jeu.plateau.annuler_coup(self._coups_joues.pop())
+        
+        variante: List[Coup] = []
+        refutations: Dict[Coup, Optional[Coup]] = {}
+        if prouve:
+            variante = self._variante(attaquant, coups_essayes)
+        elif prouve is False:
+            refutations = self._refutations(attaquant, coups)
+        
+        return ResultatMat(prouve, coups_essayes, variante, refutations,
+                           self.noeuds, time.perf_counter() - debut)
+    
+    # --- Recherche --------------------------------------------------------
+    
+    def _mid(self, couleur: str, attaquant: bool, coups: int,
+             seuil_preuve: int, seuil_refutation: int) -> Tuple[int, int]:
+        """
+        Développe un nœud jusqu'à ce que ses nombres dépassent les seuils.
+        
+        Args:
+            couleur: Couleur du camp au trait
+            attaquant: True si l'attaquant est au trait (nœud OU)
+            coups: Nombre de coups restant à l'attaquant
+            seuil_preuve: Seuil du nombre de preuve
+            seuil_refutation: Seuil du nombre de réfutation
+            
+        Returns:
+            Tuple (nombre de preuve, nombre de réfutation) du nœud
+            
+        Raises:
+            RechercheInterrompue: Si la limite de nœuds est atteinte
+        """
+        self.noeuds += 1
+        if self.noeuds_max is not None and self.noeuds > self.noeuds_max:
+            raise RechercheInterrompue()
+        
+        plateau = self._jeu.plateau
+        cle = hacher(plateau, couleur)
+        enfants = self._generer(couleur, attaquant, cle)
+        
+        terminal = self._evaluer_terminal(couleur, attaquant, coups, enfants)
+        if terminal is not None:
+            self._stocker((cle, coups), terminal)
+            return terminal
+        
+        adverse = couleur_adverse(couleur)
+        coups_enfants = coups - 1 if attaquant else coups
+        
+        while True:
+            valeurs = [self._table.get((cle_enfant, coups_enfants), (1, 1))
+                       for _, cle_enfant in enfants]
+            preuve, refutation = self._combiner(valeurs, attaquant)
+            if preuve >= seuil_preuve or refutation >= seuil_refutation:
+                break
+            
+            # Choisir l'enfant le plus prometteur et calculer ses seuils
+            indice_cle = 0 if attaquant else 1
+            ordre = sorted(range(len(valeurs)), key=lambda i: valeurs[i][indice_cle])
+            meilleur = ordre[0]
+            deuxieme = valeurs[ordre[1]][indice_cle] if len(ordre) > 1 else INFINI
+            preuve_enfant, refutation_enfant = valeurs[meilleur]
+            if attaquant:
+                seuil_preuve_enfant = min(seuil_preuve, deuxieme + 1)
+                seuil_refutation_enfant = min(INFINI, seuil_refutation - refutation + refutation_enfant)
+            else:
+                seuil_preuve_enfant = min(INFINI, seuil_preuve - preuve + preuve_enfant)
+                seuil_refutation_enfant = min(seuil_refutation, deuxieme + 1)
+            
+            coup, _ = enfants[meilleur]
+            self._coups_joues.append(plateau.jouer_coup(*coup))
+            self._mid(adverse, not attaquant, coups_enfants,
+                      seuil_preuve_enfant, seuil_refutation_enfant)
+            plateau.annuler_coup(self._coups_joues.pop())
+        
+        self._stocker((cle, coups), (preuve, refutation))
+        return preuve, refutation
+    
+    def _generer(self, couleur: str, attaquant: bool, cle: int) -> List[Tuple[Coup, int]]:
+        """
+        Retourne les coups à explorer et la clé de la position qu'ils produisent.
+        
+        L'attaquant ne joue que des coups qui donnent échec ; le défenseur
+        essaie tous ses coups légaux. Chaque promotion est développée en ses
+        quatre pièces possibles.
+        """
+        entree = self._coups.get((cle, attaquant))
+        if entree is not None:
+            return entree
+        
+        plateau = self._jeu.plateau
+        adverse = couleur_adverse(couleur)
+        enfants = []
+        for depart, arrivee in self._jeu.obtenir_tous_mouvements_legaux(couleur):
+            promotions = (None,)
+            if arrivee[0] in (0, 7) and isinstance(plateau.grille[depart[0]][depart[1]], Pion):
+                promotions = PROMOTIONS
+            for promotion in promotions:
+                coup_joue = plateau.jouer_coup(depart, arrivee, promotion)
+                if not attaquant or self._jeu.est_echec(adverse):
+                    enfants.append(((depart, arrivee, promotion), hacher(plateau, adverse)))
+                plateau.annuler_coup(coup_joue)
+        
+        if len(self._coups) >= self.taille_table_max:
+            self._coups.clear()
+        self._coups[(cle, attaquant)] = enfants
+        return enfants
+    
+    def _evaluer_terminal(self, couleur: str, attaquant: bool, coups: int,
+                          enfants: List[Tuple[Coup, int]]) -> Optional[Tuple[int, int]]:
+        """
+        Retourne les nombres d'un nœud dont le résultat est connu sans recherche.
+        
+        Returns:
+            (0, INFINI) si le mat est prouvé, (INFINI, 0) s'il est réfuté, None sinon
+        """
+        if attaquant:
+            if coups <= 0 or not enfants:
+                return INFINI, 0
+            return None
+        if not enfants:
+            # Le défenseur n'a plus de coup : mat s'il est en échec, pat sinon
+            return (0, INFINI) if self._jeu.est_echec(couleur) else (INFINI, 0)
+        if coups <= 0:
+            return INFINI, 0
+        return None
+    
+    @staticmethod
+    def _combiner(valeurs: List[Tuple[int, int]], attaquant: bool) -> Tuple[int, int]:
+        """Combine les nombres des enfants d'un nœud OU (attaquant) ou ET (défenseur)."""
+        if attaquant:
+            return (min(preuve for preuve, _ in valeurs),
+                    min(INFINI, sum(refutation for _, refutation in valeurs)))
+        return (min(INFINI, sum(preuve for preuve, _ in valeurs)),
+                min(refutation for _, refutation in valeurs))
+    
+    def _stocker(self, cle: Tuple[int, int], valeur: Tuple[int, int]):
+        """Enregistre les nombres d'un nœud en vidant la table si elle est pleine."""
+        if len(self._table) >= self.taille_table_max and cle not in self._table:
+            self._table.clear()
+        self._table[cle] = valeur
+    
+    # --- Résultats --------------------------------------------------------
+    
+    def _variante(self, attaquant: str, coups: int) -> List[Coup]:
+        """
+        Reconstitue la variante de mat à partir de la table de transposition.
+        
+        L'attaquant joue un coup prouvé, le défenseur la réponse qui retarde
+        le plus le mat ; la dernière position est vérifiée avec
+        Jeu.est_echec_et_mat().
+        """
+        plateau = self._jeu.plateau
+        couleur, est_attaquant = attaquant, True
+        variante: List[Coup] = []
+        coups_joues = []
+        
+        while True:
+            enfants = self._generer(couleur, est_attaquant, hacher(plateau, couleur))
+            if not enfants:
+                break
+            coups_enfants = coups - 1 if est_attaquant else coups
+            if est_attaquant:
+                choix = [coup for coup, cle in enfants
+                         if self._table.get((cle, coups_enfants), (1, 1))[0] == 0]
+                if not choix:
+                    break
+                coup = choix[0]
+            else:
+                coup = max(enfants, key=lambda enfant: self._duree_mat(enfant[0], couleur, coups))[0]
+            variante.append(coup)
+            coups_joues.append(plateau.jouer_coup(*coup))
+            couleur, est_attaquant, coups = couleur_adverse(couleur), not est_attaquant, coups_enfants
+        
+        mat = self._jeu.est_echec_et_mat(couleur)
+        for coup_joue in reversed(coups_joues):
+            plateau.annuler_coup(coup_joue)
+        return variante if mat else []
+    
+    def _duree_mat(self, coup: Coup, defenseur: str, coups: int) -> int:
+        """Nombre de coups dont l'attaquant a besoin pour mater après une réponse prouvée."""
+        plateau = self._jeu.plateau
+        attaquant = couleur_adverse(defenseur)
+        noeuds_max, self.noeuds_max = self.noeuds_max, None
+        coup_joue = plateau.jouer_coup(*coup)
+        try:
+            for profondeur in range(1, coups):
+                if self._mid(attaquant, True, profondeur, INFINI, INFINI)[0] == 0:
+                    return profondeur
+            return coups
+        finally:
+            plateau.annuler_coup(coup_joue)
+            self.noeuds_max = noeuds_max
+    
+    def _refutations(self, attaquant: str, coups: int) -> Dict[Coup, Optional[Coup]]:
+        """
+        Associe à chaque échec de l'attaquant une réponse qui échappe au mat.
+        
+        Returns:
+            Dictionnaire coup de l'attaquant -> réponse qui échappe au mat
+            (None si le coup ne laisse aucune réponse, c'est-à-dire un pat)
+        """
+        plateau = self._jeu.plateau
+        defenseur = couleur_adverse(attaquant)
+        refutations: Dict[Coup, Optional[Coup]] = {}
+        
+        for coup, cle in self._generer(attaquant, True, hacher(plateau, attaquant)):
+            coup_joue = plateau.jouer_coup(*coup)
+            reponses = self._generer(defenseur, False, cle)
+            # Sans réponse réfutée dans la table, toutes échappent (plus de coup à l'attaquant)
+            reponse = reponses[0][0] if reponses else None
+            for coup_defense, cle_defense in reponses:
+                if self._table.get((cle_defense, coups - 1), (1, 1))[1] == 0:
+                    reponse = coup_defense
+                    break
+            plateau.annuler_coup(coup_joue)
+            refutations[coup] = reponse
+        
+        return refutations
+
+
+def main():
+    """Cherche un mat forcé dans une position FEN donnée sur la ligne de commande."""
+    import argparse
+    from src.notation import LETTRES_UCI, case_vers_notation
+    from src.profilage import ajouter_option_profil, profil_optionnel
+    analyseur = argparse.ArgumentParser(description="Recherche d'un mat en N coups")
+    analyseur.add_argument('fen', help="Position en notation FEN")
+    analyseur.add_argument('coups', type=int, help="Nombre maximal de coups de l'attaquant")
+    analyseur.add_argument('--noeuds-max', type=int, default=None, help="Limite de nœuds")
+    ajouter_option_profil(analyseur)
+    arguments = analyseur.parse_args()
+    
+    def notation(coup):
+        depart, arrivee, promotion = coup
+        return case_vers_notation(depart) + case_vers_notation(arrivee) + \
+            (LETTRES_UCI[promotion] if promotion is not None else '')
+    
+    with profil_optionnel(arguments.profile):
+        resultat = SolveurMat(arguments.noeuds_max).resoudre(Jeu.depuis_fen(arguments.fen),
+                                                             arguments.coups)
+    if resultat.prouve:
+        print(f"Mat en {resultat.coups} : {' '.join(notation(coup) for coup in resultat.variante)}")
+    elif resultat.prouve is False:
+        print(f"Pas de mat en {resultat.coups} coups")
+        for coup, reponse in resultat.refutations.items():
+            print(f"  {notation(coup)} -> {notation(reponse) if reponse else '-'}")
+    else:
+        print("Limite de nœuds atteinte")
+    print(f"{resultat.noeuds} nœuds en {resultat.secondes:.2f} s "
+          f"({resultat.noeuds_par_seconde} nœuds/s)")
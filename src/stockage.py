@@ -0,0 +1,266 @@
+"""
+Module contenant l'enregistrement des parties dans une base SQLite.
+Une partie occupe une ligne de la table 'parties' : joueurs, position de
+départ, résultat et coups sous forme d'un bloc d'octets (deux octets par
+coup, voir encodage.encoder_coup). La table 'positions' associe à chaque
+demi-coup de chaque partie la clé de Zobrist de la position atteinte ;
+elle est indexée par clé, ce qui rend immédiate la recherche des parties
+passant par une position donnée.
+
+Les écritures sont regroupées : enregistrer() met la partie en attente et
+valider() écrit toutes les parties en attente dans une seule transaction.
+"""
+
+import sqlite3
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from src.jeu import Jeu
+from src.plateau import Plateau
+from src.fen import plateau_depuis_fen
+from src.zobrist import hacher
+from src.encodage import encoder_coup, decoder_coup
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS parties (
+    id INTEGER PRIMARY KEY,
+    blancs TEXT NOT NULL,
+    noirs TEXT NOT NULL,
+    fen_depart TEXT NOT NULL,
+    resultat TEXT NOT NULL,
+    demi_coups INTEGER NOT NULL,
+    coups BLOB NOT NULL,
+    modifiee REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS positions (
+    partie INTEGER NOT NULL REFERENCES parties(id) ON DELETE CASCADE,
+    demi_coup INTEGER NOT NULL,
+    cle INTEGER NOT NULL,
+    PRIMARY KEY (partie, demi_coup)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS index_positions_cle ON positions(cle);
+"""
+
+TAILLE_COUP = 2
+
+Coup = Tuple[Tuple[int, int], Tuple[int, int], Optional[type]]
+
+
+def cle_signee(cle: int) -> int:
+    """Convertit une clé de Zobrist de 64 bits en entier signé stockable par SQLite."""
+    return cle - (1 << 64) if cle >= 1 << 63 else cle
+
+
+def encoder_coups(coups: Iterable[Tuple[Tuple[int, int], Tuple[int, int], Optional[type]]]) -> bytes:
+    """Encode une suite de coups (départ, arrivée, promotion) sur deux octets chacun."""
+    return b''.join(encoder_coup(*coup).to_bytes(TAILLE_COUP, 'little') for coup in coups)
+
+
+def decoder_coups(donnees: bytes) -> List[Tuple[Tuple[int, int], Tuple[int, int], Optional[type]]]:
+    """Décode une suite de coups encodée par encoder_coups()."""
+    return [decoder_coup(int.from_bytes(donnees[i:i + TAILLE_COUP], 'little'))
+            for i in range(0, len(donnees), TAILLE_COUP)]
+
+
+class Stockage:
+    """
+    Base SQLite des parties jouées ou en cours.
+    
+    S'utilise comme gestionnaire de contexte :
+        with Stockage('parties.db') as stockage:
+            identifiant = stockage.enregistrer(jeu)
+        # les parties en attente sont écrites à la sortie du bloc
+    
+    Attributs:
+        chemin (str): Chemin du fichier de la base
+        taille_lot (int): Nombre de parties en attente qui déclenche l'écriture
+    """
+    
+    def __init__(self, chemin: str = 'parties.db', taille_lot: int = 500):
+        """
+        Ouvre (ou crée) la base.
+        
+        Args:
+            chemin: Chemin du fichier de la base (':memory:' pour une base en mémoire)
+            taille_lot: Nombre de parties en attente qui déclenche l'écriture
+        """
+        self.chemin = chemin
+        self.taille_lot = taille_lot
+        self.connexion = sqlite3.connect(chemin)
+        self.connexion.execute("PRAGMA journal_mode = WAL")
+        self.connexion.execute("PRAGMA synchronous = NORMAL")
+        self.connexion.execute("PRAGMA foreign_keys = ON")
+        self.connexion.executescript(SCHEMA)
+        
+        self._prochain_identifiant = self.connexion.execute(
+            "SELECT COALESCE(MAX(id), 0) + 1 FROM parties").fetchone()[0]
+        self._en_attente: Dict[int, Tuple] = {}
+        self._positions_en_attente: List[Tuple[int, int, int]] = []
+        # Par partie : demi-coups déjà hachés, plateau et trait à ce demi-coup
+        self._suivi: Dict[int, Tuple[int, Plateau, str]] = {}
+    
+    def __enter__(self) -> 'Stockage':
+        """Retourne la base au début d'un bloc with."""
+        return self
+    
+    def __exit__(self, *exception):
+        """Écrit les parties en attente et ferme la base."""
+        self.fermer()
+    
+    def enregistrer(self, jeu: Jeu, identifiant: Optional[int] = None,
+                    resultat: Optional[str] = None) -> int:
+        """
+        Met une partie en attente d'écriture.
+        
+        Une partie déjà enregistrée est mise à jour en passant son
+        identifiant : seules les positions des nouveaux demi-coups sont
+        alors calculées, la partie devant prolonger celle déjà enregistrée.
+        
+        Args:
+            jeu: La partie
+            identifiant: Identifiant de la partie à mettre à jour (None : nouvelle partie)
+            resultat: Résultat au format PGN (déduit de la partie si None)
+            
+        Returns:
+            L'identifiant de la partie
+        """
+        if identifiant is None:
+            identifiant = self._prochain_identifiant
+            self._prochain_identifiant += 1
+        
+        coups = jeu.coups_joues()
+        deja, plateau, couleur = self._suivi.get(identifiant, (None, None, None))
+        if deja is None or deja > len(coups):
+            plateau, couleur = plateau_depuis_fen(jeu.fen_depart)
+            deja = -1
+        for demi_coup in range(deja + 1, len(coups) + 1):
+            if demi_coup > 0:
+                plateau.jouer_coup(*coups[demi_coup - 1])
+                couleur = 'noir' if couleur == 'blanc' else 'blanc'
+            self._positions_en_attente.append((identifiant, demi_coup,
+                                               cle_signee(hacher(plateau, couleur))))
+        self._suivi[identifiant] = (len(coups), plateau, couleur)
+        
+        self._en_attente[identifiant] = (
+            identifiant, jeu.joueur_blanc.nom, jeu.joueur_noir.nom, jeu.fen_depart,
+            resultat or jeu.resultat_pgn(), len(coups), encoder_coups(coups), time.time())
+        if len(self._en_attente) >= self.taille_lot:
+            self.valider()
+        return identifiant
+    
+    def enregistrer_parties(self, jeux: Iterable[Jeu]) -> List[int]:
+        """
+        Enregistre de nombreuses parties nouvelles par lots.
+        
+        Args:
+            jeux: Les parties
+            
+        Returns:
+            Les identifiants attribués, dans l'ordre
+        """
+        identifiants = [self.enregistrer(jeu) for jeu in jeux]
+        self.valider()
+        return identifiants
+    
+    def valider(self):
+        """Écrit les parties en attente dans une seule transaction."""
+        if not self._en_attente and not self._positions_en_attente:
+            return
+        with self.connexion:
+            self.connexion.executemany(
+                "INSERT INTO parties (id, blancs, noirs, fen_depart, resultat, demi_coups, coups, modifiee) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (id) DO UPDATE SET resultat = excluded.resultat, "
+                "demi_coups = excluded.demi_coups, coups = excluded.coups, modifiee = excluded.modifiee",
+                self._en_attente.values())
+            self.connexion.executemany(
+                "INSERT OR REPLACE INTO positions (partie, demi_coup, cle) VALUES (?, ?, ?)",
+                self._positions_en_attente)
+        self._en_attente.clear()
+        self._positions_en_attente.clear()
+    
+    def fermer(self):
+        """Écrit les parties en attente et ferme la base."""
+        self.valider()
+        self.connexion.close()
+    
+    def charger(self, identifiant: int, demi_coup: Optional[int] = None) -> Jeu:
+        """
+        Reconstruit une partie, éventuellement à un demi-coup donné.
+        
+        Les coups sont rejoués directement sur le plateau, sans validation
+        ni saisie.
+        
+        Args:
+            identifiant: Identifiant de la partie
+            demi_coup: Nombre de demi-coups à rejouer (tous si None)
+            
+        Returns:
+            La partie à ce demi-coup
+            
+        Raises:
+            KeyError: Si la partie n'existe pas
+            ValueError: Si le demi-coup dépasse la longueur de la partie
+        """
+        self.valider()
+        ligne = self.connexion.execute(
+            "SELECT blancs, noirs, fen_depart, resultat, coups FROM parties WHERE id = ?",
+            (identifiant,)).fetchone()
+        if ligne is None:
+            raise KeyError(f"Partie inconnue: {identifiant}")
+        blancs, noirs, fen_depart, resultat, donnees = ligne
+        coups = decoder_coups(donnees)
+        if demi_coup is None:
+            demi_coup = len(coups)
+        if not 0 <= demi_coup <= len(coups):
+            raise ValueError(f"La partie {identifiant} compte {len(coups)} demi-coups")
+        
+        jeu = Jeu.depuis_fen(fen_depart, blancs, noirs)
+        for depart, arrivee, promotion in coups[:demi_coup]:
+            piece = jeu.plateau.obtenir_piece(depart)
+            jeu.plateau.jouer_coup(depart, arrivee, promotion)
+            if promotion is not None:
+                jeu.promotions[len(jeu.historique)] = promotion
+            jeu.historique.append((depart, arrivee, type(piece)))
+            jeu.changer_joueur()
+        jeu.partie_terminee = demi_coup == len(coups) and resultat != '*'
+        return jeu
+    
+    def parties_atteignant(self, plateau: Plateau, couleur: str) -> List[Tuple[int, int]]:
+        """
+        Recherche les parties passant par une position.
+        
+        Args:
+            plateau: La position
+            couleur: Couleur du camp au trait
+            
+        Returns:
+            Liste de tuples (identifiant de la partie, premier demi-coup où la position est atteinte)
+        """
+        self.valider()
+        return self.connexion.execute(
+            "SELECT partie, MIN(demi_coup) FROM positions WHERE cle = ? GROUP BY partie ORDER BY partie",
+            (cle_signee(hacher(plateau, couleur)),)).fetchall()
+    
+    def parcourir(self) -> Iterator[Tuple[int, str, List[Coup]]]:
+        """
+        Parcourt les parties enregistrées sans les reconstruire.
+        
+        Returns:
+            Itérateur de tuples (identifiant, FEN de départ, coups (départ, arrivée, promotion)),
+            par identifiant croissant
+        """
+        self.valider()
+        for identifiant, fen_depart, donnees in self.connexion.execute(
+                "SELECT id, fen_depart, coups FROM parties ORDER BY id"):
+            yield identifiant, fen_depart, decoder_coups(donnees)
+    
+    def lister(self) -> List[Tuple[int, str, str, str, int]]:
+        """
+        Liste les parties enregistrées.
+        
+        Returns:
+            Liste de tuples (identifiant, blancs, noirs, résultat, nombre de demi-coups)
+        """
+        self.valider()
+        return self.connexion.execute(
+            "SELECT id, blancs, noirs, resultat, demi_coups FROM parties ORDER BY id").fetchall()
@@ -0,0 +1,83 @@
+"""
+Module contenant la table des structures de pions.
+La structure des pions (pions doublés, isolés, arriérés, passés) ne change
+qu'aux coups de pion et aux captures de pion : son évaluation est mémorisée,
+indexée par la clé des seuls pions (Plateau.cle_pions), dans un tableau de
+taille fixe.
+"""
+
+from typing import Optional, Tuple
+
+
+class TablePions:
+    """
+    Table de taille fixe des évaluations de structures de pions.
+    
+    Chaque case contient un tuple (cle, score, passes_blancs, passes_noirs) ;
+    une nouvelle entrée remplace toujours l'ancienne de même indice.
+    
+    Attributs:
+        taille (int): Nombre de cases de la table (puissance de deux)
+        entrees (list): Les cases de la table
+        sondages (int): Nombre de sondages depuis la création ou vider()
+        succes (int): Nombre de sondages ayant trouvé la position
+    """
+    
+    def __init__(self, taille: int = 16384):
+        """
+        Initialise la table.
+        
+        Args:
+            taille: Nombre de cases, arrondi à la puissance de deux inférieure
+            
+        Raises:
+            ValueError: Si la taille n'est pas strictement positive
+        """
+        if taille < 1:
+            raise ValueError(f"Taille invalide: {taille}")
+        self.taille = 1 << (taille.bit_length() - 1)
+        self.vider()
+    
+    def vider(self):
+        """Efface toutes les entrées et remet les statistiques à zéro."""
+        self.entrees = [None] * self.taille
+        self.sondages = 0
+        self.succes = 0
+    
+    def sonder(self, cle: int) -> Optional[Tuple[int, int, int]]:
+        """
+        Cherche une structure de pions dans la table.
+        
+        Args:
+            cle: Clé des pions de la position
+            
+        Returns:
+            Tuple (score, passes_blancs, passes_noirs) ou None
+        """
+        self.sondages += 1
+        entree = self.entrees[cle & (self.taille - 1)]
+        if entree is not None and entree[0] == cle:
+            self.succes += 1
+            return entree[1:]
+        return None
+    
+    def stocker(self, cle: int, score: int, passes_blancs: int, passes_noirs: int):
+        """
+        Enregistre l'évaluation d'une structure de pions.
+        
+        Args:
+            cle: Clé des pions de la position
+            score: Score de la structure du point de vue des blancs
+            passes_blancs: Masque des cases des pions passés blancs (bit ligne * 8 + colonne)
+            passes_noirs: Masque des cases des pions passés noirs
+        """
+        self.entrees[cle & (self.taille - 1)] = (cle, score, passes_blancs, passes_noirs)
+    
+    def taux_succes(self) -> float:
+        """
+        Retourne la proportion de sondages ayant trouvé la position.
+        
+        Returns:
+            Pourcentage de succès (0 si la table n'a pas été sondée)
+        """
+        return 100.0 * self.succes / self.sondages if self.sondages else 0.0
@@ -0,0 +1,639 @@
+"""
+Module contenant les tables de finales (générées par analyse rétrograde).
+Pour un matériel donné (KQK, KRK, KPK, KBNK...), toutes les positions sont
+énumérées avec les règles des pièces, puis la distance au mat de chacune est
+calculée en remontant depuis les positions de mat. Le résultat est écrit dans
+un fichier compact (un octet par position, réduit par symétrie) qui peut être
+projeté en mémoire et sondé en temps constant par le moteur.
+
+Codage d'un octet, du point de vue du camp au trait :
+    0       : nulle
+    1..254  : distance au mat d = octet - 1 en demi-coups ; d impair signifie
+              que le camp au trait gagne, d pair qu'il perd (d = 0 : il est mat)
+    255     : position illégale
+"""
+
+import mmap
+import multiprocessing
+import os
+import struct
+from array import array
+from typing import Dict, List, Optional, Tuple
+from src.plateau import Plateau
+from src.piece import Pion, Tour, Cavalier, Fou, Reine, Roi
+
+
+ORDRE_PIECES = 'KQRBNP'
+LETTRES_PIECES = {'K': Roi, 'Q': Reine, 'R': Tour, 'B': Fou, 'N': Cavalier, 'P': Pion}
+PIECES_LETTRES = {classe: lettre for lettre, classe in LETTRES_PIECES.items()}
+PROMOTIONS = (Reine, Tour, Fou, Cavalier)
+
+NULLE = 0
+ILLEGALE = 255
+
+ENTETE = b'SAETB\x00\x01\x00'
+FORMAT_ENTETE = '<8sII'
+TAILLE_ENTETE = struct.calcsize(FORMAT_ENTETE)
+
+# Cases du triangle a1-d1-d4 (coordonnées de la grille : ligne 7 = 1re rangée)
+_TRIANGLE = [ligne * 8 + colonne for ligne in range(8) for colonne in range(8)
+             if colonne <= 3 and 7 - ligne <= colonne]
+# Colonnes a à d, utilisées quand des pions interdisent les symétries verticales
+_DEMI_PLATEAU = [ligne * 8 + colonne for ligne in range(8) for colonne in range(4)]
+
+
+def _transformer(case: int, numero: int) -> int:
+    """Applique l'une des 8 symétries du plateau à une case (0 = identité)."""
+    ligne, colonne = divmod(case, 8)
+    if numero & 4:
+        ligne, colonne = colonne, ligne
+    if numero & 2:
+        ligne = 7 - ligne
+    if numero & 1:
+        colonne = 7 - colonne
+    return ligne * 8 + colonne
+
+
+_SYMETRIES = [[_transformer(case, numero) for case in range(64)] for numero in range(8)]
+
+
+def _symetrie_canonique(region: List[int], symetries: Tuple[int, ...]) -> List[Optional[int]]:
+    """Pour chaque case du roi blanc, la première symétrie qui l'amène dans la région."""
+    ensemble = set(region)
+    resultat = []
+    for case in range(64):
+        resultat.append(next((numero for numero in symetries
+                              if _SYMETRIES[numero][case] in ensemble), None))
+    return resultat
+
+
+_CANONIQUE_SANS_PION = _symetrie_canonique(_TRIANGLE, tuple(range(8)))
+_CANONIQUE_AVEC_PION = _symetrie_canonique(_DEMI_PLATEAU, (0, 1))
+
+
+def _trier(lettres: str) -> str:
+    """Trie les lettres d'un camp dans l'ordre K, Q, R, B, N, P."""
+    return ''.join(sorted(lettres, key=ORDRE_PIECES.index))
+
+
+def signature_canonique(blancs: str, noirs: str) -> Tuple[str, bool]:
+    """
+    Retourne la signature de la table couvrant un matériel donné.
+    
+    Le camp le plus fort est placé en premier (il joue les blancs dans la table).
+    
+    Args:
+        blancs: Lettres des pièces blanches (ex: 'KQ')
+        noirs: Lettres des pièces noires (ex: 'K')
+        
+    Returns:
+        Tuple (signature, True si les couleurs doivent être inversées)
+    """
+    blancs, noirs = _trier(blancs), _trier(noirs)
+    
+    def force(lettres):
+        return (sum(LETTRES_PIECES[lettre].valeur for lettre in lettres if lettre != 'K'),
+                [-ORDRE_PIECES.index(lettre) for lettre in lettres])
+    
+    if force(noirs) > force(blancs):
+        return noirs + blancs, True
+    return blancs + noirs, False
+
+
+def materiel_insuffisant(signature: str) -> bool:
+    """
+    Vérifie qu'aucun camp ne peut mater (roi seul ou roi et une pièce mineure contre roi).
+    
+    Args:
+        signature: Signature du matériel (ex: 'KBK')
+        
+    Returns:
+        True si la position est nulle quel que soit le placement
+    """
+    autres = signature.replace('K', '')
+    return autres in ('', 'B', 'N')
+
+
+class DescriptionTable:
+    """
+    Décrit l'indexation d'une table pour une signature de matériel.
+    
+    L'indice d'une position combine la case du roi blanc (ramenée par
+    symétrie dans une région réduite) et la case de chaque autre pièce.
+    
+    Attributs:
+        signature (str): Signature du matériel (ex: 'KQK')
+        pieces (List[Tuple[type, str]]): (classe, couleur) dans l'ordre de l'indice
+        avec_pions (bool): Vrai si la table contient des pions
+        taille (int): Nombre de positions pour un camp au trait
+    """
+    
+    def __init__(self, signature: str):
+        """
+        Initialise la description.
+        
+        Args:
+            signature: Signature du matériel, pièces blanches puis noires (ex: 'KRKN')
+            
+        Raises:
+            ValueError: Si la signature est invalide
+        """
+        if signature.count('K') != 2 or not signature.startswith('K') or \
+           any(lettre not in LETTRES_PIECES for lettre in signature):
+            raise ValueError(f"Signature de matériel invalide: {signature}")
+        
+        separation = signature.index('K', 1)
+        blancs, noirs = signature[:separation], signature[separation:]
+        self.signature = _trier(blancs) + _trier(noirs)
+        self.pieces = [(LETTRES_PIECES[lettre], 'blanc') for lettre in _trier(blancs)] + \
+                      [(LETTRES_PIECES[lettre], 'noir') for lettre in _trier(noirs)]
+        self.avec_pions = 'P' in signature
+        self.region = _DEMI_PLATEAU if self.avec_pions else _TRIANGLE
+        self._rang_region = {case: rang for rang, case in enumerate(self.region)}
+        self._canonique = _CANONIQUE_AVEC_PION if self.avec_pions else _CANONIQUE_SANS_PION
+        self.taille = len(self.region) * 64 ** (len(self.pieces) - 1)
+    
+    def indice(self, cases: List[int]) -> int:
+        """
+        Calcule l'indice d'un placement (cases dans l'ordre de self.pieces).
+        
+        Args:
+            cases: Case (ligne * 8 + colonne) de chaque pièce
+            
+        Returns:
+            Indice de la position, entre 0 et taille - 1
+        """
+        symetrie = _SYMETRIES[self._canonique[cases[0]]]
+        indice = self._rang_region[symetrie[cases[0]]]
+        for case in cases[1:]:
+            indice = indice * 64 + symetrie[case]
+        return indice
+    
+    def cases(self, indice: int) -> List[int]:
+        """
+        Retrouve le placement correspondant à un indice.
+        
+        Args:
+            indice: Indice de la position
+            
+        Returns:
+            Case de chaque pièce, dans l'ordre de self.pieces
+        """
+        cases = []
+        for _ in range(len(self.pieces) - 1):
+            indice, case = divmod(indice, 64)
+            cases.append(case)
+        cases.append(self.region[indice])
+        cases.reverse()
+        return cases
+
+
+def _decrire_position(plateau: Plateau, couleur: str) -> Tuple[str, bool, List[int], str]:
+    """
+    Décrit une position pour la sonder dans une table.
+    
+    Returns:
+        Tuple (signature canonique, inversion des couleurs, cases dans l'ordre
+        de la table, couleur au trait dans la table)
+    """
+    pieces = {'blanc': [], 'noir': []}
+    for ligne in range(8):
+        for colonne in range(8):
+            piece = plateau.grille[ligne][colonne]
+            if piece is not None:
+                pieces[piece.couleur].append((ORDRE_PIECES.index(PIECES_LETTRES[type(piece)]),
+                                              ligne * 8 + colonne))
+    for liste in pieces.values():
+        liste.sort()
+    
+    blancs = ''.join(ORDRE_PIECES[rang] for rang, _ in pieces['blanc'])
+    noirs = ''.join(ORDRE_PIECES[rang] for rang, _ in pieces['noir'])
+    signature, inverse = signature_canonique(blancs, noirs)
+    
+    if inverse:
+        # Miroir vertical et échange des couleurs
+        cases = [(7 - case // 8) * 8 + case % 8 for _, case in pieces['noir'] + pieces['blanc']]
+        couleur = 'noir' if couleur == 'blanc' else 'blanc'
+    else:
+        cases = [case for _, case in pieces['blanc'] + pieces['noir']]
+    return signature, inverse, cases, couleur
+
+
+class TableFinale:
+    """
+    Table de finale projetée en mémoire.
+    
+    Attributs:
+        description (DescriptionTable): Indexation de la table
+        chemin (str): Chemin du fichier
+    """
+    
+    def __init__(self, chemin: str):
+        """
+        Ouvre une table.
+        
+        Args:
+            chemin: Chemin du fichier .tbl
+            
+        Raises:
+            ValueError: Si le fichier n'est pas une table valide
+        """
+        self.chemin = chemin
+        signature = os.path.splitext(os.path.basename(chemin))[0]
+        self.description = DescriptionTable(signature)
+        with open(chemin, 'rb') as fichier:
+            entete, taille, _ = struct.unpack(FORMAT_ENTETE, fichier.read(TAILLE_ENTETE))
+            if entete != ENTETE or taille != self.description.taille:
+                raise ValueError(f"Table invalide: {chemin}")
+            self._donnees = mmap.mmap(fichier.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    def fermer(self):
+        """Libère la projection en mémoire."""
+        self._donnees.close()
+    
+    def octet(self, cases: List[int], couleur: str) -> int:
+        """
+        Lit la valeur brute d'une position.
+        
+        Args:
+            cases: Cases des pièces dans l'ordre de la table
+            couleur: Couleur au trait (dans l'orientation de la table)
+            
+        Returns:
+            L'octet stocké pour cette position
+        """
+        indice = self.description.indice(cases)
+        if couleur == 'noir':
+            indice += self.description.taille
+        return self._donnees[TAILLE_ENTETE + indice]
+
+
+def decoder(octet: int) -> Optional[Tuple[str, int]]:
+    """
+    Décode un octet de table.
+    
+    Args:
+        octet: Valeur stockée
+        
+    Returns:
+        Tuple ('gain' | 'perte' | 'nulle', demi-coups jusqu'au mat) ou None si illégale
+    """
+    if octet == ILLEGALE:
+        return None
+    if octet == NULLE:
+        return 'nulle', 0
+    distance = octet - 1
+    return ('gain' if distance % 2 else 'perte'), distance
+
+
+class TablesFinales:
+    """
+    Ensemble des tables disponibles dans un dossier, ouvertes à la demande.
+    
+    Attributs:
+        dossier (str): Dossier contenant les fichiers .tbl
+        pieces_max (int): Nombre maximal de pièces des tables disponibles
+    """
+    
+    def __init__(self, dossier: str):
+        """
+        Initialise l'ensemble.
+        
+        Args:
+            dossier: Dossier contenant les fichiers .tbl
+        """
+        self.dossier = dossier
+        self._tables: Dict[str, Optional[TableFinale]] = {}
+        signatures = [nom[:-4] for nom in os.listdir(dossier) if nom.endswith('.tbl')] \
+            if os.path.isdir(dossier) else []
+        self.pieces_max = max((len(signature) for signature in signatures), default=0)
+    
+    def table(self, signature: str) -> Optional[TableFinale]:
+        """
+        Retourne la table d'une signature canonique, ou None si elle n'existe pas.
+        
+        Args:
+            signature: Signature canonique (ex: 'KQK')
+        """
+        if signature not in self._tables:
+            chemin = os.path.join(self.dossier, signature + '.tbl')
+            self._tables[signature] = TableFinale(chemin) if os.path.exists(chemin) else None
+        return self._tables[signature]
+    
+    def sonder(self, plateau: Plateau, couleur: str) -> Optional[Tuple[str, int]]:
+        """
+        Cherche une position dans les tables.
+        
+        Args:
+            plateau: Le plateau de jeu
+            couleur: Couleur du camp au trait
+            
+        Returns:
+            Tuple ('gain' | 'perte' | 'nulle', demi-coups jusqu'au mat) du
+            point de vue du camp au trait, ou None si la position n'est pas couverte
+        """
+        signature, _, cases, couleur_table = _decrire_position(plateau, couleur)
+        if materiel_insuffisant(signature):
+            return 'nulle', 0
+        table = self.table(signature)
+        if table is None:
+            return None
+        return decoder(table.octet(cases, couleur_table))
+    
+    def fermer(self):
+        """Ferme toutes les tables ouvertes."""
+        for table in self._tables.values():
+            if table is not None:
+                table.fermer()
+        self._tables.clear()
+
+
+# --- Génération -------------------------------------------------------------
+
+# Contexte de génération propre à chaque processus de travail
+_contexte: dict = {}
+
+
+def _initialiser_processus(signature: str, dossier: str):
+    """Prépare un processus de travail (description et sous-tables)."""
+    _contexte['description'] = DescriptionTable(signature)
+    _contexte['tables'] = TablesFinales(dossier)
+
+
+def _analyser_bloc(bornes: Tuple[int, int]) -> Tuple[bytes, array, array]:
+    """
+    Analyse un bloc d'indices : légalité, échec et successeurs de chaque position.
+    
+    Les successeurs internes sont des indices de la table (positifs), les
+    issues externes (captures, promotions) sont codées -(1 + octet) d'après
+    la sous-table correspondante.
+    
+    Args:
+        bornes: Premier indice et indice de fin (exclu), tous camps confondus
+        
+    Returns:
+        Tuple (statut de chaque position, nombre de successeurs, successeurs à la suite)
+    """
+    description: DescriptionTable = _contexte['description']
+    tables: TablesFinales = _contexte['tables']
+    statuts = bytearray()
+    nombres = array('H')
+    successeurs = array('i')
+    
+    for indice_global in range(*bornes):
+        couleur = 'noir' if indice_global >= description.taille else 'blanc'
+        cases = description.cases(indice_global % description.taille)
+        issues = _analyser_position(description, tables, cases, couleur)
+        if issues is None:
+            statuts.append(2)
+            nombres.append(0)
+            continue
+        en_echec, liste = issues
+        statuts.append(1 if en_echec else 0)
+        nombres.append(len(liste))
+        successeurs.extend(liste)
+    
+    return bytes(statuts), nombres, successeurs
+
+
+def _analyser_position(description: DescriptionTable, tables: TablesFinales,
+                       cases: List[int], couleur: str):
+    """
+    Construit une position avec les classes de pièces et énumère ses coups légaux.
+    
+    Returns:
+        None si la position est illégale, sinon (en échec, liste des successeurs)
+    """
+    if len(set(cases)) != len(cases):
+        return None
+    
+    plateau = Plateau()
+    rois = {}
+    pieces = []
+    for (classe, couleur_piece), case in zip(description.pieces, cases):
+        ligne, colonne = divmod(case, 8)
+        if classe is Pion and ligne in (0, 7):
+            return None
+        piece = classe(couleur_piece, (ligne, colonne))
+        piece.a_bouge = not (classe is Pion and ligne == (6 if couleur_piece == 'blanc' else 1))
+        plateau.grille[ligne][colonne] = piece
+        pieces.append(piece)
+        if classe is Roi:
+            rois[couleur_piece] = piece
+    
+    adverse = 'noir' if couleur == 'blanc' else 'blanc'
+    if plateau.est_case_attaquee(rois[adverse].position, couleur):
+        return None
+    en_echec = plateau.est_case_attaquee(rois[couleur].position, adverse)
+    
+    successeurs = []
+    for piece in plateau.obtenir_toutes_pieces(couleur):
+        depart = piece.position
+        for arrivee in piece.mouvements_possibles(plateau):
+            promotions = PROMOTIONS if isinstance(piece, Pion) and arrivee[0] in (0, 7) else (None,)
+            for promotion in promotions:
+                coup_joue = plateau.jouer_coup(depart, arrivee, promotion)
+                if not plateau.est_case_attaquee(rois[couleur].position, adverse):
+                    if coup_joue[4] is None and coup_joue[8] is None:
+                        # Ni capture ni promotion : le matériel ne change pas
+                        indice = description.indice([p.position[0] * 8 + p.position[1]
+                                                     for p in pieces])
+                        if adverse == 'noir':
+                            indice += description.taille
+                        successeurs.append(indice)
+                    else:
+                        successeurs.append(_successeur(description, tables, plateau, adverse))
+                plateau.annuler_coup(coup_joue)
+    
+    return en_echec, successeurs
+
+
+def _successeur(description: DescriptionTable, tables: TablesFinales,
+                plateau: Plateau, couleur: str) -> int:
+    """Code le successeur d'un coup (indice interne ou issue externe)."""
+    signature, _, cases, couleur_table = _decrire_position(plateau, couleur)
+    if signature == description.signature:
+        indice = description.indice(cases)
+        return indice + description.taille if couleur_table == 'noir' else indice
+    if materiel_insuffisant(signature):
+        return -(1 + NULLE)
+    table = tables.table(signature)
+    if table is None:
+        raise ValueError(f"La table {signature} doit être générée avant {description.signature}")
+    return -(1 + table.octet(cases, couleur_table))
+
+
+def dependances(signature: str) -> List[str]:
+    """
+    Liste les tables atteignables en un coup par une capture et/ou une promotion.
+    
+    Args:
+        signature: Signature du matériel
+        
+    Returns:
+        Signatures canoniques des tables nécessaires (hors matériel insuffisant)
+    """
+    description = DescriptionTable(signature)
+    camps = {couleur: ''.join(PIECES_LETTRES[classe] for classe, couleur_piece in description.pieces
+                              if couleur_piece == couleur)
+             for couleur in ('blanc', 'noir')}
+    candidats = set()
+    for joueur, adversaire in (('blanc', 'noir'), ('noir', 'blanc')):
+        # Matériel du joueur : inchangé ou avec un pion promu
+        variantes_joueur = {camps[joueur]}
+        for position, lettre in enumerate(camps[joueur]):
+            if lettre == 'P':
+                reste = camps[joueur][:position] + camps[joueur][position + 1:]
+                variantes_joueur |= {reste + PIECES_LETTRES[classe] for classe in PROMOTIONS}
+        # Matériel de l'adversaire : inchangé ou amputé d'une pièce capturée
+        variantes_adversaire = {camps[adversaire]}
+        for position, lettre in enumerate(camps[adversaire]):
+            if lettre != 'K':
+                variantes_adversaire.add(camps[adversaire][:position] + camps[adversaire][position + 1:])
+        for materiel_joueur in variantes_joueur:
+            for materiel_adversaire in variantes_adversaire:
+                materiels = {joueur: materiel_joueur, adversaire: materiel_adversaire}
+                candidats.add(signature_canonique(materiels['blanc'], materiels['noir'])[0])
+    candidats.discard(description.signature)
+    return sorted(candidat for candidat in candidats if not materiel_insuffisant(candidat))
+
+
+def generer_table(signature: str, dossier: str, processus: Optional[int] = None,
+                  taille_bloc: int = 4096) -> str:
+    """
+    Génère la table d'un matériel (et, au besoin, les tables dont elle dépend).
+    
+    Args:
+        signature: Signature du matériel (ex: 'KQK', 'KPK', 'KBNK')
+        dossier: Dossier où écrire les fichiers .tbl
+        processus: Nombre de processus de travail (nombre de cœurs si None)
+        taille_bloc: Nombre de positions analysées par tâche
+        
+    Returns:
+        Chemin du fichier généré
+    """
+    os.makedirs(dossier, exist_ok=True)
+    separation = signature.index('K', 1)
+    signature = signature_canonique(signature[:separation], signature[separation:])[0]
+    chemin = os.path.join(dossier, signature + '.tbl')
+    if os.path.exists(chemin):
+        return chemin
+    
+    for dependance in dependances(signature):
+        generer_table(dependance, dossier, processus, taille_bloc)
+    
+    description = DescriptionTable(signature)
+    total = 2 * description.taille
+    blocs = [(debut, min(debut + taille_bloc, total)) for debut in range(0, total, taille_bloc)]
+    
+    # Phase 1 (parallèle) : énumérer les coups de chaque position avec les règles des pièces
+    statuts = bytearray()
+    nombres = array('H')
+    successeurs = array('i')
+    if processus == 1:
+        _initialiser_processus(signature, dossier)
+        resultats = map(_analyser_bloc, blocs)
+        for bloc_statuts, bloc_nombres, bloc_successeurs in resultats:
+            statuts += bloc_statuts
+            nombres.extend(bloc_nombres)
+            successeurs.extend(bloc_successeurs)
+    else:
+        with multiprocessing.Pool(processus, _initialiser_processus, (signature, dossier)) as groupe:
+            for bloc_statuts, bloc_nombres, bloc_successeurs in groupe.imap(_analyser_bloc, blocs):
+                statuts += bloc_statuts
+                nombres.extend(bloc_nombres)
+                successeurs.extend(bloc_successeurs)
+    
+    # Phase 2 : analyse rétrograde par niveaux de distance au mat
+    valeurs = _retrograder(statuts, nombres, successeurs)
+    
+    chemin_temporaire = chemin + '.tmp'
+    with open(chemin_temporaire, 'wb') as fichier:
+        fichier.write(struct.pack(FORMAT_ENTETE, ENTETE, description.taille, 0))
+        fichier.write(valeurs)
+    os.replace(chemin_temporaire, chemin)
+    return chemin
+
+
+def _retrograder(statuts: bytearray, nombres: array, successeurs: array) -> bytearray:
+    """
+    Calcule la distance au mat de chaque position à partir du graphe des coups.
+    
+    Les positions sont résolues par distance croissante : une position est
+    gagnée dès qu'un coup mène à une position perdue, perdue quand tous ses
+    coups mènent à des positions gagnées pour l'adversaire.
+    
+    Args:
+        statuts: 0 (légale), 1 (légale, en échec) ou 2 (illégale) par position
+        nombres: Nombre de successeurs de chaque position
+        successeurs: Successeurs de toutes les positions à la suite
+        
+    Returns:
+        Les octets de la table
+    """
+    total = len(statuts)
+    valeurs = bytearray(total)
+    restants = array('H', nombres)
+    niveaux: List[List[int]] = [[] for _ in range(ILLEGALE)]
+    evenements: List[List[int]] = [[] for _ in range(ILLEGALE)]
+    
+    # Prédécesseurs internes (tri par comptage) et issues externes
+    debuts = array('I', [0]) * (total + 1)
+    for successeur in successeurs:
+        if successeur >= 0:
+            debuts[successeur + 1] += 1
+    for indice in range(total):
+        debuts[indice + 1] += debuts[indice]
+    remplissage = array('I', debuts)
+    predecesseurs = array('I', [0]) * debuts[total]
+    
+    position_courante = 0
+    for indice in range(total):
+        if statuts[indice] == 2:
+            valeurs[indice] = ILLEGALE
+            continue
+        if nombres[indice] == 0 and statuts[indice] == 1:
+            valeurs[indice] = 1
+            niveaux[0].append(indice)
+        for successeur in successeurs[position_courante:position_courante + nombres[indice]]:
+            if successeur >= 0:
+                predecesseurs[remplissage[successeur]] = indice
+                remplissage[successeur] += 1
+            else:
+                octet = -successeur - 1
+                if octet not in (NULLE, ILLEGALE):
+                    evenements[octet - 1].append(indice)
+        position_courante += nombres[indice]
+    
+    for distance in range(ILLEGALE - 2):
+        concernes = list(evenements[distance])
+        for indice in niveaux[distance]:
+            concernes.extend(predecesseurs[debuts[indice]:debuts[indice + 1]])
+        for predecesseur in concernes:
+            if valeurs[predecesseur] != NULLE:
+                continue
+            if distance % 2 == 0:
+                # Un coup mène à une position perdue pour l'adversaire
+                valeurs[predecesseur] = distance + 2
+                niveaux[distance + 1].append(predecesseur)
+            else:
+                restants[predecesseur] -= 1
+                if restants[predecesseur] == 0:
+                    valeurs[predecesseur] = distance + 2
+                    niveaux[distance + 1].append(predecesseur)
+    
+    return valeurs
+
+
+def main():
+    """Génère les tables demandées sur la ligne de commande."""
+    import argparse
+    analyseur = argparse.ArgumentParser(description="Génération des tables de finales")
+    analyseur.add_argument('signatures', nargs='+', help="Matériel à générer (ex: KQK KRK KPK)")
+    analyseur.add_argument('--dossier', default='tables', help="Dossier de sortie")
+    analyseur.add_argument('--processus', type=int, default=None,
+                           help="Nombre de processus (nombre de cœurs par défaut)")
+    arguments = analyseur.parse_args()
+    for signature in arguments.signatures:
+        print(f"Génération de {signature}...")
+        print(f"  -> {generer_table(signature.upper(), arguments.dossier, arguments.processus)}")
@@ -0,0 +1,125 @@
+"""
+Module contenant l'export des positions en tableaux NumPy.
+Un lot de positions devient un tableau (N, 12, 8, 8) : un plan par type de
+pièce et par couleur (pions, cavaliers, fous, tours, dames, rois blancs puis
+noirs), accompagné de plans pour le trait, les droits de roque et la case
+de prise en passant. La conversion travaille sur l'encodage compact des
+positions par opérations groupées, sans boucle Python par case.
+
+NumPy est une dépendance facultative : il n'est nécessaire que pour ce module.
+"""
+
+from typing import Iterable, Tuple, Union
+from src.plateau import Plateau
+from src.encodage import TAILLE_POSITION, TRAIT_NOIR, ROQUES, encoder_position, encoder_fen
+
+try:
+    import numpy as np
+except ImportError:  # NumPy est facultatif
+    np = None
+
+
+NOMBRE_PLANS_PIECES = 12
+# Trait aux blancs, droits de roque K, Q, k, q, case de prise en passant
+NOMBRE_PLANS_AUXILIAIRES = 6
+
+Position = Union[bytes, str, Tuple[Plateau, str]]
+
+
+def _verifier_numpy():
+    """Lève une erreur explicite si NumPy n'est pas installé."""
+    if np is None:
+        raise ImportError("NumPy est nécessaire pour exporter des tenseurs (pip install numpy)")
+
+
+def encoder_lot(positions: Iterable[Position]) -> 'np.ndarray':
+    """
+    Rassemble des positions dans un tableau d'encodages compacts.
+    
+    Args:
+        positions: Positions encodées (bytes), chaînes FEN ou tuples (plateau, couleur)
+        
+    Returns:
+        Tableau (N, TAILLE_POSITION) d'octets
+    """
+    _verifier_numpy()
+    encodages = []
+    for position in positions:
+        if isinstance(position, (bytes, bytearray)):
+            encodages.append(bytes(position))
+        elif isinstance(position, str):
+            encodages.append(encoder_fen(position))
+        else:
+            encodages.append(encoder_position(*position))
+    return np.frombuffer(b''.join(encodages), dtype=np.uint8).reshape(-1, TAILLE_POSITION)
+
+
+def cases_depuis_encodages(encodages: 'np.ndarray') -> 'np.ndarray':
+    """
+    Décompresse les codes de pièce (4 bits par case) d'un lot de positions.
+    
+    Args:
+        encodages: Tableau (N, TAILLE_POSITION) d'octets
+        
+    Returns:
+        Tableau (N, 64) des codes de pièce (0 : case vide), cases dans l'ordre ligne * 8 + colonne
+    """
+    _verifier_numpy()
+    octets = encodages[:, :32]
+    cases = np.empty((len(encodages), 64), dtype=np.uint8)
+    cases[:, 0::2] = octets & 0x0F
+    cases[:, 1::2] = octets >> 4
+    return cases
+
+
+def exporter_encodages(encodages: 'np.ndarray',
+                       type_donnees=None) -> Tuple['np.ndarray', 'np.ndarray']:
+    """
+    Convertit un lot de positions encodées en plans de pièces et plans auxiliaires.
+    
+    Args:
+        encodages: Tableau (N, TAILLE_POSITION) d'octets
+        type_donnees: Type des tableaux produits (bool par défaut, ou np.uint8)
+        
+    Returns:
+        Tuple (plans des pièces (N, 12, 8, 8), plans auxiliaires (N, 6, 8, 8))
+    """
+    _verifier_numpy()
+    type_donnees = type_donnees or np.bool_
+    encodages = np.asarray(encodages, dtype=np.uint8).reshape(-1, TAILLE_POSITION)
+    nombre = len(encodages)
+    
+    cases = cases_depuis_encodages(encodages)
+    codes = np.arange(1, NOMBRE_PLANS_PIECES + 1, dtype=np.uint8)
+    pieces = (cases[:, None, :] == codes[None, :, None]).reshape(nombre, NOMBRE_PLANS_PIECES, 8, 8)
+    
+    indicateurs = encodages[:, 32]
+    bits = np.array((TRAIT_NOIR,) + ROQUES, dtype=np.uint8)
+    drapeaux = (indicateurs[:, None] & bits[None, :]) != 0
+    # Le premier plan vaut 1 quand les blancs ont le trait
+    drapeaux[:, 0] = ~drapeaux[:, 0]
+    
+    auxiliaires = np.zeros((nombre, NOMBRE_PLANS_AUXILIAIRES, 64), dtype=np.bool_)
+    auxiliaires[:, :5, :] = drapeaux[:, :, None]
+    en_passant = encodages[:, 33].astype(np.intp)
+    lignes = np.nonzero(en_passant)[0]
+    auxiliaires[lignes, 5, en_passant[lignes] - 1] = True
+    auxiliaires = auxiliaires.reshape(nombre, NOMBRE_PLANS_AUXILIAIRES, 8, 8)
+    
+    if type_donnees is not np.bool_:
+        return pieces.astype(type_donnees), auxiliaires.astype(type_donnees)
+    return pieces, auxiliaires
+
+
+def exporter(positions: Iterable[Position], type_donnees=None) -> Tuple['np.ndarray', 'np.ndarray']:
+    """
+    Convertit un lot de positions en tenseurs pour l'apprentissage.
+    
+    Args:
+        positions: Positions encodées (bytes), chaînes FEN ou tuples (plateau, couleur)
+        type_donnees: Type des tableaux produits (bool par défaut, ou np.uint8)
+        
+    Returns:
+        Tuple (plans des pièces (N, 12, 8, 8), plans auxiliaires (N, 6, 8, 8))
+    """
+    return exporter_encodages(encoder_lot(positions), type_donnees)
@@ -0,0 +1,933 @@
+"""
+Module contenant l'organisation de matchs entre moteurs.
+Chaque partie est jouée dans un processus séparé avec les règles de Jeu,
+sans affichage. Un moteur est soit le moteur de cette version du projet,
+configuré par les paramètres de Moteur, soit un programme UCI externe (par
+exemple une autre version du projet extraite dans un autre dossier).
+
+Les ouvertures sont tirées d'un fichier (positions FEN ou suites de coups
+UCI) ou générées au hasard, et chacune est jouée deux fois en inversant
+les couleurs. Les parties sont arbitrées (répétition, règle des 50 coups,
+matériel insuffisant, scores des moteurs) et écrites au fur et à mesure
+dans un fichier PGN. Entre deux moteurs, un test séquentiel du rapport de
+vraisemblance (SPRT) arrête le match dès que l'écart d'Elo est établi.
+"""
+
+import argparse
+import itertools
+import math
+import os
+import queue
+import random
+import shlex
+import subprocess
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Executor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+from typing import Callable, Dict, List, Optional, Tuple
+from src.jeu import Jeu
+from src.piece import Pion, Roi, Fou, Cavalier
+from src.moteur import Moteur
+from src.fen import FEN_INITIALE
+from src.zobrist import hacher
+from src.notation import coup_vers_uci, uci_vers_coup
+from src.pgn import coup_vers_san, ecrire_partie
+
+# Ouverture : position de départ en FEN et coups UCI joués avant que les moteurs prennent la main
+Ouverture = Tuple[str, List[str]]
+
+SCORE_MAT_UCI = 100000
+# Délai accordé à un moteur UCI pour répondre au-delà de son temps restant
+DELAI_UCI = 5.0
+
+
+class Controle:
+    """
+    Limites de réflexion des moteurs pendant un match.
+    
+    Attributs:
+        base (Optional[float]): Temps de chaque moteur en secondes (sans pendule si None)
+        increment (float): Temps ajouté après chaque coup en secondes
+        profondeur (Optional[int]): Profondeur maximale par coup
+        noeuds (Optional[int]): Nombre maximal de nœuds par coup
+    """
+    
+    def __init__(self, base: Optional[float] = None, increment: float = 0.0,
+                 profondeur: Optional[int] = None, noeuds: Optional[int] = None):
+        """Initialise les limites (au moins une doit être fixée)."""
+        if base is None and profondeur is None and noeuds is None:
+            raise ValueError("Il faut une cadence, une profondeur ou un nombre de nœuds")
+        self.base = base
+        self.increment = increment
+        self.profondeur = profondeur
+        self.noeuds = noeuds
+    
+    def texte_pgn(self) -> str:
+        """Retourne la cadence au format de l'en-tête PGN TimeControl."""
+        if self.base is None:
+            return '-'
+        return f"{self.base:g}+{self.increment:g}" if self.increment else f"{self.base:g}"
+
+
+class Adjudication:
+    """
+    Règles d'arbitrage qui terminent les parties sans attendre le mat.
+    
+    Attributs:
+        demi_coups_max (int): Nulle au-delà de ce nombre de demi-coups
+        nulle_apres (int): Numéro de coup à partir duquel la nulle par score est possible
+        nulle_score (int): Score absolu maximal (centièmes) pour la nulle par score
+        nulle_duree (int): Demi-coups consécutifs sous nulle_score pour déclarer la nulle
+        victoire_score (int): Score minimal (centièmes) pour déclarer la victoire
+        victoire_duree (int): Demi-coups consécutifs au-delà de victoire_score
+    """
+    
+    def __init__(self, demi_coups_max: int = 400, nulle_apres: int = 40, nulle_score: int = 10,
+                 nulle_duree: int = 8, victoire_score: int = 1000, victoire_duree: int = 6):
+        """Initialise les seuils d'arbitrage."""
+        self.demi_coups_max = demi_coups_max
+        self.nulle_apres = nulle_apres
+        self.nulle_score = nulle_score
+        self.nulle_duree = nulle_duree
+        self.victoire_score = victoire_score
+        self.victoire_duree = victoire_duree
+    
+    def juger(self, scores: List[Optional[int]], numero_coup: int) -> Optional[str]:
+        """
+        Juge la partie d'après les derniers scores annoncés par les moteurs.
+        
+        Args:
+            scores: Score de chaque demi-coup du point de vue des blancs (None si inconnu)
+            numero_coup: Numéro du coup à jouer
+            
+        Returns:
+            '1-0', '0-1' ou '1/2-1/2' si la partie est jugée, None sinon
+        """
+        derniers = scores[-self.victoire_duree:]
+        if len(derniers) == self.victoire_duree and None not in derniers:
+            if all(score >= self.victoire_score for score in derniers):
+                return '1-0'
+            if all(score <= -self.victoire_score for score in derniers):
+                return '0-1'
+        
+        derniers = scores[-self.nulle_duree:]
+        if numero_coup >= self.nulle_apres and len(derniers) == self.nulle_duree \
+                and None not in derniers and all(abs(score) <= self.nulle_score for score in derniers):
+            return '1/2-1/2'
+        return None
+
+
+class MoteurInterne:
+    """Moteur de cette version du projet, exécuté dans le processus de la partie."""
+    
+    def __init__(self, options: Dict[str, object]):
+        """
+        Crée le moteur.
+        
+        Args:
+            options: Paramètres de Moteur (profondeur, elaguer_captures_perdantes, ...)
+        """
+        self.moteur = Moteur(**options)
+    
+    def choisir(self, jeu: Jeu, fen_depart: str, coups_uci: List[str],
+                controle: Controle) -> Tuple[Optional[str], Optional[int]]:
+        """
+        Choisit le coup à jouer.
+        
+        Returns:
+            Tuple (coup UCI ou None, score du point de vue du camp au trait ou None)
+        """
+        couleur = jeu.joueur_actuel.couleur
+        coup, score = self.moteur.chercher_iteratif(jeu.plateau, couleur, controle.profondeur,
+                                                    noeuds_max=controle.noeuds,
+                                                    gestion_temps=jeu.gestion_temps())
+        if coup is None:
+            return None, None
+        return coup_vers_uci(jeu.plateau, coup), score
+    
+    def fermer(self):
+        """Libère le moteur (rien à faire)."""
+
+
+class MoteurUCI:
+    """Programme externe piloté par le protocole UCI."""
+    
+    def __init__(self, commande: str, options: Dict[str, object]):
+        """
+        Lance le programme et le prépare pour une nouvelle partie.
+        
+        Args:
+            commande: Ligne de commande du programme
+            options: Options UCI envoyées par 'setoption'
+            
+        Raises:
+            RuntimeError: Si le programme ne répond pas au protocole
+        """
+        self.processus = subprocess.Popen(shlex.split(commande), stdin=subprocess.PIPE,
+                                          stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                          text=True, bufsize=1)
+        # Lecture dans un fil séparé pour pouvoir attendre avec un délai
+        self._lignes: 'queue.Queue[Optional[str]]' = queue.Queue()
+        self._lecteur = threading.Thread(target=self._lire, daemon=True)
+        self._lecteur.start()
+        
+        self.envoyer('uci')
+        self._attendre('uciok', DELAI_UCI)
+        for nom, valeur in options.items():
+            self.envoyer(f"setoption name {nom} value {valeur}")
+        self.envoyer('ucinewgame')
+        self.envoyer('isready')
+        self._attendre('readyok', DELAI_UCI)
+    
+    def _lire(self):
+        """Corps du fil de lecture : transmet chaque ligne reçue."""
+        for ligne in self.processus.stdout:
+            self._lignes.put(ligne.strip())
+        self._lignes.put(None)
+    
+    def envoyer(self, commande: str):
+        """Envoie une commande au programme."""
+        self.processus.stdin.write(commande + '\n')
+        self.processus.stdin.flush()
+    
+    def _attendre(self, debut: str, delai: Optional[float],
+                  traiter: Optional[Callable[[str], None]] = None) -> str:
+        """
+        Attend une ligne commençant par un mot donné.
+        
+        Args:
+            debut: Premier mot attendu
+            delai: Temps maximal d'attente en secondes (illimité si None)
+            traiter: Fonction appelée sur chaque autre ligne reçue
+            
+        Returns:
+            La ligne attendue
+            
+        Raises:
+            RuntimeError: Si le délai expire ou si le programme s'arrête
+        """
+        echeance = time.monotonic() + delai if delai is not None else None
+        while True:
+            try:
+                ligne = self._lignes.get(timeout=max(0.0, echeance - time.monotonic())
+                                         if echeance is not None else None)
+            except queue.Empty:
+                raise RuntimeError(f"Pas de réponse '{debut}' du moteur UCI")
+            if ligne is None:
+                raise RuntimeError("Le moteur UCI s'est arrêté")
+            if ligne.split(' ', 1)[0] == debut:
+                return ligne
+            if traiter is not None:
+                traiter(ligne)
+    
+    def choisir(self, jeu: Jeu, fen_depart: str, coups_uci: List[str],
+                controle: Controle) -> Tuple[Optional[str], Optional[int]]:
+        """
+        Choisit le coup à jouer.
+        
+        Returns:
+            Tuple (coup UCI ou None, score du point de vue du camp au trait ou None)
+        """
+        position = 'position startpos' if fen_depart == FEN_INITIALE else f"position fen {fen_depart}"
+        if coups_uci:
+            position += ' moves ' + ' '.join(coups_uci)
+        self.envoyer(position)
+        
+        delai = DELAI_UCI
+        if jeu.pendule is not None:
+            pendule = jeu.pendule
+            increment = round(pendule.increment * 1000)
+            self.envoyer(f"go wtime {max(0, round(pendule.temps_restant('blanc') * 1000))} "
+                         f"btime {max(0, round(pendule.temps_restant('noir') * 1000))} "
+                         f"winc {increment} binc {increment}")
+            delai += pendule.temps_restant(jeu.joueur_actuel.couleur)
+        elif controle.profondeur is not None:
+            self.envoyer(f"go depth {controle.profondeur}")
+            delai = None
+        else:
+            self.envoyer(f"go nodes {controle.noeuds}")
+            delai = None
+        
+        score = []
+        
+        def lire_info(ligne: str):
+            mots = ligne.split()
+            if mots[0] == 'info' and 'score' in mots:
+                indice = mots.index('score')
+                if mots[indice + 1] == 'cp':
+                    score[:] = [int(mots[indice + 2])]
+                elif mots[indice + 1] == 'mate':
+                    distance = int(mots[indice + 2])
+                    score[:] = [SCORE_MAT_UCI - abs(distance) if distance > 0
+                                else -SCORE_MAT_UCI + abs(distance)]
+        
+        ligne = self._attendre('bestmove', delai, lire_info)
+        mots = ligne.split()
+        coup = mots[1] if len(mots) > 1 and mots[1] != '0000' else None
+        return coup, score[0] if score else None
+    
+    def fermer(self):
+        """Arrête le programme."""
+        try:
+            self.envoyer('quit')
+            self.processus.wait(2)
+        except (OSError, subprocess.TimeoutExpired):
+            self.processus.kill()
+            self.processus.wait()
+        # Le programme arrêté, le fil de lecture atteint la fin de stdout
+        self._lecteur.join(2)
+        for flux in (self.processus.stdin, self.processus.stdout):
+            try:
+                flux.close()
+            except OSError:
+                pass
+
+
+class ConfigurationMoteur:
+    """
+    Description d'un moteur participant au match.
+    
+    Attributs:
+        nom (str): Nom du moteur dans les résultats
+        options (Dict[str, object]): Paramètres de Moteur, ou options UCI si commande est fixée
+        commande (Optional[str]): Ligne de commande d'un moteur UCI externe (None : moteur interne)
+    """
+    
+    def __init__(self, nom: str, options: Optional[Dict[str, object]] = None,
+                 commande: Optional[str] = None):
+        """Initialise la configuration."""
+        self.nom = nom
+        self.options = options or {}
+        self.commande = commande
+    
+    @classmethod
+    def depuis_texte(cls, texte: str) -> 'ConfigurationMoteur':
+        """
+        Lit une configuration de la forme 'nom[:cle=valeur,cle=valeur...]'.
+        
+        La clé 'commande' désigne un moteur UCI externe, par exemple
+        'base:commande=python3 ../base/main_uci.py'. Les valeurs entières
+        sont converties.
+        
+        Args:
+            texte: La configuration
+            
+        Returns:
+            La configuration lue
+            
+        Raises:
+            ValueError: Si le texte est mal formé
+        """
+        nom, _, reste = texte.partition(':')
+        if not nom:
+            raise ValueError(f"Configuration de moteur invalide: {texte}")
+        options: Dict[str, object] = {}
+        commande = None
+        for element in filter(None, reste.split(',')):
+            cle, egal, valeur = element.partition('=')
+            if not egal:
+                raise ValueError(f"Option de moteur invalide: {element}")
+            if cle == 'commande':
+                commande = valeur
+                continue
+            try:
+                options[cle] = int(valeur)
+            except ValueError:
+                options[cle] = valeur
+        return cls(nom, options, commande)
+    
+    def creer(self):
+        """Crée le moteur décrit (dans le processus de la partie)."""
+        if self.commande is not None:
+            return MoteurUCI(self.commande, self.options)
+        return MoteurInterne(self.options)
+
+
+class ResultatPartie:
+    """
+    Résultat d'une partie du match.
+    
+    Attributs:
+        numero (int): Numéro de la partie
+        blancs (str): Nom du moteur blanc
+        noirs (str): Nom du moteur noir
+        resultat (str): '1-0', '0-1' ou '1/2-1/2'
+        motif (str): Raison de la fin de partie
+        demi_coups (int): Nombre de demi-coups joués par les moteurs
+        pgn (str): La partie au format PGN
+    """
+    
+    def __init__(self, numero: int, blancs: str, noirs: str, resultat: str, motif: str,
+                 demi_coups: int, pgn: str):
+        """Initialise le résultat."""
+        self.numero = numero
+        self.blancs = blancs
+        self.noirs = noirs
+        self.resultat = resultat
+        self.motif = motif
+        self.demi_coups = demi_coups
+        self.pgn = pgn
+
+
+def materiel_insuffisant(jeu: Jeu) -> bool:
+    """Indique si aucun camp ne peut mater (rois seuls, ou un seul fou ou cavalier)."""
+    pieces = [piece for ligne in jeu.plateau.grille for piece in ligne
+              if piece is not None and not isinstance(piece, Roi)]
+    return not pieces or (len(pieces) == 1 and isinstance(pieces[0], (Fou, Cavalier)))
+
+
+def jouer_partie(numero: int, blancs: ConfigurationMoteur, noirs: ConfigurationMoteur,
+                 ouverture: Ouverture, controle: Controle,
+                 adjudication: Optional[Adjudication] = None,
+                 evenement: str = "Tournoi local") -> ResultatPartie:
+    """
+    Joue une partie complète entre deux moteurs (exécuté dans un processus séparé).
+    
+    Un moteur qui joue un coup illégal, ne répond pas ou dépasse son temps
+    perd la partie.
+    
+    Args:
+        numero: Numéro de la partie
+        blancs: Configuration du moteur blanc
+        noirs: Configuration du moteur noir
+        ouverture: Position de départ et coups imposés
+        controle: Limites de réflexion
+        adjudication: Règles d'arbitrage (seulement les règles du jeu si None)
+        evenement: Nom du match dans le PGN
+        
+    Returns:
+        Le résultat de la partie
+    """
+    fen_depart, coups_ouverture = ouverture
+    jeu = Jeu.depuis_fen(fen_depart, blancs.nom, noirs.nom)
+    noirs_commencent = jeu.joueur_actuel.couleur == 'noir'
+    numero_depart = int(fen_depart.split()[5]) if len(fen_depart.split()) > 5 else 1
+    coups_uci: List[str] = []
+    coups_san: List[str] = []
+    sans_prise = 0
+    
+    def jouer(texte: str) -> Optional[str]:
+        """Joue un coup UCI s'il est légal ; retourne le message d'erreur sinon."""
+        nonlocal sans_prise
+        try:
+            depart, arrivee, promotion = uci_vers_coup(texte)
+        except ValueError as e:
+            return str(e)
+        if (depart, arrivee) not in jeu.obtenir_tous_mouvements_legaux(jeu.joueur_actuel.couleur):
+            return f"coup illégal {texte}"
+        piece = jeu.plateau.obtenir_piece(depart)
+        if isinstance(piece, Pion) or jeu.plateau.obtenir_piece(arrivee) is not None:
+            sans_prise = 0
+        else:
+            sans_prise += 1
+        coups_san.append(coup_vers_san(jeu, depart, arrivee, promotion))
+        coups_uci.append(texte)
+        jeu.jouer_coup(depart, arrivee, promotion)
+        return None
+    
+    for texte in coups_ouverture:
+        if jouer(texte) is not None:
+            raise ValueError(f"Ouverture invalide: {' '.join(coups_ouverture)}")
+    
+    if controle.base is not None:
+        jeu.fixer_cadence(controle.base, controle.increment)
+    repetitions = Counter([hacher(jeu.plateau, jeu.joueur_actuel.couleur)])
+    scores: List[Optional[int]] = []
+    moteurs = {'blanc': blancs.creer(), 'noir': noirs.creer()}
+    demi_coups = 0
+    
+    try:
+        while True:
+            couleur = jeu.joueur_actuel.couleur
+            gagne = '1-0' if couleur == 'noir' else '0-1'
+            perdu = '0-1' if couleur == 'noir' else '1-0'
+            
+            fin = jeu.resultat()
+            if fin == 'echec_et_mat':
+                resultat, motif, terminaison = gagne, "échec et mat", 'normal'
+                break
+            if fin == 'pat':
+                resultat, motif, terminaison = '1/2-1/2', "pat", 'normal'
+                break
+            if repetitions[hacher(jeu.plateau, couleur)] >= 3:
+                resultat, motif, terminaison = '1/2-1/2', "triple répétition", 'normal'
+                break
+            if sans_prise >= 100:
+                resultat, motif, terminaison = '1/2-1/2', "règle des 50 coups", 'normal'
+                break
+            if materiel_insuffisant(jeu):
+                resultat, motif, terminaison = '1/2-1/2', "matériel insuffisant", 'normal'
+                break
+            if adjudication is not None:
+                if demi_coups >= adjudication.demi_coups_max:
+                    resultat, motif, terminaison = '1/2-1/2', "longueur maximale", 'adjudication'
+                    break
+                juge = adjudication.juger(scores, (len(coups_uci) + noirs_commencent) // 2 + numero_depart)
+                if juge is not None:
+                    resultat, motif, terminaison = juge, "arbitrage sur le score", 'adjudication'
+                    break
+            
+            try:
+                coup, score = moteurs[couleur].choisir(jeu, fen_depart, coups_uci, controle)
+            except (RuntimeError, OSError) as e:
+                resultat, motif, terminaison = perdu, f"moteur {couleur} en échec : {e}", 'abandoned'
+                break
+            erreur = jouer(coup) if coup is not None else "aucun coup proposé"
+            if erreur is not None:
+                resultat, motif, terminaison = perdu, f"{erreur} ({couleur})", 'rules infraction'
+                break
+            demi_coups += 1
+            scores.append(None if score is None else (score if couleur == 'blanc' else -score))
+            repetitions[hacher(jeu.plateau, jeu.joueur_actuel.couleur)] += 1
+            
+            if jeu.pendule is not None and jeu.pendule.couleur_tombee() == couleur:
+                resultat, motif, terminaison = perdu, f"temps dépassé ({couleur})", 'time forfeit'
+                break
+    finally:
+        for moteur in moteurs.values():
+            moteur.fermer()
+    
+    entetes = {
+        'Event': evenement,
+        'Site': 'SAE_echec',
+        'Date': time.strftime('%Y.%m.%d'),
+        'Round': str(numero),
+        'White': blancs.nom,
+        'Black': noirs.nom,
+        'TimeControl': controle.texte_pgn(),
+        'Termination': terminaison,
+        'PlyCount': str(len(coups_san)),
+    }
+    if fen_depart != FEN_INITIALE:
+        entetes['SetUp'] = '1'
+        entetes['FEN'] = fen_depart
+    pgn = ecrire_partie(entetes, coups_san, resultat, noirs_commencent, numero_depart, motif)
+    return ResultatPartie(numero, blancs.nom, noirs.nom, resultat, motif, demi_coups, pgn)
+
+
+def lire_ouvertures(chemin: str) -> List[Ouverture]:
+    """
+    Lit un fichier d'ouvertures : une position FEN ou une suite de coups UCI par ligne.
+    
+    Les lignes vides et celles qui commencent par '#' sont ignorées.
+    
+    Args:
+        chemin: Chemin du fichier
+        
+    Returns:
+        Liste des ouvertures
+        
+    Raises:
+        ValueError: Si le fichier ne contient aucune ouverture
+    """
+    ouvertures = []
+    with open(chemin, encoding='utf-8') as fichier:
+        for ligne in fichier:
+            ligne = ligne.strip()
+            if not ligne or ligne.startswith('#'):
+                continue
+            if '/' in ligne:
+                # Une EPD peut n'avoir que quatre champs : compléter les compteurs
+                champs = ligne.split(';')[0].split()
+                champs += ['0', '1'][len(champs) - 4:] if 4 <= len(champs) < 6 else []
+                ouvertures.append((' '.join(champs[:6]), []))
+            else:
+                ouvertures.append((FEN_INITIALE, ligne.split()))
+    if not ouvertures:
+        raise ValueError(f"Aucune ouverture dans {chemin}")
+    return ouvertures
+
+
+def ouvertures_aleatoires(nombre: int, demi_coups: int, graine: Optional[int] = None) -> List[Ouverture]:
+    """
+    Génère des ouvertures en jouant des coups légaux au hasard depuis la position initiale.
+    
+    Args:
+        nombre: Nombre d'ouvertures
+        demi_coups: Nombre de coups aléatoires par ouverture
+        graine: Graine du générateur (tirage reproductible)
+        
+    Returns:
+        Liste des ouvertures, sans doublon si possible
+    """
+    generateur = random.Random(graine)
+    ouvertures: List[Ouverture] = []
+    vues = set()
+    for _ in range(nombre * 10):
+        if len(ouvertures) == nombre:
+            break
+        jeu = Jeu()
+        coups = []
+        for _ in range(demi_coups):
+            legaux = jeu.obtenir_tous_mouvements_legaux(jeu.joueur_actuel.couleur)
+            if not legaux:
+                break
+            depart, arrivee = generateur.choice(legaux)
+            coups.append(coup_vers_uci(jeu.plateau, (depart, arrivee)))
+            jeu.jouer_coup(depart, arrivee)
+        if tuple(coups) not in vues:
+            vues.add(tuple(coups))
+            ouvertures.append((FEN_INITIALE, coups))
+    return ouvertures
+
+
+def elo_depuis_score(score: float) -> float:
+    """Convertit un score moyen (entre 0 et 1) en écart d'Elo."""
+    if score <= 0:
+        return -math.inf
+    if score >= 1:
+        return math.inf
+    return 400 * math.log10(score / (1 - score))
+
+
+def score_depuis_elo(elo: float) -> float:
+    """Convertit un écart d'Elo en score moyen attendu."""
+    return 1 / (1 + 10 ** (-elo / 400))
+
+
+class Score:
+    """
+    Bilan d'un moteur contre un autre.
+    
+    Attributs:
+        victoires (int): Parties gagnées
+        nulles (int): Parties nulles
+        defaites (int): Parties perdues
+    """
+    
+    def __init__(self):
+        """Initialise un bilan vide."""
+        self.victoires = 0
+        self.nulles = 0
+        self.defaites = 0
+    
+    @property
+    def parties(self) -> int:
+        """Nombre de parties jouées."""
+        return self.victoires + self.nulles + self.defaites
+    
+    @property
+    def points(self) -> float:
+        """Nombre de points marqués."""
+        return self.victoires + self.nulles / 2
+    
+    def ajouter(self, points: float):
+        """Enregistre une partie : 1 (victoire), 0.5 (nulle) ou 0 (défaite)."""
+        if points == 1:
+            self.victoires += 1
+        elif points == 0:
+            self.defaites += 1
+        else:
+            self.nulles += 1
+    
+    def variance(self) -> float:
+        """Variance du résultat d'une partie."""
+        if not self.parties:
+            return 0.0
+        moyenne = self.points / self.parties
+        return (self.victoires + self.nulles / 4) / self.parties - moyenne ** 2
+    
+    def elo(self) -> Tuple[float, float]:
+        """
+        Estime l'écart d'Elo et sa marge d'erreur à 95 %.
+        
+        Returns:
+            Tuple (écart d'Elo, demi-largeur de l'intervalle de confiance)
+        """
+        if not self.parties:
+            return 0.0, math.inf
+        moyenne = self.points / self.parties
+        ecart = 1.96 * math.sqrt(self.variance() / self.parties)
+        if moyenne - ecart <= 0 or moyenne + ecart >= 1:
+            return elo_depuis_score(moyenne), math.inf
+        return elo_depuis_score(moyenne), (elo_depuis_score(moyenne + ecart) -
+                                           elo_depuis_score(moyenne - ecart)) / 2
+
+
+class Sprt:
+    """
+    Test séquentiel du rapport de vraisemblance entre deux hypothèses d'écart d'Elo.
+    
+    H0 : l'écart vaut elo0 ; H1 : l'écart vaut elo1. Le rapport de
+    vraisemblance est calculé avec l'approximation normale du modèle
+    victoire/nulle/défaite.
+    
+    Attributs:
+        elo0 (float): Écart d'Elo sous H0
+        elo1 (float): Écart d'Elo sous H1
+        borne_inferieure (float): H0 est acceptée en dessous
+        borne_superieure (float): H1 est acceptée au-dessus
+    """
+    
+    def __init__(self, elo0: float = 0.0, elo1: float = 10.0, alpha: float = 0.05,
+                 beta: float = 0.05):
+        """
+        Initialise le test.
+        
+        Args:
+            elo0: Écart d'Elo sous H0
+            elo1: Écart d'Elo sous H1
+            alpha: Risque d'accepter H1 à tort
+            beta: Risque d'accepter H0 à tort
+        """
+        self.elo0 = elo0
+        self.elo1 = elo1
+        self.borne_inferieure = math.log(beta / (1 - alpha))
+        self.borne_superieure = math.log((1 - beta) / alpha)
+    
+    def llr(self, score: Score) -> float:
+        """Retourne le logarithme du rapport de vraisemblance pour un bilan."""
+        variance = score.variance()
+        if not score.parties or variance <= 0:
+            return 0.0
+        moyenne = score.points / score.parties
+        score0, score1 = score_depuis_elo(self.elo0), score_depuis_elo(self.elo1)
+        return (score1 - score0) * (2 * moyenne - score0 - score1) / (2 * variance / score.parties)
+    
+    def decision(self, score: Score) -> Optional[str]:
+        """
+        Retourne 'H1' ou 'H0' si l'une des hypothèses est acceptée, None sinon.
+        """
+        llr = self.llr(score)
+        if llr >= self.borne_superieure:
+            return 'H1'
+        if llr <= self.borne_inferieure:
+            return 'H0'
+        return None
+
+
+class Tournoi:
+    """
+    Match ou tournoi toutes rondes entre moteurs.
+    
+    Chaque ouverture est jouée par chaque paire de moteurs, une fois avec
+    chaque couleur. Avec deux moteurs et un SPRT, le match s'arrête dès que
+    le test conclut.
+    
+    Attributs:
+        moteurs (List[ConfigurationMoteur]): Les participants
+        scores (Dict[Tuple[str, str], Score]): Bilan de chaque paire (premier contre second)
+        resultats (List[ResultatPartie]): Parties terminées, dans l'ordre d'arrivée
+        decision (Optional[str]): Conclusion du SPRT ('H0', 'H1' ou None)
+    """
+    
+    def __init__(self, moteurs: List[ConfigurationMoteur], controle: Controle,
+                 ouvertures: List[Ouverture], parties_max: int = 100,
+                 concurrence: Optional[int] = None, fichier_pgn: Optional[str] = None,
+                 sprt: Optional[Sprt] = None, adjudication: Optional[Adjudication] = None,
+                 graine: Optional[int] = None, evenement: str = "Tournoi local",
+                 executeur: Optional[Executor] = None):
+        """
+        Prépare le tournoi.
+        
+        Args:
+            moteurs: Les participants (au moins deux, noms distincts)
+            controle: Limites de réflexion
+            ouvertures: Ouvertures tirées dans un ordre aléatoire
+            parties_max: Nombre maximal de parties
+            concurrence: Parties jouées en parallèle (nombre de processeurs par défaut)
+            fichier_pgn: Fichier où ajouter les parties au fur et à mesure (ou None)
+            sprt: Test d'arrêt anticipé (seulement pour un match à deux moteurs)
+            adjudication: Règles d'arbitrage
+            graine: Graine du tirage des ouvertures
+            evenement: Nom du tournoi dans le PGN
+            executeur: Exécuteur des parties (groupe de processus par défaut)
+            
+        Raises:
+            ValueError: Si les participants ne conviennent pas
+        """
+        noms = [moteur.nom for moteur in moteurs]
+        if len(moteurs) < 2 or len(set(noms)) != len(noms):
+            raise ValueError("Il faut au moins deux moteurs de noms distincts")
+        if sprt is not None and len(moteurs) != 2:
+            raise ValueError("Le SPRT ne s'applique qu'à un match entre deux moteurs")
+        self.moteurs = moteurs
+        self.controle = controle
+        self.ouvertures = list(ouvertures)
+        random.Random(graine).shuffle(self.ouvertures)
+        self.parties_max = parties_max
+        self.concurrence = concurrence or os.cpu_count() or 1
+        self.fichier_pgn = fichier_pgn
+        self.sprt = sprt
+        self.adjudication = adjudication
+        self.evenement = evenement
+        self.executeur = executeur
+        self.paires = list(itertools.combinations(moteurs, 2))
+        self.scores: Dict[Tuple[str, str], Score] = {(a.nom, b.nom): Score() for a, b in self.paires}
+        self.resultats: List[ResultatPartie] = []
+        self.decision: Optional[str] = None
+    
+    def _parties(self):
+        """Génère les parties à jouer : (numero, blancs, noirs, ouverture)."""
+        numero = 1
+        for ouverture in itertools.cycle(self.ouvertures):
+            for premier, second in self.paires:
+                for blancs, noirs in ((premier, second), (second, premier)):
+                    if numero > self.parties_max:
+                        return
+                    yield numero, blancs, noirs, ouverture
+                    numero += 1
+    
+    def enregistrer(self, resultat: ResultatPartie):
+        """
+        Prend en compte une partie terminée (bilans, PGN, SPRT).
+        
+        Args:
+            resultat: Le résultat de la partie
+        """
+        self.resultats.append(resultat)
+        points_blancs = {'1-0': 1.0, '0-1': 0.0}.get(resultat.resultat, 0.5)
+        if (resultat.blancs, resultat.noirs) in self.scores:
+            self.scores[(resultat.blancs, resultat.noirs)].ajouter(points_blancs)
+        else:
+            self.scores[(resultat.noirs, resultat.blancs)].ajouter(1 - points_blancs)
+        
+        if self.fichier_pgn is not None:
+            with open(self.fichier_pgn, 'a', encoding='utf-8') as fichier:
+                fichier.write(resultat.pgn)
+        
+        if self.sprt is not None:
+            self.decision = self.sprt.decision(next(iter(self.scores.values())))
+    
+    def lancer(self, afficher: Optional[Callable[[str], None]] = print) -> Dict[Tuple[str, str], Score]:
+        """
+        Joue le tournoi jusqu'à la dernière partie ou la conclusion du SPRT.
+        
+        Args:
+            afficher: Fonction recevant une ligne de progression par partie (ou None)
+            
+        Returns:
+            Le bilan de chaque paire
+        """
+        executeur = self.executeur or ProcessPoolExecutor(self.concurrence)
+        parties = self._parties()
+        en_cours = set()
+        try:
+            while True:
+                # Garder au plus 'concurrence' parties en cours pour pouvoir s'arrêter vite
+                while self.decision is None and len(en_cours) < self.concurrence:
+                    suivante = next(parties, None)
+                    if suivante is None:
+                        break
+                    numero, blancs, noirs, ouverture = suivante
+                    en_cours.add(executeur.submit(jouer_partie, numero, blancs, noirs, ouverture,
+                                                  self.controle, self.adjudication, self.evenement))
+                if not en_cours:
+                    break
+                terminees, en_cours = wait(en_cours, return_when=FIRST_COMPLETED)
+                for future in terminees:
+                    self.enregistrer(future.result())
+                    if afficher is not None:
+                        afficher(self.progression())
+        finally:
+            for future in en_cours:
+                future.cancel()
+            if self.executeur is None:
+                executeur.shutdown(wait=True, cancel_futures=True)
+        return self.scores
+    
+    def progression(self) -> str:
+        """Retourne la ligne de progression après la dernière partie terminée."""
+        dernier = self.resultats[-1]
+        ligne = (f"Partie {dernier.numero} : {dernier.blancs} - {dernier.noirs} "
+                 f"{dernier.resultat} ({dernier.motif})")
+        if self.sprt is not None:
+            score = next(iter(self.scores.values()))
+            elo, marge = score.elo()
+            ligne += (f" | +{score.victoires} ={score.nulles} -{score.defaites}"
+                      f" | Elo {elo:+.1f} ± {marge:.1f}"
+                      f" | LLR {self.sprt.llr(score):.2f}"
+                      f" [{self.sprt.borne_inferieure:.2f}, {self.sprt.borne_superieure:.2f}]")
+        return ligne
+    
+    def tableau(self) -> str:
+        """
+        Retourne le tableau récapitulatif du tournoi.
+        
+        Returns:
+            Une ligne par moteur (classé par points) puis une ligne par paire
+        """
+        totaux = {moteur.nom: Score() for moteur in self.moteurs}
+        for (premier, second), score in self.scores.items():
+            for nom, victoires, defaites in ((premier, score.victoires, score.defaites),
+                                             (second, score.defaites, score.victoires)):
+                totaux[nom].victoires += victoires
+                totaux[nom].defaites += defaites
+                totaux[nom].nulles += score.nulles
+        
+        lignes = [f"{'Moteur':<20} {'Points':>8} {'Parties':>8} {'+':>5} {'=':>5} {'-':>5} {'%':>6}"]
+        for nom, score in sorted(totaux.items(), key=lambda item: -item[1].points):
+            pourcentage = 100 * score.points / score.parties if score.parties else 0.0
+            lignes.append(f"{nom:<20} {score.points:>8.1f} {score.parties:>8} {score.victoires:>5} "
+                          f"{score.nulles:>5} {score.defaites:>5} {pourcentage:>5.1f}%")
+        lignes.append('')
+        for (premier, second), score in self.scores.items():
+            elo, marge = score.elo()
+            lignes.append(f"{premier} contre {second} : +{score.victoires} ={score.nulles} "
+                          f"-{score.defaites}, Elo {elo:+.1f} ± {marge:.1f}")
+        if self.sprt is not None:
+            conclusion = {'H1': f"H1 acceptée (écart ≥ {self.sprt.elo1:g} Elo)",
+                          'H0': f"H0 acceptée (écart ≤ {self.sprt.elo0:g} Elo)",
+                          None: "pas de conclusion"}[self.decision]
+            lignes.append(f"SPRT [{self.sprt.elo0:g}, {self.sprt.elo1:g}] : {conclusion}")
+        return '\n'.join(lignes)
+
+
+def main():
+    """Lance un tournoi depuis la ligne de commande."""
+    analyseur = argparse.ArgumentParser(
+        description="Match entre moteurs d'échecs",
+        epilog="Exemple : --moteur nouveau:profondeur=4 "
+               "--moteur 'base:commande=python3 ../base/main_uci.py' --cadence 10+0.1 --sprt 0,10")
+    analyseur.add_argument('--moteur', action='append', required=True, metavar='NOM:OPTIONS',
+                           help="Participant : nom[:cle=valeur,...] ; 'commande=...' pour un moteur UCI")
+    analyseur.add_argument('--cadence', metavar='SEC+INC',
+                           help="Temps par partie en secondes et incrément, ex. 10+0.1")
+    analyseur.add_argument('--profondeur', type=int, help="Profondeur fixe par coup")
+    analyseur.add_argument('--noeuds', type=int, help="Nombre de nœuds par coup")
+    analyseur.add_argument('--parties', type=int, default=100, help="Nombre maximal de parties")
+    analyseur.add_argument('--concurrence', type=int, default=None,
+                           help="Parties jouées en parallèle (nombre de processeurs par défaut)")
+    analyseur.add_argument('--ouvertures', metavar='FICHIER',
+                           help="Fichier de positions FEN ou de suites de coups UCI")
+    analyseur.add_argument('--demi-coups-aleatoires', type=int, default=4,
+                           help="Sans fichier d'ouvertures : coups tirés au hasard par ouverture")
+    analyseur.add_argument('--graine', type=int, default=None, help="Graine du tirage des ouvertures")
+    analyseur.add_argument('--pgn', default='tournoi.pgn', help="Fichier PGN des parties")
+    analyseur.add_argument('--sprt', metavar='ELO0,ELO1',
+                           help="Arrêt anticipé dès que l'écart d'Elo est établi, ex. 0,10")
+    analyseur.add_argument('--alpha', type=float, default=0.05, help="Risque de première espèce du SPRT")
+    analyseur.add_argument('--beta', type=float, default=0.05, help="Risque de seconde espèce du SPRT")
+    analyseur.add_argument('--sans-adjudication', action='store_true',
+                           help="N'arbitre pas les parties d'après les scores des moteurs")
+    arguments = analyseur.parse_args()
+    
+    try:
+        moteurs = [ConfigurationMoteur.depuis_texte(texte) for texte in arguments.moteur]
+        base, increment = None, 0.0
+        if arguments.cadence:
+            texte_base, _, texte_increment = arguments.cadence.partition('+')
+            base, increment = float(texte_base), float(texte_increment or 0)
+        controle = Controle(base, increment, arguments.profondeur, arguments.noeuds)
+        sprt = None
+        if arguments.sprt:
+            elo0, elo1 = (float(valeur) for valeur in arguments.sprt.split(','))
+            sprt = Sprt(elo0, elo1, arguments.alpha, arguments.beta)
+        if arguments.ouvertures:
+            ouvertures = lire_ouvertures(arguments.ouvertures)
+        else:
+            ouvertures = ouvertures_aleatoires(max(1, arguments.parties // 2),
+                                               arguments.demi_coups_aleatoires, arguments.graine)
+        tournoi = Tournoi(moteurs, controle, ouvertures, arguments.parties, arguments.concurrence,
+                          arguments.pgn, sprt, None if arguments.sans_adjudication else Adjudication(),
+                          arguments.graine)
+    except (ValueError, OSError) as e:
+        analyseur.error(str(e))
+    
+    debut = time.perf_counter()
+    tournoi.lancer()
+    print()
+    print(tournoi.tableau())
+    print(f"\n{len(tournoi.resultats)} parties en {time.perf_counter() - debut:.1f} s, "
+          f"écrites dans {arguments.pgn}")
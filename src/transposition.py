@@ -0,0 +1,110 @@
+"""
+Module contenant la table de transposition du moteur.
+La table mémorise le résultat des recherches déjà effectuées, indexé par la
+clé de Zobrist de la position, dans un tableau de taille fixe.
+"""
+
+from typing import Optional, Tuple
+
+
+# Types de bornes stockées avec le score
+EXACT = 0
+BORNE_INFERIEURE = 1
+BORNE_SUPERIEURE = 2
+
+# Estimation de la place occupée par une entrée (tuple Python et son contenu)
+OCTETS_PAR_ENTREE = 160
+
+
+class TableTransposition:
+    """
+    Table de transposition de taille fixe à remplacement par profondeur.
+    
+    Chaque case contient un tuple (cle, profondeur, score, borne, coup).
+    Deux positions de même indice se partagent la case : la recherche la
+    plus profonde est conservée, sauf si l'entrée vient d'une recherche
+    précédente.
+    
+    Attributs:
+        taille (int): Nombre de cases de la table
+        entrees (list): Les cases de la table
+        generation (int): Numéro de la recherche en cours
+    """
+    
+    def __init__(self, taille_mo: int = 16):
+        """
+        Initialise la table.
+        
+        Args:
+            taille_mo: Taille approximative de la table en mégaoctets
+        """
+        self.generation = 0
+        self.redimensionner(taille_mo)
+    
+    def redimensionner(self, taille_mo: int):
+        """
+        Change la taille de la table (son contenu est effacé).
+        
+        Args:
+            taille_mo: Taille approximative de la table en mégaoctets
+        """
+        self.taille = max(1, taille_mo * 1024 * 1024 // OCTETS_PAR_ENTREE)
+        self.entrees = [None] * self.taille
+        self._generations = bytearray(self.taille)
+    
+    def vider(self):
+        """Efface toutes les entrées."""
+        self.entrees = [None] * self.taille
+        self._generations = bytearray(self.taille)
+    
+    def nouvelle_recherche(self):
+        """Signale le début d'une nouvelle recherche (vieillit les entrées)."""
+        self.generation = (self.generation + 1) % 256
+    
+    def sonder(self, cle: int) -> Optional[Tuple]:
+        """
+        Cherche une position dans la table.
+        
+        Args:
+            cle: Clé de Zobrist de la position
+            
+        Returns:
+            Tuple (cle, profondeur, score, borne, coup) ou None
+        """
+        entree = self.entrees[cle % self.taille]
+        if entree is not None and entree[0] == cle:
+            return entree
+        return None
+    
+    def stocker(self, cle: int, profondeur: int, score: int, borne: int, coup):
+        """
+        Enregistre le résultat d'une recherche.
+        
+        Args:
+            cle: Clé de Zobrist de la position
+            profondeur: Profondeur de la recherche
+            score: Score trouvé
+            borne: EXACT, BORNE_INFERIEURE ou BORNE_SUPERIEURE
+            coup: Meilleur coup trouvé (ou None)
+        """
+        indice = cle % self.taille
+        ancienne = self.entrees[indice]
+        if ancienne is not None and ancienne[0] != cle and \
+           ancienne[1] > profondeur and self._generations[indice] == self.generation:
+            return
+        if ancienne is not None and ancienne[0] == cle and coup is None:
+            # Conserver le meilleur coup connu de cette position
+            coup = ancienne[4]
+        self.entrees[indice] = (cle, profondeur, score, borne, coup)
+        self._generations[indice] = self.generation
+    
+    def taux_remplissage(self) -> int:
+        """
+        Estime le remplissage de la table, en pour mille (« hashfull » UCI).
+        
+        Returns:
+            Nombre de cases occupées pour mille, sur un échantillon
+        """
+        echantillon = min(self.taille, 1000)
+        occupees = sum(1 for entree in self.entrees[:echantillon] if entree is not None)
+        return occupees * 1000 // echantillon
@@ -0,0 +1,412 @@
+"""
+Module contenant le protocole UCI (Universal Chess Interface).
+Il permet d'utiliser le moteur depuis une interface graphique ou un
+gestionnaire de tournois, en échangeant des commandes texte sur
+l'entrée et la sortie standard.
+"""
+
+import sys
+import threading
+import time
+from typing import List, Optional, TextIO, Tuple
+from src.plateau import Plateau
+from src.moteur import Moteur, Coup, couleur_adverse
+from src.fen import FEN_INITIALE, plateau_depuis_fen
+from src.notation import coup_vers_uci, uci_vers_coup
+from src.gestion_temps import GestionTemps
+
+
+NOM_MOTEUR = "SAE_echec"
+AUTEUR = "Équipe SAE"
+
+MULTIPV_MAX = 32
+# Options UCI de la recherche sélective et attributs correspondants du moteur
+OPTIONS_SELECTIVES = {
+    'NullMove': 'coup_nul',
+    'LateMoveReductions': 'reductions',
+    'PVS': 'pvs',
+    'CheckExtensions': 'extensions_echec',
+    'AspirationWindows': 'fenetres_aspiration',
+}
+OPTIONS_SELECTIVES_MINUSCULES = {option.lower(): attribut for option, attribut in OPTIONS_SELECTIVES.items()}
+
+
+class ProtocoleUCI:
+    """
+    Interprète des commandes UCI et pilote le moteur.
+    
+    La recherche tourne dans un fil d'exécution séparé, ce qui permet de
+    traiter 'stop', 'isready' ou 'quit' pendant que le moteur réfléchit.
+    
+    Attributs:
+        moteur (Moteur): Le moteur de recherche
+        plateau (Plateau): La position courante
+        couleur (str): Couleur du camp au trait
+        fils (int): Valeur de l'option Threads (la recherche reste sur un seul fil)
+        demi_coups (int): Demi-coups joués depuis la position donnée par 'position'
+        multipv (int): Valeur de l'option MultiPV (nombre de lignes analysées)
+    """
+    
+    def __init__(self, sortie: Optional[TextIO] = None, moteur: Optional[Moteur] = None):
+        """
+        Initialise le protocole.
+        
+        Args:
+            sortie: Flux de sortie des réponses (sortie standard par défaut)
+            moteur: Le moteur à utiliser (un nouveau moteur par défaut)
+        """
+        self.sortie = sortie if sortie is not None else sys.stdout
+        self.moteur = moteur if moteur is not None else Moteur()
+        self.plateau, self.couleur = plateau_depuis_fen(FEN_INITIALE)
+        self.demi_coups = 0
+        self.fils = 1
+        self.multipv = 1
+        self._fil_recherche: Optional[threading.Thread] = None
+        self._attente_stop = threading.Event()
+        self._attente_infinie = False
+        self._verrou_sortie = threading.Lock()
+        # Limites d'un 'go ponder', appliquées à 'ponderhit' : temps_max, gestion_temps
+        # et True si la recherche est bornée (en temps, en profondeur ou en nœuds)
+        self._limites_ponderation: Optional[Tuple[Optional[float], Optional[GestionTemps], bool]] = None
+        # Échéance et gestion du temps fixées par 'ponderhit' à la recherche en cours
+        self._echeance_ponderhit: Optional[float] = None
+        self._gestion_ponderhit: Optional[GestionTemps] = None
+    
+    def envoyer(self, message: str):
+        """
+        Écrit une ligne de réponse et vide le tampon immédiatement.
+        
+        Args:
+            message: La ligne à envoyer
+        """
+        with self._verrou_sortie:
+            self.sortie.write(message + "\n")
+            self.sortie.flush()
+    
+    def boucle(self, entree: Optional[TextIO] = None):
+        """
+        Lit et traite les commandes jusqu'à 'quit' ou la fin de l'entrée.
+        
+        Args:
+            entree: Flux d'entrée des commandes (entrée standard par défaut)
+        """
+        entree = entree if entree is not None else sys.stdin
+        for ligne in entree:
+            if not self.traiter(ligne):
+                return
+        
+        # Fin de l'entrée : laisser une recherche limitée se terminer normalement
+        if not self._attente_infinie:
+            self.attendre()
+        self._arreter_recherche()
+    
+    def traiter(self, ligne: str) -> bool:
+        """
+        Traite une commande UCI.
+        
+        Args:
+            ligne: La commande reçue
+            
+        Returns:
+            False si la commande demande de quitter, True sinon
+        """
+        mots = ligne.split()
+        if not mots:
+            return True
+        
+        commande, arguments = mots[0], mots[1:]
+        
+        if commande == 'uci':
+            self.envoyer(f"id name {NOM_MOTEUR}")
+            self.envoyer(f"id author {AUTEUR}")
+            self.envoyer("option name Hash type spin default 16 min 1 max 1024")
+            self.envoyer("option name Threads type spin default 1 min 1 max 64")
+            self.envoyer(f"option name MultiPV type spin default 1 min 1 max {MULTIPV_MAX}")
+            self.envoyer("option name PawnStructure type check default false")
+            for option, attribut in OPTIONS_SELECTIVES.items():
+                defaut = 'true' if getattr(self.moteur, attribut) else 'false'
+                self.envoyer(f"option name {option} type check default {defaut}")
+            self.envoyer("uciok")
+        elif commande == 'isready':
+            self.envoyer("readyok")
+        elif commande == 'ucinewgame':
+            self._arreter_recherche()
+            self.moteur.table.vider()
+        elif commande == 'setoption':
+            self._commande_setoption(arguments)
+        elif commande == 'position':
+            self._arreter_recherche()
+            self._commande_position(arguments)
+        elif commande == 'go':
+            self._arreter_recherche()
+            self._commande_go(arguments)
+        elif commande == 'ponderhit':
+            self._commande_ponderhit()
+        elif commande == 'stop':
+            self._arreter_recherche()
+        elif commande == 'quit':
+            self._arreter_recherche()
+            return False
+        else:
+            self.envoyer(f"info string commande inconnue: {commande}")
+        
+        return True
+    
+    def attendre(self):
+        """Attend la fin de la recherche en cours (sans l'interrompre)."""
+        if self._fil_recherche is not None:
+            self._fil_recherche.join()
+    
+    def _arreter_recherche(self):
+        """Interrompt la recherche en cours et attend son 'bestmove'."""
+        if self._fil_recherche is None:
+            return
+        self._attente_stop.set()
+        # Répéter la demande : le fil peut ne pas avoir encore démarré sa recherche
+        while self._fil_recherche.is_alive():
+            self.moteur.arreter()
+            self._fil_recherche.join(0.01)
+        self._fil_recherche = None
+        self._limites_ponderation = None
+    
+    def _commande_setoption(self, arguments: List[str]):
+        """
+        Traite 'setoption name <nom> value <valeur>'.
+        
+        Args:
+            arguments: Les mots qui suivent 'setoption'
+        """
+        if 'name' not in arguments or 'value' not in arguments:
+            return
+        indice_valeur = arguments.index('value')
+        nom = ' '.join(arguments[arguments.index('name') + 1:indice_valeur]).lower()
+        valeur = ' '.join(arguments[indice_valeur + 1:])
+        
+        try:
+            if nom == 'hash':
+                self._arreter_recherche()
+                self.moteur.table.redimensionner(max(1, int(valeur)))
+            elif nom == 'threads':
+                self.fils = max(1, int(valeur))
+            elif nom == 'multipv':
+                self.multipv = min(MULTIPV_MAX, max(1, int(valeur)))
+            elif nom == 'pawnstructure':
+                self.moteur.structure_pions = valeur.lower() == 'true'
+            elif nom in OPTIONS_SELECTIVES_MINUSCULES:
+                setattr(self.moteur, OPTIONS_SELECTIVES_MINUSCULES[nom], valeur.lower() == 'true')
+            else:
+                self.envoyer(f"info string option inconnue: {nom}")
+        except ValueError:
+            self.envoyer(f"info string valeur invalide pour {nom}: {valeur}")
+    
+    def _commande_position(self, arguments: List[str]):
+        """
+        Traite 'position startpos|fen <fen> [moves <coups>...]'.
+        
+        Args:
+            arguments: Les mots qui suivent 'position'
+        """
+        if 'moves' in arguments:
+            indice_coups = arguments.index('moves')
+            description, coups = arguments[:indice_coups], arguments[indice_coups + 1:]
+        else:
+            description, coups = arguments, []
+        
+        try:
+            if description and description[0] == 'fen':
+                plateau, couleur = plateau_depuis_fen(' '.join(description[1:]))
+            else:
+                plateau, couleur = plateau_depuis_fen(FEN_INITIALE)
+            
+            for texte in coups:
+                depart, arrivee, promotion = uci_vers_coup(texte)
+                if plateau.obtenir_piece(depart) is None:
+                    raise ValueError(f"Coup impossible: {texte}")
+                plateau.jouer_coup(depart, arrivee, promotion)
+                couleur = couleur_adverse(couleur)
+        except ValueError as e:
+            self.envoyer(f"info string {e}")
+            return
+        
+        self.plateau, self.couleur = plateau, couleur
+        self.demi_coups = len(coups)
+    
+    def _commande_go(self, arguments: List[str]):
+        """
+        Traite 'go' et lance la recherche dans un fil séparé.
+        
+        Args:
+            arguments: Les mots qui suivent 'go'
+        """
+        parametres = {}
+        infini = ponder = False
+        i = 0
+        while i < len(arguments):
+            mot = arguments[i]
+            if mot in ('infinite', 'ponder'):
+                infini = True
+                ponder = ponder or mot == 'ponder'
+                i += 1
+            elif i + 1 < len(arguments):
+                try:
+                    parametres[mot] = int(arguments[i + 1])
+                except ValueError:
+                    pass
+                i += 2
+            else:
+                i += 1
+        
+        temps_max = None
+        gestion_temps = None
+        if 'movetime' in parametres:
+            temps_max = parametres['movetime'] / 1000
+        else:
+            restant = parametres.get('wtime' if self.couleur == 'blanc' else 'btime')
+            increment = parametres.get('winc' if self.couleur == 'blanc' else 'binc', 0)
+            if restant is not None and (ponder or not infini):
+                gestion_temps = GestionTemps(restant / 1000, increment / 1000,
+                                             self.demi_coups // 2 + 1, parametres.get('movestogo'))
+        
+        # En réflexion sur le temps adverse, la pendule ne s'applique qu'à partir de 'ponderhit'
+        bornee = temps_max is not None or gestion_temps is not None or \
+            'depth' in parametres or 'nodes' in parametres
+        self._limites_ponderation = (temps_max, gestion_temps, bornee) if ponder else None
+        self._echeance_ponderhit = self._gestion_ponderhit = None
+        self._attente_stop.clear()
+        self._attente_infinie = infini
+        self._fil_recherche = threading.Thread(
+            target=self._rechercher,
+            args=(self.plateau.copier(), self.couleur, parametres.get('depth'),
+                  None if infini else temps_max, parametres.get('nodes'), infini,
+                  None if infini else gestion_temps),
+            daemon=True)
+        self._fil_recherche.start()
+    
+    def _commande_ponderhit(self):
+        """
+        Traite 'ponderhit' : le coup attendu a été joué, la réflexion en cours
+        devient une recherche normale, limitée par les paramètres de temps du
+        'go ponder' (la pendule partant de maintenant). Sans aucune limite,
+        la recherche reste infinie et attend 'stop'.
+        """
+        if self._fil_recherche is None or self._limites_ponderation is None:
+            return
+        temps_max, gestion_temps, bornee = self._limites_ponderation
+        self._limites_ponderation = None
+        if gestion_temps is not None:
+            gestion_temps.demarrer()
+            if temps_max is None or gestion_temps.limite_dure < temps_max:
+                temps_max = gestion_temps.limite_dure
+        self._gestion_ponderhit = gestion_temps
+        if temps_max is not None:
+            self._echeance_ponderhit = time.perf_counter() + temps_max
+            self.moteur.fixer_echeance(temps_max)
+        if bornee:
+            # 'bestmove' est envoyé dès la fin de la recherche, sans attendre 'stop'
+            self._attente_infinie = False
+            self._attente_stop.set()
+    
+    def _suivre_ponderhit(self, coup: Optional[Coup], score: int):
+        """
+        Applique, après chaque itération, les limites fixées par 'ponderhit'.
+        
+        L'échéance est réappliquée car le moteur l'efface au début de sa
+        recherche si 'ponderhit' arrive avant ; la gestion du temps décide
+        ensuite si une nouvelle itération peut commencer.
+        """
+        if self._echeance_ponderhit is not None:
+            self.moteur.fixer_echeance(self._echeance_ponderhit - time.perf_counter())
+        gestion_temps = self._gestion_ponderhit
+        if gestion_temps is not None and not gestion_temps.continuer(coup, score):
+            self.moteur.arreter()
+    
+    def _rechercher(self, plateau: Plateau, couleur: str, profondeur: Optional[int],
+                    temps_max: Optional[float], noeuds_max: Optional[int], infini: bool,
+                    gestion_temps: Optional[GestionTemps] = None):
+        """
+        Corps du fil de recherche : cherche puis envoie 'bestmove'.
+        
+        Args:
+            plateau: Copie de la position à analyser
+            couleur: Couleur du camp au trait
+            profondeur: Profondeur maximale (ou None)
+            temps_max: Temps maximal en secondes (ou None)
+            noeuds_max: Nombre maximal de nœuds (ou None)
+            infini: Si True, 'bestmove' n'est envoyé qu'après 'stop' (ou 'ponderhit')
+            gestion_temps: Gestion du temps sous une cadence (ou None)
+        """
+        def rapport(profondeur_atteinte, score, noeuds, secondes, variante):
+            self._envoyer_info(plateau, couleur, profondeur_atteinte, score, noeuds,
+                               secondes, variante)
+            self._suivre_ponderhit(variante[0] if variante else None, score)
+        
+        def rapport_lignes(profondeur_atteinte, lignes, noeuds, secondes):
+            for numero, (_, score, variante) in enumerate(lignes, 1):
+                self._envoyer_info(plateau, couleur, profondeur_atteinte, score, noeuds,
+                                   secondes, variante, numero)
+            if lignes:
+                self._suivre_ponderhit(lignes[0][0], lignes[0][1])
+        
+        if self.multipv > 1:
+            lignes = self.moteur.chercher_multipv(plateau, couleur, self.multipv, profondeur,
+                                                  temps_max, noeuds_max, rapport_lignes,
+                                                  gestion_temps)
+            coup = lignes[0][0] if lignes else None
+        else:
+            coup, _ = self.moteur.chercher_iteratif(plateau, couleur, profondeur, temps_max,
+                                                    noeuds_max, rapport, gestion_temps)
+        
+        facteur = self.moteur.facteur_branchement()
+        if facteur is not None:
+            self.envoyer(f"info string facteur de branchement effectif : {facteur:.2f}")
+        if self.moteur.structure_pions:
+            table_pions = self.moteur.table_pions
+            self.envoyer(f"info string table des pions : {table_pions.taux_succes():.1f} % de succès "
+                         f"sur {table_pions.sondages} sondages")
+        
+        if infini:
+            # En mode infini, le protocole impose d'attendre 'stop' avant de répondre
+            self._attente_stop.wait()
+        
+        if coup is None:
+            self.envoyer("bestmove 0000")
+        else:
+            self.envoyer(f"bestmove {coup_vers_uci(plateau, coup)}")
+    
+    def _envoyer_info(self, plateau: Plateau, couleur: str, profondeur: int, score: int,
+                      noeuds: int, secondes: float, variante: List[Coup],
+                      multipv: Optional[int] = None):
+        """Envoie la ligne 'info' d'une itération terminée (d'une de ses lignes en MultiPV)."""
+        if abs(score) >= Moteur.SEUIL_MAT:
+            demi_coups = Moteur.SCORE_MAT - abs(score)
+            coups_avant_mat = (demi_coups + 1) // 2
+            texte_score = f"mate {coups_avant_mat if score > 0 else -coups_avant_mat}"
+        else:
+            texte_score = f"cp {score}"
+        
+        textes_variante = []
+        coups_joues = []
+        for coup in variante:
+            textes_variante.append(coup_vers_uci(plateau, coup))
+            coups_joues.append(plateau.jouer_coup(*coup))
+        for coup_joue in reversed(coups_joues):
+            plateau.annuler_coup(coup_joue)
+        
+        millisecondes = int(secondes * 1000)
+        noeuds_par_seconde = int(noeuds / secondes) if secondes > 0 else 0
+        numero = f" multipv {multipv}" if multipv is not None else ""
+        self.envoyer(f"info depth {profondeur}{numero} score {texte_score} nodes {noeuds} "
+                     f"nps {noeuds_par_seconde} time {millisecondes} "
+                     f"hashfull {self.moteur.table.taux_remplissage()} "
+                     f"pv {' '.join(textes_variante)}".rstrip())
+
+
+def main():
+    """Lance le moteur en mode UCI sur l'entrée et la sortie standard."""
+    import argparse
+    from src.profilage import ajouter_option_profil, profil_optionnel
+    analyseur = argparse.ArgumentParser(description="Moteur d'échecs en mode UCI")
+    ajouter_option_profil(analyseur)
+    arguments = analyseur.parse_args()
+    with profil_optionnel(arguments.profile):
+        ProtocoleUCI().boucle()
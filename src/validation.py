@@ -0,0 +1,317 @@
+"""
+Module contenant la validation de coups par micro-lots.
+Les requêtes (position encodée, coup UCI) arrivent une à une dans une file ;
+un fil de regroupement forme des lots d'au plus 'taille_lot' requêtes, ou
+moins si la plus ancienne attend depuis 'delai' secondes, et les confie à un
+groupe de processus. Dans un lot, chaque position distincte n'est décodée
+qu'une fois (voir encodage.decoder_position) et chaque couple (position,
+coup) n'est validé qu'une fois, par Jeu.verifier_coup. Chaque requête reçoit
+son propre Future : les résultats sont rendus dans l'ordre des requêtes.
+Le service mesure le débit et la latence de chaque requête (médiane et
+99e centile).
+"""
+
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+from src.jeu import Jeu
+from src.encodage import decoder_position
+from src.piece import Pion
+from src.notation import uci_vers_coup
+
+# Position encodée (encodage.encoder_position) et coup en notation UCI
+Requete = Tuple[bytes, str]
+
+TAILLE_LOT = 256
+DELAI = 0.002
+# Nombre de latences conservées pour le calcul des centiles
+HISTORIQUE_LATENCES = 100000
+
+
+def valider_lot(requetes: List[Requete]) -> List[Optional[str]]:
+    """
+    Valide un lot de requêtes (exécuté dans un processus du groupe).
+    
+    Args:
+        requetes: Couples (position encodée, coup UCI)
+        
+    Returns:
+        Pour chaque requête, dans l'ordre, None si le coup est légal, sinon
+        le message d'erreur
+    """
+    jeux: Dict[bytes, Union[Jeu, str]] = {}
+    resultats: Dict[Requete, Optional[str]] = {}
+    reponses = []
+    for requete in requetes:
+        if requete not in resultats:
+            resultats[requete] = _valider(jeux, *requete)
+        reponses.append(resultats[requete])
+    return reponses
+
+
+def _valider(jeux: Dict[bytes, Union[Jeu, str]], encodage: bytes, texte: str) -> Optional[str]:
+    """
+    Valide un coup, en décodant la position au premier coup demandé dans celle-ci.
+    
+    Args:
+        jeux: Parties déjà décodées dans le lot, par encodage (ou message d'erreur)
+        encodage: La position encodée
+        texte: Le coup en notation UCI
+        
+    Returns:
+        None si le coup est légal, sinon le message d'erreur
+    """
+    jeu = jeux.get(encodage)
+    if jeu is None:
+        try:
+            plateau, couleur = decoder_position(encodage)
+        except (ValueError, TypeError) as erreur:
+            jeu = str(erreur)
+        else:
+            jeu = Jeu()
+            jeu.plateau = plateau
+            jeu.joueur_actuel = jeu.joueur_blanc if couleur == 'blanc' else jeu.joueur_noir
+        jeux[encodage] = jeu
+    if isinstance(jeu, str):
+        return jeu
+    
+    if not isinstance(texte, str):
+        return f"Coup UCI invalide: {texte!r}"
+    try:
+        depart, arrivee, promotion = uci_vers_coup(texte)
+    except ValueError as erreur:
+        return str(erreur)
+    erreur = jeu.verifier_coup(depart, arrivee)
+    if erreur is None and promotion is not None:
+        piece = jeu.plateau.grille[depart[0]][depart[1]]
+        if not isinstance(piece, Pion) or arrivee[0] not in (0, 7):
+            return "Ce coup n'est pas une promotion."
+    return erreur
+
+
+class ValidateurCoups:
+    """
+    Service de validation de coups par micro-lots.
+    
+    S'utilise comme gestionnaire de contexte :
+        with ValidateurCoups(processus=4) as validateur:
+            resultats = validateur.valider(requetes)
+            print(validateur.statistiques())
+    
+    Attributs:
+        taille_lot (int): Nombre maximal de requêtes par lot
+        delai (float): Attente maximale (secondes) avant d'envoyer un lot incomplet
+        executeur (Executor): Exécuteur des lots (groupe de processus par défaut)
+        lots (int): Nombre de lots traités
+    """
+    
+    def __init__(self, taille_lot: int = TAILLE_LOT, delai: float = DELAI,
+                 processus: Optional[int] = None, executeur: Optional[Executor] = None):
+        """
+        Démarre le service.
+        
+        Args:
+            taille_lot: Nombre maximal de requêtes par lot
+            delai: Attente maximale (secondes) avant d'envoyer un lot incomplet
+            processus: Nombre de processus du groupe (nombre de cœurs si None)
+            executeur: Exécuteur à utiliser à la place d'un groupe de processus
+            
+        Raises:
+            ValueError: Si la taille des lots n'est pas strictement positive
+        """
+        if taille_lot < 1:
+            raise ValueError(f"Taille de lot invalide: {taille_lot}")
+        self.taille_lot = taille_lot
+        self.delai = delai
+        self._executeur_propre = executeur is None
+        self.executeur = executeur or ProcessPoolExecutor(processus)
+        self.lots = 0
+        
+        self._file: 'queue.Queue[Optional[Tuple[bytes, str, Future, float]]]' = queue.Queue()
+        self._verrou = threading.Lock()
+        self._latences: deque = deque(maxlen=HISTORIQUE_LATENCES)
+        self._requetes = 0
+        self._premiere: Optional[float] = None
+        self._derniere: Optional[float] = None
+        self._fil = threading.Thread(target=self._regrouper, daemon=True)
+        self._fil.start()
+    
+    def __enter__(self) -> 'ValidateurCoups':
+        """Retourne le service au début d'un bloc with."""
+        return self
+    
+    def __exit__(self, *exception):
+        """Arrête le service."""
+        self.fermer()
+    
+    def soumettre(self, encodage: bytes, coup: str) -> Future:
+        """
+        Ajoute une requête à la file.
+        
+        Args:
+            encodage: La position encodée (encodage.encoder_position)
+            coup: Le coup en notation UCI
+            
+        Une requête dont la position n'est pas une suite d'octets ou le coup
+        pas un texte est refusée aussitôt, sans entrer dans un lot.
+        
+        Returns:
+            Future dont le résultat est None si le coup est légal, sinon le message d'erreur
+        """
+        future: Future = Future()
+        if not isinstance(encodage, bytes):
+            future.set_result(f"Position encodée invalide: {encodage!r}")
+            return future
+        if not isinstance(coup, str):
+            future.set_result(f"Coup UCI invalide: {coup!r}")
+            return future
+        instant = time.perf_counter()
+        with self._verrou:
+            if self._premiere is None:
+                self._premiere = instant
+        self._file.put((encodage, coup, future, instant))
+        return future
+    
+    def valider(self, requetes: Iterable[Requete]) -> List[Optional[str]]:
+        """
+        Soumet des requêtes et attend leurs résultats.
+        
+        Args:
+            requetes: Couples (position encodée, coup UCI)
+            
+        Returns:
+            Les résultats, dans l'ordre des requêtes
+        """
+        futures = [self.soumettre(encodage, coup) for encodage, coup in requetes]
+        return [future.result() for future in futures]
+    
+    def statistiques(self) -> Dict[str, float]:
+        """
+        Retourne le débit et la latence des requêtes traitées.
+        
+        Returns:
+            Dictionnaire : requetes, lots, debit (requêtes par seconde entre la
+            première soumission et le dernier résultat), latence_p50 et
+            latence_p99 (millisecondes, sur les HISTORIQUE_LATENCES dernières requêtes)
+        """
+        with self._verrou:
+            latences = sorted(self._latences)
+            requetes, lots = self._requetes, self.lots
+            duree = (self._derniere - self._premiere) if self._derniere is not None else 0.0
+        
+        def centile(rang: float) -> float:
+            if not latences:
+                return 0.0
+            return 1000 * latences[min(len(latences) - 1, int(rang * len(latences)))]
+        
+        return {'requetes': requetes, 'lots': lots,
+                'debit': requetes / duree if duree > 0 else 0.0,
+                'latence_p50': centile(0.50), 'latence_p99': centile(0.99)}
+    
+    def reinitialiser_statistiques(self):
+        """Remet à zéro les mesures (par exemple après une phase de chauffe)."""
+        with self._verrou:
+            self._latences.clear()
+            self._requetes = self.lots = 0
+            self._premiere = self._derniere = None
+    
+    def fermer(self):
+        """Traite les requêtes en attente puis arrête le service."""
+        self._file.put(None)
+        self._fil.join()
+        if self._executeur_propre:
+            self.executeur.shutdown(wait=True)
+    
+    def _regrouper(self):
+        """Corps du fil de regroupement : forme les lots et les confie à l'exécuteur."""
+        actif = True
+        while actif:
+            element = self._file.get()
+            if element is None:
+                break
+            lot = [element]
+            echeance = element[3] + self.delai
+            while len(lot) < self.taille_lot:
+                try:
+                    element = self._file.get(timeout=max(0.0, echeance - time.perf_counter()))
+                except queue.Empty:
+                    break
+                if element is None:
+                    actif = False
+                    break
+                lot.append(element)
+            
+            try:
+                resultat = self.executeur.submit(valider_lot,
+                                                 [(encodage, coup) for encodage, coup, _, _ in lot])
+            except RuntimeError as erreur:
+                for _, _, future, _ in lot:
+                    future.set_exception(erreur)
+                continue
+            resultat.add_done_callback(lambda resultat, lot=lot: self._terminer(lot, resultat))
+    
+    def _terminer(self, lot: List[Tuple[bytes, str, Future, float]], resultat: Future):
+        """Transmet les résultats d'un lot à chaque requête et enregistre les latences."""
+        try:
+            reponses = resultat.result()
+        except Exception as erreur:
+            for _, _, future, _ in lot:
+                future.set_exception(erreur)
+            return
+        
+        fin = time.perf_counter()
+        with self._verrou:
+            self._latences.extend(fin - instant for _, _, _, instant in lot)
+            self._requetes += len(lot)
+            self.lots += 1
+            self._derniere = fin
+        for (_, _, future, _), reponse in zip(lot, reponses):
+            future.set_result(reponse)
+
+
+def main():
+    """Mesure le débit et la latence du service sur des rafales de requêtes aléatoires."""
+    import argparse
+    import random
+    from src.encodage import encoder_position
+    from src.notation import coup_vers_uci, case_vers_notation
+    analyseur = argparse.ArgumentParser(description="Banc d'essai de la validation par micro-lots")
+    analyseur.add_argument('--requetes', type=int, default=20000, help="Nombre de requêtes")
+    analyseur.add_argument('--positions', type=int, default=200, help="Nombre de positions distinctes")
+    analyseur.add_argument('--rafale', type=int, default=1000, help="Requêtes envoyées d'un coup")
+    analyseur.add_argument('--processus', type=int, default=None,
+                           help="Nombre de processus (nombre de cœurs par défaut)")
+    analyseur.add_argument('--taille-lot', type=int, default=TAILLE_LOT, help="Requêtes par lot")
+    analyseur.add_argument('--delai', type=float, default=DELAI * 1000,
+                           help="Attente maximale d'un lot incomplet (ms)")
+    arguments = analyseur.parse_args()
+    
+    # Positions de parties aléatoires ; un coup sur deux est légal
+    generateur = random.Random(1)
+    candidates: List[Requete] = []
+    jeu = Jeu()
+    while len(candidates) < 2 * arguments.positions:
+        couleur = jeu.joueur_actuel.couleur
+        legaux = jeu.obtenir_tous_mouvements_legaux(couleur)
+        if not legaux or len(jeu.historique) > 80:
+            jeu = Jeu()
+            continue
+        encodage = encoder_position(jeu.plateau, couleur)
+        candidates.append((encodage, coup_vers_uci(jeu.plateau, generateur.choice(legaux))))
+        cases = [case_vers_notation((generateur.randrange(8), generateur.randrange(8))) for _ in range(2)]
+        candidates.append((encodage, ''.join(cases)))
+        jeu.jouer_coup(*generateur.choice(legaux))
+    requetes = [generateur.choice(candidates) for _ in range(arguments.requetes)]
+    
+    with ValidateurCoups(arguments.taille_lot, arguments.delai / 1000, arguments.processus) as validateur:
+        validateur.valider(requetes[:arguments.rafale])
+        validateur.reinitialiser_statistiques()
+        for debut in range(0, len(requetes), arguments.rafale):
+            validateur.valider(requetes[debut:debut + arguments.rafale])
+        statistiques = validateur.statistiques()
+    print(f"{statistiques['requetes']} requêtes en {statistiques['lots']} lots : "
+          f"{statistiques['debit']:.0f} requêtes/s, latence médiane {statistiques['latence_p50']:.1f} ms, "
+          f"99e centile {statistiques['latence_p99']:.1f} ms")
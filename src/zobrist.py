@@ -0,0 +1,80 @@
+"""
+Module contenant le hachage de Zobrist des positions.
+Chaque position reçoit une clé de 64 bits, identique pour deux positions
+ayant les mêmes pièces, le même trait, les mêmes droits de roque et la
+même case de prise en passant.
+"""
+
+import random
+from typing import Dict, List, Tuple
+from src.plateau import Plateau
+from src.piece import Pion, Tour, Cavalier, Fou, Reine, Roi
+
+
+TYPES_PIECES = (Pion, Cavalier, Fou, Tour, Reine, Roi)
+
+# Générateur à graine fixe : les clés sont identiques d'une exécution à l'autre
+_generateur = random.Random(20240611)
+
+CLES_PIECES: Dict[Tuple[type, str], List[int]] = {
+    (type_piece, couleur): [_generateur.getrandbits(64) for _ in range(64)]
+    for type_piece in TYPES_PIECES
+    for couleur in ('blanc', 'noir')
+}
+CLE_TRAIT_NOIR = _generateur.getrandbits(64)
+# Ordre des droits de roque : petit blanc, grand blanc, petit noir, grand noir
+CLES_ROQUE = [_generateur.getrandbits(64) for _ in range(4)]
+CLES_EN_PASSANT = [_generateur.getrandbits(64) for _ in range(8)]
+
+
+def droits_roque(plateau: Plateau) -> Tuple[bool, bool, bool, bool]:
+    """
+    Déduit les droits de roque de l'état a_bouge des rois et des tours.
+    
+    Args:
+        plateau: Le plateau de jeu
+        
+    Returns:
+        Tuple (petit blanc, grand blanc, petit noir, grand noir)
+    """
+    droits = []
+    for couleur, ligne in (('blanc', 7), ('noir', 0)):
+        roi = plateau.grille[ligne][4]
+        roi_intact = isinstance(roi, Roi) and roi.couleur == couleur and not roi.a_bouge
+        for colonne in (7, 0):
+            tour = plateau.grille[ligne][colonne]
+            droits.append(roi_intact and isinstance(tour, Tour) and
+                          tour.couleur == couleur and not tour.a_bouge)
+    return tuple(droits)
+
+
+def hacher(plateau: Plateau, couleur: str) -> int:
+    """
+    Calcule la clé de Zobrist d'une position.
+    
+    Args:
+        plateau: Le plateau de jeu
+        couleur: Couleur du camp au trait
+        
+    Returns:
+        Clé de 64 bits
+    """
+    cle = 0
+    for ligne in range(8):
+        rangee = plateau.grille[ligne]
+        for colonne in range(8):
+            piece = rangee[colonne]
+            if piece is not None:
+                cle ^= CLES_PIECES[(type(piece), piece.couleur)][ligne * 8 + colonne]
+    
+    if couleur == 'noir':
+        cle ^= CLE_TRAIT_NOIR
+    
+    for indice, droit in enumerate(droits_roque(plateau)):
+        if droit:
+            cle ^= CLES_ROQUE[indice]
+    
+    if plateau.position_en_passant is not None:
+        cle ^= CLES_EN_PASSANT[plateau.position_en_passant[1]]
+    
+    return cle
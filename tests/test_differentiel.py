@@ -0,0 +1,87 @@
+"""
+Tests unitaires pour le test différentiel de la génération des coups.
+"""
+
+import unittest
+import sys
+import os
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.fen import FEN_INITIALE, plateau_depuis_fen
+from src.piece import Pion, Cavalier
+from src.differentiel import (VERIFICATIONS, coups_reference, jouer_partie_aleatoire,
+                              minimiser, lancer, _comparer_coups)
+
+KIWIPETE = 'r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1'
+
+
+def sans_cavaliers(plateau, couleur, reference):
+    """Générateur défectueux : oublie les coups de cavalier."""
+    obtenus = [coup for coup in reference if not isinstance(plateau.obtenir_piece(coup[0]), Cavalier)]
+    return _comparer_coups("sans_cavaliers", obtenus, reference)
+
+
+def sans_en_passant(plateau, couleur, reference):
+    """Générateur défectueux : oublie les prises en passant."""
+    obtenus = [(depart, arrivee) for depart, arrivee in reference
+               if not (isinstance(plateau.obtenir_piece(depart), Pion)
+                       and depart[1] != arrivee[1] and plateau.obtenir_piece(arrivee) is None)]
+    return _comparer_coups("sans_en_passant", obtenus, reference)
+
+
+class TestReference(unittest.TestCase):
+    """Tests pour la génération de référence."""
+    
+    def test_nombre_de_coups(self):
+        """Test du nombre de coups légaux de positions connues."""
+        self.assertEqual(len(coups_reference(*plateau_depuis_fen(FEN_INITIALE))), 20)
+        self.assertEqual(len(coups_reference(*plateau_depuis_fen(KIWIPETE))), 48)
+    
+    def test_verifications_sur_kiwipete(self):
+        """Test de l'accord des générateurs optimisés sur une position riche."""
+        plateau, couleur = plateau_depuis_fen(KIWIPETE)
+        reference = coups_reference(plateau, couleur)
+        for nom, verification in VERIFICATIONS.items():
+            self.assertIsNone(verification(plateau.copier(), couleur, reference), nom)
+
+
+class TestDifferentiel(unittest.TestCase):
+    """Tests pour les parties aléatoires et la réduction des divergences."""
+    
+    def test_parties_sans_divergence(self):
+        """Test de parties courtes, reproductibles d'une exécution à l'autre."""
+        with ThreadPoolExecutor(1) as executeur:
+            premier = lancer(3, graine=5, demi_coups_max=20, executeur=executeur)
+            second = lancer(3, graine=5, demi_coups_max=20, executeur=executeur)
+        self.assertEqual(premier[1], [])
+        self.assertEqual(premier[0], second[0])
+        with self.assertRaises(ValueError):
+            lancer(1, verifications=['inconnue'])
+    
+    def test_divergence_detectee_et_reduite(self):
+        """Test de la détection d'un générateur défectueux et de la réduction de la position."""
+        with mock.patch.dict(VERIFICATIONS, {'sans_cavaliers': sans_cavaliers}):
+            positions, divergences = jouer_partie_aleatoire('0:0', 10, ['sans_cavaliers'])
+        self.assertEqual(len(divergences), 1)
+        divergence = divergences[0]
+        self.assertEqual(divergence.demi_coup, 0)
+        self.assertEqual(divergence.fen, FEN_INITIALE)
+        # Seuls restent les deux rois et un cavalier
+        rangees = divergence.fen_minimale.split()[0]
+        self.assertEqual(sorted(c for c in rangees if c.isalpha()), ['K', 'N', 'k'])
+    
+    def test_reduction_en_passant(self):
+        """Test de la réduction d'une divergence liée à la prise en passant."""
+        fen = 'rnbqkbnr/ppp1p1pp/8/3pPp2/8/8/PPPP1PPP/RNBQKBNR w KQkq f6 0 3'
+        with mock.patch.dict(VERIFICATIONS, {'sans_en_passant': sans_en_passant}):
+            reduite = minimiser(fen, 'sans_en_passant')
+        self.assertEqual(reduite.split()[0], '4k3/8/8/4Pp2/8/8/8/4K3')
+        self.assertEqual(reduite.split()[3], 'f6')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+"""
+Tests unitaires pour l'encodage compact des positions et des coups.
+"""
+
+import unittest
+import sys
+import os
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.fen import FEN_INITIALE, plateau_depuis_fen, fen_depuis_plateau
+from src.piece import Cavalier
+from src.zobrist import hacher
+from src.encodage import (TAILLE_POSITION, encoder_position, encoder_fen, decoder_position,
+                          encoder_coup, decoder_coup)
+
+
+FENS = [
+    FEN_INITIALE,
+    'r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1',
+    '4k2r/8/8/3pP3/8/8/8/R3K3 w Qk d6 0 1',
+    '8/8/8/4k3/8/8/3q4/4K3 b - - 0 1',
+]
+
+
+class TestEncodage(unittest.TestCase):
+    """Tests pour l'encodage compact."""
+    
+    def test_taille(self):
+        """Test qu'une position tient sur TAILLE_POSITION octets."""
+        plateau, couleur = plateau_depuis_fen(FEN_INITIALE)
+        self.assertEqual(len(encoder_position(plateau, couleur)), TAILLE_POSITION)
+    
+    def test_aller_retour(self):
+        """Test qu'une position décodée est identique à l'originale."""
+        for fen in FENS:
+            plateau, couleur = plateau_depuis_fen(fen)
+            decode, couleur_decodee = decoder_position(encoder_position(plateau, couleur))
+            self.assertEqual(couleur_decodee, couleur)
+            self.assertEqual(hacher(decode, couleur_decodee), hacher(plateau, couleur))
+            self.assertEqual(fen_depuis_plateau(decode, couleur_decodee), fen)
+    
+    def test_encoder_fen(self):
+        """Test que l'encodage direct d'une FEN égale celui du plateau."""
+        for fen in FENS:
+            plateau, couleur = plateau_depuis_fen(fen)
+            self.assertEqual(encoder_fen(fen), encoder_position(plateau, couleur))
+    
+    def test_donnees_invalides(self):
+        """Test que des données invalides sont refusées."""
+        with self.assertRaises(ValueError):
+            decoder_position(b'\x00' * 10)
+        # Case de prise en passant hors du plateau, puis hors des 3e et 6e rangées
+        encodage = bytearray(encoder_fen('4k3/8/8/8/4P3/8/8/4K3 b - e3 0 1'))
+        for octet in (200, 65, 1):
+            encodage[33] = octet
+            with self.assertRaises(ValueError):
+                decoder_position(bytes(encodage))
+        with self.assertRaises(ValueError):
+            encoder_fen('8/8/8 w - - 0 1')
+        # 64 cases au total, mais des rangées de largeur incorrecte ou 9 rangées
+        for placement in ('4k4/7/8/8/8/8/8/4K3', '4k3/8/8/8/8/8/8/4K3/', '4k3/8/8/8/8/8/8/4K3/8',
+                          '44k3/8/8/8/8/8/8/4K3'):
+            with self.assertRaises(ValueError):
+                encoder_fen(placement + ' w - - 0 1')
+    
+    def test_coup(self):
+        """Test l'encodage des coups, avec et sans promotion."""
+        self.assertEqual(decoder_coup(encoder_coup((6, 4), (4, 4))), ((6, 4), (4, 4), None))
+        code = encoder_coup((1, 0), (0, 1), Cavalier)
+        self.assertLess(code, 1 << 15)
+        self.assertEqual(decoder_coup(code), ((1, 0), (0, 1), Cavalier))
+
+
+if __name__ == '__main__':
+    unittest.main()
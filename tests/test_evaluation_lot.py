@@ -0,0 +1,75 @@
+"""
+Tests unitaires pour l'évaluation vectorisée d'un lot de positions.
+"""
+
+import unittest
+import random
+import sys
+import os
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.fen import FEN_INITIALE, plateau_depuis_fen
+from src.evaluation import evaluer
+from src.encodage import encoder_position
+from src.moteur import Moteur, couleur_adverse
+from src.tenseurs import np, encoder_lot, exporter
+from src.evaluation_lot import evaluer_plans, evaluer_encodages
+
+
+def corpus(nombre: int, graine: int = 7):
+    """Construit des positions variées en jouant des coups légaux au hasard."""
+    aleatoire = random.Random(graine)
+    moteur = Moteur()
+    positions = []
+    plateau, couleur = plateau_depuis_fen(FEN_INITIALE)
+    while len(positions) < nombre:
+        coups = moteur.coups_legaux(plateau, couleur)
+        if not coups or len(plateau.pieces_capturees) > 20:
+            plateau, couleur = plateau_depuis_fen(FEN_INITIALE)
+            continue
+        plateau.jouer_coup(*aleatoire.choice(coups))
+        couleur = couleur_adverse(couleur)
+        positions.append((plateau.copier(), couleur))
+    return positions
+
+
+@unittest.skipIf(np is None, "NumPy n'est pas installé")
+class TestEvaluationLot(unittest.TestCase):
+    """Tests pour l'évaluation par lot."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Prépare un corpus de positions commun aux tests."""
+        cls.positions = corpus(300)
+    
+    def test_position_initiale(self):
+        """Test que la position initiale est équilibrée."""
+        scores = evaluer_encodages(encoder_lot([FEN_INITIALE]), avec_mobilite=True)
+        self.assertEqual(scores.tolist(), [0])
+    
+    def test_accord_sans_mobilite(self):
+        """Test l'égalité avec l'évaluateur unitaire (matériel et tables)."""
+        scores = evaluer_encodages(encoder_lot(self.positions))
+        attendus = [evaluer(plateau, couleur) for plateau, couleur in self.positions]
+        self.assertEqual(scores.tolist(), attendus)
+    
+    def test_accord_avec_mobilite(self):
+        """Test l'égalité avec l'évaluateur unitaire, mobilité comprise."""
+        scores = evaluer_encodages(encoder_lot(self.positions), avec_mobilite=True)
+        attendus = [evaluer(plateau, couleur, avec_mobilite=True)
+                    for plateau, couleur in self.positions]
+        self.assertEqual(scores.tolist(), attendus)
+    
+    def test_point_de_vue_blanc(self):
+        """Test que sans plans auxiliaires le score est donné pour les blancs."""
+        plateau, couleur = plateau_depuis_fen('4k3/8/8/8/8/8/8/3QK3 b - - 0 1')
+        pieces, _ = exporter([(plateau, couleur)])
+        self.assertEqual(int(evaluer_plans(pieces)[0]), evaluer(plateau, 'blanc'))
+        self.assertEqual(int(evaluer_encodages(encoder_lot([encoder_position(plateau, couleur)]))[0]),
+                         evaluer(plateau, 'noir'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+"""
+Tests unitaires pour l'explorateur d'ouvertures.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.fen import FEN_INITIALE, plateau_depuis_fen
+from src.piece import Cavalier
+from src.explorateur import Explorateur, construire_explorateur
+
+PARTIES = """[Event "Un"]
+1. e4 e5 2. Nf3 Nc6 1-0
+
+[Event "Deux"]
+1. e4 c5 1/2-1/2
+
+[Event "Trois"]
+1. Nf3 Nf6 2. g3 g6 0-1
+
+[Event "Quatre"]
+1. g3 Nf6 2. Nf3 d5 *
+
+[Event "Illégale"]
+1. e4 e4 1-0
+
+[Event "Promotion"]
+[SetUp "1"]
+[FEN "4k3/P7/8/8/8/8/8/4K3 w - - 0 1"]
+1. a8=N 1-0
+"""
+
+
+class TestExplorateur(unittest.TestCase):
+    """Tests pour la construction et la consultation de l'explorateur."""
+    
+    def setUp(self):
+        """Écrit le fichier PGN dans un dossier temporaire."""
+        self.dossier = tempfile.TemporaryDirectory()
+        self.pgn = os.path.join(self.dossier.name, 'parties.pgn')
+        with open(self.pgn, 'w', encoding='utf-8') as fichier:
+            fichier.write(PARTIES)
+    
+    def tearDown(self):
+        """Supprime le dossier temporaire."""
+        self.dossier.cleanup()
+    
+    def construire(self, nom: str, importees=(5, 1), **options) -> str:
+        """Construit un explorateur, vérifie le nombre de parties importées et retourne son chemin."""
+        chemin = os.path.join(self.dossier.name, nom)
+        self.assertEqual(construire_explorateur([self.pgn], chemin, **options), importees)
+        return chemin
+    
+    def test_statistiques_et_transposition(self):
+        """Test des suites de la position initiale et d'une position atteinte par transposition."""
+        with Explorateur(self.construire('ouvertures.exp')) as explorateur:
+            plateau, couleur = plateau_depuis_fen(FEN_INITIALE)
+            self.assertEqual(explorateur.suites(plateau, couleur),
+                             [(((6, 4), (4, 4), None), 2, 1, 1, 0),
+                              (((7, 6), (5, 5), None), 1, 0, 0, 1),
+                              (((6, 6), (5, 6), None), 1, 0, 0, 0)])
+            self.assertEqual(explorateur.statistiques(plateau, couleur), (4, 1, 1, 1))
+            
+            # 1. Nf3 Nf6 2. g3 et 1. g3 Nf6 2. Nf3 mènent à la même position
+            plateau, couleur = plateau_depuis_fen(
+                'rnbqkb1r/pppppppp/5n2/8/8/5NP1/PPPPPP1P/RNBQKB1R b KQkq - 0 2')
+            self.assertEqual(sorted(coup for coup, *_ in explorateur.suites(plateau, couleur)),
+                             [((1, 3), (3, 3), None), ((1, 6), (2, 6), None)])
+            
+            plateau, couleur = plateau_depuis_fen('4k3/P7/8/8/8/8/8/4K3 w - - 0 1')
+            self.assertEqual(explorateur.suites(plateau, couleur),
+                             [(((1, 0), (0, 0), Cavalier), 1, 1, 0, 0)])
+            plateau, couleur = plateau_depuis_fen('4k3/8/8/8/8/8/8/4K3 w - - 0 1')
+            self.assertEqual(explorateur.suites(plateau, couleur), [])
+    
+    def test_series_sur_disque(self):
+        """Test qu'un dictionnaire minuscule (une série par couple) donne le même fichier."""
+        with open(self.construire('memoire.exp'), 'rb') as fichier:
+            attendu = fichier.read()
+        with open(self.construire('series.exp', entrees_max=1), 'rb') as fichier:
+            self.assertEqual(fichier.read(), attendu)
+    
+    def test_demi_coups_max(self):
+        """Test de la limite du nombre de demi-coups retenus par partie."""
+        # Le coup illégal de la cinquième partie n'est plus rejoué
+        with Explorateur(self.construire('court.exp', (6, 0), demi_coups_max=1)) as explorateur:
+            self.assertEqual(explorateur.entrees, 4)
+    
+    def test_fichier_invalide(self):
+        """Test du refus d'un fichier qui n'est pas un explorateur."""
+        chemin = os.path.join(self.dossier.name, 'invalide.exp')
+        with open(chemin, 'wb') as fichier:
+            fichier.write(b'SAETB\x00\x01\x00' + bytes(8))
+        with self.assertRaises(ValueError):
+            Explorateur(chemin)
+        with self.assertRaises(ValueError):
+            construire_explorateur([self.pgn], chemin, entrees_max=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+"""
+Tests unitaires pour la notation FEN.
+"""
+
+import unittest
+import sys
+import os
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.plateau import Plateau
+from src.fen import FEN_INITIALE, plateau_depuis_fen, fen_depuis_plateau
+from src.piece import Pion, Roi, Tour
+from src.zobrist import hacher
+
+
+class TestFen(unittest.TestCase):
+    """Tests pour la conversion FEN."""
+    
+    def test_position_initiale(self):
+        """Test que la FEN initiale donne le même plateau que initialiser()."""
+        plateau, couleur = plateau_depuis_fen(FEN_INITIALE)
+        reference = Plateau()
+        reference.initialiser()
+        
+        self.assertEqual(couleur, 'blanc')
+        self.assertEqual(hacher(plateau, 'blanc'), hacher(reference, 'blanc'))
+        self.assertFalse(plateau.obtenir_piece((6, 0)).a_bouge)
+    
+    def test_aller_retour(self):
+        """Test qu'une FEN relue puis réécrite est inchangée."""
+        fen = 'r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1'
+        plateau, couleur = plateau_depuis_fen(fen)
+        self.assertEqual(fen_depuis_plateau(plateau, couleur), fen)
+    
+    def test_droits_roque_et_en_passant(self):
+        """Test la lecture des droits de roque et de la case en passant."""
+        plateau, couleur = plateau_depuis_fen('4k2r/8/8/3pP3/8/8/8/R3K3 w Qk d6 0 1')
+        
+        self.assertFalse(plateau.obtenir_piece((7, 4)).a_bouge)
+        self.assertFalse(plateau.obtenir_piece((7, 0)).a_bouge)
+        self.assertFalse(plateau.obtenir_piece((0, 7)).a_bouge)
+        self.assertEqual(plateau.position_en_passant, (2, 3))
+        self.assertTrue(plateau.obtenir_piece((3, 4)).a_bouge)
+    
+    def test_fen_invalide(self):
+        """Test qu'une FEN invalide lève une erreur."""
+        with self.assertRaises(ValueError):
+            plateau_depuis_fen('8/8/8 w - -')
+        with self.assertRaises(ValueError):
+            plateau_depuis_fen('8/8/8/8/8/8/8/8 x - -')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+"""
+Tests unitaires pour la gestion du temps du moteur.
+"""
+
+import unittest
+import sys
+import os
+import time
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.gestion_temps import GestionTemps, allouer, FACTEUR_INSTABILITE_MAX
+from src.moteur import Moteur
+from src.plateau import Plateau
+
+
+class TestAllocation(unittest.TestCase):
+    """Tests pour le calcul des limites souple et dure."""
+    
+    def test_limites_ordonnees(self):
+        """Test que la limite souple ne dépasse pas la dure, ni la dure le temps restant."""
+        for restant, increment, numero in ((300, 0, 1), (60, 2, 30), (5, 0, 80), (0.2, 0, 10)):
+            souple, dure = allouer(restant, increment, numero)
+            self.assertLessEqual(souple, dure)
+            self.assertLess(dure, restant)
+    
+    def test_plus_de_temps_avec_moins_de_coups(self):
+        """Test que la part allouée grandit quand il reste moins de coups à jouer."""
+        self.assertGreater(allouer(300, 0, 1, coups_restants=5)[0], allouer(300, 0, 1)[0])
+        self.assertGreater(allouer(300, 0, 60)[0], allouer(300, 0, 1)[0])
+    
+    def test_increment(self):
+        """Test que l'incrément est presque entièrement dépensé."""
+        self.assertAlmostEqual(allouer(100, 5, 1)[0] - allouer(100, 0, 1)[0], 4.0)
+
+
+class TestInstabilite(unittest.TestCase):
+    """Tests pour l'allongement de la limite souple."""
+    
+    def test_changement_de_coup(self):
+        """Test qu'un changement de meilleur coup allonge la réflexion, une confirmation la réduit."""
+        gestion = GestionTemps(60)
+        gestion.demarrer()
+        self.assertTrue(gestion.continuer('a', 10))
+        self.assertEqual(gestion.facteur_instabilite, 1.0)
+        
+        for coup in 'bcdefg':
+            gestion.continuer(coup, 10)
+        self.assertEqual(gestion.facteur_instabilite, FACTEUR_INSTABILITE_MAX)
+        
+        gestion.continuer('g', 10)
+        self.assertLess(gestion.facteur_instabilite, FACTEUR_INSTABILITE_MAX)
+    
+    def test_chute_du_score(self):
+        """Test qu'une chute du score allonge la réflexion."""
+        gestion = GestionTemps(60)
+        gestion.demarrer()
+        gestion.continuer('a', 100)
+        gestion.continuer('a', 0)
+        self.assertGreater(gestion.facteur_instabilite, 1.0)
+    
+    def test_arret_apres_la_limite_souple(self):
+        """Test qu'aucune itération n'est commencée une fois la limite souple passée."""
+        gestion = GestionTemps(60)
+        gestion.debut = time.perf_counter() - gestion.limite_souple
+        self.assertFalse(gestion.continuer('a', 0))
+
+
+class TestMoteurSousCadence(unittest.TestCase):
+    """Tests pour la recherche pilotée par la gestion du temps."""
+    
+    def test_limite_dure_respectee(self):
+        """Test que la recherche rend un coup sans dépasser la limite dure."""
+        plateau = Plateau()
+        plateau.initialiser()
+        gestion = GestionTemps(2.0)
+        
+        debut = time.perf_counter()
+        coup, _ = Moteur().chercher_iteratif(plateau, 'blanc', gestion_temps=gestion)
+        duree = time.perf_counter() - debut
+        
+        self.assertIsNotNone(coup)
+        self.assertLess(duree, gestion.limite_dure + 0.25)
+
+
+if __name__ == '__main__':
+    unittest.main()
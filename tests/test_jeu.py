@@ -126,10 +126,15 @@ class TestJeu(unittest.TestCase):
         self.jeu.effectuer_coup((6, 4), (4, 4))
         self.assertEqual(len(self.jeu.historique), 1)
         
-        depart, arrivee, piece = self.jeu.historique[0]
+        depart, arrivee, classe = self.jeu.historique[0]
         self.assertEqual(depart, (6, 4))
         self.assertEqual(arrivee, (4, 4))
-        self.assertIsInstance(piece, Pion)
+        self.assertIs(classe, Pion)
+    
+    def test_case_en_passant(self):
+        """Test que la case de prise en passant est celle traversée par le pion."""
+        self.jeu.effectuer_coup((6, 4), (4, 4))
+        self.assertEqual(self.jeu.plateau.position_en_passant, (5, 4))
     
     def test_notation_vers_position(self):
         """Test la conversion de notation en position."""
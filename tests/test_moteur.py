@@ -0,0 +1,240 @@
+"""
+Tests unitaires pour le moteur de recherche.
+"""
+
+import unittest
+import sys
+import os
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.plateau import Plateau
+from src.moteur import Moteur
+from src.evaluation import evaluer, structure_pions, evaluer_structure_pions
+from src.table_pions import TablePions
+from src.piece import Pion, Tour, Cavalier, Fou, Reine, Roi
+from src.fen import plateau_depuis_fen
+from src.jeu import Jeu
+
+
+class TestMoteur(unittest.TestCase):
+    """Tests pour la classe Moteur."""
+    
+    def setUp(self):
+        """Initialise un moteur et un plateau vide avant chaque test."""
+        self.moteur = Moteur(profondeur=2)
+        self.plateau = Plateau()
+    
+    def test_evaluation_position_initiale_equilibree(self):
+        """Test que la position initiale est évaluée à zéro."""
+        self.plateau.initialiser()
+        self.assertEqual(evaluer(self.plateau, 'blanc'), 0)
+        self.assertEqual(evaluer(self.plateau, 'noir'), 0)
+    
+    def test_coups_legaux_position_initiale(self):
+        """Test que le moteur trouve les 20 coups de la position initiale."""
+        self.plateau.initialiser()
+        self.assertEqual(len(self.moteur.coups_legaux(self.plateau, 'blanc')), 20)
+    
+    def test_quiescence_refuse_capture_defendue(self):
+        """Test que la quiescence ne prend pas un pion défendu avec la reine."""
+        self.plateau.placer_piece(Roi('blanc', (7, 4)), (7, 4))
+        self.plateau.placer_piece(Reine('blanc', (4, 3)), (4, 3))
+        self.plateau.placer_piece(Roi('noir', (0, 4)), (0, 4))
+        self.plateau.placer_piece(Pion('noir', (3, 4)), (3, 4))
+        self.plateau.placer_piece(Pion('noir', (2, 5)), (2, 5))
+        
+        score_statique = evaluer(self.plateau, 'blanc')
+        score = self.moteur.quiescence(self.plateau, 'blanc', -10 ** 6, 10 ** 6)
+        
+        # Le « stand pat » reste le meilleur choix : prendre perdrait la reine
+        self.assertEqual(score, score_statique)
+    
+    def test_quiescence_resout_echange(self):
+        """Test que la quiescence voit le gain d'une pièce non défendue."""
+        self.plateau.placer_piece(Roi('blanc', (7, 4)), (7, 4))
+        self.plateau.placer_piece(Tour('blanc', (7, 0)), (7, 0))
+        self.plateau.placer_piece(Roi('noir', (0, 7)), (0, 7))
+        self.plateau.placer_piece(Cavalier('noir', (2, 0)), (2, 0))
+        
+        score_statique = evaluer(self.plateau, 'blanc')
+        score = self.moteur.quiescence(self.plateau, 'blanc', -10 ** 6, 10 ** 6)
+        
+        self.assertGreater(score, score_statique + Cavalier.valeur // 2)
+    
+    def test_quiescence_detecte_mat(self):
+        """Test que la quiescence ne se contente pas de l'évaluation statique en échec."""
+        plateau, _ = plateau_depuis_fen('R5k1/5ppp/8/8/8/8/8/6K1 b - - 0 1')
+        self.assertEqual(self.moteur.quiescence(plateau, 'noir', -10 ** 6, 10 ** 6), -Moteur.SCORE_MAT)
+        
+        # En échec mais avec une parade : le score reste celui d'une position jouable
+        plateau, _ = plateau_depuis_fen('R5k1/5pp1/8/8/8/8/8/6K1 b - - 0 1')
+        self.assertGreater(self.moteur.quiescence(plateau, 'noir', -10 ** 6, 10 ** 6), -Moteur.SEUIL_MAT)
+    
+    def test_recherche_restaure_plateau(self):
+        """Test que la recherche laisse le plateau inchangé."""
+        self.plateau.initialiser()
+        avant = [[type(p) if p else None for p in rangee] for rangee in self.plateau.grille]
+        
+        self.moteur.chercher(self.plateau, 'blanc', 2)
+        
+        apres = [[type(p) if p else None for p in rangee] for rangee in self.plateau.grille]
+        self.assertEqual(avant, apres)
+        self.assertIsNone(self.plateau.position_en_passant)
+    
+    def test_trouve_mat_en_un(self):
+        """Test que le moteur trouve un mat du couloir."""
+        self.plateau.placer_piece(Roi('noir', (0, 6)), (0, 6))
+        self.plateau.placer_piece(Pion('noir', (1, 5)), (1, 5))
+        self.plateau.placer_piece(Pion('noir', (1, 6)), (1, 6))
+        self.plateau.placer_piece(Pion('noir', (1, 7)), (1, 7))
+        self.plateau.placer_piece(Roi('blanc', (7, 6)), (7, 6))
+        self.plateau.placer_piece(Tour('blanc', (7, 0)), (7, 0))
+        
+        coup, score = self.moteur.chercher(self.plateau, 'blanc', 2)
+        
+        self.assertEqual(coup, ((7, 0), (0, 0)))
+        self.assertGreater(score, Moteur.SCORE_MAT - 10)
+    
+    def test_sans_elagage_meme_resultat(self):
+        """Test que l'élagage SEE ne change pas le score d'une position calme."""
+        self.plateau.placer_piece(Roi('blanc', (7, 4)), (7, 4))
+        self.plateau.placer_piece(Fou('blanc', (5, 2)), (5, 2))
+        self.plateau.placer_piece(Roi('noir', (0, 4)), (0, 4))
+        self.plateau.placer_piece(Pion('noir', (2, 5)), (2, 5))
+        self.plateau.placer_piece(Pion('noir', (1, 6)), (1, 6))
+        
+        sans_elagage = Moteur(elaguer_captures_perdantes=False)
+        score_avec = self.moteur.quiescence(self.plateau, 'blanc', -10 ** 6, 10 ** 6)
+        score_sans = sans_elagage.quiescence(self.plateau, 'blanc', -10 ** 6, 10 ** 6)
+        
+        self.assertEqual(score_avec, score_sans)
+    
+    
+    def test_recherche_iterative_limite_noeuds(self):
+        """Test que la limite de nœuds interrompt la recherche avec un coup légal."""
+        self.plateau.initialiser()
+        
+        coup, _ = self.moteur.chercher_iteratif(self.plateau, 'blanc', noeuds_max=300)
+        
+        self.assertIn(coup, self.moteur.coups_legaux(self.plateau, 'blanc'))
+        self.assertLess(self.moteur.noeuds, 600)
+    
+    def test_recherche_iterative_rapport_et_variante(self):
+        """Test le rapport de chaque itération et la variante principale."""
+        self.plateau.initialiser()
+        rapports = []
+        
+        coup, score = self.moteur.chercher_iteratif(
+            self.plateau, 'blanc', profondeur_max=2,
+            rapport=lambda *infos: rapports.append(infos))
+        
+        self.assertEqual([infos[0] for infos in rapports], [1, 2])
+        self.assertEqual(rapports[-1][4][0], coup)
+        self.assertEqual(len(rapports[-1][4]), 2)
+    
+    def test_multipv_scores_exacts(self):
+        """Test que chaque ligne MultiPV a le score d'une recherche limitée à son coup."""
+        plateau, couleur = plateau_depuis_fen(
+            'r1bqkbnr/pppp1ppp/2n5/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R w KQkq - 2 3')
+        
+        lignes = self.moteur.chercher_multipv(plateau, couleur, 3, profondeur_max=2)
+        
+        self.assertEqual(len({coup for coup, _, _ in lignes}), 3)
+        scores = [score for _, score, _ in lignes]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+        _, meilleur = Moteur().chercher_iteratif(plateau, couleur, profondeur_max=2)
+        self.assertEqual(scores[0], meilleur)
+        for coup, score, variante in lignes:
+            self.assertEqual(variante[0], coup)
+            coup_joue = plateau.jouer_coup(*coup)
+            _, reponse = Moteur().chercher(plateau, 'noir', 1)
+            plateau.annuler_coup(coup_joue)
+            self.assertEqual(score, -reponse)
+    
+    def test_analyser_partie(self):
+        """Test de l'analyse d'une partie : lignes légales, partie inchangée."""
+        jeu = Jeu()
+        avant = jeu.vers_fen()
+        
+        lignes = Moteur(profondeur=2).analyser(jeu, lignes=4)
+        
+        self.assertEqual(len(lignes), 4)
+        self.assertEqual(jeu.vers_fen(), avant)
+        legaux = jeu.obtenir_tous_mouvements_legaux('blanc')
+        self.assertTrue(all(coup in legaux for coup, _, _ in lignes))
+        # Moins de coups légaux que de lignes demandées
+        jeu = Jeu.depuis_fen('7k/8/8/8/8/8/8/K7 w - - 0 1')
+        self.assertEqual(len(Moteur(profondeur=2).analyser(jeu, lignes=5)), 3)
+    
+    def test_structure_pions(self):
+        """Test des pions doublés, isolés, arriérés et passés."""
+        # e4 et e3 : doublés et isolés, seul e4 (en tête) est passé
+        plateau, _ = plateau_depuis_fen('4k3/8/8/8/4P3/4P3/8/4K3 w - - 0 1')
+        self.assertEqual(structure_pions(plateau), (-15 - 2 * 12 + 20, 1 << 36, 0))
+        # b6 et b5 noirs doublés et isolés : seul b5 (en tête) est passé
+        plateau, _ = plateau_depuis_fen('4k3/8/1p6/1p6/8/8/8/4K3 w - - 0 1')
+        self.assertEqual(structure_pions(plateau), (15 + 2 * 12 - 20, 0, 1 << 25))
+        # d4 passé ; e3 arriéré (e4 attaquée par f5) ; f5 isolé
+        plateau, _ = plateau_depuis_fen('4k3/8/8/5p2/3P4/4P3/8/4K3 w - - 0 1')
+        self.assertEqual(structure_pions(plateau), (20 - 8 + 12, 1 << 35, 0))
+        self.assertEqual(evaluer(plateau, 'noir', avec_structure_pions=True),
+                         evaluer(plateau, 'noir') - 24)
+        # Pion passé bloqué par un cavalier adverse
+        plateau, _ = plateau_depuis_fen('4k3/8/8/4n3/4P3/8/8/4K3 w - - 0 1')
+        self.assertEqual(evaluer_structure_pions(plateau), -12 + 20 - 10)
+    
+    def test_table_pions(self):
+        """Test de la table des pions : même score, succès comptés."""
+        plateau, _ = plateau_depuis_fen('4k3/8/8/5p2/3P4/4P3/8/4K3 w - - 0 1')
+        table = TablePions(8)
+        self.assertEqual(evaluer_structure_pions(plateau, table), evaluer_structure_pions(plateau))
+        # Un coup de roi ne change pas la structure : la table répond
+        plateau.jouer_coup((7, 4), (7, 3))
+        self.assertEqual(evaluer_structure_pions(plateau, table), 24)
+        self.assertEqual((table.sondages, table.succes), (2, 1))
+        self.assertEqual(table.taux_succes(), 50.0)
+        
+        moteur = Moteur(profondeur=2, structure_pions=True)
+        plateau, couleur = plateau_depuis_fen('r1bq1rk1/pp2ppbp/2np1np1/8/3NP3/2N1BP2/PPPQ2PP/R3KB1R w KQ - 0 9')
+        moteur.chercher(plateau, couleur)
+        self.assertGreater(moteur.table_pions.taux_succes(), 50)
+    
+    def test_recherche_selective(self):
+        """Test de la recherche sélective : mat trouvé, moins de nœuds, facteur de branchement."""
+        selectif = Moteur(coup_nul=True, reductions=True, pvs=True, extensions_echec=True,
+                          fenetres_aspiration=True)
+        self.plateau.placer_piece(Roi('noir', (0, 6)), (0, 6))
+        for colonne in (5, 6, 7):
+            self.plateau.placer_piece(Pion('noir', (1, colonne)), (1, colonne))
+        self.plateau.placer_piece(Roi('blanc', (7, 6)), (7, 6))
+        self.plateau.placer_piece(Tour('blanc', (7, 0)), (7, 0))
+        coup, score = selectif.chercher_iteratif(self.plateau, 'blanc', profondeur_max=3)
+        self.assertEqual(coup, ((7, 0), (0, 0)))
+        self.assertGreater(score, Moteur.SCORE_MAT - 10)
+        
+        fen = 'r1bq1rk1/pp2ppbp/2np1np1/8/3NP3/2N1BP2/PPPQ2PP/R3KB1R w KQ - 0 9'
+        plateau, couleur = plateau_depuis_fen(fen)
+        complet = Moteur()
+        complet.chercher(plateau, couleur, 1)
+        self.assertIsNone(complet.facteur_branchement())
+        complet.chercher_iteratif(plateau, couleur, profondeur_max=4)
+        selectif.chercher_iteratif(plateau, couleur, profondeur_max=4)
+        self.assertEqual(len(selectif.noeuds_iterations), 4)
+        self.assertLess(selectif.noeuds, complet.noeuds)
+        self.assertLess(selectif.facteur_branchement(), complet.facteur_branchement())
+    
+    def test_fenetres_aspiration_meme_resultat(self):
+        """Test que les fenêtres d'aspiration ne changent ni le coup ni le score."""
+        plateau, couleur = plateau_depuis_fen(
+            'r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1')
+        attendu = Moteur().chercher_iteratif(plateau, couleur, profondeur_max=3)
+        
+        moteur = Moteur(fenetres_aspiration=True)
+        moteur.FENETRE_ASPIRATION = 5
+        self.assertEqual(moteur.chercher_iteratif(plateau, couleur, profondeur_max=3), attendu)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+Tests unitaires pour l'index de recherche de motifs.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.jeu import Jeu
+from src.stockage import Stockage
+from src.motifs import np, IndexMotifs, analyser_motif, construire_index, MASQUE_PLEIN
+
+# 1. e4 e5 2. Cf3 Cc6 3. Fb5 a6
+PARTIE_ESPAGNOLE = [((6, 4), (4, 4)), ((1, 4), (3, 4)), ((7, 6), (5, 5)),
+                    ((0, 1), (2, 2)), ((7, 5), (3, 1)), ((1, 0), (2, 0))]
+# Tour en 7e rangée, le roi noir recule en h8, mat du couloir
+PARTIE_COULOIR = ('6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1',
+                  [((7, 0), (1, 0)), ((0, 6), (0, 7)), ((1, 0), (0, 0))])
+
+
+class TestAnalyseMotif(unittest.TestCase):
+    """Tests pour la syntaxe des motifs."""
+    
+    def test_termes(self):
+        """Test des cases, colonnes, rangées et de l'absence."""
+        self.assertEqual(analyser_motif('R7'), [(3, 0xFF << 8, True)])
+        self.assertEqual(analyser_motif('kg1,h1'), [(11, 1 << 62 | 1 << 63, True)])
+        self.assertEqual(analyser_motif('Pa !q'),
+                         [(0, sum(1 << (ligne * 8) for ligne in range(8)), True),
+                          (10, MASQUE_PLEIN, False)])
+    
+    def test_erreurs(self):
+        """Test des motifs mal formés."""
+        for motif in ('', 'X', '!', 'Kz9', 'K9', 'Ka1,'):
+            with self.assertRaises(ValueError):
+                analyser_motif(motif)
+
+
+@unittest.skipIf(np is None, "NumPy n'est pas installé")
+class TestIndexMotifs(unittest.TestCase):
+    """Tests pour la construction et la consultation de l'index."""
+    
+    def setUp(self):
+        """Enregistre deux parties dans une base temporaire et construit l'index."""
+        self.repertoire = tempfile.TemporaryDirectory()
+        self.dossier = os.path.join(self.repertoire.name, 'motifs')
+        with Stockage(os.path.join(self.repertoire.name, 'parties.db')) as base:
+            fen_couloir, coups_couloir = PARTIE_COULOIR
+            for jeu, coups in ((Jeu(), PARTIE_ESPAGNOLE), (Jeu.depuis_fen(fen_couloir), coups_couloir)):
+                for coup in coups:
+                    jeu.jouer_coup(*coup)
+                base.enregistrer(jeu)
+            self.assertEqual(construire_index(base, self.dossier), 11)
+        self.index = IndexMotifs(self.dossier)
+    
+    def tearDown(self):
+        """Supprime le répertoire temporaire."""
+        del self.index
+        self.repertoire.cleanup()
+    
+    def test_recherche(self):
+        """Test de motifs connus dans les deux parties."""
+        self.assertEqual(self.index.positions, 11)
+        self.assertEqual(self.index.rechercher('R7 kg8'), [(2, 1)])
+        self.assertEqual(self.index.rechercher('Bb5 pa6'), [(1, 6)])
+        self.assertEqual(self.index.rechercher('!P'), [(2, 0), (2, 1), (2, 2), (2, 3)])
+        self.assertEqual(self.index.rechercher('N', limite=2), [(1, 0), (1, 1)])
+        self.assertEqual(self.index.rechercher('Q q kh8'), [])
+    
+    def test_trait_et_premiere_occurrence(self):
+        """Test du filtre sur le camp au trait et du premier demi-coup de chaque partie."""
+        self.assertEqual(self.index.rechercher('R7 kg8', 'blanc'), [])
+        self.assertEqual(self.index.rechercher('R7 kg8', 'noir'), [(2, 1)])
+        self.assertEqual(self.index.parties_atteignant('pe5'), [(1, 2)])
+        self.assertEqual(self.index.parties_atteignant('K !r'), [(2, 0)])
+        self.assertEqual(self.index.parties_atteignant('ke8,g8', 'blanc'), [(1, 0), (2, 0)])
+    
+    def test_base_vide_et_index_invalide(self):
+        """Test d'un index sans position et d'un index incohérent."""
+        vide = os.path.join(self.repertoire.name, 'vide')
+        with Stockage(os.path.join(self.repertoire.name, 'vide.db')) as base:
+            self.assertEqual(construire_index(base, vide), 0)
+        self.assertEqual(IndexMotifs(vide).rechercher('K'), [])
+        
+        np.save(os.path.join(self.dossier, 'demi_coups.npy'), np.zeros(3, dtype=np.uint16))
+        with self.assertRaises(ValueError):
+            IndexMotifs(self.dossier)
+
+
+if __name__ == '__main__':
+    unittest.main()
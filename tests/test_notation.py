@@ -0,0 +1,96 @@
+"""
+Tests unitaires pour la conversion des coups en notation SAN et UCI.
+"""
+
+import unittest
+import sys
+import os
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.jeu import Jeu
+from src.piece import Tour, Cavalier, Reine
+from src.fen import plateau_depuis_fen, fen_depuis_plateau
+from src.notation import (case_vers_notation, notation_vers_case, coup_vers_san, san_vers_coup,
+                          coup_vers_uci, uci_vers_coup)
+
+
+class TestNotation(unittest.TestCase):
+    """Tests pour le module de notation."""
+    
+    def san(self, fen: str, depart, arrivee, promotion=None) -> str:
+        """Écrit un coup en SAN, vérifie qu'il se relit en ce coup et que la position est restaurée."""
+        plateau, couleur = plateau_depuis_fen(fen)
+        texte = coup_vers_san(plateau, depart, arrivee, promotion)
+        self.assertEqual(fen_depuis_plateau(plateau, couleur), fen)
+        self.assertEqual(san_vers_coup(plateau, couleur, texte), (depart, arrivee, promotion))
+        return texte
+    
+    def test_cases(self):
+        """Test de la conversion des cases dans les deux sens."""
+        self.assertEqual(notation_vers_case('e2'), (6, 4))
+        self.assertEqual(notation_vers_case('h8'), (0, 7))
+        self.assertEqual(case_vers_notation((7, 0)), 'a1')
+        with self.assertRaisesRegex(ValueError, 'Colonne invalide'):
+            notation_vers_case('z2')
+        with self.assertRaisesRegex(ValueError, 'Ligne invalide'):
+            notation_vers_case('e9')
+        with self.assertRaisesRegex(ValueError, 'Notation invalide'):
+            notation_vers_case('e10')
+    
+    def test_ambiguite_et_clouage(self):
+        """Test de la levée d'ambiguïté, qui ignore une pièce clouée."""
+        self.assertEqual(self.san('4k3/8/8/R7/8/8/8/R3K3 w - - 0 1', (7, 0), (5, 0)), 'R1a3')
+        self.assertEqual(self.san('4k3/8/8/8/8/8/4K3/R6R w - - 0 1', (7, 7), (7, 5)), 'Rhf1')
+        fen = '4k3/8/8/8/1Q1Q4/8/1Q6/4K3 w - - 0 1'
+        self.assertEqual(self.san(fen, (4, 1), (5, 2)), 'Qb4c3')
+        # Le cavalier e2 est cloué par la tour e8 : Nc3 n'est pas ambigu
+        self.assertEqual(self.san('4r1k1/8/8/8/8/8/4N3/1N2K3 w - - 0 1', (7, 1), (5, 2)), 'Nc3')
+    
+    def test_coups_speciaux(self):
+        """Test des roques, de la prise en passant, des promotions et des suffixes."""
+        fen = 'r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1'
+        self.assertEqual(self.san(fen, (7, 4), (7, 6)), 'O-O')
+        self.assertEqual(self.san(fen, (7, 4), (7, 2)), 'O-O-O')
+        self.assertEqual(self.san('4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 1', (3, 4), (2, 3)), 'exd6')
+        self.assertEqual(self.san('4k3/P7/8/8/8/8/8/4K3 w - - 0 1', (1, 0), (0, 0), Reine), 'a8=Q+')
+        self.assertEqual(self.san('4k3/P7/8/8/8/8/8/4K3 w - - 0 1', (1, 0), (0, 0), Cavalier), 'a8=N')
+        self.assertEqual(self.san('6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1', (7, 0), (0, 0)), 'Ra8#')
+    
+    def test_lecture_tolerante_et_erreurs(self):
+        """Test des variantes acceptées à la lecture et des coups refusés."""
+        plateau, couleur = plateau_depuis_fen('r3k2r/1P6/8/8/8/8/8/R3K2R w KQkq - 0 1')
+        self.assertEqual(san_vers_coup(plateau, couleur, '0-0!'), ((7, 4), (7, 6), None))
+        self.assertEqual(san_vers_coup(plateau, couleur, 'bxa8R+'), ((1, 1), (0, 0), Tour))
+        for texte in ('Nf3', 'Rb2', 'e4', 'b8=K', 'Rb1b2', 'Kf2f3', 'Qd4'):
+            with self.assertRaises(ValueError):
+                san_vers_coup(plateau, couleur, texte)
+        # Les deux tours peuvent aller en d1
+        plateau, couleur = plateau_depuis_fen('4k3/8/8/8/8/8/4K3/R6R w - - 0 1')
+        with self.assertRaisesRegex(ValueError, 'ambigu'):
+            san_vers_coup(plateau, couleur, 'Rd1')
+    
+    def test_partie_complete(self):
+        """Test de la relecture d'une partie écrite en SAN."""
+        jeu = Jeu()
+        for texte in ('e4', 'e5', 'Nf3', 'Nc6', 'Bb5', 'a6', 'Ba4', 'Nf6', 'O-O', 'Be7'):
+            depart, arrivee, promotion = san_vers_coup(jeu.plateau, jeu.joueur_actuel.couleur, texte)
+            self.assertIsNone(jeu.jouer_coup(depart, arrivee, promotion))
+        self.assertEqual(jeu.coups_san(), ['e4', 'e5', 'Nf3', 'Nc6', 'Bb5', 'a6', 'Ba4', 'Nf6',
+                                           'O-O', 'Be7'])
+    
+    def test_uci(self):
+        """Test de la notation UCI, y compris la sous-promotion."""
+        plateau, _ = plateau_depuis_fen('4k3/P7/8/8/8/8/8/4K3 w - - 0 1')
+        self.assertEqual(coup_vers_uci(plateau, ((1, 0), (0, 0))), 'a7a8q')
+        self.assertEqual(coup_vers_uci(plateau, ((1, 0), (0, 0)), Cavalier), 'a7a8n')
+        self.assertEqual(coup_vers_uci(plateau, ((7, 4), (6, 4))), 'e1e2')
+        self.assertEqual(uci_vers_coup('a7a8n'), ((1, 0), (0, 0), Cavalier))
+        for texte in ('a7a9', 'a7a8k', 'e2', 'e2e4e5'):
+            with self.assertRaises(ValueError):
+                uci_vers_coup(texte)
+
+
+if __name__ == '__main__':
+    unittest.main()
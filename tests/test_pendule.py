@@ -0,0 +1,105 @@
+"""
+Tests unitaires pour la pendule.
+"""
+
+import unittest
+import sys
+import os
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.pendule import Pendule
+from src.jeu import Jeu
+
+
+class HorlogeManuelle:
+    """Horloge avancée à la main par les tests."""
+    
+    def __init__(self):
+        """Initialise l'horloge à zéro."""
+        self.instant = 0.0
+    
+    def __call__(self) -> float:
+        """Retourne l'instant courant."""
+        return self.instant
+
+
+class TestPendule(unittest.TestCase):
+    """Tests pour la pendule à incrément."""
+    
+    def setUp(self):
+        """Crée une pendule 60 s + 2 s dont les blancs ont le trait."""
+        self.horloge = HorlogeManuelle()
+        self.pendule = Pendule(60, 2, horloge=self.horloge)
+        self.pendule.demarrer('blanc')
+    
+    def test_decompte_et_increment(self):
+        """Test que le temps du coup est décompté puis l'incrément ajouté."""
+        self.horloge.instant = 10
+        self.assertEqual(self.pendule.temps_restant('blanc'), 50)
+        
+        self.assertEqual(self.pendule.appuyer(), 10)
+        self.assertEqual(self.pendule.temps_restant('blanc'), 52)
+        self.assertEqual(self.pendule.en_marche, 'noir')
+        
+        self.horloge.instant = 15
+        self.assertEqual(self.pendule.temps_restant('noir'), 55)
+        self.assertEqual(self.pendule.temps_restant('blanc'), 52)
+    
+    def test_drapeau(self):
+        """Test qu'un camp tombé le reste malgré l'incrément."""
+        self.assertIsNone(self.pendule.couleur_tombee())
+        self.horloge.instant = 61
+        self.assertEqual(self.pendule.couleur_tombee(), 'blanc')
+        
+        self.pendule.appuyer()
+        self.assertEqual(self.pendule.couleur_tombee(), 'blanc')
+    
+    def test_affichage(self):
+        """Test de l'affichage des cadrans."""
+        self.horloge.instant = 45.5
+        self.assertEqual(str(self.pendule), "Blancs 0:14.5 | Noirs 1:00")
+
+
+class TestJeuAvecPendule(unittest.TestCase):
+    """Tests pour une partie jouée à la pendule."""
+    
+    def test_fixer_cadence(self):
+        """Test que la pendule démarre pour le joueur au trait."""
+        jeu = Jeu.depuis_fen('4k3/8/8/8/8/8/8/4K3 b - - 0 1')
+        jeu.fixer_cadence(180, 2)
+        self.assertEqual(jeu.pendule.en_marche, 'noir')
+        self.assertEqual(jeu.pendule.increment, 2)
+    
+    def test_coups_appuient_sur_la_pendule(self):
+        """Test que chaque coup passe la main à la pendule adverse."""
+        jeu = Jeu()
+        horloge = HorlogeManuelle()
+        jeu.pendule = Pendule(300, 3, horloge=horloge)
+        jeu.pendule.demarrer('blanc')
+        
+        horloge.instant = 4
+        self.assertIsNone(jeu.jouer_coup((6, 4), (4, 4)))
+        self.assertEqual(jeu.pendule.en_marche, 'noir')
+        self.assertEqual(jeu.pendule.temps_restant('blanc'), 299)
+        
+        gestion = jeu.gestion_temps()
+        self.assertLess(gestion.limite_souple, gestion.limite_dure)
+        self.assertLess(gestion.limite_dure, 300)
+    
+    def test_temps_depasse(self):
+        """Test que la partie se termine quand un drapeau tombe."""
+        jeu = Jeu()
+        horloge = HorlogeManuelle()
+        jeu.pendule = Pendule(1, horloge=horloge)
+        jeu.pendule.demarrer('blanc')
+        self.assertIsNone(jeu.resultat())
+        
+        horloge.instant = 2
+        self.assertEqual(jeu.resultat(), 'temps_depasse')
+        self.assertEqual(jeu.pendule.couleur_tombee(), 'blanc')
+
+
+if __name__ == '__main__':
+    unittest.main()
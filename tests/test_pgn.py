@@ -0,0 +1,109 @@
+"""
+Tests unitaires pour l'écriture des parties au format PGN.
+"""
+
+import unittest
+import sys
+import os
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.jeu import Jeu
+from src.piece import Cavalier
+from src.pgn import coup_vers_san, ecrire_partie, lire_parties
+
+
+class TestSan(unittest.TestCase):
+    """Tests pour la notation algébrique standard."""
+    
+    def san(self, fen: str, depart, arrivee, promotion=None) -> str:
+        """Convertit un coup joué depuis une position FEN."""
+        jeu = Jeu.depuis_fen(fen)
+        avant = jeu.vers_fen()
+        texte = coup_vers_san(jeu, depart, arrivee, promotion)
+        self.assertEqual(jeu.vers_fen(), avant)
+        return texte
+    
+    def test_coups_simples(self):
+        """Test des coups de pion et de pièce."""
+        jeu = Jeu()
+        self.assertEqual(coup_vers_san(jeu, (6, 4), (4, 4)), 'e4')
+        self.assertEqual(coup_vers_san(jeu, (7, 6), (5, 5)), 'Nf3')
+    
+    def test_ambiguite(self):
+        """Test de la levée d'ambiguïté par colonne puis par rangée."""
+        fen = 'rnbqkb1r/ppp1pppp/5n2/3p4/3P4/5N2/PPP1PPPP/RNBQKB1R w KQkq - 2 3'
+        self.assertEqual(self.san(fen, (7, 1), (6, 3)), 'Nbd2')
+        self.assertEqual(self.san('4k3/8/8/R7/8/8/8/R3K3 w - - 0 1', (7, 0), (5, 0)), 'R1a3')
+    
+    def test_roques(self):
+        """Test des deux roques."""
+        fen = 'r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1'
+        self.assertEqual(self.san(fen, (7, 4), (7, 6)), 'O-O')
+        self.assertEqual(self.san(fen, (7, 4), (7, 2)), 'O-O-O')
+    
+    def test_prise_en_passant(self):
+        """Test de la prise en passant."""
+        self.assertEqual(self.san('4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 1', (3, 4), (2, 3)), 'exd6')
+    
+    def test_promotion_echec_et_mat(self):
+        """Test de la promotion, de l'échec et du mat."""
+        fen = '4k3/P7/8/8/8/8/8/4K3 w - - 0 1'
+        self.assertEqual(self.san(fen, (1, 0), (0, 0)), 'a8=Q+')
+        self.assertEqual(self.san(fen, (1, 0), (0, 0), Cavalier), 'a8=N')
+        self.assertEqual(self.san('6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1', (7, 0), (0, 0)), 'Ra8#')
+
+
+class TestEcriturePartie(unittest.TestCase):
+    """Tests pour la mise en forme PGN."""
+    
+    def test_entetes_et_coups(self):
+        """Test de l'ordre des en-têtes et de la numérotation des coups."""
+        texte = ecrire_partie({'White': 'A', 'Black': 'B', 'Event': 'Test', 'Termination': 'normal'},
+                              ['e4', 'e5', 'Qh5', 'Nc6'], '*')
+        lignes = texte.split('\n')
+        self.assertEqual(lignes[0], '[Event "Test"]')
+        self.assertEqual(lignes[6], '[Result "*"]')
+        self.assertEqual(lignes[7], '[Termination "normal"]')
+        self.assertIn('1. e4 e5 2. Qh5 Nc6 *', texte)
+        self.assertTrue(texte.endswith('\n\n'))
+    
+    def test_noirs_au_trait_et_longueur_des_lignes(self):
+        """Test d'une partie commencée par les noirs et du découpage des lignes."""
+        texte = ecrire_partie({}, ['e5'] + ['Nf3', 'Nc6'] * 40, '1/2-1/2', noirs_commencent=True,
+                              premier_numero=12, commentaire='répétition')
+        coups = texte.split('\n\n')[1]
+        self.assertTrue(coups.startswith('12... e5 13. Nf3 Nc6'))
+        self.assertTrue(coups.rstrip().endswith('{répétition} 1/2-1/2'))
+        self.assertTrue(all(len(ligne) < 80 for ligne in coups.split('\n')))
+
+
+class TestLecturePartie(unittest.TestCase):
+    """Tests pour la lecture des fichiers PGN."""
+    
+    def test_relecture_ecriture(self):
+        """Test qu'une partie écrite par ecrire_partie est relue à l'identique."""
+        coups = ['e5'] + ['Nf3', 'Nc6'] * 40
+        texte = ecrire_partie({'White': 'A "B"'}, coups, '0-1', noirs_commencent=True,
+                              premier_numero=12, commentaire='abandon')
+        [(entetes, relus, resultat)] = list(lire_parties(texte.splitlines(True)))
+        self.assertEqual(entetes['White'], 'A "B"')
+        self.assertEqual(relus, coups)
+        self.assertEqual(resultat, '0-1')
+    
+    def test_commentaires_variantes_et_parties_sans_entete(self):
+        """Test des éléments ignorés et de la séparation des parties."""
+        texte = ('[Event "Test"]\n[Result "1-0"]\n\n'
+                 '1. e4 {commentaire\n[Event "x"] sur deux lignes} e5 2. Nf3 (2. f4 exf4 (2... d5))\n'
+                 '2...Nc6 $1 3.Bb5 ; fin de ligne\n\n'
+                 '[Event "Deux"]\n1. d4 d5 * 1. c4\n[Event "Trois"]\n[Result "0-1"]\n1. f3\n')
+        parties = list(lire_parties(texte.splitlines(True)))
+        self.assertEqual([coups for _, coups, _ in parties],
+                         [['e4', 'e5', 'Nf3', 'Nc6', 'Bb5'], ['d4', 'd5'], ['c4'], ['f3']])
+        self.assertEqual([resultat for _, _, resultat in parties], ['1-0', '*', '*', '0-1'])
+        self.assertEqual(parties[2][0], {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -11,6 +11,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 from src.plateau import Plateau
 from src.piece import Pion, Tour, Cavalier, Fou, Reine, Roi
+from src.fen import plateau_depuis_fen, fen_depuis_plateau
 
 
 class TestPlateau(unittest.TestCase):
@@ -170,6 +171,232 @@ class TestPlateau(unittest.TestCase):
                     self.assertIsInstance(piece_copiee, type(piece_originale))
                     self.assertEqual(piece_copiee.couleur, piece_originale.couleur)
                     self.assertEqual(piece_copiee.position, piece_originale.position)
+    
+    def test_copie_sur_ecriture(self):
+        """Test de la copie sur écriture : rangées partagées jusqu'à la première modification."""
+        self.plateau.initialiser()
+        pion = self.plateau.obtenir_piece((6, 4))
+        copie = self.plateau.copier()
+        self.assertIs(copie.grille[6], self.plateau.grille[6])
+        
+        copie.jouer_coup((6, 4), (4, 4))
+        self.assertIs(self.plateau.obtenir_piece((6, 4)), pion)
+        self.assertEqual(pion.position, (6, 4))
+        self.assertFalse(pion.a_bouge)
+        self.assertIsNone(self.plateau.obtenir_piece((4, 4)))
+        self.assertIsInstance(copie.obtenir_piece((4, 4)), Pion)
+        # Les rangées non modifiées restent partagées
+        self.assertIs(copie.grille[0], self.plateau.grille[0])
+        self.assertIsNot(copie.grille[6], self.plateau.grille[6])
+    
+    def test_annuler_apres_copie(self):
+        """Test de l'annulation d'un coup joué avant une copie, sans effet sur la copie."""
+        self.plateau.initialiser()
+        coup_joue = self.plateau.jouer_coup((7, 6), (5, 5))
+        copie = self.plateau.copier()
+        self.plateau.annuler_coup(coup_joue)
+        
+        self.assertIsInstance(self.plateau.obtenir_piece((7, 6)), Cavalier)
+        self.assertFalse(self.plateau.obtenir_piece((7, 6)).a_bouge)
+        cavalier = copie.obtenir_piece((5, 5))
+        self.assertIsInstance(cavalier, Cavalier)
+        self.assertEqual(cavalier.position, (5, 5))
+        self.assertTrue(cavalier.a_bouge)
+        self.assertIsNone(copie.obtenir_piece((7, 6)))
+    
+    def test_cle_pions_incrementale(self):
+        """Test de la clé des pions : inchangée par les pièces, suivie aux prises et promotions."""
+        plateau, couleur = plateau_depuis_fen('4k3/1P6/8/3p4/4P3/8/8/4K2N w - - 0 1')
+        initiale = plateau.cle_pions()
+        coups_joues = [plateau.jouer_coup((7, 7), (5, 6))]
+        self.assertEqual(plateau.cle_pions(), initiale)
+        
+        for depart, arrivee in [((0, 4), (0, 3)), ((4, 4), (3, 3)), ((0, 3), (0, 2)), ((1, 1), (0, 1))]:
+            coups_joues.append(plateau.jouer_coup(depart, arrivee))
+            couleur = 'noir' if couleur == 'blanc' else 'blanc'
+            recalculee = plateau_depuis_fen(fen_depuis_plateau(plateau, couleur))[0].cle_pions()
+            self.assertEqual(plateau.cle_pions(), recalculee, (depart, arrivee))
+        
+        while coups_joues:
+            plateau.annuler_coup(coups_joues.pop())
+        self.assertEqual(plateau.cle_pions(), initiale)
+    
+    def test_jouer_et_annuler_coup(self):
+        """Test qu'un coup joué puis annulé restaure le plateau."""
+        self.plateau.initialiser()
+        pion = self.plateau.obtenir_piece((6, 4))
+        
+        coup_joue = self.plateau.jouer_coup((6, 4), (4, 4))
+        self.assertEqual(self.plateau.obtenir_piece((4, 4)), pion)
+        self.assertEqual(self.plateau.position_en_passant, (5, 4))
+        
+        self.plateau.annuler_coup(coup_joue)
+        self.assertEqual(self.plateau.obtenir_piece((6, 4)), pion)
+        self.assertIsNone(self.plateau.obtenir_piece((4, 4)))
+        self.assertFalse(pion.a_bouge)
+        self.assertIsNone(self.plateau.position_en_passant)
+    
+    def test_jouer_coup_roque_et_en_passant(self):
+        """Test le roque et la prise en passant joués sans affichage."""
+        roi = Roi('blanc', (7, 4))
+        tour = Tour('blanc', (7, 7))
+        self.plateau.placer_piece(roi, (7, 4))
+        self.plateau.placer_piece(tour, (7, 7))
+        
+        coup_joue = self.plateau.jouer_coup((7, 4), (7, 6))
+        self.assertEqual(self.plateau.obtenir_piece((7, 5)), tour)
+        self.plateau.annuler_coup(coup_joue)
+        self.assertEqual(self.plateau.obtenir_piece((7, 7)), tour)
+        self.assertFalse(tour.a_bouge)
+        
+        pion_blanc = Pion('blanc', (3, 4))
+        pion_noir = Pion('noir', (3, 3))
+        self.plateau.placer_piece(pion_blanc, (3, 4))
+        self.plateau.placer_piece(pion_noir, (3, 3))
+        self.plateau.position_en_passant = (2, 3)
+        
+        coup_joue = self.plateau.jouer_coup((3, 4), (2, 3))
+        self.assertIsNone(self.plateau.obtenir_piece((3, 3)))
+        self.plateau.annuler_coup(coup_joue)
+        self.assertEqual(self.plateau.obtenir_piece((3, 3)), pion_noir)
+    
+    def test_attaquants(self):
+        """Test la détection des pièces qui attaquent une case."""
+        self.plateau.initialiser()
+        
+        # f3 est attaquée par le cavalier g1 et les pions e2 et g2
+        attaquants = self.plateau.attaquants((5, 5), 'blanc')
+        self.assertEqual(len(attaquants), 3)
+        self.assertFalse(self.plateau.est_case_attaquee((4, 4), 'blanc'))
+    
+    def test_echange_statique_capture_gagnante(self):
+        """Test la SEE d'une pièce non défendue."""
+        self.plateau.placer_piece(Tour('blanc', (7, 0)), (7, 0))
+        self.plateau.placer_piece(Cavalier('noir', (2, 0)), (2, 0))
+        
+        self.assertEqual(self.plateau.echange_statique((7, 0), (2, 0)), Cavalier.valeur)
+    
+    def test_echange_statique_capture_perdante(self):
+        """Test la SEE d'une reine qui prend un pion défendu."""
+        self.plateau.placer_piece(Reine('blanc', (4, 3)), (4, 3))
+        self.plateau.placer_piece(Pion('noir', (3, 4)), (3, 4))
+        self.plateau.placer_piece(Pion('noir', (2, 5)), (2, 5))
+        
+        self.assertEqual(self.plateau.echange_statique((4, 3), (3, 4)),
+                         Pion.valeur - Reine.valeur)
+    
+    def test_echange_statique_rayons_x(self):
+        """Test que la SEE voit une tour doublée derrière la première."""
+        self.plateau.placer_piece(Tour('blanc', (7, 3)), (7, 3))
+        self.plateau.placer_piece(Tour('blanc', (6, 3)), (6, 3))
+        self.plateau.placer_piece(Fou('noir', (2, 3)), (2, 3))
+        self.plateau.placer_piece(Tour('noir', (0, 3)), (0, 3))
+        
+        # TxF, TxT, TxT : les blancs gagnent le fou
+        self.assertEqual(self.plateau.echange_statique((6, 3), (2, 3)), Fou.valeur)
+    
+    def test_coup_pseudo_legal_comme_mouvements_possibles(self):
+        """Test que la validation d'un coup isolé suit les mouvements des pièces."""
+        positions = ['r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1',
+                     'rnbqkbnr/ppp1p1pp/8/3pPp2/8/8/PPPP1PPP/RNBQKBNR w KQkq f6 0 3',
+                     '8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1']
+        cases = [(ligne, colonne) for ligne in range(8) for colonne in range(8)]
+        for fen in positions:
+            plateau, _ = plateau_depuis_fen(fen)
+            for depart in cases:
+                piece = plateau.obtenir_piece(depart)
+                mouvements = piece.mouvements_possibles(plateau) if piece else []
+                for arrivee in cases:
+                    self.assertEqual(plateau.est_coup_pseudo_legal(depart, arrivee),
+                                     arrivee in mouvements, (fen, depart, arrivee))
+        self.assertFalse(plateau.est_coup_pseudo_legal((4, 1), (8, 1)))
+    
+    def test_cartes_attaques_comptent_les_attaquants(self):
+        """Test des cartes d'attaques : un compte par attaquant, sur chaque case."""
+        plateau, _ = plateau_depuis_fen('r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1')
+        plateau.activer_attaques()
+        for couleur in ('blanc', 'noir'):
+            for ligne in range(8):
+                for colonne in range(8):
+                    self.assertEqual(plateau.attaques[couleur][ligne][colonne],
+                                     len(plateau.attaquants((ligne, colonne), couleur)))
+        copie = plateau.copier()
+        self.assertEqual(copie.attaques, plateau.attaques)
+        self.assertIsNot(copie.attaques['blanc'], plateau.attaques['blanc'])
+        plateau.desactiver_attaques()
+        self.assertIsNone(plateau.attaques)
+    
+    def test_cartes_attaques_incrementales(self):
+        """Test de la mise à jour des cartes : roque, en passant, promotion, puis annulation."""
+        plateau, _ = plateau_depuis_fen('r3k2r/6P1/8/3pP3/8/8/8/R3K2R w KQkq d6 0 1')
+        plateau.activer_attaques()
+        
+        def recalculees():
+            copie = plateau.copier()
+            copie.activer_attaques()
+            return copie.attaques
+        
+        initiales = recalculees()
+        coups_joues = []
+        for depart, arrivee in [((7, 4), (7, 6)), ((0, 4), (0, 2)), ((3, 4), (2, 3)),
+                                ((0, 3), (2, 3)), ((1, 6), (0, 7))]:
+            coups_joues.append(plateau.jouer_coup(depart, arrivee))
+            self.assertEqual(plateau.attaques, recalculees(), (depart, arrivee))
+        # f8 est attaquée par la tour f1 (colonne ouverte) et la nouvelle dame h8
+        self.assertEqual(plateau.attaques['blanc'][0][5], 2)
+        self.assertTrue(plateau.est_case_attaquee((0, 5), 'blanc'))
+        while coups_joues:
+            plateau.annuler_coup(coups_joues.pop())
+        self.assertEqual(plateau.attaques, initiales)
+    
+    def test_cache_mouvements_invalidation_ciblee(self):
+        """Test du cache des mouvements : seules les pièces concernées sont recalculées."""
+        self.plateau.initialiser()
+        cavalier = self.plateau.mouvements((7, 6))
+        tour = self.plateau.mouvements((7, 0))
+        self.assertEqual(tour, [])
+        
+        coup_joue = self.plateau.jouer_coup((6, 0), (5, 0))
+        self.assertIs(self.plateau.mouvements((7, 6)), cavalier)
+        self.assertEqual(self.plateau.mouvements((7, 0)), [(6, 0)])
+        self.assertEqual(self.plateau.mouvements((6, 0)), [])
+        
+        # Coup annulé : la position redevient celle du cache
+        self.plateau.annuler_coup(coup_joue)
+        self.assertEqual(self.plateau.mouvements((7, 0)), [])
+        self.assertEqual(sorted(self.plateau.mouvements((6, 0))), [(4, 0), (5, 0)])
+    
+    def test_cache_mouvements_en_passant_et_roque(self):
+        """Test du cache des mouvements avec la prise en passant et le roque."""
+        plateau, _ = plateau_depuis_fen('4k3/3p4/8/4P3/8/8/8/4KB1R b K - 0 1')
+        self.assertNotIn((2, 3), plateau.mouvements((3, 4)))
+        self.assertNotIn((7, 6), plateau.mouvements((7, 4)))
+        
+        poussee = plateau.jouer_coup((1, 3), (3, 3))
+        self.assertIn((2, 3), plateau.mouvements((3, 4)))
+        plateau.annuler_coup(poussee)
+        self.assertNotIn((2, 3), plateau.mouvements((3, 4)))
+        
+        # Le fou libère la route du roque ; la tour qui a bougé l'interdit
+        plateau.jouer_coup((7, 5), (5, 3))
+        self.assertIn((7, 6), plateau.mouvements((7, 4)))
+        plateau.jouer_coup((7, 7), (7, 6))
+        plateau.jouer_coup((7, 6), (7, 7))
+        self.assertNotIn((7, 6), plateau.mouvements((7, 4)))
+    
+    def test_coup_nul(self):
+        """Test que le coup nul efface la prise en passant et que son annulation la rétablit."""
+        plateau, _ = plateau_depuis_fen('4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 2')
+        self.assertIn((2, 3), plateau.mouvements((3, 4)))
+        
+        ancien_en_passant = plateau.jouer_coup_nul()
+        self.assertEqual(ancien_en_passant, (2, 3))
+        self.assertIsNone(plateau.position_en_passant)
+        self.assertNotIn((2, 3), plateau.mouvements((3, 4)))
+        
+        plateau.annuler_coup_nul(ancien_en_passant)
+        self.assertEqual(plateau.position_en_passant, (2, 3))
+        self.assertIn((2, 3), plateau.mouvements((3, 4)))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,137 @@
+"""
+Tests unitaires pour la réflexion sur le temps de l'adversaire.
+"""
+
+import unittest
+import sys
+import os
+import io
+import time
+from contextlib import redirect_stdout
+from unittest import mock
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.jeu import Jeu
+from src.joueur import Joueur
+from src.encodage import encoder_position
+from src.ponderation import MoteurAsynchrone
+from src.gestion_temps import GestionTemps
+
+
+class TestMoteurAsynchrone(unittest.TestCase):
+    """Tests pour le moteur exécuté dans un processus séparé."""
+    
+    def setUp(self):
+        """Démarre un moteur limité en profondeur pour chaque test."""
+        self.moteur = MoteurAsynchrone(profondeur_max=2)
+        self.jeu = Jeu()
+    
+    def tearDown(self):
+        """Arrête le processus du moteur."""
+        self.moteur.fermer()
+    
+    def test_chercher(self):
+        """Test que la recherche retourne un coup légal et sa variante."""
+        coup, _, variante = self.moteur.chercher(self.jeu.plateau, 'blanc')
+        
+        self.assertIn(coup, self.jeu.obtenir_tous_mouvements_legaux('blanc'))
+        self.assertEqual(variante[0], coup)
+    
+    def test_ponderation_reussie(self):
+        """Test que le résultat est réutilisé quand le coup attendu est joué."""
+        self.jeu.jouer_coup((6, 4), (4, 4))
+        attendu = self.jeu.obtenir_tous_mouvements_legaux('noir')[0]
+        self.moteur.ponderer(self.jeu.plateau, 'noir', attendu)
+        self.assertTrue(self.moteur.en_ponderation)
+        
+        self.jeu.jouer_coup(*attendu)
+        resultat = self.moteur.conclure_ponderation(self.jeu.plateau, 'blanc', 5.0)
+        
+        self.assertIsNotNone(resultat)
+        self.assertIn(resultat[0], self.jeu.obtenir_tous_mouvements_legaux('blanc'))
+        self.assertFalse(self.moteur.en_ponderation)
+        self.assertEqual(self.moteur.ponderations_reussies, 1)
+    
+    def test_ponderation_manquee(self):
+        """Test qu'un autre coup abandonne la réflexion sans perturber la suite."""
+        self.jeu.jouer_coup((6, 4), (4, 4))
+        coups = self.jeu.obtenir_tous_mouvements_legaux('noir')
+        self.moteur.ponderer(self.jeu.plateau, 'noir', coups[0])
+        
+        self.jeu.jouer_coup(*coups[1])
+        self.assertIsNone(self.moteur.conclure_ponderation(self.jeu.plateau, 'blanc', 5.0))
+        self.assertFalse(self.moteur.en_ponderation)
+        self.assertEqual(self.moteur.ponderations_reussies, 0)
+        
+        coup, _, _ = self.moteur.chercher(self.jeu.plateau, 'blanc')
+        self.assertIn(coup, self.jeu.obtenir_tous_mouvements_legaux('blanc'))
+    
+    def test_ponderation_sous_cadence(self):
+        """Test qu'une réflexion réussie suit la gestion du temps transmise."""
+        self.jeu.jouer_coup((6, 4), (4, 4))
+        attendu = self.jeu.obtenir_tous_mouvements_legaux('noir')[0]
+        self.moteur.ponderer(self.jeu.plateau, 'noir', attendu)
+        
+        self.jeu.jouer_coup(*attendu)
+        resultat = self.moteur.conclure_ponderation(self.jeu.plateau, 'blanc',
+                                                    gestion_temps=GestionTemps(10.0))
+        self.assertIn(resultat[0], self.jeu.obtenir_tous_mouvements_legaux('blanc'))
+    
+    def test_temps_compte_depuis_le_lancement(self):
+        """Test qu'une réflexion sans limite de profondeur s'arrête selon le temps accordé."""
+        moteur = MoteurAsynchrone()
+        try:
+            self.jeu.jouer_coup((6, 4), (4, 4))
+            attendu = self.jeu.obtenir_tous_mouvements_legaux('noir')[0]
+            moteur.ponderer(self.jeu.plateau, 'noir', attendu)
+            time.sleep(0.5)
+            
+            self.jeu.jouer_coup(*attendu)
+            debut = time.perf_counter()
+            resultat = moteur.conclure_ponderation(self.jeu.plateau, 'blanc', 0.5)
+            
+            # Le temps accordé est déjà écoulé : la réponse est immédiate
+            self.assertLess(time.perf_counter() - debut, 0.5)
+            self.assertIn(resultat[0], self.jeu.obtenir_tous_mouvements_legaux('blanc'))
+        finally:
+            moteur.fermer()
+
+
+class TestPartieContreMoteur(unittest.TestCase):
+    """Tests pour une partie entre un joueur et le moteur."""
+    
+    def test_tours_alternes(self):
+        """Test que le moteur répond au joueur puis réfléchit pendant sa saisie."""
+        jeu = Jeu("Humain", "Moteur")
+        with MoteurAsynchrone(profondeur_max=2) as moteur:
+            jeu.affronter_moteur(moteur, 'noir', temps_par_coup=5.0)
+            with mock.patch('builtins.input', side_effect=['e2 e4']), redirect_stdout(io.StringIO()):
+                jeu.jouer_tour()
+                jeu.jouer_tour()
+            
+            self.assertEqual(len(jeu.historique), 2)
+            self.assertEqual(jeu.joueur_actuel.couleur, 'blanc')
+            self.assertTrue(moteur.en_ponderation)
+            
+            # Jouer la réponse attendue : le coup suivant du moteur vient de la réflexion
+            for depart, arrivee in jeu.obtenir_tous_mouvements_legaux('blanc'):
+                copie = jeu.plateau.copier()
+                copie.jouer_coup(depart, arrivee)
+                if encoder_position(copie, 'noir') == moteur._position_ponderee:
+                    break
+            saisie = f"{Joueur.position_vers_notation(depart)} {Joueur.position_vers_notation(arrivee)}"
+            with mock.patch('builtins.input', side_effect=[saisie]), redirect_stdout(io.StringIO()):
+                jeu.jouer_tour()
+            
+            self.assertEqual(moteur.ponderations_reussies, 1)
+            self.assertIsNotNone(jeu._reponse_ponderee)
+            with redirect_stdout(io.StringIO()):
+                jeu.jouer_tour()
+            self.assertEqual(len(jeu.historique), 4)
+            self.assertEqual(jeu.joueur_actuel.couleur, 'blanc')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+"""
+Tests unitaires pour l'instrumentation facultative.
+"""
+
+import unittest
+import json
+import pstats
+import sys
+import os
+import tempfile
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.jeu import Jeu
+from src.plateau import Plateau
+from src.piece import Pion
+from src.moteur import Moteur
+from src.profilage import Profileur, profil_optionnel
+
+
+class TestProfileur(unittest.TestCase):
+    """Tests pour le profileur."""
+    
+    def test_compteurs(self):
+        """Test que les appels sont comptés pendant l'activation."""
+        jeu = Jeu()
+        with Profileur() as profileur:
+            jeu.obtenir_tous_mouvements_legaux('blanc')
+            Moteur().chercher(jeu.plateau, 'blanc', 1)
+        
+        statistiques = profileur.statistiques
+        self.assertEqual(statistiques['Jeu.obtenir_tous_mouvements_legaux'].appels, 1)
+        self.assertEqual(statistiques['Jeu._est_roi_en_echec'].appels, 20)
+        self.assertGreaterEqual(statistiques['Pion.mouvements_possibles'].appels, 8)
+        self.assertGreater(statistiques['Moteur._compter_noeud'].appels, 0)
+        self.assertGreater(statistiques['Jeu.obtenir_tous_mouvements_legaux'].temps, 0)
+    
+    def test_restauration(self):
+        """Test que les méthodes d'origine sont restaurées à la désactivation."""
+        originale = Pion.__dict__['mouvements_possibles']
+        profileur = Profileur()
+        profileur.activer()
+        self.assertIsNot(Pion.__dict__['mouvements_possibles'], originale)
+        profileur.desactiver()
+        self.assertIs(Pion.__dict__['mouvements_possibles'], originale)
+        
+        # Désactivé, le profileur ne compte plus rien
+        Plateau().copier()
+        self.assertEqual(profileur.statistiques['Plateau.copier'].appels, 0)
+    
+    def test_recursion_comptee_une_fois(self):
+        """Test que le temps d'un appel récursif n'est pas compté deux fois."""
+        jeu = Jeu()
+        with Profileur() as profileur:
+            Moteur().chercher(jeu.plateau, 'blanc', 2)
+        quiescence = profileur.statistiques['Moteur.quiescence']
+        recherche = profileur.statistiques['Moteur.chercher']
+        self.assertLessEqual(quiescence.temps, recherche.temps)
+    
+    def test_exports(self):
+        """Test les exports JSON et pstats."""
+        with tempfile.TemporaryDirectory() as dossier:
+            chemin_json = os.path.join(dossier, 'profil.json')
+            chemin_pstats = os.path.join(dossier, 'profil.prof')
+            with profil_optionnel(chemin_json, afficher=False):
+                Jeu().obtenir_tous_mouvements_legaux('blanc')
+            with profil_optionnel(chemin_pstats, afficher=False):
+                Jeu().obtenir_tous_mouvements_legaux('blanc')
+            
+            with open(chemin_json, encoding='utf-8') as fichier:
+                rapport = json.load(fichier)
+            self.assertEqual(rapport['fonctions']['Jeu.obtenir_tous_mouvements_legaux']['appels'], 1)
+            
+            statistiques = pstats.Stats(chemin_pstats).stats
+            noms = {cle[2]: valeurs for cle, valeurs in statistiques.items()}
+            self.assertEqual(noms['Jeu.obtenir_tous_mouvements_legaux'][1], 1)
+    
+    def test_sans_profil(self):
+        """Test que sans chemin aucun profileur n'est créé."""
+        with profil_optionnel(None) as profileur:
+            self.assertIsNone(profileur)
+
+
+if __name__ == '__main__':
+    unittest.main()
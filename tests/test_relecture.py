@@ -0,0 +1,101 @@
+"""
+Tests unitaires pour la relecture des parties avec photographies.
+"""
+
+import unittest
+import sys
+import os
+import random
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.jeu import Jeu
+from src.piece import Cavalier
+from src.relecture import Relecture
+
+
+def partie_aleatoire(demi_coups: int, graine: int = 7):
+    """
+    Joue une partie de coups légaux tirés au hasard.
+    
+    Returns:
+        Tuple (partie jouée, FEN de chaque demi-coup à partir de la position de départ)
+    """
+    hasard = random.Random(graine)
+    jeu = Jeu()
+    fens = [jeu.vers_fen()]
+    for _ in range(demi_coups):
+        coups = jeu.obtenir_tous_mouvements_legaux(jeu.joueur_actuel.couleur)
+        if not coups:
+            break
+        jeu.jouer_coup(*hasard.choice(sorted(coups)))
+        fens.append(jeu.vers_fen())
+    return jeu, fens
+
+
+class TestRelecture(unittest.TestCase):
+    """Tests pour la classe Relecture."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Joue une fois la partie commune aux tests."""
+        cls.jeu, cls.fens = partie_aleatoire(120)
+    
+    def test_chaque_demi_coup(self):
+        """Test de la position à chaque demi-coup, en avançant puis en reculant."""
+        relecture = Relecture.depuis_jeu(self.jeu, intervalle=8)
+        self.assertEqual(len(relecture), len(self.fens) - 1)
+        self.assertEqual(relecture.vers_fen(), self.fens[0])
+        while relecture.avancer():
+            self.assertEqual(relecture.vers_fen(), self.fens[relecture.demi_coup])
+        self.assertEqual(relecture.demi_coup, len(relecture))
+        while relecture.reculer():
+            self.assertEqual(relecture.vers_fen(), self.fens[relecture.demi_coup])
+        self.assertEqual(relecture.demi_coup, 0)
+    
+    def test_acces_direct(self):
+        """Test de sauts au hasard : position exacte et peu de coups joués."""
+        relecture = Relecture.depuis_jeu(self.jeu, intervalle=8)
+        hasard = random.Random(3)
+        for _ in range(50):
+            cible = hasard.randrange(len(relecture) + 1)
+            avant = relecture.applications
+            relecture.aller(cible)
+            self.assertEqual(relecture.vers_fen(), self.fens[cible])
+            self.assertLess(relecture.applications - avant, 8)
+    
+    def test_pas_a_pas_sans_restauration(self):
+        """Test du déplacement d'un demi-coup : un seul coup joué ou annulé."""
+        relecture = Relecture.depuis_jeu(self.jeu, intervalle=8)
+        relecture.aller(43)
+        avant = relecture.applications
+        relecture.aller(42)
+        relecture.aller(44)
+        self.assertEqual(relecture.applications - avant, 3)
+        self.assertEqual(relecture.vers_fen(), self.fens[44])
+    
+    def test_hors_partie(self):
+        """Test des demi-coups hors de la partie et des bornes du pas à pas."""
+        relecture = Relecture.depuis_jeu(self.jeu)
+        self.assertFalse(relecture.reculer())
+        with self.assertRaises(ValueError):
+            relecture.aller(len(relecture) + 1)
+        with self.assertRaises(ValueError):
+            Relecture([], intervalle=0)
+    
+    def test_position_de_depart_et_promotion(self):
+        """Test d'une partie commencée depuis une FEN, avec sous-promotion."""
+        jeu = Jeu.depuis_fen('8/P6k/8/8/8/8/8/4K3 w - - 0 1')
+        jeu.jouer_coup((1, 0), (0, 0), Cavalier)
+        jeu.jouer_coup((1, 7), (2, 7))
+        relecture = Relecture.depuis_jeu(jeu, intervalle=1)
+        relecture.aller(1)
+        self.assertIsInstance(relecture.plateau.obtenir_piece((0, 0)), Cavalier)
+        self.assertEqual(relecture.couleur, 'noir')
+        relecture.aller(0)
+        self.assertIsNone(relecture.plateau.obtenir_piece((0, 0)))
+
+
+if __name__ == '__main__':
+    unittest.main()
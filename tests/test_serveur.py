@@ -0,0 +1,150 @@
+"""
+Tests unitaires pour le serveur de parties.
+"""
+
+import unittest
+import sys
+import os
+import json
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.serveur import ServeurParties, analyser_position, calculer_coup_moteur
+
+
+class TestServeurParties(unittest.IsolatedAsyncioTestCase):
+    """Tests pour la classe ServeurParties."""
+    
+    async def asyncSetUp(self):
+        """Démarre un serveur sur un port libre."""
+        self.serveur = ServeurParties(port=0, executeur=ThreadPoolExecutor(2))
+        await self.serveur.demarrer()
+    
+    async def asyncTearDown(self):
+        """Arrête le serveur."""
+        await self.serveur.arreter()
+    
+    async def connecter(self):
+        """Ouvre une connexion cliente."""
+        return await asyncio.open_connection('127.0.0.1', self.serveur.port)
+    
+    async def echanger(self, client, message, nombre_reponses=1):
+        """Envoie un message et lit les réponses."""
+        lecteur, ecrivain = client
+        ecrivain.write(json.dumps(message).encode() + b"\n")
+        await ecrivain.drain()
+        return [json.loads(await lecteur.readline()) for _ in range(nombre_reponses)]
+    
+    async def test_creer_et_rejoindre(self):
+        """Test la création d'une partie et l'arrivée du second joueur."""
+        blanc = await self.connecter()
+        cree, etat = await self.echanger(blanc, {'type': 'creer'}, 2)
+        self.assertEqual(cree['couleur'], 'blanc')
+        self.assertEqual(etat['trait'], 'blanc')
+        
+        noir = await self.connecter()
+        rejoint, etat_noir = await self.echanger(noir, {'type': 'rejoindre', 'partie': cree['partie']}, 2)
+        self.assertEqual(rejoint['couleur'], 'noir')
+        etat_blanc = json.loads(await blanc[0].readline())
+        self.assertEqual(etat_blanc, etat_noir)
+        
+        for _, ecrivain in (blanc, noir):
+            ecrivain.close()
+    
+    async def test_coup_diffuse_aux_deux_joueurs(self):
+        """Test qu'un coup valide est diffusé aux deux joueurs."""
+        blanc = await self.connecter()
+        cree, _ = await self.echanger(blanc, {'type': 'creer'}, 2)
+        noir = await self.connecter()
+        await self.echanger(noir, {'type': 'rejoindre', 'partie': cree['partie']}, 2)
+        await blanc[0].readline()
+        
+        etat_blanc, = await self.echanger(blanc, {'type': 'coup', 'coup': 'e2e4'})
+        etat_noir = json.loads(await noir[0].readline())
+        
+        self.assertEqual(etat_blanc['coups'], ['e2e4'])
+        self.assertEqual(etat_noir['trait'], 'noir')
+        
+        for _, ecrivain in (blanc, noir):
+            ecrivain.close()
+    
+    async def test_coup_refuse(self):
+        """Test le refus d'un coup illégal ou joué hors de son tour."""
+        blanc = await self.connecter()
+        await self.echanger(blanc, {'type': 'creer'}, 2)
+        
+        erreur, = await self.echanger(blanc, {'type': 'coup', 'coup': 'e2e5'})
+        self.assertEqual(erreur['type'], 'erreur')
+        
+        erreur, = await self.echanger(blanc, {'type': 'coup', 'coup': 'e7e5'})
+        self.assertEqual(erreur['type'], 'erreur')
+        
+        erreur, = await self.echanger(blanc, {'type': 'inconnu'})
+        self.assertEqual(erreur['type'], 'erreur')
+        blanc[1].close()
+    
+    async def test_champs_mal_types(self):
+        """Test qu'un champ d'un mauvais type est refusé sans couper la connexion."""
+        blanc = await self.connecter()
+        for message in ({'type': 'creer', 'fen': 42}, {'type': 'rejoindre', 'partie': [1]},
+                        {'type': 'coup', 'coup': 123}):
+            erreur, = await self.echanger(blanc, message)
+            self.assertEqual(erreur['type'], 'erreur')
+        
+        cree, _ = await self.echanger(blanc, {'type': 'creer'}, 2)
+        self.assertEqual(cree['type'], 'cree')
+        blanc[1].close()
+    
+    async def test_partie_contre_moteur(self):
+        """Test que le moteur répond au coup du joueur."""
+        blanc = await self.connecter()
+        await self.echanger(blanc, {'type': 'creer', 'moteur': True}, 2)
+        
+        etat, = await self.echanger(blanc, {'type': 'coup', 'coup': 'e2e4'})
+        
+        self.assertEqual(len(etat['coups']), 2)
+        self.assertEqual(etat['trait'], 'blanc')
+        blanc[1].close()
+    
+    async def test_detection_mat(self):
+        """Test que le mat est signalé aux joueurs."""
+        blanc = await self.connecter()
+        await self.echanger(blanc, {'type': 'creer', 'fen': '6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1'}, 2)
+        
+        etat, = await self.echanger(blanc, {'type': 'coup', 'coup': 'a1a8'})
+        
+        self.assertEqual(etat['resultat'], 'echec_et_mat')
+        blanc[1].close()
+    
+    async def test_nettoyage_sessions_inactives(self):
+        """Test la suppression des parties abandonnées."""
+        blanc = await self.connecter()
+        await self.echanger(blanc, {'type': 'creer'}, 2)
+        await self.echanger(blanc, {'type': 'quitter'}, 0)
+        await blanc[0].read()
+        blanc[1].close()
+        await blanc[1].wait_closed()
+        
+        self.serveur.inactivite_max = 0
+        self.assertEqual(self.serveur.nettoyer_sessions(), 1)
+        self.assertEqual(len(self.serveur.sessions), 0)
+
+
+class TestCalculsDeportes(unittest.TestCase):
+    """Tests des fonctions exécutées dans le groupe de processus."""
+    
+    def test_analyser_position(self):
+        """Test la détection du pat et de la partie en cours."""
+        self.assertEqual(analyser_position('7k/5Q2/6K1/8/8/8/8/8 b - - 0 1'), 'pat')
+        self.assertIsNone(analyser_position('rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1'))
+    
+    def test_calculer_coup_moteur(self):
+        """Test que le moteur trouve le mat en un."""
+        self.assertEqual(calculer_coup_moteur('6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1', 2), 'a1a8')
+
+
+if __name__ == '__main__':
+    unittest.main()
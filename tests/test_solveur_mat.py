@@ -0,0 +1,104 @@
+"""
+Tests unitaires pour le solveur de mats forcés.
+"""
+
+import unittest
+import sys
+import os
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.jeu import Jeu
+from src.solveur_mat import SolveurMat
+from src.piece import Cavalier
+
+
+# Dd8+ Fxd8 Te8#
+MAT_EN_DEUX = 'r1b2k1r/ppp1bppp/8/1B1Q4/5q2/2P5/PPP2PPP/R3R1K1 w - - 1 1'
+# Mat étouffé de Philidor : Cf7+ Rg8 Ch6+ Rh8 Dg8+ Txg8 Cf7#
+MAT_ETOUFFE = '3r3k/6pp/8/6N1/2Q5/8/8/6K1 w - - 0 1'
+
+
+class TestSolveurMat(unittest.TestCase):
+    """Tests pour la recherche de mat en N coups."""
+    
+    def setUp(self):
+        """Prépare un solveur pour chaque test."""
+        self.solveur = SolveurMat()
+    
+    def test_mat_en_deux(self):
+        """Test qu'un mat en deux est prouvé avec sa variante."""
+        jeu = Jeu.depuis_fen(MAT_EN_DEUX)
+        resultat = self.solveur.resoudre(jeu, 2)
+        
+        self.assertTrue(resultat.prouve)
+        self.assertEqual(resultat.coups, 2)
+        self.assertEqual(resultat.variante, [((3, 3), (0, 3), None), ((1, 4), (0, 3), None),
+                                             ((7, 4), (0, 4), None)])
+        self.assertGreater(resultat.noeuds, 0)
+    
+    def test_refutation(self):
+        """Test qu'un mat en un est réfuté avec une défense pour chaque échec."""
+        jeu = Jeu.depuis_fen(MAT_EN_DEUX)
+        resultat = self.solveur.resoudre(jeu, 1)
+        
+        self.assertFalse(resultat.prouve)
+        self.assertEqual(resultat.variante, [])
+        # Dd8+ Fxd8 et Dxf7+ Rxf7
+        self.assertEqual(resultat.refutations, {((3, 3), (0, 3), None): ((1, 4), (0, 3), None),
+                                                ((3, 3), (1, 5), None): ((0, 5), (1, 5), None)})
+    
+    def test_mat_le_plus_court(self):
+        """Test que le solveur annonce le mat le plus court et la défense la plus longue."""
+        jeu = Jeu.depuis_fen(MAT_ETOUFFE)
+        resultat = self.solveur.resoudre(jeu, 5)
+        
+        self.assertTrue(resultat.prouve)
+        self.assertEqual(resultat.coups, 4)
+        self.assertEqual(len(resultat.variante), 7)
+        # Après Ch6+, le roi retourne en h8 plutôt que d'être maté en f8
+        self.assertEqual(resultat.variante[3], ((0, 6), (0, 7), None))
+    
+    def test_plateau_restaure(self):
+        """Test que la recherche laisse la position inchangée."""
+        jeu = Jeu.depuis_fen(MAT_ETOUFFE)
+        self.solveur.resoudre(jeu, 4)
+        self.assertEqual(jeu.vers_fen(), Jeu.depuis_fen(MAT_ETOUFFE).vers_fen())
+    
+    def test_limite_noeuds(self):
+        """Test qu'une recherche interrompue ne conclut pas et restaure la position."""
+        jeu = Jeu.depuis_fen(MAT_ETOUFFE)
+        resultat = SolveurMat(noeuds_max=10).resoudre(jeu, 4)
+        
+        self.assertIsNone(resultat.prouve)
+        self.assertEqual(jeu.vers_fen(), Jeu.depuis_fen(MAT_ETOUFFE).vers_fen())
+    
+    def test_echecs_seulement(self):
+        """Test que l'attaquant ne joue que des coups d'échec."""
+        # Rf7 puis Th1# mate en deux, mais le premier coup ne donne pas échec
+        jeu = Jeu.depuis_fen('7k/8/5K2/8/8/8/8/6R1 w - - 0 1')
+        resultat = self.solveur.resoudre(jeu, 2)
+        
+        self.assertFalse(resultat.prouve)
+        self.assertEqual(set(resultat.refutations), {((7, 6), (0, 6), None), ((7, 6), (7, 7), None)})
+    
+    def test_sous_promotion_attaquant(self):
+        """Test qu'un mat par sous-promotion est trouvé (f8=C#, une dame ne mate pas)."""
+        jeu = Jeu.depuis_fen('6nb/5Ppk/7p/5K2/8/8/8/8 w - - 0 1')
+        resultat = self.solveur.resoudre(jeu, 1)
+        
+        self.assertTrue(resultat.prouve)
+        self.assertEqual(resultat.variante, [((1, 5), (0, 5), Cavalier)])
+    
+    def test_sous_promotion_defenseur(self):
+        """Test qu'une défense par sous-promotion réfute le mat (Da1+ e1=C+)."""
+        jeu = Jeu.depuis_fen('8/8/8/8/8/Q4KR1/4p3/7k w - - 0 1')
+        resultat = self.solveur.resoudre(jeu, 2)
+        
+        self.assertFalse(resultat.prouve)
+        self.assertEqual(resultat.refutations[((5, 0), (7, 0), None)], ((6, 4), (7, 4), Cavalier))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+"""
+Tests unitaires pour l'enregistrement des parties dans une base SQLite.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.jeu import Jeu
+from src.piece import Cavalier
+from src.stockage import Stockage, encoder_coups, decoder_coups
+
+# 1. e4 e5 2. Cf3 Cc6 3. Fb5 a6
+PARTIE_ESPAGNOLE = [((6, 4), (4, 4)), ((1, 4), (3, 4)), ((7, 6), (5, 5)),
+                    ((0, 1), (2, 2)), ((7, 5), (3, 1)), ((1, 0), (2, 0))]
+
+
+def jouer(jeu: Jeu, coups) -> Jeu:
+    """Joue une suite de coups sur une partie."""
+    for coup in coups:
+        jeu.jouer_coup(*coup)
+    return jeu
+
+
+class TestStockage(unittest.TestCase):
+    """Tests pour la classe Stockage."""
+    
+    def setUp(self):
+        """Ouvre une base dans un répertoire temporaire."""
+        self.repertoire = tempfile.TemporaryDirectory()
+        self.chemin = os.path.join(self.repertoire.name, 'parties.db')
+        self.stockage = Stockage(self.chemin)
+    
+    def tearDown(self):
+        """Ferme la base et supprime le répertoire."""
+        self.stockage.fermer()
+        self.repertoire.cleanup()
+    
+    def test_encodage_coups(self):
+        """Test de l'aller-retour de l'encodage des coups sur deux octets."""
+        coups = [((6, 4), (4, 4), None), ((1, 0), (0, 1), Cavalier)]
+        donnees = encoder_coups(coups)
+        self.assertEqual(len(donnees), 4)
+        self.assertEqual(decoder_coups(donnees), coups)
+    
+    def test_aller_retour(self):
+        """Test de l'enregistrement puis du chargement d'une partie."""
+        jeu = jouer(Jeu("Alice", "Bob"), PARTIE_ESPAGNOLE)
+        identifiant = self.stockage.enregistrer(jeu)
+        self.stockage.fermer()
+        
+        self.stockage = Stockage(self.chemin)
+        charge = self.stockage.charger(identifiant)
+        self.assertEqual(charge.vers_fen(), jeu.vers_fen())
+        self.assertEqual(charge.joueur_blanc.nom, "Alice")
+        self.assertEqual(charge.joueur_actuel.couleur, 'blanc')
+        self.assertEqual(len(charge.historique), 6)
+        self.assertEqual(self.stockage.lister(), [(identifiant, "Alice", "Bob", '*', 6)])
+    
+    def test_charger_demi_coup(self):
+        """Test du chargement d'une partie à un demi-coup donné."""
+        jeu = jouer(Jeu(), PARTIE_ESPAGNOLE)
+        identifiant = self.stockage.enregistrer(jeu)
+        attendu = jouer(Jeu(), PARTIE_ESPAGNOLE[:3])
+        
+        charge = self.stockage.charger(identifiant, 3)
+        self.assertEqual(charge.vers_fen(), attendu.vers_fen())
+        self.assertEqual(charge.joueur_actuel.couleur, 'noir')
+        self.assertFalse(charge.partie_terminee)
+        with self.assertRaises(ValueError):
+            self.stockage.charger(identifiant, 7)
+        with self.assertRaises(KeyError):
+            self.stockage.charger(identifiant + 1)
+    
+    def test_promotion_et_position_depart(self):
+        """Test d'une partie commencée depuis une FEN avec sous-promotion."""
+        fen = '8/P6k/8/8/8/8/8/4K3 w - - 0 1'
+        jeu = Jeu.depuis_fen(fen)
+        jeu.jouer_coup((1, 0), (0, 0), Cavalier)
+        identifiant = self.stockage.enregistrer(jeu)
+        
+        charge = self.stockage.charger(identifiant)
+        self.assertIsInstance(charge.plateau.obtenir_piece((0, 0)), Cavalier)
+        self.assertEqual(charge.fen_depart, fen)
+        self.assertEqual(charge.coups_joues(), [((1, 0), (0, 0), Cavalier)])
+    
+    def test_parties_atteignant(self):
+        """Test de la recherche des parties passant par une position."""
+        espagnole = self.stockage.enregistrer(jouer(Jeu(), PARTIE_ESPAGNOLE))
+        # Même position après 2... Cc6 par interversion : 1. Cf3 e5 2. e4 Cc6
+        interversion = self.stockage.enregistrer(jouer(Jeu(), [
+            ((7, 6), (5, 5)), ((1, 4), (3, 4)), ((6, 4), (4, 4)), ((0, 1), (2, 2))]))
+        self.stockage.enregistrer(jouer(Jeu(), [((6, 3), (4, 3))]))
+        
+        position = jouer(Jeu(), PARTIE_ESPAGNOLE[:4])
+        self.assertEqual(self.stockage.parties_atteignant(position.plateau, 'blanc'),
+                         [(espagnole, 4), (interversion, 4)])
+        self.assertEqual(self.stockage.parties_atteignant(position.plateau, 'noir'), [])
+    
+    def test_mise_a_jour_partie_en_cours(self):
+        """Test de l'enregistrement répété d'une partie en cours."""
+        jeu = Jeu()
+        identifiant = None
+        for coup in PARTIE_ESPAGNOLE:
+            jeu.jouer_coup(*coup)
+            identifiant = self.stockage.enregistrer(jeu, identifiant)
+            self.stockage.valider()
+        
+        self.assertEqual(len(self.stockage.lister()), 1)
+        nombre = self.stockage.connexion.execute("SELECT COUNT(*) FROM positions").fetchone()[0]
+        self.assertEqual(nombre, len(PARTIE_ESPAGNOLE) + 1)
+        self.assertEqual(self.stockage.charger(identifiant).vers_fen(), jeu.vers_fen())
+    
+    def test_enregistrement_par_lots(self):
+        """Test de l'enregistrement de nombreuses parties en plusieurs lots."""
+        self.stockage.taille_lot = 4
+        jeux = [jouer(Jeu(f"B{i}", f"N{i}"), PARTIE_ESPAGNOLE[:i % 6 + 1]) for i in range(10)]
+        identifiants = self.stockage.enregistrer_parties(jeux)
+        
+        self.assertEqual(identifiants, list(range(1, 11)))
+        self.assertEqual([ligne[4] for ligne in self.stockage.lister()],
+                         [i % 6 + 1 for i in range(10)])
+    
+    def test_parcourir(self):
+        """Test du parcours des parties sans reconstruction."""
+        self.stockage.enregistrer(jouer(Jeu(), PARTIE_ESPAGNOLE[:2]))
+        self.stockage.enregistrer(Jeu.depuis_fen('4k3/8/8/8/8/8/8/4K3 w - - 0 1'))
+        self.assertEqual(list(self.stockage.parcourir()),
+                         [(1, Jeu().vers_fen(), [coup + (None,) for coup in PARTIE_ESPAGNOLE[:2]]),
+                          (2, '4k3/8/8/8/8/8/8/4K3 w - - 0 1', [])])
+    
+    def test_resultat_partie_terminee(self):
+        """Test du résultat enregistré pour une partie terminée par le mat."""
+        # Mat du berger
+        jeu = jouer(Jeu(), [((6, 4), (4, 4)), ((1, 4), (3, 4)), ((7, 5), (4, 2)),
+                            ((0, 1), (2, 2)), ((7, 3), (3, 7)), ((0, 6), (2, 5)),
+                            ((3, 7), (1, 5))])
+        jeu.partie_terminee = True
+        identifiant = self.stockage.enregistrer(jeu)
+        self.assertEqual(self.stockage.lister()[0][3], '1-0')
+        self.assertTrue(self.stockage.charger(identifiant).partie_terminee)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,174 @@
+"""
+Tests unitaires pour les tables de finales.
+"""
+
+import unittest
+import sys
+import os
+import struct
+import tempfile
+from array import array
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.fen import plateau_depuis_fen
+from src.moteur import Moteur
+from src.tables_finales import (DescriptionTable, TablesFinales, signature_canonique,
+                                materiel_insuffisant, dependances, decoder,
+                                _decrire_position, _analyser_position, _retrograder,
+                                ENTETE, FORMAT_ENTETE, NULLE)
+
+
+def case(notation: str) -> int:
+    """Convertit une case en notation algébrique (ex: 'e4') en indice 0..63."""
+    return (8 - int(notation[1])) * 8 + ord(notation[0]) - ord('a')
+
+
+class TestDescription(unittest.TestCase):
+    """Tests pour l'indexation des tables."""
+    
+    def test_aller_retour_indice(self):
+        """Test que cases(indice(cases)) redonne le placement canonique."""
+        description = DescriptionTable('KQK')
+        for indice in (0, 1, 4095, description.taille // 2, description.taille - 1):
+            self.assertEqual(description.indice(description.cases(indice)), indice)
+    
+    def test_symetrie(self):
+        """Test que deux positions symétriques ont le même indice."""
+        description = DescriptionTable('KRK')
+        originale = [case('b1'), case('h7'), case('d5')]
+        miroir = [case('g1'), case('a7'), case('e5')]
+        self.assertEqual(description.indice(originale), description.indice(miroir))
+    
+    def test_taille(self):
+        """Test la taille d'une table avec et sans pion."""
+        self.assertEqual(DescriptionTable('KQK').taille, 10 * 64 * 64)
+        self.assertEqual(DescriptionTable('KPK').taille, 32 * 64 * 64)
+    
+    def test_signature_invalide(self):
+        """Test qu'une signature sans deux rois est refusée."""
+        with self.assertRaises(ValueError):
+            DescriptionTable('KQQ')
+
+
+class TestSignatures(unittest.TestCase):
+    """Tests pour les signatures de matériel."""
+    
+    def test_camp_le_plus_fort_en_premier(self):
+        """Test que le camp le plus fort joue les blancs dans la table."""
+        self.assertEqual(signature_canonique('KQ', 'K'), ('KQK', False))
+        self.assertEqual(signature_canonique('K', 'KR'), ('KRK', True))
+        self.assertEqual(signature_canonique('KN', 'KB'), ('KBKN', True))
+    
+    def test_materiel_insuffisant(self):
+        """Test la détection des finales nulles par manque de matériel."""
+        self.assertTrue(materiel_insuffisant('KK'))
+        self.assertTrue(materiel_insuffisant('KNK'))
+        self.assertFalse(materiel_insuffisant('KPK'))
+    
+    def test_dependances(self):
+        """Test les tables atteignables par capture ou promotion."""
+        self.assertEqual(dependances('KQK'), [])
+        self.assertEqual(dependances('KPK'), ['KQK', 'KRK'])
+        self.assertEqual(dependances('KQKR'), ['KQK', 'KRK'])
+    
+    def test_decrire_position_inversee(self):
+        """Test qu'une position où les noirs ont la dame est sondée en miroir."""
+        plateau, couleur = plateau_depuis_fen('8/8/8/4k3/8/8/3q4/4K3 w - - 0 1')
+        signature, inverse, cases, couleur_table = _decrire_position(plateau, couleur)
+        self.assertEqual(signature, 'KQK')
+        self.assertTrue(inverse)
+        self.assertEqual(couleur_table, 'noir')
+        self.assertEqual(cases, [case('e4'), case('d7'), case('e8')])
+
+
+class TestGeneration(unittest.TestCase):
+    """Tests pour l'analyse des positions et l'analyse rétrograde."""
+    
+    def test_position_illegale(self):
+        """Test qu'une position où le camp qui n'a pas le trait est en échec est illégale."""
+        description = DescriptionTable('KQK')
+        cases = [case('a1'), case('e1'), case('e8')]
+        self.assertIsNone(_analyser_position(description, None, cases, 'blanc'))
+    
+    def test_position_mat(self):
+        """Test qu'une position de mat n'a aucun successeur."""
+        description = DescriptionTable('KQK')
+        cases = [case('c1'), case('b2'), case('a1')]
+        self.assertEqual(_analyser_position(description, None, cases, 'noir'), (True, []))
+    
+    def test_successeurs_internes(self):
+        """Test que les coups sans capture mènent à des indices de la même table."""
+        description = DescriptionTable('KQK')
+        en_echec, successeurs = _analyser_position(
+            description, None, [case('a1'), case('d3'), case('h8')], 'blanc')
+        self.assertFalse(en_echec)
+        # 3 coups de roi et 25 coups de dame
+        self.assertEqual(len(successeurs), 3 + 25)
+        self.assertTrue(all(successeur >= description.taille for successeur in successeurs))
+    
+    def test_retrograder(self):
+        """Test l'analyse rétrograde sur un petit graphe de coups."""
+        # 0 : mat ; 1 : mate en un coup ; 2 : tous ses coups mènent à 1 ;
+        # 3 : pat ; 4 : illégale ; 5 : une issue externe perdue en 2 demi-coups
+        statuts = bytearray([1, 0, 0, 0, 2, 0])
+        nombres = array('H', [0, 2, 1, 0, 0, 1])
+        successeurs = array('i', [3, 0, 1, -(1 + 3)])
+        valeurs = _retrograder(statuts, nombres, successeurs)
+        
+        self.assertEqual(decoder(valeurs[0]), ('perte', 0))
+        self.assertEqual(decoder(valeurs[1]), ('gain', 1))
+        self.assertEqual(decoder(valeurs[2]), ('perte', 2))
+        self.assertEqual(decoder(valeurs[3]), ('nulle', 0))
+        self.assertIsNone(decoder(valeurs[4]))
+        self.assertEqual(decoder(valeurs[5]), ('gain', 3))
+
+
+class TestSondage(unittest.TestCase):
+    """Tests pour la lecture d'une table projetée en mémoire."""
+    
+    def setUp(self):
+        """Écrit une table KQK nulle partout sauf pour une position de mat en un."""
+        self.dossier = tempfile.TemporaryDirectory()
+        description = DescriptionTable('KQK')
+        valeurs = bytearray([NULLE]) * (2 * description.taille)
+        # Blancs : Rc3, Dd2, noirs : Ra1 ; les blancs matent par Db2
+        indice = description.indice([case('c3'), case('d2'), case('a1')])
+        valeurs[indice] = 1 + 1
+        # Même placement, noirs au trait : Rb1 forcé puis Db2 mat
+        valeurs[description.taille + indice] = 1 + 2
+        with open(os.path.join(self.dossier.name, 'KQK.tbl'), 'wb') as fichier:
+            fichier.write(struct.pack(FORMAT_ENTETE, ENTETE, description.taille, 0))
+            fichier.write(valeurs)
+        self.tables = TablesFinales(self.dossier.name)
+    
+    def tearDown(self):
+        """Ferme les tables et supprime le dossier temporaire."""
+        self.tables.fermer()
+        self.dossier.cleanup()
+    
+    def test_sonder(self):
+        """Test le sondage d'une position et de sa version aux couleurs inversées."""
+        self.assertEqual(self.tables.pieces_max, 3)
+        plateau, couleur = plateau_depuis_fen('8/8/8/8/8/2K5/3Q4/k7 w - - 0 1')
+        self.assertEqual(self.tables.sonder(plateau, couleur), ('gain', 1))
+        plateau, couleur = plateau_depuis_fen('K7/3q4/2k5/8/8/8/8/8 b - - 0 1')
+        self.assertEqual(self.tables.sonder(plateau, couleur), ('gain', 1))
+    
+    def test_materiel_insuffisant(self):
+        """Test qu'une finale sans matériel suffisant est nulle sans table."""
+        plateau, couleur = plateau_depuis_fen('8/8/8/4k3/8/8/3N4/4K3 w - - 0 1')
+        self.assertEqual(self.tables.sonder(plateau, couleur), ('nulle', 0))
+    
+    def test_moteur(self):
+        """Test que le moteur utilise le score des tables pendant la recherche."""
+        moteur = Moteur(tables_finales=self.tables)
+        plateau, couleur = plateau_depuis_fen('8/8/8/8/8/2K5/8/k2Q4 w - - 0 1')
+        coup, score = moteur.chercher(plateau, couleur, 2)
+        self.assertEqual(coup, ((7, 3), (6, 3)))
+        self.assertEqual(score, Moteur.SCORE_MAT - 1 - 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
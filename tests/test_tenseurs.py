@@ -0,0 +1,66 @@
+"""
+Tests unitaires pour l'export des positions en tableaux NumPy.
+"""
+
+import unittest
+import sys
+import os
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.fen import FEN_INITIALE, plateau_depuis_fen
+from src.encodage import encoder_fen
+from src.tenseurs import np, exporter, encoder_lot
+
+FEN_EN_PASSANT = '4k2r/8/8/3pP3/8/8/8/R3K3 w Qk d6 0 1'
+
+
+@unittest.skipIf(np is None, "NumPy n'est pas installé")
+class TestTenseurs(unittest.TestCase):
+    """Tests pour l'export en tenseurs."""
+    
+    def test_formes(self):
+        """Test les dimensions et le type des tableaux produits."""
+        pieces, auxiliaires = exporter([FEN_INITIALE, FEN_EN_PASSANT])
+        self.assertEqual(pieces.shape, (2, 12, 8, 8))
+        self.assertEqual(auxiliaires.shape, (2, 6, 8, 8))
+        self.assertEqual(pieces.dtype, np.bool_)
+        
+        pieces, _ = exporter([FEN_INITIALE], np.uint8)
+        self.assertEqual(pieces.dtype, np.uint8)
+    
+    def test_plans_pieces(self):
+        """Test que chaque plan correspond aux pièces du plateau."""
+        pieces, _ = exporter([FEN_INITIALE])
+        self.assertEqual(int(pieces.sum()), 32)
+        self.assertTrue(pieces[0, 0, 6].all())        # Pions blancs en ligne 6
+        self.assertTrue(pieces[0, 6, 1].all())        # Pions noirs en ligne 1
+        self.assertTrue(pieces[0, 5, 7, 4])           # Roi blanc en e1
+        self.assertTrue(pieces[0, 11, 0, 4])          # Roi noir en e8
+        self.assertTrue(pieces[0, 1, 7, 1] and pieces[0, 1, 7, 6])  # Cavaliers blancs
+    
+    def test_plans_auxiliaires(self):
+        """Test les plans de trait, de roque et de prise en passant."""
+        _, auxiliaires = exporter([FEN_EN_PASSANT, '8/8/8/4k3/8/8/3q4/4K3 b - - 0 1'])
+        self.assertTrue(auxiliaires[0, 0].all())      # Blancs au trait
+        self.assertFalse(auxiliaires[1, 0].any())
+        # Droits Q et k seulement
+        self.assertEqual([bool(auxiliaires[0, plan].all()) for plan in range(1, 5)],
+                         [False, True, True, False])
+        self.assertEqual(int(auxiliaires[0, 5].sum()), 1)
+        self.assertTrue(auxiliaires[0, 5, 2, 3])      # Case d6
+        self.assertFalse(auxiliaires[1, 5].any())
+    
+    def test_sources_equivalentes(self):
+        """Test que FEN, plateaux et encodages donnent les mêmes tenseurs."""
+        plateau, couleur = plateau_depuis_fen(FEN_EN_PASSANT)
+        lot = encoder_lot([FEN_EN_PASSANT, (plateau, couleur), encoder_fen(FEN_EN_PASSANT)])
+        self.assertTrue((lot[0] == lot[1]).all() and (lot[1] == lot[2]).all())
+        pieces, auxiliaires = exporter([FEN_EN_PASSANT, (plateau, couleur)])
+        self.assertTrue((pieces[0] == pieces[1]).all())
+        self.assertTrue((auxiliaires[0] == auxiliaires[1]).all())
+
+
+if __name__ == '__main__':
+    unittest.main()
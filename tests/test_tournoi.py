@@ -0,0 +1,155 @@
+"""
+Tests unitaires pour les matchs entre moteurs.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.fen import FEN_INITIALE
+from src.tournoi import (Adjudication, ConfigurationMoteur, Controle, Score, Sprt, Tournoi,
+                         jouer_partie, lire_ouvertures, ouvertures_aleatoires)
+
+RACINE = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+# Les blancs matent en un coup (Ta8#)
+MAT_EN_UN = '6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1'
+
+
+def bilan(victoires: int, nulles: int, defaites: int) -> Score:
+    """Construit un bilan."""
+    score = Score()
+    score.victoires, score.nulles, score.defaites = victoires, nulles, defaites
+    return score
+
+
+class TestStatistiques(unittest.TestCase):
+    """Tests pour l'estimation de l'Elo et le SPRT."""
+    
+    def test_elo(self):
+        """Test de l'écart d'Elo et de sa marge."""
+        elo, marge = bilan(50, 0, 50).elo()
+        self.assertEqual(elo, 0.0)
+        elo, marge = bilan(60, 30, 10).elo()
+        self.assertAlmostEqual(elo, 190.8, places=1)
+        self.assertGreater(marge, 0)
+        self.assertLess(bilan(600, 300, 100).elo()[1], marge)
+    
+    def test_sprt(self):
+        """Test que le SPRT accepte l'hypothèse soutenue par les résultats."""
+        sprt = Sprt(0, 10)
+        self.assertIsNone(sprt.decision(bilan(3, 2, 1)))
+        self.assertEqual(sprt.decision(bilan(400, 200, 250)), 'H1')
+        self.assertEqual(sprt.decision(bilan(250, 200, 400)), 'H0')
+        self.assertEqual(sprt.llr(Score()), 0.0)
+
+
+class TestConfiguration(unittest.TestCase):
+    """Tests pour la lecture des configurations et des ouvertures."""
+    
+    def test_configuration_moteur(self):
+        """Test de la lecture d'une configuration de moteur."""
+        configuration = ConfigurationMoteur.depuis_texte('test:profondeur=2,elaguer_captures_perdantes=0')
+        self.assertEqual(configuration.nom, 'test')
+        self.assertEqual(configuration.options, {'profondeur': 2, 'elaguer_captures_perdantes': 0})
+        self.assertIsNone(configuration.commande)
+        
+        externe = ConfigurationMoteur.depuis_texte('base:commande=python3 main_uci.py,Hash=32')
+        self.assertEqual(externe.commande, 'python3 main_uci.py')
+        self.assertEqual(externe.options, {'Hash': 32})
+        
+        with self.assertRaises(ValueError):
+            ConfigurationMoteur.depuis_texte('test:profondeur')
+    
+    def test_lire_ouvertures(self):
+        """Test de la lecture d'un fichier de positions et de suites de coups."""
+        with tempfile.TemporaryDirectory() as dossier:
+            chemin = os.path.join(dossier, 'ouvertures.txt')
+            with open(chemin, 'w', encoding='utf-8') as fichier:
+                fichier.write("# Ouvertures\n\ne2e4 e7e5\n"
+                              "rnbqkbnr/pppp1ppp/8/4p3/4P3/8/PPPP1PPP/RNBQKBNR w KQkq e6;\n")
+            ouvertures = lire_ouvertures(chemin)
+        
+        self.assertEqual(ouvertures[0], (FEN_INITIALE, ['e2e4', 'e7e5']))
+        self.assertEqual(ouvertures[1], ('rnbqkbnr/pppp1ppp/8/4p3/4P3/8/PPPP1PPP/RNBQKBNR w KQkq e6 0 1', []))
+    
+    def test_ouvertures_aleatoires(self):
+        """Test que le tirage est reproductible et sans doublon."""
+        ouvertures = ouvertures_aleatoires(5, 4, graine=3)
+        self.assertEqual(ouvertures, ouvertures_aleatoires(5, 4, graine=3))
+        self.assertEqual(len(set(tuple(coups) for _, coups in ouvertures)), 5)
+        self.assertTrue(all(len(coups) == 4 for _, coups in ouvertures))
+    
+    def test_adjudication(self):
+        """Test de l'arbitrage sur le score."""
+        adjudication = Adjudication(nulle_apres=10, nulle_duree=4, victoire_duree=3)
+        self.assertEqual(adjudication.juger([0, 1500, 1200, 1100], 5), '1-0')
+        self.assertIsNone(adjudication.juger([0, 1500, None, 1100], 5))
+        self.assertIsNone(adjudication.juger([0, 5, -5, 0], 5))
+        self.assertEqual(adjudication.juger([0, 5, -5, 0], 10), '1/2-1/2')
+
+
+class TestParties(unittest.TestCase):
+    """Tests pour le déroulement des parties et du tournoi."""
+    
+    def test_mat(self):
+        """Test qu'une partie se termine par le mat et s'écrit en PGN."""
+        moteur = ConfigurationMoteur('interne')
+        resultat = jouer_partie(1, moteur, ConfigurationMoteur('autre'), (MAT_EN_UN, []),
+                                Controle(profondeur=2))
+        
+        self.assertEqual(resultat.resultat, '1-0')
+        self.assertEqual(resultat.motif, 'échec et mat')
+        self.assertIn('[FEN "6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1"]', resultat.pgn)
+        self.assertIn('1. Ra8# {échec et mat} 1-0', resultat.pgn)
+    
+    def test_moteur_uci(self):
+        """Test d'une partie contre un moteur UCI externe."""
+        externe = ConfigurationMoteur('uci', commande=f"{sys.executable} {os.path.join(RACINE, 'main_uci.py')}")
+        resultat = jouer_partie(1, externe, ConfigurationMoteur('interne'), (MAT_EN_UN, []),
+                                Controle(profondeur=2))
+        self.assertEqual(resultat.resultat, '1-0')
+        self.assertEqual(resultat.demi_coups, 1)
+    
+    def test_tournoi(self):
+        """Test d'un petit match : couleurs alternées, PGN complet et tableau."""
+        moteurs = [ConfigurationMoteur('a', {'taille_table_mo': 1}),
+                   ConfigurationMoteur('b', {'elaguer_captures_perdantes': False})]
+        with tempfile.TemporaryDirectory() as dossier:
+            chemin = os.path.join(dossier, 'match.pgn')
+            tournoi = Tournoi(moteurs, Controle(profondeur=1), ouvertures_aleatoires(2, 2, graine=1),
+                              parties_max=4, concurrence=2, fichier_pgn=chemin,
+                              adjudication=Adjudication(demi_coups_max=6), graine=1)
+            scores = tournoi.lancer(afficher=None)
+            with open(chemin, encoding='utf-8') as fichier:
+                pgn = fichier.read()
+        
+        self.assertEqual(scores[('a', 'b')].parties, 4)
+        self.assertEqual(pgn.count('[Event '), 4)
+        self.assertEqual(sorted(resultat.blancs for resultat in tournoi.resultats), ['a', 'a', 'b', 'b'])
+        self.assertIn('a contre b', tournoi.tableau())
+    
+    def test_arret_sprt(self):
+        """Test que le match s'arrête dès que le SPRT conclut."""
+        moteurs = [ConfigurationMoteur('a'), ConfigurationMoteur('b')]
+        # Bornes nulles : le test conclut dès la première partie
+        tournoi = Tournoi(moteurs, Controle(profondeur=1), ouvertures_aleatoires(2, 2, graine=1),
+                          parties_max=10, concurrence=1, sprt=Sprt(alpha=0.5, beta=0.5),
+                          adjudication=Adjudication(demi_coups_max=4))
+        tournoi.lancer(afficher=None)
+        
+        self.assertEqual(len(tournoi.resultats), 1)
+        self.assertIsNotNone(tournoi.decision)
+        self.assertIn('SPRT', tournoi.tableau())
+    
+    def test_participants_invalides(self):
+        """Test du refus de participants en double."""
+        with self.assertRaises(ValueError):
+            Tournoi([ConfigurationMoteur('a'), ConfigurationMoteur('a')], Controle(profondeur=1), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
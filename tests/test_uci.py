@@ -0,0 +1,161 @@
+"""
+Tests unitaires pour le protocole UCI.
+"""
+
+import unittest
+import sys
+import os
+import io
+import time
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.uci import ProtocoleUCI, uci_vers_coup, coup_vers_uci
+from src.moteur import Moteur
+from src.piece import Cavalier, Pion
+
+
+class TestProtocoleUCI(unittest.TestCase):
+    """Tests pour la classe ProtocoleUCI."""
+    
+    def setUp(self):
+        """Initialise un protocole écrivant dans un tampon."""
+        self.sortie = io.StringIO()
+        self.protocole = ProtocoleUCI(self.sortie, Moteur(taille_table_mo=1))
+    
+    def lignes(self):
+        """Retourne les lignes envoyées par le protocole."""
+        return self.sortie.getvalue().splitlines()
+    
+    def test_uci_et_isready(self):
+        """Test l'identification du moteur."""
+        self.protocole.traiter('uci')
+        self.protocole.traiter('isready')
+        
+        lignes = self.lignes()
+        self.assertTrue(lignes[0].startswith('id name'))
+        self.assertIn('uciok', lignes)
+        self.assertEqual(lignes[-1], 'readyok')
+    
+    def test_position_startpos_moves(self):
+        """Test la mise en place d'une position avec des coups."""
+        self.protocole.traiter('position startpos moves e2e4 e7e5 g1f3')
+        
+        self.assertEqual(self.protocole.couleur, 'noir')
+        self.assertIsInstance(self.protocole.plateau.obtenir_piece((5, 5)), Cavalier)
+        self.assertIsInstance(self.protocole.plateau.obtenir_piece((3, 4)), Pion)
+    
+    def test_go_depth(self):
+        """Test qu'une recherche à profondeur fixe répond par bestmove."""
+        self.protocole.traiter('position startpos')
+        self.protocole.traiter('go depth 2')
+        self.protocole.attendre()
+        
+        lignes = self.lignes()
+        self.assertTrue(any(ligne.startswith('info depth 2') for ligne in lignes))
+        self.assertTrue(lignes[-1].startswith('bestmove '))
+    
+    def test_go_mat_en_un(self):
+        """Test que le moteur annonce un mat en un."""
+        self.protocole.traiter('position fen 6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1')
+        self.protocole.traiter('go depth 3')
+        self.protocole.attendre()
+        
+        lignes = self.lignes()
+        self.assertEqual(lignes[-1], 'bestmove a1a8')
+        self.assertTrue(any('score mate 1' in ligne for ligne in lignes))
+    
+    def test_stop_interrompt_recherche_infinie(self):
+        """Test que 'stop' termine une recherche infinie."""
+        self.protocole.traiter('position startpos')
+        self.protocole.traiter('go infinite')
+        self.protocole.traiter('stop')
+        
+        self.assertTrue(self.lignes()[-1].startswith('bestmove '))
+    
+    def test_ponderhit_applique_la_cadence(self):
+        """Test que 'ponderhit' limite la réflexion selon la pendule du 'go ponder'."""
+        self.protocole.traiter('position startpos moves e2e4')
+        self.protocole.traiter('go ponder wtime 2000 btime 2000')
+        time.sleep(0.2)
+        self.assertFalse(any(ligne.startswith('bestmove') for ligne in self.lignes()))
+        
+        debut = time.perf_counter()
+        self.protocole.traiter('ponderhit')
+        fil = self.protocole._fil_recherche
+        fil.join(10)
+        self.assertFalse(fil.is_alive())
+        self.assertLess(time.perf_counter() - debut, 2)
+        self.assertTrue(self.lignes()[-1].startswith('bestmove '))
+    
+    def test_ponderhit_sans_limite(self):
+        """Test qu'un 'go ponder' sans limite attend toujours 'stop' après 'ponderhit'."""
+        self.protocole.traiter('position startpos')
+        self.protocole.traiter('go ponder')
+        self.protocole.traiter('ponderhit')
+        time.sleep(0.2)
+        self.assertFalse(any(ligne.startswith('bestmove') for ligne in self.lignes()))
+        
+        self.protocole.traiter('stop')
+        self.assertTrue(self.lignes()[-1].startswith('bestmove '))
+    
+    def test_setoption(self):
+        """Test les options Hash et Threads."""
+        self.protocole.traiter('setoption name Hash value 2')
+        self.protocole.traiter('setoption name Threads value 4')
+        
+        self.assertEqual(self.protocole.fils, 4)
+        self.assertEqual(self.protocole.moteur.table.taille, 2 * 1024 * 1024 // 160)
+    
+    def test_multipv(self):
+        """Test que l'option MultiPV envoie une ligne 'info' par variante."""
+        self.protocole.traiter('setoption name MultiPV value 3')
+        self.protocole.traiter('position startpos')
+        self.protocole.traiter('go depth 2')
+        self.protocole.attendre()
+        
+        lignes = [ligne for ligne in self.lignes() if ligne.startswith('info depth 2 ')]
+        self.assertEqual([ligne.split()[4] for ligne in lignes], ['1', '2', '3'])
+        meilleur = lignes[0].split(' pv ')[1].split()[0]
+        self.assertEqual(self.lignes()[-1], f'bestmove {meilleur}')
+    
+    def test_structure_pions(self):
+        """Test de l'option PawnStructure et du taux de succès de la table des pions."""
+        self.protocole.traiter('setoption name PawnStructure value true')
+        self.assertTrue(self.protocole.moteur.structure_pions)
+        self.protocole.traiter('position startpos moves e2e4 d7d5')
+        self.protocole.traiter('go depth 2')
+        self.protocole.attendre()
+        
+        self.assertTrue(any(ligne.startswith('info string table des pions') for ligne in self.lignes()))
+        self.assertTrue(self.lignes()[-1].startswith('bestmove '))
+    
+    def test_recherche_selective(self):
+        """Test des options de recherche sélective et du facteur de branchement rapporté."""
+        self.protocole.traiter('uci')
+        self.assertIn('option name NullMove type check default false', self.lignes())
+        self.protocole.traiter('setoption name NullMove value true')
+        self.protocole.traiter('setoption name LateMoveReductions value true')
+        self.assertTrue(self.protocole.moteur.coup_nul)
+        self.assertTrue(self.protocole.moteur.reductions)
+        self.assertFalse(self.protocole.moteur.pvs)
+        self.protocole.traiter('position startpos')
+        self.protocole.traiter('go depth 3')
+        self.protocole.attendre()
+        
+        self.assertTrue(any(ligne.startswith('info string facteur de branchement effectif')
+                            for ligne in self.lignes()))
+        self.assertTrue(self.lignes()[-1].startswith('bestmove '))
+    
+    def test_conversion_coups(self):
+        """Test la conversion des coups en notation UCI."""
+        self.assertEqual(uci_vers_coup('e7e8n'), ((1, 4), (0, 4), Cavalier))
+        self.protocole.traiter('position fen 8/4P3/8/8/8/8/8/k6K w - - 0 1')
+        self.assertEqual(coup_vers_uci(self.protocole.plateau, ((1, 4), (0, 4))), 'e7e8q')
+        with self.assertRaises(ValueError):
+            uci_vers_coup('z9z9')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+"""
+Tests unitaires pour la validation de coups par micro-lots.
+"""
+
+import unittest
+import sys
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+# Ajouter le répertoire parent au path pour les imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.fen import FEN_INITIALE
+from src.encodage import encoder_fen
+from src.validation import ValidateurCoups, valider_lot
+
+DEPART = encoder_fen(FEN_INITIALE)
+PROMOTION = encoder_fen('4k3/P7/8/8/8/8/8/4K3 w - - 0 1')
+ROQUE_EN_ECHEC = encoder_fen('4k3/8/8/8/8/8/4r3/R3K2R w KQ - 0 1')
+
+
+class TestValiderLot(unittest.TestCase):
+    """Tests pour la validation d'un lot dans un processus."""
+    
+    def test_resultats_dans_l_ordre(self):
+        """Test des coups légaux, illégaux et mal formés, répétés dans un lot."""
+        requetes = [(DEPART, 'e2e4'), (DEPART, 'e2e5'), (PROMOTION, 'a7a8n'), (DEPART, 'e2e4'),
+                    (DEPART, 'e7e5'), (DEPART, 'e2e4q'), (ROQUE_EN_ECHEC, 'e1g1'), (PROMOTION, 'z7a8'),
+                    (b'\x00' * 3, 'e2e4')]
+        resultats = valider_lot(requetes)
+        self.assertEqual(len(resultats), len(requetes))
+        self.assertIsNone(resultats[0])
+        self.assertEqual(resultats[1], "Ce mouvement n'est pas valide pour cette pièce.")
+        self.assertIsNone(resultats[2])
+        self.assertIsNone(resultats[3])
+        self.assertEqual(resultats[4], "Cette pièce n'est pas la vôtre.")
+        self.assertEqual(resultats[5], "Ce coup n'est pas une promotion.")
+        self.assertIsNotNone(resultats[6])
+        self.assertIsNotNone(resultats[7])
+        self.assertIn('invalide', resultats[8])
+
+
+class TestValidateurCoups(unittest.TestCase):
+    """Tests pour le service de validation par micro-lots."""
+    
+    def test_lots_et_statistiques(self):
+        """Test du regroupement des requêtes et des mesures du service."""
+        requetes = [(DEPART, 'e2e4'), (DEPART, 'e2e5')] * 50
+        with ThreadPoolExecutor(2) as executeur:
+            with ValidateurCoups(taille_lot=16, delai=0.05, executeur=executeur) as validateur:
+                resultats = validateur.valider(requetes)
+                statistiques = validateur.statistiques()
+        self.assertEqual(resultats, [None, "Ce mouvement n'est pas valide pour cette pièce."] * 50)
+        self.assertEqual(statistiques['requetes'], 100)
+        self.assertGreaterEqual(statistiques['lots'], 7)
+        self.assertLess(statistiques['lots'], 100)
+        self.assertGreater(statistiques['debit'], 0)
+        self.assertLessEqual(statistiques['latence_p50'], statistiques['latence_p99'])
+    
+    def test_requete_mal_typee(self):
+        """Test qu'une requête mal typée n'affecte pas les autres requêtes du lot."""
+        requetes = [(DEPART, 'e2e4'), (DEPART, 123), ([1], 'e2e4'), (DEPART, 'e2e5')]
+        with ThreadPoolExecutor(1) as executeur:
+            with ValidateurCoups(taille_lot=16, delai=0.05, executeur=executeur) as validateur:
+                resultats = validateur.valider(requetes)
+        self.assertIsNone(resultats[0])
+        self.assertIn('invalide', resultats[1])
+        self.assertIn('invalide', resultats[2])
+        self.assertEqual(resultats[3], "Ce mouvement n'est pas valide pour cette pièce.")
+        self.assertIn('invalide', valider_lot([(DEPART, None)])[0])
+    
+    def test_fermeture_et_groupe_de_processus(self):
+        """Test que les requêtes en attente sont traitées à la fermeture, dans un processus séparé."""
+        validateur = ValidateurCoups(taille_lot=1000, delai=10.0, processus=1)
+        futures = [validateur.soumettre(PROMOTION, coup) for coup in ('a7a8q', 'a7b8q', 'e1e2')]
+        validateur.fermer()
+        self.assertEqual([future.result() is None for future in futures], [True, False, True])
+        self.assertEqual(validateur.lots, 1)
+        with self.assertRaises(ValueError):
+            ValidateurCoups(taille_lot=0, executeur=ThreadPoolExecutor(1))
+
+
+if __name__ == '__main__':
+    unittest.main()